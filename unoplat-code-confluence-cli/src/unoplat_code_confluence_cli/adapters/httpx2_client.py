@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json as json_lib
+from collections.abc import Iterator
 from typing import Any
 from urllib.parse import SplitResult, urlsplit, urlunsplit
 
@@ -91,6 +92,50 @@ class Httpx2HttpClient:
         self._raise_for_status(response, response_data=response_data, action=action)
         return response_data
 
+    def stream(
+        self,
+        *,
+        base_url: str,
+        path: str,
+        timeout: float,
+        action: str,
+        params: dict[str, str] | None = None,
+        detail_statuses: set[int] | None = None,
+    ) -> Iterator[bytes]:
+        last_error: httpx2.HTTPError | None = None
+        for candidate_base_url in self._probe_base_urls(base_url):
+            streaming = False
+            try:
+                with httpx2.stream(
+                    "GET",
+                    f"{candidate_base_url}{path}",
+                    params=params,
+                    timeout=timeout,
+                ) as response:
+                    if response.is_error:
+                        response.read()
+                        response_data = self._to_response_data(response)
+                        if (
+                            detail_statuses is not None
+                            and response.status_code in detail_statuses
+                        ):
+                            detail = self.extract_error_detail(response_data)
+                            raise NetworkError(detail or f"Unable to {action}.")
+                        self._raise_for_status(
+                            response, response_data=response_data, action=action
+                        )
+                    streaming = True
+                    yield from response.iter_bytes()
+                    return
+            except httpx2.HTTPError as exc:
+                # Only retry another loopback alias before any bytes were yielded.
+                if streaming:
+                    raise NetworkError(f"Interrupted while trying to {action}: {exc}") from exc
+                last_error = exc
+                continue
+
+        raise NetworkError(f"Unable to reach service to {action}: {last_error}")
+
     def extract_error_detail(self, response: HttpResponse) -> str | None:
         payload = response.body
         if not isinstance(payload, dict):
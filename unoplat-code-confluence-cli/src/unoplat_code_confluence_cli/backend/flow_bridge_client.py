@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+
 from pydantic import BaseModel, Field, ValidationError
 
 from unoplat_code_confluence_cli.config import CliSettings
@@ -186,3 +188,14 @@ class FlowBridgeClient:
                 f"HTTP status {response.status_code}"
             )
         )
+
+    def export_codebase(self, *, codebase_qualified_name: str) -> Iterator[bytes]:
+        """Stream a codebase's ingested graph as NDJSON chunks."""
+        return self._http.stream(
+            base_url=self._settings.flow_bridge_base_url,
+            path="/codebase-export",
+            params={"codebase_qualified_name": codebase_qualified_name},
+            timeout=self._settings.request_timeout_seconds,
+            action="export codebase",
+            detail_statuses={404, 422},
+        )
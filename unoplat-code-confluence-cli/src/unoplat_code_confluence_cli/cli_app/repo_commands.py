@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from typing import BinaryIO
+
 import click
 
 from unoplat_code_confluence_cli.cli_app.context import CliServices
 from unoplat_code_confluence_cli.cli_app.output import json_command, progress
 from unoplat_code_confluence_cli.domain.results import RepositoryAddResult, RepositoryRefreshResult
+from unoplat_code_confluence_cli.errors import CliError
 
 
 @click.group(name="repo")
@@ -24,6 +27,38 @@ def repo_add(services: CliServices, repository_git_url: str) -> RepositoryAddRes
     )
 
 
+@repo_group.command(name="export")
+@click.argument("codebase_qualified_name")
+@click.option(
+    "--output",
+    "-o",
+    type=click.File("wb"),
+    default="-",
+    show_default=True,
+    help="File to write the NDJSON export to; '-' writes to stdout.",
+)
+@click.pass_obj
+def repo_export(
+    services: CliServices,
+    codebase_qualified_name: str,
+    output: BinaryIO,
+) -> None:
+    """Stream an ingested codebase's files, imports and framework usages as NDJSON.
+
+    The summary is printed to stderr so stdout can be piped to an indexer.
+    """
+    try:
+        result = services.repository.export_codebase(
+            codebase_qualified_name=codebase_qualified_name,
+            output=output,
+            output_name=getattr(output, "name", "-"),
+            progress=progress,
+        )
+    except CliError as exc:
+        raise click.ClickException(str(exc)) from exc
+    click.echo(result.model_dump_json(indent=2), err=True)
+
+
 @click.command(name="add-repository")
 @click.argument("repository_git_url")
 @click.pass_obj
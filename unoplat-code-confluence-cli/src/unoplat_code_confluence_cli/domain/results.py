@@ -66,6 +66,17 @@ class RepositoryRefreshResult(BaseModel):
     )
 
 
+class CodebaseExportResult(BaseModel):
+    """Summary of a codebase graph streamed from Flow Bridge as NDJSON."""
+
+    model_config = ConfigDict(frozen=True)
+
+    codebase_qualified_name: str
+    output: str
+    records: int
+    bytes_written: int
+
+
 class RepositoryProviderCheck(BaseModel):
     """Repository-provider credential verification result."""
 
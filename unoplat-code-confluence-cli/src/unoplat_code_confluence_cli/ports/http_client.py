@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from typing import Any, Protocol
 
 from pydantic import BaseModel, ConfigDict
@@ -47,4 +48,17 @@ class HttpClient(Protocol):
         detail_statuses: set[int] | None = None,
     ) -> HttpResponse: ...
 
+    def stream(
+        self,
+        *,
+        base_url: str,
+        path: str,
+        timeout: float,
+        action: str,
+        params: dict[str, str] | None = None,
+        detail_statuses: set[int] | None = None,
+    ) -> Iterator[bytes]:
+        """Yield the body of a GET response as it arrives, without buffering it."""
+        ...
+
     def extract_error_detail(self, response: HttpResponse) -> str | None: ...
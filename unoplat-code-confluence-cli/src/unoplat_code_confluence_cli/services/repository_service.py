@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from typing import BinaryIO
 
 from unoplat_code_confluence_cli.backend.flow_bridge_client import FlowBridgeClient
 from unoplat_code_confluence_cli.domain.repository import RepositoryGitUrl
-from unoplat_code_confluence_cli.domain.results import RepositoryAddResult, RepositoryRefreshResult
+from unoplat_code_confluence_cli.domain.results import (
+    CodebaseExportResult,
+    RepositoryAddResult,
+    RepositoryRefreshResult,
+)
 from unoplat_code_confluence_cli.services.app_service import AppService
 from unoplat_code_confluence_cli.services.setup_service import SetupService
 
@@ -61,3 +66,30 @@ class RepositoryService:
             provider_key=add_result.provider_key,
             repository_git_url=add_result.repository_git_url,
         )
+
+    def export_codebase(
+        self,
+        *,
+        codebase_qualified_name: str,
+        output: BinaryIO,
+        output_name: str,
+        progress: ProgressCallback | None = None,
+    ) -> CodebaseExportResult:
+        """Copy a codebase's NDJSON export to ``output`` chunk by chunk."""
+        if self._auto_start:
+            self._app.ensure_running(progress=progress)
+        records = 0
+        bytes_written = 0
+        for chunk in self._flow_bridge.export_codebase(
+            codebase_qualified_name=codebase_qualified_name
+        ):
+            output.write(chunk)
+            records += chunk.count(b"\n")
+            bytes_written += len(chunk)
+        output.flush()
+        return CodebaseExportResult(
+            codebase_qualified_name=codebase_qualified_name,
+            output=output_name,
+            records=records,
+            bytes_written=bytes_written,
+        )
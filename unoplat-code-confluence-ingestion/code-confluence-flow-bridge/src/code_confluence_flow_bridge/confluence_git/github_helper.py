@@ -2,7 +2,7 @@ import os
 from datetime import datetime
 from pathlib import PurePosixPath
 import traceback
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 from urllib.parse import quote, urlsplit, urlunsplit
 
 from git import Repo
@@ -33,6 +33,7 @@ from code_confluence_flow_bridge.models.github.github_repo import (
 )
 from code_confluence_flow_bridge.utility.environment_utils import (
     ensure_local_repository_base_path,
+    get_environment_settings,
 )
 
 
@@ -148,6 +149,130 @@ def _reset_to_remote(repo: Repo, default_branch: str, repo_path: str) -> None:
     logger.debug("Cleaned untracked files | repo_path={}", repo_path)
 
 
+# Bare mirrors live next to the working copies, keyed by "<owner>/<repo>.git".
+MIRROR_CACHE_DIRNAME = ".mirrors"
+
+CloneStrategy = Literal["full", "shallow", "partial"]
+
+
+def _clone_options(strategy: CloneStrategy) -> List[str]:
+    """Extra ``git clone`` options implementing a clone strategy."""
+    if strategy == "shallow":
+        return ["--depth", "1", "--no-single-branch"]
+    if strategy == "partial":
+        return ["--filter=blob:none"]
+    return []
+
+
+def _fetch_options(strategy: CloneStrategy) -> List[str]:
+    """Extra ``git fetch`` options keeping later fetches within the strategy."""
+    if strategy == "shallow":
+        return ["--depth", "1"]
+    if strategy == "partial":
+        return ["--filter=blob:none"]
+    return []
+
+
+def _credential_rewrite_option(
+    repo_url: str, authenticated_repo_url: str
+) -> Dict[str, str]:
+    """One-shot ``-c`` option routing lazy fetches through the authenticated URL.
+
+    Partial clones download missing blobs from ``origin`` during checkout. The
+    stored origin URL carries no token, so the rewrite is passed on the command
+    line only and never written to git config.
+    """
+    if authenticated_repo_url == repo_url:
+        return {}
+    return {"c": f"url.{authenticated_repo_url}.insteadOf={repo_url}"}
+
+
+def _is_standalone_clone(repo_path: str) -> bool:
+    """True when ``repo_path`` is a regular clone rather than a mirror worktree."""
+    return os.path.isdir(os.path.join(repo_path, ".git"))
+
+
+def _sync_repository_mirror(
+    mirror_path: str,
+    repo_url: str,
+    authenticated_repo_url: str,
+    strategy: CloneStrategy,
+    git_env: Dict[str, str],
+) -> Repo:
+    """Create the bare mirror on first use, otherwise fetch only new objects."""
+    if not os.path.exists(mirror_path):
+        logger.info(
+            "Creating bare mirror | mirror_path={} | strategy={} | status=cloning",
+            mirror_path,
+            strategy,
+        )
+        mirror = Repo.clone_from(
+            authenticated_repo_url,
+            mirror_path,
+            bare=True,
+            env=git_env,
+            multi_options=_clone_options(strategy),
+        )
+        mirror.git.remote("set-url", "origin", repo_url)
+        return mirror
+
+    logger.info(
+        "Fetching into bare mirror | mirror_path={} | strategy={} | status=fetching",
+        mirror_path,
+        strategy,
+    )
+    mirror = Repo(mirror_path)
+    mirror.git.update_environment(**git_env)
+    mirror.git.remote("set-url", "origin", repo_url)
+    # Worktrees are checked out detached, so every branch ref may be updated.
+    mirror.git.fetch(
+        authenticated_repo_url,
+        "+refs/heads/*:refs/heads/*",
+        "--prune",
+        *_fetch_options(strategy),
+    )
+    return mirror
+
+
+def _checkout_mirror_worktree(
+    mirror: Repo,
+    worktree_path: str,
+    branch: str,
+    repo_url: str,
+    authenticated_repo_url: str,
+    git_env: Dict[str, str],
+) -> None:
+    """Check ``branch`` out of ``mirror`` into a detached worktree.
+
+    The worktree is managed by the ingestion pipeline: local edits are
+    discarded and untracked files removed on every refresh.
+    """
+    branch_ref = f"refs/heads/{branch}"
+    rewrite = _credential_rewrite_option(repo_url, authenticated_repo_url)
+    if not os.path.exists(worktree_path):
+        # Forget registrations whose directories were deleted out of band.
+        mirror.git.worktree("prune")
+        mirror.git(**rewrite).worktree(
+            "add", "--detach", "--force", worktree_path, branch_ref
+        )
+        logger.info(
+            "Created worktree from mirror | repo_path={} | branch={} | status=success",
+            worktree_path,
+            branch,
+        )
+        return
+
+    worktree = Repo(worktree_path)
+    worktree.git.update_environment(**git_env)
+    worktree.git(**rewrite).checkout("--detach", "--force", branch_ref)
+    worktree.git.clean("-fd")
+    logger.info(
+        "Updated worktree from mirror | repo_path={} | branch={} | status=success",
+        worktree_path,
+        branch,
+    )
+
+
 class GithubHelper:
     # works with - vhttps://github.com/organization/repository,https://github.com/organization/repository.git,git@github.com:organization/repository.git
     def clone_repository(
@@ -190,16 +315,47 @@ class GithubHelper:
 
             # Use configured repository base path from environment settings
             base_path = ensure_local_repository_base_path()
+            env_settings = get_environment_settings()
+            clone_strategy: CloneStrategy = env_settings.repository_clone_strategy
+            mirror_path = os.path.join(
+                str(base_path), MIRROR_CACHE_DIRNAME, f"{repo_path}.git"
+            )
             # Reassign repo_path to the local clone path
             repo_path = os.path.join(str(base_path), repo_name)
 
-            # Clone repository if not already cloned, otherwise update it
-            if not os.path.exists(repo_path):
+            # Clone repository if not already cloned, otherwise update it.
+            # Standalone clones made before the mirror cache was enabled keep
+            # being updated in place.
+            if env_settings.repository_mirror_cache_enabled and not (
+                _is_standalone_clone(repo_path)
+            ):
+                mirror = _sync_repository_mirror(
+                    mirror_path,
+                    repo_url,
+                    authenticated_repo_url,
+                    clone_strategy,
+                    git_env,
+                )
+                _checkout_mirror_worktree(
+                    mirror,
+                    repo_path,
+                    github_repo.default_branch,
+                    repo_url,
+                    authenticated_repo_url,
+                    git_env,
+                )
+            elif not os.path.exists(repo_path):
                 logger.info(
-                    "Repository not found locally, cloning | repo_path={} | status=cloning",
+                    "Repository not found locally, cloning | repo_path={} | strategy={} | status=cloning",
+                    repo_path,
+                    clone_strategy,
+                )
+                cloned_repo = Repo.clone_from(
+                    authenticated_repo_url,
                     repo_path,
+                    env=git_env,
+                    multi_options=_clone_options(clone_strategy),
                 )
-                cloned_repo = Repo.clone_from(authenticated_repo_url, repo_path, env=git_env)
                 cloned_repo.git.remote("set-url", "origin", repo_url)
                 logger.info(
                     "Repository cloned successfully | repo_path={} | status=success",
@@ -214,6 +370,9 @@ class GithubHelper:
                 # Open existing repository
                 local_repo = Repo(repo_path)
                 local_repo.git.remote("set-url", "origin", repo_url)
+                lazy_fetch_rewrite = _credential_rewrite_option(
+                    repo_url, authenticated_repo_url
+                )
 
                 try:
                     # Fetch first - we need remote refs for reset/pull operations
@@ -222,6 +381,7 @@ class GithubHelper:
                     local_repo.git.fetch(
                         authenticated_repo_url,
                         "+refs/heads/*:refs/remotes/origin/*",
+                        *_fetch_options(clone_strategy),
                     )
 
                     # Get default branch (needed for reset or checkout)
@@ -265,48 +425,60 @@ class GithubHelper:
                             default_branch,
                             repo_path,
                         )
-                        local_repo.git.checkout(
+                        local_repo.git(**lazy_fetch_rewrite).checkout(
                             "-b", default_branch, f"origin/{default_branch}"
                         )
                     else:
                         # Branch exists locally, just checkout
-                        local_repo.git.checkout(default_branch)
+                        local_repo.git(**lazy_fetch_rewrite).checkout(default_branch)
 
-                    # Pull latest changes
-                    logger.info(
-                        "Pulling latest changes | repo_path={} | status=pulling",
-                        repo_path,
-                    )
-
-                    try:
-                        # Git (>=2.34) requires an explicit reconciliation strategy
-                        pull_output: str = local_repo.git.pull(
-                            "--no-rebase", authenticated_repo_url, default_branch
-                        )
-                        logger.debug(
-                            "Pull output | output={} | repo_path={}",
-                            pull_output,
+                    if clone_strategy != "full":
+                        # Truncated histories cannot be merged; the fetch above
+                        # already brought the branch tip, so move onto it.
+                        logger.info(
+                            "Resetting to fetched branch tip | repo_path={} | strategy={} | status=resetting",
                             repo_path,
+                            clone_strategy,
                         )
-                    except Exception as git_err:
-                        logger.error(
-                            "git pull failed | repo_path={} | error={} | status=failed",
+                        local_repo.git(**lazy_fetch_rewrite).reset(
+                            "--hard", f"origin/{default_branch}"
+                        )
+                    else:
+                        # Pull latest changes
+                        logger.info(
+                            "Pulling latest changes | repo_path={} | status=pulling",
                             repo_path,
-                            _sanitize_token(git_err, github_token),
                         )
-                        # If pull created merge conflicts, recover by resetting to remote
-                        if _has_unmerged_files(local_repo):
-                            logger.warning(
-                                "Pull caused merge conflicts, recovering via reset | repo_path={} | status=recovering",
+
+                        try:
+                            # Git (>=2.34) requires an explicit reconciliation strategy
+                            pull_output: str = local_repo.git.pull(
+                                "--no-rebase", authenticated_repo_url, default_branch
+                            )
+                            logger.debug(
+                                "Pull output | output={} | repo_path={}",
+                                pull_output,
                                 repo_path,
                             )
-                            _reset_to_remote(local_repo, default_branch, repo_path)
-                            logger.info(
-                                "Repository recovered after pull conflict | repo_path={} | status=success",
+                        except Exception as git_err:
+                            logger.error(
+                                "git pull failed | repo_path={} | error={} | status=failed",
                                 repo_path,
+                                _sanitize_token(git_err, github_token),
                             )
-                        else:
-                            raise
+                            # If pull created merge conflicts, recover by resetting to remote
+                            if _has_unmerged_files(local_repo):
+                                logger.warning(
+                                    "Pull caused merge conflicts, recovering via reset | repo_path={} | status=recovering",
+                                    repo_path,
+                                )
+                                _reset_to_remote(local_repo, default_branch, repo_path)
+                                logger.info(
+                                    "Repository recovered after pull conflict | repo_path={} | status=success",
+                                    repo_path,
+                                )
+                            else:
+                                raise
 
                     logger.info(
                         "Repository updated successfully | repo_path={} | status=success",
@@ -25,6 +25,8 @@ class DataModelDetectorFactory:
         ProgrammingLanguage.PYTHON: PythonDataModelDetectorStrategy,
         ProgrammingLanguage.TYPESCRIPT: TypeScriptDataModelDetectorStrategy,
     }
+    # Strategies are stateless, so one instance per language is shared.
+    _instances: Dict[ProgrammingLanguage, DataModelDetectorStrategy] = {}
 
     @classmethod
     def get_strategy(
@@ -37,7 +39,7 @@ class DataModelDetectorFactory:
             programming_language: Programming language enum value
 
         Returns:
-            DataModelDetectorStrategy: Appropriate strategy instance
+            DataModelDetectorStrategy: Shared strategy instance for the language
 
         Raises:
             UnsupportedLanguageForDataModelDetectionError: If language is not supported
@@ -47,7 +49,11 @@ class DataModelDetectorFactory:
                 f"Unsupported language for data model detection: {programming_language}"
             )
 
-        return cls._strategies[programming_language]()
+        strategy = cls._instances.get(programming_language)
+        if strategy is None:
+            strategy = cls._strategies[programming_language]()
+            cls._instances[programming_language] = strategy
+        return strategy
 
 
 class UnsupportedLanguageForDataModelDetectionError(Exception):
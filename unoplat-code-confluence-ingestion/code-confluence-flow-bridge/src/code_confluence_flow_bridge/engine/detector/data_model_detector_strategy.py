@@ -32,3 +32,6 @@ class DataModelDetectorStrategy(ABC):
                 - DataModelPosition: Positions of detected data models
         """
         pass
+
+    def warm_up(self) -> None:
+        """Compile the strategy's queries ahead of the first file (optional)."""
@@ -0,0 +1,145 @@
+"""
+In-memory index of framework feature specs keyed by dotted import prefixes.
+
+The framework catalog does not change while a codebase is being parsed, so
+detection services resolve a file's imports against this index instead of
+querying PostgreSQL once per source file.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable, Sequence
+import hashlib
+
+from loguru import logger
+from unoplat_code_confluence_commons.base_models import FeatureSpec
+
+from code_confluence_flow_bridge.engine.programming_language.common.compiled_query_registry import (
+    COMPILED_QUERY_REGISTRY,
+)
+from code_confluence_flow_bridge.processor.db.postgres.db import get_session_cm
+from code_confluence_flow_bridge.processor.db.postgres.framework_query_service import (
+    get_all_framework_features_for_language,
+)
+
+
+def _dotted_prefixes(path: str) -> list[str]:
+    """Return ``path`` and every leading dotted prefix of it, shortest first."""
+    parts = path.split(".")
+    return [".".join(parts[:idx]) for idx in range(1, len(parts) + 1)]
+
+
+def _catalog_fingerprint(feature_specs: Sequence[FeatureSpec]) -> str:
+    """Order-independent digest of the specs; changes whenever a definition does."""
+    digest = hashlib.sha256()
+    for spec_json in sorted(spec.model_dump_json() for spec in feature_specs):
+        digest.update(spec_json.encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()[:16]
+
+
+class FrameworkFeatureIndex:
+    """Hashed prefix index resolving import paths to candidate `FeatureSpec`s.
+
+    Every feature absolute path is registered under each of its dotted
+    prefixes, so a lookup for an import path returns the features whose path
+    is the import itself or a dotted descendant of it. This mirrors the
+    ``absolute_path = :import OR absolute_path LIKE ':import.%'`` predicate
+    used by `get_framework_features_for_imports`.
+    """
+
+    def __init__(self, language: str, feature_specs: Sequence[FeatureSpec]) -> None:
+        self.language = language
+        self._feature_specs: tuple[FeatureSpec, ...] = tuple(feature_specs)
+
+        prefix_map: dict[str, set[int]] = {}
+        for spec_id, spec in enumerate(self._feature_specs):
+            for absolute_path in spec.absolute_paths:
+                for prefix in _dotted_prefixes(absolute_path):
+                    prefix_map.setdefault(prefix, set()).add(spec_id)
+        self._prefix_map: dict[str, frozenset[int]] = {
+            prefix: frozenset(spec_ids) for prefix, spec_ids in prefix_map.items()
+        }
+
+        self.catalog_version: str = _catalog_fingerprint(self._feature_specs)
+
+    def __len__(self) -> int:
+        return len(self._feature_specs)
+
+    @property
+    def feature_specs(self) -> tuple[FeatureSpec, ...]:
+        return self._feature_specs
+
+    def resolve(self, import_paths: Iterable[str]) -> list[FeatureSpec]:
+        """Return feature specs matching the imports or any of their ancestors.
+
+        Args:
+            import_paths: Fully-qualified import paths from a file's
+                ``import_aliases`` (e.g. ``["fastapi.APIRouter"]``).
+
+        Returns:
+            Matching specs in catalog order, without duplicates.
+        """
+        spec_ids: set[int] = set()
+        for import_path in import_paths:
+            normalized_path = import_path.strip()
+            if not normalized_path:
+                continue
+            for prefix in _dotted_prefixes(normalized_path):
+                matched_ids = self._prefix_map.get(prefix)
+                if matched_ids:
+                    spec_ids.update(matched_ids)
+        return [self._feature_specs[spec_id] for spec_id in sorted(spec_ids)]
+
+
+# Per-process cache of indexes by language. The catalog generation is bumped on
+# every invalidation so a load that raced with a reload is never cached.
+_feature_indexes: dict[str, FrameworkFeatureIndex] = {}
+_catalog_generation = 0
+_index_lock = asyncio.Lock()
+
+
+async def get_framework_feature_index(language: str) -> FrameworkFeatureIndex:
+    """Return the cached feature index for ``language``, building it on first use.
+
+    An empty catalog is returned but not cached, so a transient database error
+    during the first load does not disable detection for the worker's lifetime.
+    """
+    normalized_language = language.lower()
+    cached_index = _feature_indexes.get(normalized_language)
+    if cached_index is not None:
+        return cached_index
+
+    async with _index_lock:
+        cached_index = _feature_indexes.get(normalized_language)
+        if cached_index is not None:
+            return cached_index
+
+        generation = _catalog_generation
+        async with get_session_cm() as session:
+            feature_specs = await get_all_framework_features_for_language(
+                session, normalized_language
+            )
+        feature_index = FrameworkFeatureIndex(normalized_language, feature_specs)
+
+        if feature_specs and generation == _catalog_generation:
+            _feature_indexes[normalized_language] = feature_index
+        logger.info(
+            "Built framework feature index | language={} | feature_specs={}",
+            normalized_language,
+            len(feature_index),
+        )
+        return feature_index
+
+
+def invalidate_framework_feature_indexes() -> None:
+    """Drop every cached index and compiled query; the next lookup reloads."""
+    global _catalog_generation
+    _catalog_generation += 1
+    _feature_indexes.clear()
+    COMPILED_QUERY_REGISTRY.clear()
+    logger.debug(
+        "Invalidated framework feature indexes | generation={}",
+        _catalog_generation,
+    )
@@ -0,0 +1,95 @@
+"""Multi-pattern tree-sitter queries covering several feature specs at once."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Sequence, Tuple
+
+import tree_sitter
+from unoplat_code_confluence_commons.base_models import FeatureSpec
+
+QueryMatch = Tuple[int, Dict[str, List[tree_sitter.Node]]]
+
+
+@dataclass(frozen=True)
+class CombinedFeatureQuery:
+    """One compiled query whose patterns map back to the spec that rendered them.
+
+    Attributes:
+        query: Compiled query concatenating every spec's rendered patterns.
+        spec_index_by_pattern: ``spec_index_by_pattern[i]`` is the position in
+            the originating spec sequence of the spec owning pattern ``i``.
+        spec_count: Number of specs the query was built for.
+    """
+
+    query: tree_sitter.Query
+    spec_index_by_pattern: Tuple[int, ...]
+    spec_count: int
+
+    def matches_by_spec(self, root_node: tree_sitter.Node) -> List[List[QueryMatch]]:
+        """Traverse ``root_node`` once and group matches per originating spec."""
+        grouped: List[List[QueryMatch]] = [[] for _ in range(self.spec_count)]
+        cursor = tree_sitter.QueryCursor(self.query)
+        for pattern_index, captures in cursor.matches(root_node):
+            grouped[self.spec_index_by_pattern[pattern_index]].append(
+                (pattern_index, captures)
+            )
+        return grouped
+
+    def matches_for_specs(
+        self, root_node: tree_sitter.Node, spec_indexes: Sequence[int]
+    ) -> List[List[QueryMatch]]:
+        """Traverse ``root_node`` once and keep only the matches of ``spec_indexes``.
+
+        The result is aligned with ``spec_indexes``; matches of the other specs
+        in the query are dropped.
+        """
+        grouped: List[List[QueryMatch]] = [[] for _ in spec_indexes]
+        positions: Dict[int, List[int]] = {}
+        for position, spec_index in enumerate(spec_indexes):
+            positions.setdefault(spec_index, []).append(position)
+        cursor = tree_sitter.QueryCursor(self.query)
+        for pattern_index, captures in cursor.matches(root_node):
+            for position in positions.get(
+                self.spec_index_by_pattern[pattern_index], ()
+            ):
+                grouped[position].append((pattern_index, captures))
+        return grouped
+
+
+def compile_combined_feature_query(
+    language: tree_sitter.Language,
+    feature_specs: Sequence[FeatureSpec],
+    render_query: Callable[[FeatureSpec], str],
+) -> CombinedFeatureQuery:
+    """Compile the rendered patterns of ``feature_specs`` into one query.
+
+    Args:
+        language: Tree-sitter language the rendered patterns target.
+        feature_specs: Specs whose patterns are combined, in dispatch order.
+        render_query: Renders the query source for a single spec.
+
+    Raises:
+        ValueError: If a spec cannot be rendered by ``render_query``.
+        tree_sitter.QueryError: If the combined source does not compile.
+    """
+    segments: List[str] = []
+    segment_starts: List[int] = []
+    offset = 0
+    for feature_spec in feature_specs:
+        segment = render_query(feature_spec) + "\n"
+        segment_starts.append(offset)
+        segments.append(segment)
+        offset += len(segment.encode("utf-8"))
+
+    query = tree_sitter.Query(language, "".join(segments))
+    spec_index_by_pattern = tuple(
+        bisect_right(segment_starts, query.start_byte_for_pattern(pattern_index)) - 1
+        for pattern_index in range(query.pattern_count)
+    )
+    return CombinedFeatureQuery(
+        query=query,
+        spec_index_by_pattern=spec_index_by_pattern,
+        spec_count=len(feature_specs),
+    )
@@ -0,0 +1,220 @@
+"""Process-wide registry of compiled framework detection queries.
+
+Queries are keyed by a feature's natural identity
+``(language, library, capability_key, operation_key)`` so a cache hit costs a
+tuple lookup plus an equality check of the fields that shape the query, instead
+of rendering the template and hashing the spec. The registry is shared by the
+Python and TypeScript query builders and is cleared whenever the framework
+catalog is reloaded.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import tree_sitter
+from unoplat_code_confluence_commons.base_models import FeatureSpec
+
+from code_confluence_flow_bridge.engine.programming_language.common.combined_feature_query import (
+    CombinedFeatureQuery,
+)
+
+FeatureQueryKey = Tuple[str, str, str, str]
+# Fields that change the rendered query for a given identity. Compared on every
+# hit so an edited definition (or an ad-hoc spec reusing an identity) is never
+# served a stale query.
+FeatureQuerySignature = Tuple[Any, ...]
+
+
+def feature_query_key(language: str, feature_spec: FeatureSpec) -> FeatureQueryKey:
+    """Return the natural identity of ``feature_spec`` within ``language``."""
+    return (
+        language,
+        feature_spec.library,
+        feature_spec.capability_key,
+        feature_spec.operation_key,
+    )
+
+
+def feature_query_signature(feature_spec: FeatureSpec) -> FeatureQuerySignature:
+    """Return the spec fields that determine its rendered query."""
+    return (
+        feature_spec.concept,
+        feature_spec.target_level,
+        feature_spec.construct_query,
+    )
+
+
+@dataclass(frozen=True)
+class LanguageFeatureQuery:
+    """Combined query over every spec of a language seen so far.
+
+    Attributes:
+        combined_query: Query over the specs that compile on their own, or
+            ``None`` when none of them does.
+        feature_specs: Every spec the query was asked to cover.
+        spec_slots: Signature and combined-query spec index per feature key;
+            the index is ``None`` for specs left out because they do not compile.
+    """
+
+    combined_query: Optional[CombinedFeatureQuery]
+    feature_specs: Tuple[FeatureSpec, ...]
+    spec_slots: Dict[FeatureQueryKey, Tuple[FeatureQuerySignature, Optional[int]]]
+
+    def spec_indexes(
+        self, language: str, feature_specs: Sequence[FeatureSpec]
+    ) -> Optional[List[Optional[int]]]:
+        """Return each spec's combined-query index, or ``None`` if one is not covered."""
+        indexes: List[Optional[int]] = []
+        for feature_spec in feature_specs:
+            slot = self.spec_slots.get(feature_query_key(language, feature_spec))
+            if slot is None or slot[0] != feature_query_signature(feature_spec):
+                return None
+            indexes.append(slot[1])
+        return indexes
+
+
+def compile_language_feature_query(
+    language: str,
+    feature_specs: Sequence[FeatureSpec],
+    compile_spec_query: Callable[[FeatureSpec], tree_sitter.Query],
+    compile_combined_query: Callable[[Sequence[FeatureSpec]], CombinedFeatureQuery],
+) -> LanguageFeatureQuery:
+    """Combine every spec whose own query compiles into one language query.
+
+    Specs that do not render or compile are recorded without an index so the
+    detector can fall back to querying them separately.
+    """
+    compilable_specs: List[FeatureSpec] = []
+    spec_slots: Dict[FeatureQueryKey, Tuple[FeatureQuerySignature, Optional[int]]] = {}
+    for feature_spec in feature_specs:
+        spec_index: Optional[int] = None
+        try:
+            compile_spec_query(feature_spec)
+        except (ValueError, KeyError, tree_sitter.QueryError):
+            pass
+        else:
+            spec_index = len(compilable_specs)
+            compilable_specs.append(feature_spec)
+        spec_slots[feature_query_key(language, feature_spec)] = (
+            feature_query_signature(feature_spec),
+            spec_index,
+        )
+    return LanguageFeatureQuery(
+        combined_query=(
+            compile_combined_query(compilable_specs) if compilable_specs else None
+        ),
+        feature_specs=tuple(feature_specs),
+        spec_slots=spec_slots,
+    )
+
+
+@dataclass(frozen=True)
+class CompiledQueryRegistryStats:
+    """Snapshot of registry effectiveness."""
+
+    hits: int
+    misses: int
+    query_count: int
+    combined_hits: int
+    combined_misses: int
+    combined_query_count: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class CompiledQueryRegistry:
+    """Cache of per-feature queries and one combined query per language.
+
+    Per-feature queries are bounded by the catalog size and kept for the life
+    of the process. The combined query of a language covers the whole catalog
+    once pre-warmed; a spec it does not cover yet extends it, so it is
+    recompiled at most once per newly seen spec rather than per import mix.
+    """
+
+    def __init__(self) -> None:
+        self._queries: Dict[
+            FeatureQueryKey, Tuple[FeatureQuerySignature, tree_sitter.Query]
+        ] = {}
+        self._language_queries: Dict[str, LanguageFeatureQuery] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._combined_hits = 0
+        self._combined_misses = 0
+
+    def get_query(
+        self,
+        key: FeatureQueryKey,
+        signature: FeatureQuerySignature,
+        compile_query: Callable[[], tree_sitter.Query],
+    ) -> tree_sitter.Query:
+        """Return the compiled query for ``key``, compiling it on first use."""
+        entry = self._queries.get(key)
+        if entry is not None and entry[0] == signature:
+            self._hits += 1
+            return entry[1]
+
+        self._misses += 1
+        query = compile_query()
+        self._queries[key] = (signature, query)
+        return query
+
+    def get_language_query(
+        self,
+        language: str,
+        feature_specs: Sequence[FeatureSpec],
+        compile_query: Callable[[Sequence[FeatureSpec]], LanguageFeatureQuery],
+    ) -> LanguageFeatureQuery:
+        """Return the language query, extending it when ``feature_specs`` are not covered."""
+        with self._lock:
+            entry = self._language_queries.get(language)
+            if (
+                entry is not None
+                and entry.spec_indexes(language, feature_specs) is not None
+            ):
+                self._combined_hits += 1
+                return entry
+            self._combined_misses += 1
+
+        # Specs seen before stay covered; a changed definition replaces its
+        # earlier version under the same feature key.
+        specs_by_key: Dict[FeatureQueryKey, FeatureSpec] = {
+            feature_query_key(language, feature_spec): feature_spec
+            for feature_spec in (entry.feature_specs if entry is not None else ())
+        }
+        specs_by_key.update(
+            (feature_query_key(language, feature_spec), feature_spec)
+            for feature_spec in feature_specs
+        )
+        language_query = compile_query(list(specs_by_key.values()))
+        with self._lock:
+            self._language_queries[language] = language_query
+        return language_query
+
+    def contains(self, key: FeatureQueryKey) -> bool:
+        return key in self._queries
+
+    def stats(self) -> CompiledQueryRegistryStats:
+        return CompiledQueryRegistryStats(
+            hits=self._hits,
+            misses=self._misses,
+            query_count=len(self._queries),
+            combined_hits=self._combined_hits,
+            combined_misses=self._combined_misses,
+            combined_query_count=len(self._language_queries),
+        )
+
+    def clear(self) -> None:
+        """Drop every compiled query; counters are kept for observability."""
+        with self._lock:
+            self._queries.clear()
+            self._language_queries.clear()
+
+
+COMPILED_QUERY_REGISTRY = CompiledQueryRegistry()
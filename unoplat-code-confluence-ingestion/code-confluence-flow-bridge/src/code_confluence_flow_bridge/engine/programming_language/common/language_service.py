@@ -6,8 +6,8 @@ from dataclasses import dataclass
 
 from code_confluence_flow_bridge.engine.programming_language.common.source_context import (
     ImportAliasStrategy,
-    LanguagePackImportExtractor,
     SourceContextBuilder,
+    TreeImportExtractor,
 )
 
 
@@ -20,9 +20,9 @@ class LanguageServiceSpec:
     supported_extensions: frozenset[str]
     ignored_file_names: frozenset[str]
 
-    def create_import_extractor(self) -> LanguagePackImportExtractor:
-        """Factory Method for language-pack-backed import extraction."""
-        return LanguagePackImportExtractor(language_name=self.language_name)
+    def create_import_extractor(self) -> TreeImportExtractor:
+        """Factory Method for query-based import extraction off a parsed tree."""
+        return TreeImportExtractor.for_strategy(self.alias_strategy)
 
     def create_source_context_builder(self) -> SourceContextBuilder:
         """Factory Method for the source-context Template Method builder."""
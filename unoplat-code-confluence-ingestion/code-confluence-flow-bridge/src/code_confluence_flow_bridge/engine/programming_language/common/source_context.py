@@ -3,20 +3,16 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Dict, List
+from typing import ClassVar, Dict, List, Sequence
 
 from pydantic import BaseModel, ConfigDict
 import tree_sitter
 from tree_sitter_language_pack import (
-    ProcessConfig,
     SupportedLanguage,
+    get_language,
     get_parser,
-    process,
 )
 
-if TYPE_CHECKING:
-    from tree_sitter_language_pack import ProcessResult
-
 
 class BaseSourceContext(BaseModel):
     """Base Pydantic model for parsed source contexts."""
@@ -31,48 +27,93 @@ class BaseSourceContext(BaseModel):
 
 
 class ImportAliasStrategy(ABC):
-    """Strategy for resolving raw import statements into import aliases."""
+    """Strategy for resolving import statement nodes into import aliases."""
+
+    #: Language whose grammar the strategy's node types belong to.
+    language_name: ClassVar[SupportedLanguage]
+    #: Node types holding a single import statement in that grammar.
+    import_node_types: ClassVar[tuple[str, ...]]
 
     @abstractmethod
-    def build_import_aliases(self, imports: List[str]) -> Dict[str, str]:
-        """Build fully-qualified import path -> local alias mappings."""
+    def build_import_aliases_from_nodes(
+        self, import_nodes: Sequence[tree_sitter.Node], source_bytes: bytes
+    ) -> Dict[str, str]:
+        """Build fully-qualified import path -> local alias mappings.
+
+        Args:
+            import_nodes: Import statement nodes of an already-parsed tree.
+            source_bytes: The bytes the nodes' offsets refer to.
+        """
         raise NotImplementedError
 
-
-class LanguagePackImportExtractor(BaseModel):
-    """Extract raw import statements using tree-sitter-language-pack intelligence."""
+    def build_import_aliases(self, imports: List[str]) -> Dict[str, str]:
+        """Build alias mappings from raw import statement strings.
+
+        Each statement is parsed on its own; parsing pipelines use
+        `build_import_aliases_from_nodes` on the file's existing tree instead.
+        """
+        parser = get_parser(self.language_name)
+        mapping: Dict[str, str] = {}
+        for import_statement in imports:
+            if not import_statement.strip():
+                continue
+            src_bytes = bytes(import_statement, "utf8")
+            root_node = parser.parse(src_bytes).root_node
+            import_nodes = [
+                node
+                for node in root_node.children
+                if node.type in self.import_node_types
+            ]
+            for full_path, alias in self.build_import_aliases_from_nodes(
+                import_nodes, src_bytes
+            ).items():
+                mapping.setdefault(full_path, alias)
+        return mapping
+
+
+# Compiled import queries keyed by (language, node types); built once per process.
+_IMPORT_QUERIES: Dict[tuple[str, tuple[str, ...]], tree_sitter.Query] = {}
+
+
+class TreeImportExtractor(BaseModel):
+    """Collect import statement nodes from an already-parsed tree.
+
+    A compiled query walks the existing tree, so extracting imports costs no
+    additional parse of the file or of the individual statements.
+    """
 
     model_config = ConfigDict(frozen=True)
 
-    language_name: str
-
-    def extract_imports(self, source_bytes: bytes) -> List[str]:
-        """Return raw import statement strings for downstream alias extraction."""
-        source_text = source_bytes.decode("utf-8", errors="ignore")
-        result: ProcessResult = process(
-            source_text,
-            ProcessConfig(
-                language=self.language_name,
-                structure=False,
-                imports=True,
-                exports=False,
-                comments=False,
-                docstrings=False,
-                symbols=False,
-                diagnostics=False,
-            ),
+    language_name: SupportedLanguage
+    import_node_types: tuple[str, ...]
+
+    @classmethod
+    def for_strategy(cls, alias_strategy: ImportAliasStrategy) -> "TreeImportExtractor":
+        """Build an extractor for the node types ``alias_strategy`` resolves."""
+        return cls(
+            language_name=alias_strategy.language_name,
+            import_node_types=alias_strategy.import_node_types,
         )
 
-        imports: List[str] = []
-        for import_info in result.get("imports", []):
-            span = import_info["span"]
-            imports.append(
-                source_bytes[span["start_byte"] : span["end_byte"]].decode(
-                    "utf-8", errors="ignore"
-                )
+    def _query(self) -> tree_sitter.Query:
+        cache_key = (self.language_name, self.import_node_types)
+        query = _IMPORT_QUERIES.get(cache_key)
+        if query is None:
+            alternatives = " ".join(
+                f"({node_type})" for node_type in self.import_node_types
+            )
+            query = tree_sitter.Query(
+                get_language(self.language_name), f"[{alternatives}] @import"
             )
+            _IMPORT_QUERIES[cache_key] = query
+        return query
 
-        return imports
+    def extract_import_nodes(
+        self, root_node: tree_sitter.Node
+    ) -> List[tree_sitter.Node]:
+        """Return import statement nodes at any depth, in source order."""
+        captures = tree_sitter.QueryCursor(self._query()).captures(root_node)
+        return sorted(captures.get("import", []), key=lambda node: node.start_byte)
 
 
 class SourceContextBuilder(BaseModel):
@@ -81,15 +122,23 @@ class SourceContextBuilder(BaseModel):
     model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
 
     language_name: SupportedLanguage
-    import_extractor: LanguagePackImportExtractor
+    import_extractor: TreeImportExtractor
     alias_strategy: ImportAliasStrategy
 
     def from_bytes(self, source_bytes: bytes) -> BaseSourceContext:
-        """Parse once, extract imports, resolve aliases, and build a context."""
+        """Parse once, then read imports and aliases off the same tree."""
         tree = get_parser(self.language_name).parse(source_bytes)
         root_node = tree.root_node
-        imports = self.import_extractor.extract_imports(source_bytes)
-        import_aliases = self.alias_strategy.build_import_aliases(imports)
+        import_nodes = self.import_extractor.extract_import_nodes(root_node)
+        imports = [
+            source_bytes[node.start_byte : node.end_byte].decode(
+                "utf-8", errors="ignore"
+            )
+            for node in import_nodes
+        ]
+        import_aliases = self.alias_strategy.build_import_aliases_from_nodes(
+            import_nodes, source_bytes
+        )
         return BaseSourceContext(
             source_bytes=source_bytes,
             tree=tree,
@@ -0,0 +1,70 @@
+"""Pre-compile framework detection queries before the first file is parsed."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Sequence
+from typing import Protocol
+
+from loguru import logger
+from unoplat_code_confluence_commons.base_models import FeatureSpec
+
+from code_confluence_flow_bridge.engine.framework_feature_index import (
+    get_framework_feature_index,
+)
+from code_confluence_flow_bridge.engine.programming_language.common.compiled_query_registry import (
+    COMPILED_QUERY_REGISTRY,
+)
+from code_confluence_flow_bridge.engine.programming_language.python.python_framework_query_builder import (
+    PythonFrameworkQueryBuilder,
+)
+from code_confluence_flow_bridge.engine.programming_language.typescript.typescript_framework_query_builder import (
+    TypeScriptFrameworkQueryBuilder,
+)
+
+SUPPORTED_QUERY_LANGUAGES: tuple[str, ...] = ("python", "typescript")
+
+
+class _PrewarmableQueryBuilder(Protocol):
+    def prewarm(self, feature_specs: Iterable[FeatureSpec]) -> int: ...
+
+
+_QUERY_BUILDER_FACTORIES: dict[str, Callable[[], _PrewarmableQueryBuilder]] = {
+    "python": PythonFrameworkQueryBuilder,
+    "typescript": TypeScriptFrameworkQueryBuilder,
+}
+
+
+def prewarm_feature_specs(language: str, feature_specs: Sequence[FeatureSpec]) -> int:
+    """Compile the queries for ``feature_specs`` into the shared registry.
+
+    Returns:
+        Number of specs whose query is compiled; 0 for unsupported languages.
+    """
+    builder_factory = _QUERY_BUILDER_FACTORIES.get(language.lower())
+    if builder_factory is None:
+        return 0
+    return builder_factory().prewarm(feature_specs)
+
+
+async def prewarm_framework_queries(
+    languages: Iterable[str] = SUPPORTED_QUERY_LANGUAGES,
+) -> int:
+    """Load each language's catalog and compile all of its detection queries.
+
+    Returns:
+        Total number of compiled queries across ``languages``.
+    """
+    compiled = 0
+    for language in languages:
+        feature_index = await get_framework_feature_index(language)
+        compiled += prewarm_feature_specs(language, feature_index.feature_specs)
+
+    stats = COMPILED_QUERY_REGISTRY.stats()
+    logger.info(
+        "Pre-warmed compiled query registry | compiled={} | cached={} | hits={} | misses={}",
+        compiled,
+        stats.query_count,
+        stats.hits,
+        stats.misses,
+    )
+    return compiled
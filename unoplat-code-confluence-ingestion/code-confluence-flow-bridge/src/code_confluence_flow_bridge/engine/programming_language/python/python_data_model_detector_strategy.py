@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cache
 from pathlib import Path
 from typing import Dict, Tuple, override
 
@@ -25,6 +26,10 @@ class PythonDataModelDetectorStrategy(DataModelDetectorStrategy):
         Path(__file__).resolve().parent / "queries" / "dataclasses.scm"
     )
 
+    @override
+    def warm_up(self) -> None:
+        _get_python_dataclass_query(self._DATACLASS_QUERY_PATH, self._LANGUAGE_NAME)
+
     @override
     def detect(
         self,
@@ -89,10 +94,11 @@ class PythonDataModelDetectorStrategy(DataModelDetectorStrategy):
         return positions
 
 
+@cache
 def _get_python_dataclass_query(
     query_path: Path, language_name: str
 ) -> tree_sitter.Query:
-    """Load the Python language and compile the dataclass query."""
+    """Load the Python language and compile the dataclass query once per process."""
     language = get_language(language_name)  # type: ignore[arg-type]
     query_source = query_path.read_text(encoding="utf-8")
     return tree_sitter.Query(language, query_source)
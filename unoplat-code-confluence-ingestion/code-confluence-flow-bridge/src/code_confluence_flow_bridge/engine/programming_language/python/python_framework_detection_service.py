@@ -12,37 +12,15 @@ from unoplat_code_confluence_commons.base_models import Detection
 from code_confluence_flow_bridge.engine.framework_detection_service import (
     FrameworkDetectionService,
 )
+from code_confluence_flow_bridge.engine.framework_feature_index import (
+    get_framework_feature_index,
+)
 from code_confluence_flow_bridge.engine.programming_language.common.source_context import (
     BaseSourceContext,
 )
 from code_confluence_flow_bridge.engine.programming_language.python.python_tree_sitter_framework_detector import (
     PythonTreeSitterFrameworkDetector,
 )
-from code_confluence_flow_bridge.processor.db.postgres.db import get_session_cm
-from code_confluence_flow_bridge.processor.db.postgres.framework_query_service import (
-    get_framework_features_for_imports,
-)
-
-def _expand_import_paths(import_paths: List[str]) -> List[str]:
-    """Expand dotted import paths into all ancestor prefixes for DB lookup.
-
-    Args:
-        import_paths: Fully-qualified dotted import paths
-            (e.g. ``["flask.blueprints.Blueprint"]``).
-
-    Returns:
-        Sorted, deduplicated list containing each original path plus every
-        leading prefix (e.g. ``["flask", "flask.blueprints",
-        "flask.blueprints.Blueprint"]``).
-    """
-    expanded: List[str] = []
-    for path in import_paths:
-        expanded.append(path)
-        parts = path.split(".")
-        # Generate every leading prefix so the DB query can match at any depth
-        for idx in range(1, len(parts)):
-            expanded.append(".".join(parts[:idx]))
-    return sorted(set(expanded))
 
 
 class PythonFrameworkDetectionService(FrameworkDetectionService):
@@ -87,16 +65,10 @@ class PythonFrameworkDetectionService(FrameworkDetectionService):
                 logger.debug("No import aliases found in source")
                 return []
 
-            # Step 2: Query database for framework features matching the imports
-            async with get_session_cm() as session:
-                # Get all absolute paths from the import aliases
-                absolute_paths = _expand_import_paths(
-                    list(context.import_aliases.keys())
-                )
-
-                feature_specs = await get_framework_features_for_imports(
-                    session, programming_language.lower(), absolute_paths
-                )
+            # Step 2: Resolve the imports against the in-memory feature index
+            feature_index = await get_framework_feature_index("python")
+            absolute_paths = sorted(context.import_aliases.keys())
+            feature_specs = feature_index.resolve(absolute_paths)
 
             logger.opt(lazy=True).debug(
                 "Framework feature specs loaded | count={} | imports={}",
@@ -2,10 +2,8 @@
 
 from __future__ import annotations
 
-import hashlib
-import json
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterable, Optional, Sequence
 
 import tree_sitter
 from tree_sitter_language_pack import get_language
@@ -17,6 +15,17 @@ from unoplat_code_confluence_commons.base_models import (
     TargetLevel,
 )
 
+from code_confluence_flow_bridge.engine.programming_language.common.combined_feature_query import (
+    compile_combined_feature_query,
+)
+from code_confluence_flow_bridge.engine.programming_language.common.compiled_query_registry import (
+    COMPILED_QUERY_REGISTRY,
+    LanguageFeatureQuery,
+    compile_language_feature_query,
+    feature_query_key,
+    feature_query_signature,
+)
+
 _TEMPLATE_DIR = Path(__file__).resolve().parent / "queries"
 _TEMPLATE_PATHS = {
     "annotation_function": _TEMPLATE_DIR / "annotation_function_like.scm",
@@ -25,8 +34,10 @@ _TEMPLATE_PATHS = {
     "inheritance": _TEMPLATE_DIR / "inheritance.scm",
 }
 
-# Module-level cache: avoids recompiling identical tree-sitter queries across calls.
-_QUERY_CACHE: Dict[str, tree_sitter.Query] = {}
+# Templates are read once at import; rendering never touches the filesystem.
+_TEMPLATES: Dict[str, str] = {
+    key: path.read_text(encoding="utf-8") for key, path in _TEMPLATE_PATHS.items()
+}
 
 
 def _escape_query_regex(regex: str) -> str:
@@ -51,36 +62,6 @@ def _render_template(template: str, replacements: Dict[str, str]) -> str:
     return rendered
 
 
-def _load_template(path: Path) -> str:
-    """Read a ``.scm`` template file from disk."""
-    return path.read_text(encoding="utf-8")
-
-
-def _definition_hash(feature_spec: FeatureSpec) -> str:
-    """Compute a deterministic SHA-256 hex digest for cache-key derivation.
-
-    Args:
-        feature_spec: The feature specification whose fields are serialised
-            into a canonical JSON payload before hashing.
-
-    Returns:
-        A 64-character lowercase hex string uniquely identifying the spec.
-    """
-    payload = {
-        "capability_key": feature_spec.capability_key,
-        "operation_key": feature_spec.operation_key,
-        "library": feature_spec.library,
-        "absolute_paths": feature_spec.absolute_paths,
-        "target_level": feature_spec.target_level.value,
-        "concept": feature_spec.concept.value,
-        "locator_strategy": feature_spec.locator_strategy.value,
-        "construct_query": feature_spec.construct_query,
-    }
-    # sort_keys + compact separators guarantee a stable byte representation.
-    payload_json = json.dumps(payload, sort_keys=True, separators=(",", ":"))
-    return hashlib.sha256(payload_json.encode("utf-8")).hexdigest()
-
-
 class PythonFrameworkQueryBuilder:
     """Builds tree-sitter queries for Python framework detection."""
 
@@ -101,16 +82,60 @@ class PythonFrameworkQueryBuilder:
             ValueError: If the concept in *feature_spec* is not supported.
             KeyError: If the resolved template key has no corresponding template file.
         """
-        template_key = self._select_template_key(feature_spec)
-        template_path = _TEMPLATE_PATHS[template_key]
-        template = _load_template(template_path)
-        query_source = self._render_query(template, feature_spec)
-        cache_key = f"{template_key}:{_definition_hash(feature_spec)}"
+        return COMPILED_QUERY_REGISTRY.get_query(
+            feature_query_key("python", feature_spec),
+            feature_query_signature(feature_spec),
+            lambda: tree_sitter.Query(
+                self._language, self._render_feature_query(feature_spec)
+            ),
+        )
+
+    def build_language_query(
+        self, feature_specs: Sequence[FeatureSpec]
+    ) -> LanguageFeatureQuery:
+        """Build (or retrieve from cache) the multi-pattern query for this language.
+
+        The query covers every spec seen so far, not only ``feature_specs``, so
+        files with different import mixes share one compiled query and filter
+        its matches down to their own specs.
+        """
+        return COMPILED_QUERY_REGISTRY.get_language_query(
+            "python",
+            feature_specs,
+            lambda specs: compile_language_feature_query(
+                "python",
+                specs,
+                self.build_query,
+                lambda compilable_specs: compile_combined_feature_query(
+                    self._language, compilable_specs, self._render_feature_query
+                ),
+            ),
+        )
+
+    def prewarm(self, feature_specs: Iterable[FeatureSpec]) -> int:
+        """Compile every spec's query and the language query ahead of the first parsed file.
 
-        if cache_key not in _QUERY_CACHE:
-            _QUERY_CACHE[cache_key] = tree_sitter.Query(self._language, query_source)
+        Specs whose concept is unsupported or whose query fails to compile are
+        skipped; they surface again (and are logged) during detection.
 
-        return _QUERY_CACHE[cache_key]
+        Returns:
+            Number of specs whose query is now compiled.
+        """
+        feature_specs = list(feature_specs)
+        compiled = 0
+        for feature_spec in feature_specs:
+            try:
+                self.build_query(feature_spec)
+            except (ValueError, tree_sitter.QueryError):
+                continue
+            compiled += 1
+        self.build_language_query(feature_specs)
+        return compiled
+
+    def _render_feature_query(self, feature_spec: FeatureSpec) -> str:
+        """Render the query source for a single spec from its template."""
+        template_key = self._select_template_key(feature_spec)
+        return self._render_query(_TEMPLATES[template_key], feature_spec)
 
     def _select_template_key(self, feature_spec: FeatureSpec) -> str:
         """Map a feature spec's concept and target level to a template key."""
@@ -2,19 +2,19 @@
 
 from __future__ import annotations
 
-from typing import Dict, Final, List
+from typing import ClassVar, Dict, Final, List, Sequence
 
 import tree_sitter
-from tree_sitter_language_pack import get_parser
+from tree_sitter_language_pack import SupportedLanguage
 
 from code_confluence_flow_bridge.engine.programming_language.common.source_context import (
     BaseSourceContext,
     ImportAliasStrategy,
-    LanguagePackImportExtractor,
     SourceContextBuilder,
+    TreeImportExtractor,
 )
 
-_LANGUAGE_NAME: Final = "python"
+_LANGUAGE_NAME: Final[SupportedLanguage] = "python"
 
 
 def _record_import_alias(
@@ -27,7 +27,15 @@ def _record_import_alias(
 class PythonImportAliasStrategy(ImportAliasStrategy):
     """Resolve Python import statements into fully-qualified path aliases."""
 
-    def build_import_aliases(self, imports: List[str]) -> Dict[str, str]:
+    language_name: ClassVar[SupportedLanguage] = _LANGUAGE_NAME
+    import_node_types: ClassVar[tuple[str, ...]] = (
+        "import_statement",
+        "import_from_statement",
+    )
+
+    def build_import_aliases_from_nodes(
+        self, import_nodes: Sequence[tree_sitter.Node], source_bytes: bytes
+    ) -> Dict[str, str]:
         """
         Return a mapping from fully-qualified import path to its alias in the file.
 
@@ -39,21 +47,13 @@ class PythonImportAliasStrategy(ImportAliasStrategy):
             from fastapi import FastAPI       → {"fastapi.FastAPI": "FastAPI"}
             from fastapi import FastAPI as fp → {"fastapi.FastAPI": "fp"}
         """
-        parser = get_parser(_LANGUAGE_NAME)
         mapping: Dict[str, str] = {}
 
-        for import_statement in imports:
-            if not import_statement.strip():
-                continue
-
-            tree = parser.parse(bytes(import_statement, "utf8"))
-            src_bytes = bytes(import_statement, "utf8")
-
-            for node in tree.root_node.children:
-                if node.type == "import_statement":
-                    self._handle_import_statement(node, src_bytes, mapping)
-                elif node.type == "import_from_statement":
-                    self._handle_import_from_statement(node, src_bytes, mapping)
+        for node in import_nodes:
+            if node.type == "import_statement":
+                self._handle_import_statement(node, source_bytes, mapping)
+            elif node.type == "import_from_statement":
+                self._handle_import_from_statement(node, source_bytes, mapping)
 
         return mapping
 
@@ -147,10 +147,11 @@ class PythonSourceContext(BaseSourceContext):
 
     @classmethod
     def from_bytes(cls, source_bytes: bytes) -> "PythonSourceContext":
+        alias_strategy = PythonImportAliasStrategy()
         base_context = SourceContextBuilder(
             language_name=_LANGUAGE_NAME,
-            import_extractor=LanguagePackImportExtractor(language_name=_LANGUAGE_NAME),
-            alias_strategy=PythonImportAliasStrategy(),
+            import_extractor=TreeImportExtractor.for_strategy(alias_strategy),
+            alias_strategy=alias_strategy,
         ).from_bytes(source_bytes)
         return cls(
             source_bytes=base_context.source_bytes,
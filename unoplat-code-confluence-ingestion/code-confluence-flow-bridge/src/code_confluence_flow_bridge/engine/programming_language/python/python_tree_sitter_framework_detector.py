@@ -18,6 +18,9 @@ from unoplat_code_confluence_commons.base_models import (
     InheritanceInfo,
 )
 
+from code_confluence_flow_bridge.engine.programming_language.common.combined_feature_query import (
+    QueryMatch,
+)
 from code_confluence_flow_bridge.engine.programming_language.python.python_framework_query_builder import (
     PythonFrameworkQueryBuilder,
 )
@@ -271,21 +274,28 @@ class PythonTreeSitterFrameworkDetector:
             A flat list of ``Detection`` instances (may be empty) aggregated
             across all specs.
         """
-        detections: List[Detection] = []
+        imported_specs: List[FeatureSpec] = []
         for spec in feature_specs:
+            if not _is_feature_imported(spec.absolute_paths, context.import_aliases):
+                logger.opt(lazy=True).debug(
+                    "Skipping feature; import not found | library={} | feature_key={} | paths={} | aliases={}",
+                    lambda: spec.library,
+                    lambda: spec.feature_key,
+                    lambda: spec.absolute_paths,
+                    lambda: sorted(context.import_aliases.keys()),
+                )
+                continue
+            imported_specs.append(spec)
+        if not imported_specs:
+            return []
+
+        detections: List[Detection] = []
+        matches_by_spec = self._match_features(context, imported_specs)
+        for spec, matches in zip(imported_specs, matches_by_spec):
+            if matches is None:
+                continue
             try:
-                if not _is_feature_imported(
-                    spec.absolute_paths, context.import_aliases
-                ):
-                    logger.opt(lazy=True).debug(
-                        "Skipping feature; import not found | library={} | feature_key={} | paths={} | aliases={}",
-                        lambda: spec.library,
-                        lambda: spec.feature_key,
-                        lambda: spec.absolute_paths,
-                        lambda: sorted(context.import_aliases.keys()),
-                    )
-                    continue
-                feature_detections = self._detect_feature(context, spec)
+                feature_detections = self._detect_feature(context, spec, matches)
                 if feature_detections:
                     logger.opt(lazy=True).debug(
                         "Feature detections | library={} | feature_key={} | count={}",
@@ -302,13 +312,66 @@ class PythonTreeSitterFrameworkDetector:
                 )
         return detections
 
-    def _detect_feature(
+    def _match_features(
+        self, context: PythonSourceContext, feature_specs: List[FeatureSpec]
+    ) -> List[Optional[List[QueryMatch]]]:
+        """Collect query matches for every spec from a single tree traversal.
+
+        The language's multi-pattern query is run once and its matches are
+        filtered down to ``feature_specs`` by pattern index. Specs the combined
+        query leaves out, or every spec if it cannot be built, are queried
+        separately so one broken spec does not disable detection for the rest;
+        specs that fail yield ``None``.
+        """
+        try:
+            language_query = self._query_builder.build_language_query(feature_specs)
+            spec_indexes = language_query.spec_indexes("python", feature_specs)
+            if spec_indexes is None:
+                raise ValueError("language query does not cover the requested specs")
+            combined_query = language_query.combined_query
+            combined_indexes = [index for index in spec_indexes if index is not None]
+            combined_matches = iter(
+                combined_query.matches_for_specs(context.root_node, combined_indexes)
+                if combined_query is not None and combined_indexes
+                else []
+            )
+            return [
+                next(combined_matches)
+                if index is not None
+                else self._match_feature(context, spec)
+                for spec, index in zip(feature_specs, spec_indexes)
+            ]
+        except Exception as exc:
+            logger.debug(
+                "Combined feature query unavailable; querying per spec | error={}",
+                exc,
+            )
+
+        return [self._match_feature(context, spec) for spec in feature_specs]
+
+    def _match_feature(
         self, context: PythonSourceContext, spec: FeatureSpec
+    ) -> Optional[List[QueryMatch]]:
+        """Run the standalone query of ``spec``; ``None`` if it cannot be built."""
+        try:
+            query = self._query_builder.build_query(spec)
+            cursor = tree_sitter.QueryCursor(query)
+            return cursor.matches(context.root_node)
+        except Exception as exc:
+            logger.warning(
+                "Framework detection failed | feature_key={} | error={}",
+                spec.feature_key,
+                exc,
+            )
+            return None
+
+    def _detect_feature(
+        self,
+        context: PythonSourceContext,
+        spec: FeatureSpec,
+        matches: List[QueryMatch],
     ) -> List[Detection]:
-        """Build a tree-sitter query for *spec* and route matches to the appropriate concept handler."""
-        query = self._query_builder.build_query(spec)
-        cursor = tree_sitter.QueryCursor(query)
-        matches = cursor.matches(context.root_node)
+        """Route the query matches collected for *spec* to its concept handler."""
 
         if spec.concept == Concept.ANNOTATION_LIKE:
             return self._detect_annotation_like(context, spec, matches)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cache
 from pathlib import Path
 import re
 from typing import Dict, Optional, Tuple
@@ -25,6 +26,9 @@ class TypeScriptDataModelDetectorStrategy(DataModelDetectorStrategy):
     _LANGUAGE_NAME = "typescript"
     _TYPES_QUERY_PATH = Path(__file__).resolve().parent / "queries" / "types.scm"
 
+    def warm_up(self) -> None:
+        _get_typescript_types_query(self._TYPES_QUERY_PATH, self._LANGUAGE_NAME)
+
     def detect(
         self,
         source_context: BaseSourceContext,
@@ -113,10 +117,11 @@ class TypeScriptDataModelDetectorStrategy(DataModelDetectorStrategy):
         return None
 
 
+@cache
 def _get_typescript_types_query(
     query_path: Path, language_name: str
 ) -> tree_sitter.Query:
-    """Load the TypeScript language and compile the types.scm query."""
+    """Load the TypeScript language and compile the types.scm query once per process."""
     language = get_language(language_name)  # type: ignore[arg-type]
     query_source = query_path.read_text(encoding="utf-8")
     return tree_sitter.Query(language, query_source)
@@ -10,36 +10,15 @@ from unoplat_code_confluence_commons.base_models import Detection
 from code_confluence_flow_bridge.engine.framework_detection_service import (
     FrameworkDetectionService,
 )
+from code_confluence_flow_bridge.engine.framework_feature_index import (
+    get_framework_feature_index,
+)
 from code_confluence_flow_bridge.engine.programming_language.common.source_context import (
     BaseSourceContext,
 )
 from code_confluence_flow_bridge.engine.programming_language.typescript.typescript_tree_sitter_framework_detector import (
     TypeScriptTreeSitterFrameworkDetector,
 )
-from code_confluence_flow_bridge.processor.db.postgres.db import get_session_cm
-from code_confluence_flow_bridge.processor.db.postgres.framework_query_service import (
-    get_framework_features_for_imports,
-)
-
-def _expand_import_paths(import_paths: List[str]) -> List[str]:
-    """Expand dotted import paths into all ancestor prefixes for DB lookup.
-
-    Args:
-        import_paths: Fully-qualified dotted import paths
-            (e.g. ``["next/server.NextRequest"]``).
-
-    Returns:
-        Sorted, deduplicated list containing each original path plus every
-        leading prefix so the DB query can match at any depth.
-    """
-    expanded: List[str] = []
-    for path in import_paths:
-        expanded.append(path)
-        parts = path.split(".")
-        # Generate every leading prefix so the DB query can match at any depth
-        for idx in range(1, len(parts)):
-            expanded.append(".".join(parts[:idx]))
-    return sorted(set(expanded))
 
 
 class TypeScriptFrameworkDetectionService(FrameworkDetectionService):
@@ -73,13 +52,9 @@ class TypeScriptFrameworkDetectionService(FrameworkDetectionService):
             return []
 
         try:
-            async with get_session_cm() as session:
-                absolute_paths = _expand_import_paths(
-                    list(context.import_aliases.keys())
-                )
-                feature_specs = await get_framework_features_for_imports(
-                    session, "typescript", absolute_paths
-                )
+            feature_index = await get_framework_feature_index("typescript")
+            absolute_paths = sorted(context.import_aliases.keys())
+            feature_specs = feature_index.resolve(absolute_paths)
 
             logger.opt(lazy=True).debug(
                 "TypeScript framework feature specs loaded | count={} | imports={}",
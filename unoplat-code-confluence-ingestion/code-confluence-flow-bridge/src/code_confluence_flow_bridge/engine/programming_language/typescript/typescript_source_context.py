@@ -2,19 +2,19 @@
 
 from __future__ import annotations
 
-from typing import Dict, Final, List
+from typing import ClassVar, Dict, Final, List, Sequence
 
 import tree_sitter
-from tree_sitter_language_pack import get_parser
+from tree_sitter_language_pack import SupportedLanguage
 
 from code_confluence_flow_bridge.engine.programming_language.common.source_context import (
     BaseSourceContext,
     ImportAliasStrategy,
-    LanguagePackImportExtractor,
     SourceContextBuilder,
+    TreeImportExtractor,
 )
 
-_LANGUAGE_NAME: Final = "typescript"
+_LANGUAGE_NAME: Final[SupportedLanguage] = "typescript"
 
 
 def _record_import_alias(
@@ -36,7 +36,12 @@ def _get_string_value(node: tree_sitter.Node, source_bytes: bytes) -> str:
 class TypeScriptImportAliasStrategy(ImportAliasStrategy):
     """Resolve TypeScript import statements into local aliases."""
 
-    def build_import_aliases(self, imports: List[str]) -> Dict[str, str]:
+    language_name: ClassVar[SupportedLanguage] = _LANGUAGE_NAME
+    import_node_types: ClassVar[tuple[str, ...]] = ("import_statement",)
+
+    def build_import_aliases_from_nodes(
+        self, import_nodes: Sequence[tree_sitter.Node], source_bytes: bytes
+    ) -> Dict[str, str]:
         """
         Return a mapping from fully-qualified import path to its local alias.
 
@@ -47,20 +52,12 @@ class TypeScriptImportAliasStrategy(ImportAliasStrategy):
         - Type-only named: import type { NextRequest } from 'next/server'
         - Namespace:       import * as ns from 'next/server' → skipped (v1)
         """
-        parser = get_parser(_LANGUAGE_NAME)
         mapping: Dict[str, str] = {}
 
-        for import_statement in imports:
-            if not import_statement.strip():
+        for node in import_nodes:
+            if node.type != "import_statement":
                 continue
-
-            tree = parser.parse(bytes(import_statement, "utf8"))
-            src_bytes = bytes(import_statement, "utf8")
-
-            for node in tree.root_node.children:
-                if node.type != "import_statement":
-                    continue
-                self._handle_import_statement(node, src_bytes, mapping)
+            self._handle_import_statement(node, source_bytes, mapping)
 
         return mapping
 
@@ -132,10 +129,11 @@ class TypeScriptSourceContext(BaseSourceContext):
     @classmethod
     def from_bytes(cls, source_bytes: bytes) -> "TypeScriptSourceContext":
         """Parse TypeScript bytes and build a fully-populated context."""
+        alias_strategy = TypeScriptImportAliasStrategy()
         base_context = SourceContextBuilder(
             language_name=_LANGUAGE_NAME,
-            import_extractor=LanguagePackImportExtractor(language_name=_LANGUAGE_NAME),
-            alias_strategy=TypeScriptImportAliasStrategy(),
+            import_extractor=TreeImportExtractor.for_strategy(alias_strategy),
+            alias_strategy=alias_strategy,
         ).from_bytes(source_bytes)
         return cls(
             source_bytes=base_context.source_bytes,
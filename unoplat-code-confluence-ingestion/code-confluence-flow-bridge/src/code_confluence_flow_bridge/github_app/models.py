@@ -120,3 +120,12 @@ class ManifestConversionResponse(BaseModel):
     instructions: List[str] = Field(
         description="Ordered list of recommended follow-up steps for the operator."
     )
+
+
+class PushEvent(BaseModel):
+    """Push to a repository's default branch, reduced to what a refresh needs."""
+
+    repository_name: str
+    repository_owner_name: str
+    before_sha: str = Field(description="Branch head before the push.")
+    after_sha: str = Field(description="Branch head after the push.")
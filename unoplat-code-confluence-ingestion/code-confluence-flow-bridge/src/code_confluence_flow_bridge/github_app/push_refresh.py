@@ -0,0 +1,324 @@
+"""Turn GitHub push webhooks into debounced incremental repository refreshes.
+
+A burst of pushes to a repository's default branch collapses into one refresh
+that covers the first ``before`` to the latest ``after`` commit. The refresh
+starts once the repository has been quiet for a configurable period, or when
+the first coalesced push has waited for the maximum delay. A refresh that
+finds another repository operation still running is retried later with any
+pushes that arrived in the meantime folded in.
+
+The refresh runs with incremental parsing forced on, so only files whose
+checksum changed since the last ingestion are re-parsed.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from loguru import logger
+from sqlalchemy.orm import selectinload
+from temporalio.client import Client
+from unoplat_code_confluence_commons.base_models import Repository
+from unoplat_code_confluence_commons.configuration_models import CodebaseConfig
+from unoplat_code_confluence_commons.credential_enums import CredentialNamespace
+
+from code_confluence_flow_bridge.github_app.models import PushEvent
+from code_confluence_flow_bridge.logging.trace_utils import (
+    bind_trace_id_logger,
+    build_trace_id,
+)
+from code_confluence_flow_bridge.models.github.github_repo import (
+    RepositoryRequestConfiguration,
+)
+from code_confluence_flow_bridge.models.workflow.repo_workflow_base import (
+    CommitRange,
+)
+from code_confluence_flow_bridge.processor.db.postgres.db import get_session_cm
+from code_confluence_flow_bridge.routers.repository.idempotency_service import (
+    get_active_repository_operation,
+)
+from code_confluence_flow_bridge.routers.repository.mappers import (
+    build_programming_language_metadata,
+)
+from code_confluence_flow_bridge.utility.detection import (
+    CodebaseDetector,
+    detect_codebases_multi_language,
+)
+from code_confluence_flow_bridge.utility.provider_urls import (
+    build_repository_git_url,
+)
+from code_confluence_flow_bridge.utility.token_utils import (
+    fetch_repository_provider_token,
+)
+from code_confluence_flow_bridge.utility.workflow_helpers import (
+    monitor_workflow,
+    start_workflow,
+)
+
+# GitHub reports a created or deleted branch with an all-zero commit SHA
+NULL_COMMIT_SHA = "0" * 40
+
+# Starts a refresh; returns False when it must be retried later because
+# another operation is active on the repository
+StartPushRefresh = Callable[[str, str, CommitRange], Awaitable[bool]]
+
+
+def parse_push_event(payload: dict[str, Any]) -> Optional[PushEvent]:
+    """Return the push when it moves the default branch, else None.
+
+    Pushes to other branches, tags and branch deletions do not change what
+    is ingested, so they are ignored.
+    """
+    repository = payload.get("repository") or {}
+    default_branch = repository.get("default_branch")
+    owner = repository.get("owner") or {}
+    owner_name = owner.get("login") or owner.get("name")
+    repository_name = repository.get("name")
+    before_sha = payload.get("before")
+    after_sha = payload.get("after")
+
+    if not (default_branch and owner_name and repository_name):
+        return None
+    if payload.get("ref") != f"refs/heads/{default_branch}":
+        return None
+    if payload.get("deleted") or not after_sha or after_sha == NULL_COMMIT_SHA:
+        return None
+
+    return PushEvent(
+        repository_name=repository_name,
+        repository_owner_name=owner_name,
+        before_sha=before_sha or NULL_COMMIT_SHA,
+        after_sha=after_sha,
+    )
+
+
+@dataclass
+class _PendingRefresh:
+    commit_range: CommitRange
+    first_pushed_at: float
+    last_pushed_at: float
+    not_before: float = 0.0
+
+
+class PushRefreshDebouncer:
+    """Coalesces pushes per repository and starts one refresh per burst."""
+
+    def __init__(
+        self,
+        start_refresh: StartPushRefresh,
+        quiet_seconds: float,
+        max_delay_seconds: float,
+        retry_seconds: float,
+    ) -> None:
+        self._start_refresh = start_refresh
+        self.quiet_seconds = quiet_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.retry_seconds = retry_seconds
+        self._pending: dict[tuple[str, str], _PendingRefresh] = {}
+        self._tasks: dict[tuple[str, str], asyncio.Task[None]] = {}
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def enqueue(self, event: PushEvent) -> None:
+        """Record ``event`` and (re)arm its repository's refresh timer."""
+        key = (event.repository_owner_name, event.repository_name)
+        now = asyncio.get_running_loop().time()
+        pending = self._pending.get(key)
+        if pending is None:
+            self._pending[key] = _PendingRefresh(
+                commit_range=CommitRange(
+                    before_sha=event.before_sha, after_sha=event.after_sha
+                ),
+                first_pushed_at=now,
+                last_pushed_at=now,
+            )
+        else:
+            pending.commit_range = CommitRange(
+                before_sha=pending.commit_range.before_sha,
+                after_sha=event.after_sha,
+                push_count=pending.commit_range.push_count + 1,
+            )
+            pending.last_pushed_at = now
+
+        if key not in self._tasks:
+            self._tasks[key] = asyncio.create_task(self._run(key))
+
+    async def shutdown(self) -> None:
+        """Cancel the timers; pushes still waiting are dropped."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+        if self._pending:
+            logger.warning(
+                "Dropping pending push refreshes on shutdown | repositories={}",
+                len(self._pending),
+            )
+        self._pending.clear()
+
+    def _due_at(self, pending: _PendingRefresh) -> float:
+        due = min(
+            pending.last_pushed_at + self.quiet_seconds,
+            pending.first_pushed_at + self.max_delay_seconds,
+        )
+        return max(due, pending.not_before)
+
+    async def _run(self, key: tuple[str, str]) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while (pending := self._pending.get(key)) is not None:
+                delay = self._due_at(pending) - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                    continue
+
+                del self._pending[key]
+                owner_name, repository_name = key
+                try:
+                    started = await self._start_refresh(
+                        repository_name, owner_name, pending.commit_range
+                    )
+                except Exception as exc:
+                    logger.error(
+                        "Push refresh failed to start | repository={}/{} | error={}",
+                        owner_name,
+                        repository_name,
+                        exc,
+                    )
+                    continue
+                if not started:
+                    self._requeue(key, pending, loop.time() + self.retry_seconds)
+        finally:
+            self._tasks.pop(key, None)
+
+    def _requeue(
+        self, key: tuple[str, str], pending: _PendingRefresh, not_before: float
+    ) -> None:
+        # Pushes that arrived while the refresh was being started extend the
+        # retried range instead of waiting for a refresh of their own
+        newer = self._pending.get(key)
+        if newer is not None:
+            pending.commit_range = CommitRange(
+                before_sha=pending.commit_range.before_sha,
+                after_sha=newer.commit_range.after_sha,
+                push_count=pending.commit_range.push_count
+                + newer.commit_range.push_count,
+            )
+            pending.last_pushed_at = newer.last_pushed_at
+        pending.not_before = not_before
+        self._pending[key] = pending
+
+
+async def start_push_refresh(
+    temporal_client: Client,
+    detectors: dict[str, CodebaseDetector],
+    repository_name: str,
+    repository_owner_name: str,
+    commit_range: CommitRange,
+) -> bool:
+    """Start an incremental refresh of an ingested repository.
+
+    Untracked repositories are skipped. Codebases come from the stored
+    configuration, so the refresh does not clone the repository to detect
+    them again unless none are stored.
+
+    Returns:
+        False when another repository operation is active and the refresh
+        should be retried, True otherwise
+    """
+    trace_id = build_trace_id(repository_name, repository_owner_name)
+    refresh_logger = bind_trace_id_logger(trace_id)
+
+    async with get_session_cm() as session:
+        db_repo: Repository | None = await session.get(
+            Repository,
+            (repository_name, repository_owner_name),
+            options=[selectinload(Repository.configs)],
+        )
+        if db_repo is None:
+            refresh_logger.info(
+                "Ignoring push to untracked repository | repository={}/{}",
+                repository_owner_name,
+                repository_name,
+            )
+            return True
+
+        active_run = await get_active_repository_operation(
+            session=session,
+            repository_name=repository_name,
+            repository_owner_name=repository_owner_name,
+        )
+        if active_run:
+            refresh_logger.info(
+                "Deferring push refresh behind active operation | repository={}/{} | operation={} | run_id={}",
+                repository_owner_name,
+                repository_name,
+                active_run.operation,
+                active_run.repository_workflow_run_id,
+            )
+            return False
+
+        provider_key = db_repo.repository_provider
+        provider_token, metadata = await fetch_repository_provider_token(
+            session, CredentialNamespace.REPOSITORY, provider_key
+        )
+        codebases = [
+            CodebaseConfig(
+                codebase_folder=config.codebase_folder,
+                root_packages=config.root_packages,
+                programming_language_metadata=build_programming_language_metadata(
+                    config.programming_language_metadata
+                ),
+            )
+            for config in db_repo.configs
+        ]
+
+    repository_url = build_repository_git_url(
+        repository_owner_name=repository_owner_name,
+        repository_name=repository_name,
+        provider_key=provider_key,
+        metadata=metadata,
+    )
+    if not codebases:
+        codebases = await detect_codebases_multi_language(
+            git_url=repository_url,
+            github_token=provider_token,
+            detectors=detectors,
+            request_logger=refresh_logger,
+        )
+
+    repo_request = RepositoryRequestConfiguration(
+        repository_name=repository_name,
+        repository_owner_name=repository_owner_name,
+        repository_git_url=repository_url,
+        provider_key=provider_key,
+        repository_metadata=codebases,
+    )
+    workflow_handle = await start_workflow(
+        temporal_client=temporal_client,
+        repo_request=repo_request,
+        github_token=provider_token,
+        workflow_id=(
+            f"push-refresh-{provider_key.value}-{repository_owner_name}-"
+            f"{repository_name}-{commit_range.after_sha[:12]}"
+        ),
+        trace_id=trace_id,
+        incremental_refresh=True,
+        commit_range=commit_range,
+    )
+    asyncio.create_task(monitor_workflow(workflow_handle))
+
+    refresh_logger.info(
+        "Started push refresh | repository={}/{} | commits={}..{} | pushes={} | workflow_id={}",
+        repository_owner_name,
+        repository_name,
+        commit_range.before_sha,
+        commit_range.after_sha,
+        commit_range.push_count,
+        workflow_handle.id,
+    )
+    return True
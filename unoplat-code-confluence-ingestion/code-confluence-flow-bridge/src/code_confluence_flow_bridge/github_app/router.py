@@ -24,6 +24,10 @@ from code_confluence_flow_bridge.github_app.models import (
     ManifestGenerationRequest,
     ManifestGenerationResponse,
 )
+from code_confluence_flow_bridge.github_app.push_refresh import (
+    PushRefreshDebouncer,
+    parse_push_event,
+)
 from code_confluence_flow_bridge.github_app.service import (
     build_absolute_url,
     build_registration_url,
@@ -43,10 +47,15 @@ from code_confluence_flow_bridge.models.configuration.settings import (
 
 # Local
 from code_confluence_flow_bridge.processor.db.postgres.db import get_session
-from code_confluence_flow_bridge.utility.runtime_deps import get_env_settings
+from code_confluence_flow_bridge.utility.runtime_deps import (
+    get_env_settings,
+    get_push_refresh_debouncer,
+)
 
 router = APIRouter(prefix="/integrations/github", tags=["GitHub App"])
 
+SUPPORTED_WEBHOOK_EVENTS = {"pull_request", "push"}
+
 GITHUB_MANIFEST_CONVERSION_ENDPOINT = (
     "https://api.github.com/app-manifests/{code}/conversions"
 )
@@ -249,6 +258,7 @@ async def manifest_callback(
 async def github_webhook(
     request: Request,
     session: AsyncSession = Depends(get_session),
+    push_refresh_debouncer: PushRefreshDebouncer = Depends(get_push_refresh_debouncer),
 ) -> Response:
     """Handle webhook deliveries from GitHub for the self-hosted app."""
     payload_bytes = await request.body()
@@ -280,7 +290,7 @@ async def github_webhook(
             detail="Invalid webhook signature.",
         )
 
-    if event != "pull_request":
+    if event not in SUPPORTED_WEBHOOK_EVENTS:
         logger.info("Ignoring unsupported GitHub webhook event: {}", event)
         return Response(status_code=status.HTTP_204_NO_CONTENT)
 
@@ -293,6 +303,28 @@ async def github_webhook(
             detail="Invalid JSON payload.",
         )
 
+    if event == "push":
+        push_event = parse_push_event(payload)
+        if push_event is None:
+            logger.info(
+                "Ignoring push outside the default branch (repo={}, ref={})",
+                payload.get("repository", {}).get("full_name"),
+                payload.get("ref"),
+            )
+            return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+        # Refreshes are debounced per repository, so the delivery is
+        # acknowledged before any workflow starts
+        push_refresh_debouncer.enqueue(push_event)
+        logger.info(
+            "Queued incremental refresh for push (repo={}/{}, before={}, after={})",
+            push_event.repository_owner_name,
+            push_event.repository_name,
+            push_event.before_sha,
+            push_event.after_sha,
+        )
+        return Response(status_code=status.HTTP_202_ACCEPTED)
+
     action = payload.get("action")
     pull_request = payload.get("pull_request", {})
     repo = payload.get("repository", {})
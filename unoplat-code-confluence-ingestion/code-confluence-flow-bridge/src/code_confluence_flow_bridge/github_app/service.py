@@ -43,7 +43,7 @@ FALLBACK_MANIFEST: Dict[str, Any] = {
         "pull_requests": "write",
         "metadata": "read",
     },
-    "default_events": ["pull_request"],
+    "default_events": ["pull_request", "push"],
     "callback_urls": [],
     "request_oauth_on_install": False,
     "setup_on_update": False,
@@ -135,7 +135,7 @@ def prepare_manifest(
             "metadata": "read",
         }
     )
-    manifest["default_events"] = ["pull_request"]
+    manifest["default_events"] = ["pull_request", "push"]
 
     # Webhook configuration
     hook_attributes = manifest.setdefault("hook_attributes", {})
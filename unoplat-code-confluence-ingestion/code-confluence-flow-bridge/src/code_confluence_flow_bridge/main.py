@@ -2,6 +2,7 @@ import os
 import asyncio
 from collections.abc import AsyncGenerator, Callable
 from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import traceback
 
 from fastapi import Depends, FastAPI, HTTPException
@@ -17,6 +18,10 @@ from unoplat_code_confluence_commons.base_models import (
 )
 from unoplat_code_confluence_commons.credential_enums import CredentialNamespace
 
+from code_confluence_flow_bridge.github_app.push_refresh import (
+    PushRefreshDebouncer,
+    start_push_refresh,
+)
 from code_confluence_flow_bridge.github_app.router import (
     router as github_app_router,
 )
@@ -40,6 +45,7 @@ from code_confluence_flow_bridge.parser.package_manager.python.detectors.ripgrep
 from code_confluence_flow_bridge.parser.package_manager.typescript.detectors.ripgrep_detector import (
     TypeScriptRipgrepDetector,
 )
+from code_confluence_flow_bridge.parser.parsing_runtime import ParsingRuntime
 from code_confluence_flow_bridge.processor.activity_inbound_interceptor import (
     ActivityStatusInterceptor,
 )
@@ -64,6 +70,9 @@ from code_confluence_flow_bridge.processor.db.postgres.framework_loader import (
 from code_confluence_flow_bridge.processor.db.postgres.parent_workflow_db_activity import (
     ParentWorkflowDbActivity,
 )
+from code_confluence_flow_bridge.processor.db.postgres.workflow_status_events import (
+    WorkflowStatusBroadcaster,
+)
 from code_confluence_flow_bridge.processor.generic_codebase_processing_activity import (
     GenericCodebaseProcessingActivity,
 )
@@ -304,7 +313,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     package_metadata_activity = PackageMetadataActivity()
     confluence_git_graph = ConfluenceGitGraph()
     codebase_package_ingestion = PackageManagerMetadataIngestion()
-    generic_activity = GenericCodebaseProcessingActivity()
+    # Detection services, compiled queries and parse workers live as long as
+    # the worker so codebases processed back to back reuse them.
+    app.state.parsing_runtime = ParsingRuntime(app.state.code_confluence_env)
+    generic_activity = GenericCodebaseProcessingActivity(
+        parsing_runtime=app.state.parsing_runtime
+    )
     agent_md_update_activity = AgentMdUpdateActivity()
     activities: list[ActivityCallable] = [
         git_activity.process_git_activity,
@@ -314,13 +328,21 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         confluence_git_graph.insert_git_repo_into_graph_db,
         codebase_package_ingestion.insert_package_manager_metadata,
         generic_activity.process_codebase_generic,
+        generic_activity.plan_codebase_shards,
+        generic_activity.process_codebase_shard,
+        generic_activity.merge_codebase_shards,
         agent_md_update_activity.trigger_agent_md_update,
     ]
 
     # Create database tables during startup
     await create_db_and_tables()
 
+    # Fan workflow status notifications out to /repository-status-stream clients
+    app.state.workflow_status_broadcaster = WorkflowStatusBroadcaster()
+    app.state.workflow_status_broadcaster.start()
+
     # Load framework definitions at startup
+    app.state.framework_catalog_version = None
     if os.getenv("LOAD_FRAMEWORK_DEFINITIONS", "true").lower() == "true":
         try:
             framework_loader = FrameworkDefinitionLoader(app.state.code_confluence_env)
@@ -328,6 +350,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
                 metrics = await framework_loader.load_framework_definitions_at_startup(
                     session
                 )
+                # Downstream caches of the catalog key on its content hash
+                app.state.framework_catalog_version = metrics.get("catalog_version")
                 if not metrics.get("skipped"):
                     logger.info(
                         "Framework definitions loaded in {:.3f}s", metrics["total_time"]
@@ -337,6 +361,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             if os.getenv("FRAMEWORK_DEFINITIONS_REQUIRED", "false").lower() == "true":
                 raise
 
+    # Compile detection and data-model queries for the whole catalog before
+    # the worker polls
+    try:
+        await app.state.parsing_runtime.warm_up()
+    except Exception as e:
+        logger.warning("Failed to pre-warm framework detection queries: {}", e)
+
     # Create the worker
     worker = create_worker(
         activities=activities,
@@ -349,6 +380,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     stop_event = asyncio.Event()
     worker_task = asyncio.create_task(_serve_worker(stop_event, worker))
 
+    # Debounce GitHub push webhooks into incremental refresh workflows
+    app.state.push_refresh_debouncer = PushRefreshDebouncer(
+        start_refresh=partial(
+            start_push_refresh,
+            app.state.temporal_client,
+            app.state.codebase_detectors,
+        ),
+        quiet_seconds=app.state.code_confluence_env.github_push_refresh_quiet_seconds,
+        max_delay_seconds=app.state.code_confluence_env.github_push_refresh_max_delay_seconds,
+        retry_seconds=app.state.code_confluence_env.github_push_refresh_retry_seconds,
+    )
+
     # Store references for cleanup
     app.state.worker_task = worker_task
     app.state.worker_stop = stop_event
@@ -366,6 +409,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         # ── shutdown ─────────────────────────────────────────────────────
         logger.info("Shutting down application...")
 
+        # Pending push refreshes start workflows, so stop them first
+        try:
+            await app.state.push_refresh_debouncer.shutdown()
+        except Exception as exc:
+            logger.warning("Failed to stop push refresh debouncer: {}", exc)
+
         # 1. Signal worker to stop
         stop_event.set()
 
@@ -378,6 +427,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
         # 3. Temporal client doesn't need explicit disconnect - it cleans up on garbage collection
 
+        # Stop the pooled parse workers now that no activity can lease them
+        try:
+            await app.state.parsing_runtime.shutdown()
+        except Exception as exc:
+            logger.warning("Failed to shut down parsing runtime: {}", exc)
+
+        # Release the listening connection before the engine is disposed
+        try:
+            await app.state.workflow_status_broadcaster.stop()
+        except Exception as exc:
+            logger.warning("Failed to stop workflow status listener: {}", exc)
+
         # 4. Dispose SQLAlchemy async engine
         try:
             await dispose_current_engine()
@@ -91,7 +91,7 @@ class EnvironmentSettings(BaseSettings):
     codebase_parser_file_batch_size: int = Field(
         default=1000,
         alias="CODEBASE_PARSER_FILE_BATCH_SIZE",
-        description="Number of files to process in a single batch operation. Optimal for performance vs memory usage.",
+        description="Number of parsed files buffered before they are flushed to PostgreSQL as multi-row upserts. Optimal for performance vs memory usage.",
         ge=100,  # minimum 100
         le=5000,  # maximum 5000
     )
@@ -107,7 +107,7 @@ class EnvironmentSettings(BaseSettings):
     codebase_parser_insertion_queue_size: int = Field(
         default=2000,
         alias="CODEBASE_PARSER_INSERTION_QUEUE_SIZE",
-        description="Maximum size of the asyncio queue for file insertion batches. Should be at least 2x file_batch_size for optimal throughput.",
+        description="Maximum number of parsed files waiting in the asyncio queue between the language processor and the database writer task. Should be at least 2x file_batch_size for optimal throughput.",
         ge=200,  # minimum 200
         le=10000,  # maximum 10000
     )
@@ -135,6 +135,18 @@ class EnvironmentSettings(BaseSettings):
         description="Base directory path for storing cloned repositories. Use '~' for user home directory expansion.",
     )
 
+    repository_clone_strategy: Literal["full", "shallow", "partial"] = Field(
+        default="full",
+        alias="REPOSITORY_CLONE_STRATEGY",
+        description="How repositories are cloned and fetched: 'full' keeps complete history, 'shallow' fetches only the branch tip (--depth 1), 'partial' keeps history but downloads file contents on demand (--filter=blob:none).",
+    )
+
+    repository_mirror_cache_enabled: bool = Field(
+        default=False,
+        alias="REPOSITORY_MIRROR_CACHE_ENABLED",
+        description="Keep a bare mirror of each repository under REPOSITORIES_BASE_PATH/.mirrors and check the working copy out as a worktree of it, so re-ingestion only fetches new objects.",
+    )
+
     # Framework definitions configuration
     framework_definitions_path: str = Field(
         default="/framework-definitions",
@@ -151,6 +163,52 @@ class EnvironmentSettings(BaseSettings):
         le=50,  # maximum 50 concurrent files
     )
 
+    codebase_parser_process_pool_workers: int = Field(
+        default=0,
+        alias="CODEBASE_PARSER_PROCESS_POOL_WORKERS",
+        description="Number of worker processes used to parse and run framework detection on source files. 0 keeps parsing on threads inside the worker process.",
+        ge=0,  # 0 disables the process pool
+        le=64,  # maximum 64 worker processes
+    )
+
+    codebase_parser_parse_cache_max_mb: int = Field(
+        default=0,
+        alias="CODEBASE_PARSER_PARSE_CACHE_MAX_MB",
+        description="Size bound in MiB of the content-addressed parse cache stored under REPOSITORIES_BASE_PATH/.cache. Files whose content was parsed before (in any repository) reuse the cached result. 0 disables the cache.",
+        ge=0,  # 0 disables the cache
+        le=65536,  # maximum 64 GiB
+    )
+
+    codebase_parser_checkpoint_files: int = Field(
+        default=0,
+        alias="CODEBASE_PARSER_CHECKPOINT_FILES",
+        description="Write the codebase in transactions of roughly this many files, each committed in its own session, so a retried activity resumes from the last committed chunk. An activity that exhausts its retries leaves the codebase partially rewritten in PostgreSQL until the next successful ingestion. 0 writes the whole codebase in the caller's single transaction, so a failed ingestion keeps the previous snapshot.",
+        ge=0,  # 0 disables intermediate commits
+        le=1000000,
+    )
+
+    codebase_parser_shard_target_mb: int = Field(
+        default=0,
+        alias="CODEBASE_PARSER_SHARD_TARGET_MB",
+        description="Split a codebase whose source files exceed this many megabytes into shards parsed by parallel activities across the worker pool. Every worker must see the same checkout path. 0 parses each codebase in a single activity.",
+        ge=0,  # 0 disables sharding
+        le=100000,
+    )
+
+    codebase_parser_max_shards: int = Field(
+        default=16,
+        alias="CODEBASE_PARSER_MAX_SHARDS",
+        description="Upper bound on the number of parallel shard activities for one codebase.",
+        ge=1,
+        le=256,
+    )
+
+    codebase_parser_incremental_refresh: bool = Field(
+        default=False,
+        alias="CODEBASE_PARSER_INCREMENTAL_REFRESH",
+        description="Parse only files whose checksum differs from the stored one and delete rows for files removed since the last ingestion.",
+    )
+
     codebase_parser_ignored_directories: List[str] = Field(
         default_factory=list,
         alias="CODEBASE_PARSER_IGNORED_DIRECTORIES",
@@ -220,6 +278,30 @@ class EnvironmentSettings(BaseSettings):
         le=120.0,
     )
 
+    github_push_refresh_quiet_seconds: float = Field(
+        default=30.0,
+        alias="GITHUB_PUSH_REFRESH_QUIET_SECONDS",
+        description="Quiet period after the latest push to a repository's default branch before its incremental refresh starts; pushes inside it are coalesced.",
+        ge=0.0,
+        le=3600.0,
+    )
+
+    github_push_refresh_max_delay_seconds: float = Field(
+        default=300.0,
+        alias="GITHUB_PUSH_REFRESH_MAX_DELAY_SECONDS",
+        description="Upper bound on how long a steady stream of pushes can postpone a repository's incremental refresh.",
+        ge=0.0,
+        le=86400.0,
+    )
+
+    github_push_refresh_retry_seconds: float = Field(
+        default=60.0,
+        alias="GITHUB_PUSH_REFRESH_RETRY_SECONDS",
+        description="Delay before retrying a push-triggered refresh that found another repository operation still active.",
+        ge=1.0,
+        le=3600.0,
+    )
+
     github_app_manifest_state_ttl_minutes: int = Field(
         default=30,
         alias="GITHUB_APP_MANIFEST_STATE_TTL_MINUTES",
@@ -1,6 +1,6 @@
 from datetime import datetime
 from enum import Enum
-from typing import Any, List, Optional
+from typing import Any, List, Literal, Optional
 
 from pydantic import BaseModel, Field, model_validator
 from unoplat_code_confluence_commons.configuration_models import CodebaseConfig
@@ -361,6 +361,43 @@ class ParentWorkflowJobListResponse(BaseModel):
     )
 
 
+class WorkflowStatusEvent(BaseModel):
+    """Status change of a repository or codebase workflow run, pushed to subscribers.
+
+    Carries the run's full current status rather than a diff, so a subscriber
+    that missed an event is corrected by the next one for the same run.
+    """
+
+    scope: Literal["repository", "codebase"] = Field(
+        description="Whether a repository run or one of its codebase runs changed"
+    )
+    repository_name: str = Field(description="The name of the repository")
+    repository_owner_name: str = Field(description="The name of the repository owner")
+    repository_workflow_run_id: str = Field(
+        description="The run ID of the repository workflow"
+    )
+    codebase_folder: Optional[str] = Field(
+        default=None, description="Codebase folder, for codebase scope"
+    )
+    codebase_workflow_run_id: Optional[str] = Field(
+        default=None, description="The run ID of the codebase workflow, for codebase scope"
+    )
+    operation: Optional[RepositoryWorkflowOperation] = Field(
+        default=None, description="Operation of the repository run, for repository scope"
+    )
+    status: JobStatus = Field(description="Current status of the workflow run")
+    has_error_report: bool = Field(
+        default=False,
+        description="Whether an error report was recorded; fetch /repository-status for it",
+    )
+    started_at: Optional[datetime] = Field(
+        default=None, description="Timestamp when the workflow run started"
+    )
+    completed_at: Optional[datetime] = Field(
+        default=None, description="Timestamp when the workflow run completed"
+    )
+
+
 class IssueType(str, Enum):
     REPOSITORY = "REPOSITORY"
     CODEBASE = "CODEBASE"
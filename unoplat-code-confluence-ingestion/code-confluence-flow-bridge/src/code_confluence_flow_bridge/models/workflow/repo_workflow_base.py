@@ -16,10 +16,23 @@ from code_confluence_flow_bridge.models.github.github_repo import (
 )
 
 
+class CommitRange(BaseModel):
+    """Commits a push-triggered refresh covers, coalesced across pushes."""
+
+    before_sha: str
+    after_sha: str
+    push_count: int = 1
+
+
 class RepoWorkflowRunEnvelope(BaseModel):
     repo_request: RepositoryRequestConfiguration
     github_token: str
     trace_id: str
+    # None keeps CODEBASE_PARSER_INCREMENTAL_REFRESH; set by push-triggered refreshes
+    incremental_refresh: Optional[bool] = None
+    commit_range: Optional[CommitRange] = None
+    # Recorded at start from CODEBASE_PARSER_SHARD_TARGET_MB so replays plan alike
+    codebase_sharding: bool = False
     model_config = ConfigDict(extra="allow")
 
     @property
@@ -68,6 +81,8 @@ class CodebaseChildWorkflowEnvelope(BaseModel):
     package_manager_metadata: UnoplatPackageManagerMetadata
     trace_id: str
     parent_workflow_run_id: Optional[str] = None
+    incremental_refresh: Optional[bool] = None
+    codebase_sharding: bool = False
     model_config = ConfigDict(extra="allow")
 
     @property
@@ -105,8 +120,44 @@ class CodebaseProcessingActivityEnvelope(BaseModel):
     dependencies: Optional[List[str]]
     programming_language_metadata: ProgrammingLanguageMetadata
     trace_id: str
+    incremental_refresh: Optional[bool] = None
     model_config = ConfigDict(extra="allow")
 
     @property
     def extras(self) -> dict[str, Any]:
         return dict(self.model_extra or {})
+
+
+class CodebaseShard(BaseModel):
+    """Contiguous range of a codebase's sorted source paths, parsed by one activity."""
+
+    shard_index: int
+    first_path: str
+    last_path: str
+    file_count: int
+    total_bytes: int
+
+    def contains(self, file_path: str) -> bool:
+        return self.first_path <= file_path <= self.last_path
+
+
+class CodebaseShardPlan(BaseModel):
+    shards: List[CodebaseShard] = []
+
+
+class CodebaseShardProcessingEnvelope(CodebaseProcessingActivityEnvelope):
+    shard: CodebaseShard
+
+
+class CodebaseProcessingProgress(BaseModel):
+    """Heartbeat details of `process_codebase_generic`; ``files_committed`` spans attempts."""
+
+    files_committed: int = 0
+    files_written: int = 0
+    files_skipped: int = 0
+    checkpoints: int = 0
+    elapsed_seconds: float = 0.0
+    files_per_second: float = 0.0
+    # Last path, in sorted order, through which every file was committed by
+    # this run; a resumed full refresh skips exactly those files.
+    committed_through: Optional[str] = None
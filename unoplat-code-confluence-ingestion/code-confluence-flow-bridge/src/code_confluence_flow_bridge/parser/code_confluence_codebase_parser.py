@@ -3,13 +3,19 @@
 from __future__ import annotations
 
 import os
-from collections.abc import Iterable, Iterator
+import asyncio
+from bisect import bisect_right
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+import contextlib
+from dataclasses import dataclass
+import hashlib
 from itertools import chain
 from pathlib import Path
+import time
 from typing import Dict, List, Optional, Set, cast
 
 from loguru import logger
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session
 from unoplat_code_confluence_commons.base_models import (
     CallExpressionInfo,
     ProgrammingLanguageMetadata,
@@ -19,30 +25,61 @@ from unoplat_code_confluence_commons.base_models import (
 from code_confluence_flow_bridge.engine.framework_detection_service import (
     FrameworkDetectionService,
 )
+from code_confluence_flow_bridge.engine.framework_feature_index import (
+    get_framework_feature_index,
+)
 from code_confluence_flow_bridge.engine.programming_language.python.python_framework_detection_service import (
     PythonFrameworkDetectionService,
 )
 from code_confluence_flow_bridge.engine.programming_language.typescript.typescript_framework_detection_service import (
     TypeScriptFrameworkDetectionService,
 )
+from code_confluence_flow_bridge.models.code_confluence_parsing_models.unoplat_file import (
+    UnoplatFile,
+)
 from code_confluence_flow_bridge.models.configuration.settings import (
     EnvironmentSettings,
 )
+from code_confluence_flow_bridge.models.workflow.repo_workflow_base import (
+    CodebaseProcessingProgress,
+    CodebaseShard,
+)
+from code_confluence_flow_bridge.parser.codebase_sharding import (
+    measure_file_sizes,
+    split_into_shards,
+)
 from code_confluence_flow_bridge.parser.language_processors.base import (
     LanguageCodebaseProcessor,
 )
 from code_confluence_flow_bridge.parser.language_processors.language_processor_context import (
     LanguageProcessorContext,
 )
+from code_confluence_flow_bridge.parser.language_processors.parse_cache import (
+    ParseCacheConfig,
+    default_parse_cache_path,
+    open_parse_cache,
+    parse_cache_namespace,
+)
+from code_confluence_flow_bridge.parser.language_processors.process_pool_engine import (
+    ProcessPoolParsingEngine,
+)
 from code_confluence_flow_bridge.parser.language_processors.python_processor import (
     PythonLanguageProcessor,
 )
 from code_confluence_flow_bridge.parser.language_processors.typescript_processor import (
     TypeScriptLanguageProcessor,
 )
+from code_confluence_flow_bridge.parser.parsing_runtime import ParsingRuntime
+from code_confluence_flow_bridge.parser.repository_inventory import (
+    RepositoryInventory,
+)
+from code_confluence_flow_bridge.processor.db.postgres.code_confluence_batch_writer import (
+    CodeConfluenceFileBatchWriter,
+)
 from code_confluence_flow_bridge.processor.db.postgres.code_confluence_relational_ingestion import (
     CodeConfluenceRelationalIngestion,
 )
+from code_confluence_flow_bridge.processor.db.postgres.db import get_session_cm
 
 LOW_CONFIDENCE_CALL_EXPRESSION_THRESHOLD = 0.70
 
@@ -82,6 +119,63 @@ DEFAULT_IGNORED_DIRECTORY_NAMES: frozenset[str] = frozenset(
 )
 
 
+_InsertionItem = tuple[UnoplatFile, list[dict[str, object]]]
+
+
+@dataclass
+class ParserStageTimings:
+    """Cumulative per-stage timings for one `process_files` run.
+
+    Attributes:
+        parse_seconds: Time the producer spent waiting on the language processor.
+        db_write_seconds: Time the writer task spent inside batch upserts.
+        backpressure_seconds: Time the producer was blocked on a full queue.
+        writer_idle_seconds: Time the writer task waited on an empty queue.
+        wall_seconds: End-to-end duration of the run.
+    """
+
+    parse_seconds: float = 0.0
+    db_write_seconds: float = 0.0
+    backpressure_seconds: float = 0.0
+    writer_idle_seconds: float = 0.0
+    wall_seconds: float = 0.0
+
+    @property
+    def bound_by(self) -> str:
+        """Return ``"db"`` when parsing waited on writes, otherwise ``"cpu"``."""
+        if self.backpressure_seconds > self.writer_idle_seconds:
+            return "db"
+        return "cpu"
+
+
+class _CommitMarker:
+    """Tracks the last file through which a full refresh has committed every file.
+
+    Files are written out of order, so the marker only advances over the
+    sorted prefix that is completely committed. A file that fails to parse is
+    never committed and holds the marker back; files after it are parsed
+    again on resume.
+    """
+
+    def __init__(
+        self, pending_paths: List[str], committed_through: Optional[str]
+    ) -> None:
+        self._pending_paths = pending_paths
+        self._committed: Set[str] = set()
+        self._next_index = 0
+        self.committed_through = committed_through
+
+    def mark_committed(self, file_paths: Iterable[str]) -> None:
+        self._committed.update(file_paths)
+        while (
+            self._next_index < len(self._pending_paths)
+            and self._pending_paths[self._next_index] in self._committed
+        ):
+            self.committed_through = self._pending_paths[self._next_index]
+            self._committed.discard(self.committed_through)
+            self._next_index += 1
+
+
 def _resolve_match_confidence(detection: object) -> float:
     metadata = getattr(detection, "metadata", None)
     if not isinstance(metadata, dict):
@@ -132,6 +226,28 @@ def _build_evidence_json(detection: object) -> Optional[dict[str, object]]:
     return evidence
 
 
+def _select_changed_files(
+    file_paths: Iterable[str], stored_checksums: Dict[str, Optional[str]]
+) -> List[str]:
+    """Return paths that are new or whose md5 differs from the stored checksum."""
+    changed_paths: List[str] = []
+    for file_path in file_paths:
+        stored_checksum = stored_checksums.get(file_path)
+        if stored_checksum is None:
+            changed_paths.append(file_path)
+            continue
+        try:
+            with open(file_path, "rb") as source_file:
+                checksum = hashlib.md5(source_file.read()).hexdigest()
+        except OSError:
+            # Let the language processor surface the read error.
+            changed_paths.append(file_path)
+            continue
+        if checksum != stored_checksum:
+            changed_paths.append(file_path)
+    return changed_paths
+
+
 class CodeConfluenceCodebaseParser:
     """
     Language-agnostic codebase parser with PostgreSQL ingestion.
@@ -147,28 +263,71 @@ class CodeConfluenceCodebaseParser:
         root_packages: List[str],
         programming_language_metadata: ProgrammingLanguageMetadata,
         trace_id: str,
-        session: AsyncSession,
+        session: AsyncSession | async_scoped_session[AsyncSession],
         *,
         code_confluence_env: Optional[EnvironmentSettings] = None,
+        repository_inventory: Optional[RepositoryInventory] = None,
+        parsing_runtime: Optional[ParsingRuntime] = None,
+        resume_from: Optional[CodebaseProcessingProgress] = None,
+        progress_callback: Optional[
+            Callable[[CodebaseProcessingProgress], None]
+        ] = None,
+        shard: Optional[CodebaseShard] = None,
+        incremental_refresh: Optional[bool] = None,
     ) -> None:
         self.codebase_name = codebase_name
         self.codebase_path = Path(codebase_path)
         self.root_packages = root_packages
         self.programming_language_metadata = programming_language_metadata
         self.trace_id = trace_id
-        self.session = session
+        # Falls back to the snapshot persisted by the git activity, and then to
+        # walking the codebase, when not supplied.
+        self.repository_inventory = repository_inventory
+        # Worker-wide detection services, catalog and process pool; without it
+        # each parser builds (and tears down) its own.
+        self.parsing_runtime = parsing_runtime
+        # Progress heartbeated by a previous attempt of the same activity, and
+        # the hook reporting this attempt's progress after every flush.
+        self.resume_from = resume_from
+        self.progress_callback = progress_callback
+        # Restricts parsing to one shard's path range; codebase frameworks are
+        # then recorded by the merge step once every shard has finished.
+        self.shard = shard
+        # Writes run on a dedicated writer task. A task-scoped session proxy
+        # would hand that task a fresh session outside the caller's open
+        # transaction, so pin the session owned by the constructing task.
+        if isinstance(session, async_scoped_session):
+            session = session()
+        self.session: AsyncSession = session
         self.ingestion = CodeConfluenceRelationalIngestion(session)
 
         self.framework_detection_service: Optional[FrameworkDetectionService] = None
+        if code_confluence_env is None and parsing_runtime is not None:
+            code_confluence_env = parsing_runtime.settings
         self.config: EnvironmentSettings = (
             code_confluence_env
             if code_confluence_env is not None
             else EnvironmentSettings()
         )
+        # Push-triggered refreshes ask for incremental parsing explicitly;
+        # otherwise the deployment-wide setting decides.
+        self.incremental_refresh: bool = (
+            self.config.codebase_parser_incremental_refresh
+            if incremental_refresh is None
+            else incremental_refresh
+        )
 
         self.files_processed = 0
+        self.files_unchanged = 0
+        self.files_removed = 0
+        self.files_committed = 0
+        self.checkpoints = 0
+        self._commit_marker: Optional[_CommitMarker] = None
+        self.stage_timings = ParserStageTimings()
         self._known_frameworks: Set[str] = set()
         self._known_features: Set[tuple[str, str, str]] = set()
+        # Content hash of the framework catalog this run detects features with
+        self._catalog_version: Optional[str] = None
 
         self._initialize_components()
         self.language_processor: LanguageCodebaseProcessor = (
@@ -189,6 +348,12 @@ class CodeConfluenceCodebaseParser:
         )
 
     def _initialize_components(self) -> None:
+        if self.framework_detection_service is None and self.parsing_runtime is not None:
+            self.framework_detection_service = (
+                self.parsing_runtime.framework_detection_service(
+                    self.programming_language_metadata.language.value
+                )
+            )
         if self.framework_detection_service is None:
             if self.programming_language_metadata.language.value == "python":
                 self.framework_detection_service = PythonFrameworkDetectionService()
@@ -251,6 +416,22 @@ class CodeConfluenceCodebaseParser:
         root_path = self.codebase_path.resolve()
         supported_extensions = self.language_processor.supported_extensions
 
+        inventory = self.repository_inventory or RepositoryInventory.load_snapshot(
+            root_path
+        )
+        if inventory is not None and inventory.covers(root_path):
+            logger.debug(
+                "Discovering source files from repository inventory | root={} | head={}",
+                inventory.root,
+                inventory.head,
+            )
+            for file_path in inventory.files_under(root_path, supported_extensions):
+                if self._should_ignore_file(file_path):
+                    logger.debug("Ignoring file: {}", file_path)
+                    continue
+                yield str(file_path.resolve())
+            return
+
         for current_root, dirnames, filenames in os.walk(root_path):
             dirnames[:] = [
                 dirname
@@ -274,12 +455,19 @@ class CodeConfluenceCodebaseParser:
 
     async def _load_framework_catalog(self) -> None:
         language = self.programming_language_metadata.language.value
-        self._known_frameworks = set(
-            await self.ingestion.get_framework_libraries_for_language(language)
-        )
-        self._known_features = set(
-            await self.ingestion.get_framework_features_for_language(language)
-        )
+        if self.parsing_runtime is not None:
+            catalog = await self.parsing_runtime.get_framework_catalog(
+                language, self.ingestion
+            )
+            self._known_frameworks = set(catalog.frameworks)
+            self._known_features = set(catalog.features)
+        else:
+            self._known_frameworks = set(
+                await self.ingestion.get_framework_libraries_for_language(language)
+            )
+            self._known_features = set(
+                await self.ingestion.get_framework_features_for_language(language)
+            )
         logger.debug(
             "Loaded framework catalog | language={} | frameworks={} | features={}",
             language,
@@ -287,19 +475,317 @@ class CodeConfluenceCodebaseParser:
             len(self._known_features),
         )
 
+    async def _open_parse_cache(self) -> Optional[ParseCacheConfig]:
+        """Open the content-addressed parse cache when configured.
+
+        The namespace pins the framework catalog version, so detections cached
+        against an older catalog are never replayed. An empty catalog (for
+        example after a failed load) disables caching for this run.
+        """
+        max_mb = self.config.codebase_parser_parse_cache_max_mb
+        if max_mb <= 0:
+            return None
+
+        language = self.programming_language_metadata.language.value
+        catalog_version: Optional[str] = None
+        if self.framework_detection_service is not None:
+            feature_index = await get_framework_feature_index(language)
+            if not len(feature_index):
+                return None
+            catalog_version = feature_index.catalog_version
+
+        parse_cache_config = ParseCacheConfig(
+            path=str(default_parse_cache_path(self.config.repositories_base_path)),
+            max_bytes=max_mb * 1024 * 1024,
+            namespace=parse_cache_namespace(language, catalog_version),
+        )
+        parse_cache = await asyncio.to_thread(open_parse_cache, parse_cache_config)
+        if parse_cache is None:
+            return None
+        self.language_processor.context.parse_cache = parse_cache
+        return parse_cache_config
+
+    async def _close_parse_cache(self) -> None:
+        context = self.language_processor.context
+        parse_cache, context.parse_cache = context.parse_cache, None
+        if parse_cache is None:
+            return
+        logger.info(
+            "Parse cache usage | codebase={} | hits={} | misses={}",
+            self.codebase_name,
+            parse_cache.hits,
+            parse_cache.misses,
+        )
+        await asyncio.to_thread(parse_cache.close)
+
+    @contextlib.asynccontextmanager
+    async def _parsing_engine_scope(
+        self, parse_cache_config: Optional[ParseCacheConfig] = None
+    ) -> AsyncIterator[Optional[ProcessPoolParsingEngine]]:
+        """Attach a process-pool engine when configured, else parse on threads.
+
+        With a parsing runtime the worker-wide engine is leased and outlives
+        this codebase; otherwise one is started here and shut down on exit.
+        """
+        language = self.programming_language_metadata.language.value
+        detect_frameworks = self.framework_detection_service is not None
+        context = self.language_processor.context
+
+        if self.parsing_runtime is not None:
+            async with self.parsing_runtime.lease_parsing_engine(
+                language,
+                detect_frameworks=detect_frameworks,
+                parse_cache_config=parse_cache_config,
+            ) as parsing_engine:
+                self._attach_parsing_engine(parsing_engine)
+                try:
+                    yield parsing_engine
+                finally:
+                    context.parsing_engine = None
+            return
+
+        max_workers = self.config.codebase_parser_process_pool_workers
+        if max_workers <= 0:
+            yield None
+            return
+
+        feature_specs = (
+            (await get_framework_feature_index(language)).feature_specs
+            if detect_frameworks
+            else ()
+        )
+        parsing_engine = ProcessPoolParsingEngine(
+            language,
+            max_workers,
+            feature_specs,
+            detect_frameworks=detect_frameworks,
+            parse_cache_config=parse_cache_config,
+        )
+        self._attach_parsing_engine(parsing_engine)
+        try:
+            yield parsing_engine
+        finally:
+            context.parsing_engine = None
+            await asyncio.to_thread(parsing_engine.shutdown)
+
+    def _attach_parsing_engine(
+        self, parsing_engine: Optional[ProcessPoolParsingEngine]
+    ) -> None:
+        if parsing_engine is None:
+            return
+        # Keep every worker busy while the parent awaits results.
+        context = self.language_processor.context
+        context.parsing_engine = parsing_engine
+        context.concurrency_limit = max(
+            context.concurrency_limit, parsing_engine.max_workers * 2
+        )
+
+    async def _catalog_changed(
+        self, ingestion: CodeConfluenceRelationalIngestion
+    ) -> bool:
+        """Whether the codebase's features were detected with another catalog."""
+        self._catalog_version = await ingestion.get_framework_catalog_version()
+        stored_version = await ingestion.get_codebase_catalog_version(
+            self.codebase_name
+        )
+        return stored_version != self._catalog_version
+
+    async def _record_catalog_version(self) -> None:
+        if self._catalog_version is None:
+            return
+        async with self._write_scope() as ingestion:
+            await ingestion.upsert_codebase_catalog_version(
+                self.codebase_name, self._catalog_version
+            )
+
+    async def _plan_incremental_refresh(self, discovered_paths: List[str]) -> List[str]:
+        """Delete rows for removed files and return only added or modified paths.
+
+        Stored checksums are compared with the files on disk, so unchanged files
+        are neither parsed nor rewritten. Modified files lose their previous
+        feature spans because detections are rebuilt from scratch. When the
+        framework catalog changed since the codebase was last parsed, every
+        file is returned so detections reflect the new catalog.
+        """
+        async with self._write_scope() as ingestion:
+            catalog_changed = await self._catalog_changed(ingestion)
+            stored_checksums = await ingestion.get_file_checksums(self.codebase_name)
+            if not stored_checksums:
+                return discovered_paths
+
+            if catalog_changed:
+                logger.info(
+                    "Framework catalog changed, re-parsing every file | codebase={} | catalog_version={}",
+                    self.codebase_name,
+                    self._catalog_version,
+                )
+                changed_paths = discovered_paths
+            else:
+                changed_paths = await asyncio.to_thread(
+                    _select_changed_files, discovered_paths, stored_checksums
+                )
+            removed_paths = stored_checksums.keys() - set(discovered_paths)
+
+            await ingestion.delete_files(removed_paths)
+            await ingestion.delete_file_features(
+                [path for path in changed_paths if path in stored_checksums]
+            )
+
+        self.files_unchanged = len(discovered_paths) - len(changed_paths)
+        self.files_removed = len(removed_paths)
+        logger.info(
+            "Incremental refresh plan | codebase={} | discovered={} | changed={} | unchanged={} | removed={}",
+            self.codebase_name,
+            len(discovered_paths),
+            len(changed_paths),
+            self.files_unchanged,
+            self.files_removed,
+        )
+        return changed_paths
+
+    async def _skip_stored_files(self, discovered_paths: List[str]) -> List[str]:
+        """Skip files whose stored checksum still matches the one on disk.
+
+        Used by incremental shards whose removed files the shard planner already
+        deleted; a resumed attempt thereby also skips what its predecessor
+        committed. Nothing is skipped while the codebase's catalog version is
+        stale, because the planner then cleared every file's features; the
+        merge step records the new version once all shards are stored.
+        """
+        if await self._catalog_changed(self.ingestion):
+            return discovered_paths
+        stored_checksums = await self.ingestion.get_file_checksums(self.codebase_name)
+        pending_paths = await asyncio.to_thread(
+            _select_changed_files, discovered_paths, stored_checksums
+        )
+        self.files_unchanged = len(discovered_paths) - len(pending_paths)
+        logger.info(
+            "Skipping stored files | codebase={} | shard={} | committed_before={} | skipped={} | remaining={}",
+            self.codebase_name,
+            self.shard.shard_index if self.shard else None,
+            self.resume_from.files_committed if self.resume_from else 0,
+            self.files_unchanged,
+            len(pending_paths),
+        )
+        return pending_paths
+
+    def _skip_committed_files(self, discovered_paths: List[str]) -> List[str]:
+        """Return the files a checkpointed full refresh still has to write, sorted.
+
+        Only files through the previous attempt's ``committed_through`` marker
+        are skipped. Stored rows prove nothing here: they may predate this run.
+        """
+        committed_through = (
+            self.resume_from.committed_through if self.resume_from else None
+        )
+        ordered_paths = sorted(discovered_paths)
+        skipped = (
+            bisect_right(ordered_paths, committed_through)
+            if committed_through is not None
+            else 0
+        )
+        pending_paths = ordered_paths[skipped:]
+        self._commit_marker = _CommitMarker(pending_paths, committed_through)
+        self.files_unchanged = skipped
+        if skipped:
+            logger.info(
+                "Skipping committed files | codebase={} | shard={} | committed_through={} | skipped={} | remaining={}",
+                self.codebase_name,
+                self.shard.shard_index if self.shard else None,
+                committed_through,
+                skipped,
+                len(pending_paths),
+            )
+        return pending_paths
+
+    async def plan_shards(self) -> List[CodebaseShard]:
+        """Split the codebase into byte-balanced shards for parallel activities.
+
+        Returns no shards when sharding is disabled or the codebase fits in a
+        single shard. With incremental refresh, rows of removed files are
+        deleted here once and the shards cover only the changed files.
+        """
+        target_mb = self.config.codebase_parser_shard_target_mb
+        if target_mb <= 0:
+            return []
+        target_bytes = target_mb * 1024 * 1024
+
+        discovered_paths = list(self.discover_source_files())
+        sized_paths = await asyncio.to_thread(measure_file_sizes, discovered_paths)
+        if sum(size for _, size in sized_paths) <= target_bytes:
+            return []
+        if self.incremental_refresh:
+            changed_paths = set(
+                await self._plan_incremental_refresh(discovered_paths)
+            )
+            sized_paths = [item for item in sized_paths if item[0] in changed_paths]
+
+        shards = split_into_shards(
+            sized_paths, target_bytes, self.config.codebase_parser_max_shards
+        )
+        if len(shards) <= 1:
+            return []
+        logger.info(
+            "Planned codebase shards | codebase={} | files={} | shards={} | max_shard_mb={:.1f}",
+            self.codebase_name,
+            len(sized_paths),
+            len(shards),
+            max(shard.total_bytes for shard in shards) / (1024 * 1024),
+        )
+        return shards
+
     async def process_and_insert_codebase(self) -> None:
         try:
             logger.info("Starting codebase processing: {}", self.codebase_name)
 
             discovered_files = self.discover_source_files()
+            shard = self.shard
+            if shard is not None:
+                discovered_files = (
+                    file_path
+                    for file_path in discovered_files
+                    if shard.contains(file_path)
+                )
+            incremental_refresh = self.incremental_refresh
+            if incremental_refresh and shard is None:
+                discovered_files = iter(
+                    await self._plan_incremental_refresh(list(discovered_files))
+                )
+            elif incremental_refresh:
+                discovered_files = iter(
+                    await self._skip_stored_files(list(discovered_files))
+                )
+            elif self._checkpointing:
+                discovered_files = iter(
+                    self._skip_committed_files(list(discovered_files))
+                )
+            if shard is None and not incremental_refresh:
+                self._catalog_version = (
+                    await self.ingestion.get_framework_catalog_version()
+                )
             try:
                 first_file_path = next(discovered_files)
             except StopIteration:
-                logger.warning("No source files found in {}", self.codebase_path)
+                logger.warning(
+                    "No source files to process in {} | unchanged={} | removed={}",
+                    self.codebase_path,
+                    self.files_unchanged,
+                    self.files_removed,
+                )
                 return
 
             await self._load_framework_catalog()
-            await self.process_files(chain([first_file_path], discovered_files))
+            parse_cache_config = await self._open_parse_cache()
+            try:
+                async with self._parsing_engine_scope(parse_cache_config):
+                    await self.process_files(
+                        chain([first_file_path], discovered_files)
+                    )
+            finally:
+                await self._close_parse_cache()
+            # Shards leave this to the merge step, once every shard is stored
+            if shard is None:
+                await self._record_catalog_version()
 
             logger.info("Completed codebase processing: {} files", self.files_processed)
 
@@ -309,86 +795,303 @@ class CodeConfluenceCodebaseParser:
             )
             raise
 
-    async def process_files(self, file_paths: Iterable[str]) -> None:
-        frameworks_used: Set[tuple[str, str]] = set()
+    def _build_feature_rows(
+        self,
+        file_data: UnoplatFile,
+        frameworks_used: Set[tuple[str, str]],
+    ) -> list[dict[str, object]]:
         language = self.programming_language_metadata.language.value
+        feature_rows: list[dict[str, object]] = []
+        detections = file_data.custom_features_list or []
+        logger.opt(lazy=True).debug(
+            "File detections | file={} | count={} | frameworks={} | features={}",
+            lambda: file_data.file_path,
+            lambda: len(detections),
+            lambda: len(self._known_frameworks),
+            lambda: len(self._known_features),
+        )
+        for detection in detections:
+            library = detection.library
+            capability_key = detection.capability_key
+            operation_key = detection.operation_key
+            feature_key = detection.feature_key
 
-        async for file_data in self.language_processor.iter_files(file_paths):
-            await self.ingestion.upsert_files(self.codebase_name, [file_data])
+            if library not in self._known_frameworks:
+                logger.debug(
+                    "Skipping unknown framework | library={} | file={}",
+                    library,
+                    file_data.file_path,
+                )
+                continue
 
-            detections = file_data.custom_features_list or []
-            logger.opt(lazy=True).debug(
-                "File detections | file={} | count={} | frameworks={} | features={}",
-                lambda: file_data.file_path,
-                lambda: len(detections),
-                lambda: len(self._known_frameworks),
-                lambda: len(self._known_features),
+            if (
+                library,
+                capability_key,
+                operation_key,
+            ) not in self._known_features:
+                logger.debug(
+                    "Skipping unknown feature | library={} | capability_key={} | operation_key={} | file={}",
+                    library,
+                    capability_key,
+                    operation_key,
+                    file_data.file_path,
+                )
+                continue
+
+            logger.debug(
+                "Storing feature | library={} | feature_key={} | file={} | lines={}-{}",
+                library,
+                feature_key,
+                file_data.file_path,
+                detection.start_line,
+                detection.end_line,
             )
-            if detections:
-                feature_rows: list[dict[str, object]] = []
-                for detection in detections:
-                    library = detection.library
-                    capability_key = detection.capability_key
-                    operation_key = detection.operation_key
-                    feature_key = detection.feature_key
-
-                    if library not in self._known_frameworks:
-                        logger.debug(
-                            "Skipping unknown framework | library={} | file={}",
-                            library,
-                            file_data.file_path,
-                        )
-                        continue
-
-                    if (
-                        library,
-                        capability_key,
-                        operation_key,
-                    ) not in self._known_features:
-                        logger.debug(
-                            "Skipping unknown feature | library={} | capability_key={} | operation_key={} | file={}",
-                            library,
-                            capability_key,
-                            operation_key,
-                            file_data.file_path,
-                        )
-                        continue
-
-                    logger.debug(
-                        "Storing feature | library={} | feature_key={} | file={} | lines={}-{}",
-                        library,
-                        feature_key,
-                        file_data.file_path,
-                        detection.start_line,
-                        detection.end_line,
-                    )
 
-                    match_confidence = _resolve_match_confidence(detection)
-                    feature_rows.append(
-                        {
-                            "feature_language": language,
-                            "feature_library": library,
-                            "feature_capability_key": capability_key,
-                            "feature_operation_key": operation_key,
-                            "start_line": detection.start_line,
-                            "end_line": detection.end_line,
-                            "match_text": detection.match_text,
-                            "match_confidence": match_confidence,
-                            "validation_status": _resolve_validation_status(
-                                detection,
-                                match_confidence=match_confidence,
-                            ),
-                            "evidence_json": _build_evidence_json(detection),
-                        }
-                    )
-                    frameworks_used.add((language, library))
+            match_confidence = _resolve_match_confidence(detection)
+            feature_rows.append(
+                {
+                    "feature_language": language,
+                    "feature_library": library,
+                    "feature_capability_key": capability_key,
+                    "feature_operation_key": operation_key,
+                    "start_line": detection.start_line,
+                    "end_line": detection.end_line,
+                    "match_text": detection.match_text,
+                    "match_confidence": match_confidence,
+                    "validation_status": _resolve_validation_status(
+                        detection,
+                        match_confidence=match_confidence,
+                    ),
+                    "evidence_json": _build_evidence_json(detection),
+                }
+            )
+            frameworks_used.add((language, library))
+
+        return feature_rows
+
+    @staticmethod
+    async def _enqueue_for_insertion(
+        queue: asyncio.Queue[Optional[_InsertionItem]],
+        item: Optional[_InsertionItem],
+        writer_task: asyncio.Task[None],
+    ) -> None:
+        """Put an item on the insertion queue without outliving a failed writer."""
+        if not queue.full():
+            queue.put_nowait(item)
+            return
+
+        put_task = asyncio.ensure_future(queue.put(item))
+        done, _ = await asyncio.wait(
+            {put_task, writer_task}, return_when=asyncio.FIRST_COMPLETED
+        )
+        if put_task in done:
+            return
+
+        put_task.cancel()
+        # The writer only stops early when it raised; surface that error here.
+        writer_task.result()
+        raise RuntimeError("Insertion writer stopped before the queue was drained")
 
-                if feature_rows:
-                    await self.ingestion.upsert_file_features(
-                        file_data.file_path, feature_rows
+    @property
+    def _checkpointing(self) -> bool:
+        return self.config.codebase_parser_checkpoint_files > 0
+
+    @contextlib.asynccontextmanager
+    async def _write_scope(self) -> AsyncIterator[CodeConfluenceRelationalIngestion]:
+        """Yield the ingestion the next unit of writes goes through.
+
+        Without checkpoints every write joins the caller's transaction. With
+        them each unit runs in its own short-lived session that commits on
+        exit, because the caller's session sits inside ``get_session_cm``'s
+        ``begin()`` block and cannot be committed early.
+        """
+        if not self._checkpointing:
+            yield self.ingestion
+            return
+        async with get_session_cm() as session:
+            yield CodeConfluenceRelationalIngestion(session)
+
+    def _record_checkpoint(
+        self,
+        writer: CodeConfluenceFileBatchWriter,
+        window_paths: List[str],
+        *,
+        final: bool,
+    ) -> None:
+        """Account for a committed window so a retry can resume after it."""
+        self.files_committed = writer.files_written
+        if self._commit_marker is not None:
+            self._commit_marker.mark_committed(window_paths)
+        if final:
+            return
+        self.checkpoints += 1
+        logger.info(
+            "Committed ingestion checkpoint | codebase={} | files_committed={} | checkpoints={}",
+            self.codebase_name,
+            self.files_committed,
+            self.checkpoints,
+        )
+
+    def _report_progress(
+        self, writer: CodeConfluenceFileBatchWriter, run_started: float
+    ) -> None:
+        if self.progress_callback is None:
+            return
+        previous = self.resume_from or CodebaseProcessingProgress()
+        elapsed_seconds = time.perf_counter() - run_started
+        self.progress_callback(
+            CodebaseProcessingProgress(
+                files_committed=previous.files_committed + self.files_committed,
+                files_written=writer.files_written,
+                files_skipped=self.files_unchanged,
+                checkpoints=previous.checkpoints + self.checkpoints,
+                elapsed_seconds=elapsed_seconds,
+                files_per_second=(
+                    writer.files_written / elapsed_seconds if elapsed_seconds else 0.0
+                ),
+                committed_through=(
+                    self._commit_marker.committed_through
+                    if self._commit_marker is not None
+                    else previous.committed_through
+                ),
+            )
+        )
+
+    async def _drain_insertion_queue(
+        self,
+        queue: asyncio.Queue[Optional[_InsertionItem]],
+        writer: CodeConfluenceFileBatchWriter,
+        timings: ParserStageTimings,
+        frameworks_used: Set[tuple[str, str]],
+        run_started: float,
+    ) -> None:
+        drained = False
+        while not drained:
+            window_paths: List[str] = []
+            # A single window in the caller's transaction unless checkpointing.
+            async with self._write_scope() as ingestion:
+                writer.ingestion = ingestion
+                drained = await self._drain_checkpoint_window(
+                    queue, writer, timings, window_paths, run_started
+                )
+                # Frameworks are otherwise stored once at the end; a resumed
+                # attempt skips the committed files and would never see their
+                # frameworks again.
+                if self._checkpointing and frameworks_used and self.shard is None:
+                    await ingestion.upsert_codebase_frameworks(
+                        self.codebase_name, set(frameworks_used)
                     )
+            if self._checkpointing:
+                self._record_checkpoint(writer, window_paths, final=drained)
+                if not drained:
+                    self._report_progress(writer, run_started)
+
+    async def _drain_checkpoint_window(
+        self,
+        queue: asyncio.Queue[Optional[_InsertionItem]],
+        writer: CodeConfluenceFileBatchWriter,
+        timings: ParserStageTimings,
+        window_paths: List[str],
+        run_started: float,
+    ) -> bool:
+        """Write queued files until a checkpoint is due; ``True`` once drained."""
+        checkpoint_files = self.config.codebase_parser_checkpoint_files
+        while True:
+            wait_started = time.perf_counter()
+            item = await queue.get()
+            timings.writer_idle_seconds += time.perf_counter() - wait_started
+            if item is None:
+                break
+
+            window_paths.append(item[0].file_path)
+            write_started = time.perf_counter()
+            flush_count = writer.flush_count
+            await writer.add(*item)
+            timings.db_write_seconds += time.perf_counter() - write_started
+            if writer.flush_count == flush_count:
+                continue
+            if (
+                checkpoint_files
+                and writer.files_written - self.files_committed >= checkpoint_files
+            ):
+                return False
+            self._report_progress(writer, run_started)
+
+        write_started = time.perf_counter()
+        await writer.flush()
+        timings.db_write_seconds += time.perf_counter() - write_started
+        return True
+
+    async def process_files(self, file_paths: Iterable[str]) -> None:
+        """Parse files and stream them to a dedicated writer task.
+
+        Parsing and database writes overlap: the language processor keeps
+        producing while the writer flushes batches, and the bounded insertion
+        queue applies backpressure when PostgreSQL falls behind.
+        """
+        frameworks_used: Set[tuple[str, str]] = set()
+        timings = ParserStageTimings()
+        self.stage_timings = timings
+
+        writer = CodeConfluenceFileBatchWriter(
+            self.ingestion,
+            self.codebase_name,
+            file_batch_size=self.config.codebase_parser_file_batch_size,
+        )
+        queue: asyncio.Queue[Optional[_InsertionItem]] = asyncio.Queue(
+            maxsize=self.config.codebase_parser_insertion_queue_size
+        )
+        run_started = time.perf_counter()
+        writer_task = asyncio.create_task(
+            self._drain_insertion_queue(
+                queue, writer, timings, frameworks_used, run_started
+            ),
+            name=f"codebase-writer-{self.codebase_name}",
+        )
+
+        try:
+            parse_started = time.perf_counter()
+            async for file_data in self.language_processor.iter_files(file_paths):
+                timings.parse_seconds += time.perf_counter() - parse_started
+
+                feature_rows = self._build_feature_rows(file_data, frameworks_used)
+
+                enqueue_started = time.perf_counter()
+                await self._enqueue_for_insertion(
+                    queue, (file_data, feature_rows), writer_task
+                )
+                timings.backpressure_seconds += (
+                    time.perf_counter() - enqueue_started
+                )
+                parse_started = time.perf_counter()
+
+            await self._enqueue_for_insertion(queue, None, writer_task)
+            await writer_task
+        except BaseException:
+            if not writer_task.done():
+                writer_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await writer_task
+            raise
+        finally:
+            timings.wall_seconds = time.perf_counter() - run_started
+
+        logger.info(
+            "Codebase ingestion timings | codebase={} | files={} | feature_rows={} | flushes={} | wall_s={:.2f} | parse_s={:.2f} | db_write_s={:.2f} | backpressure_s={:.2f} | writer_idle_s={:.2f} | bound_by={}",
+            self.codebase_name,
+            writer.files_written,
+            writer.feature_rows_written,
+            writer.flush_count,
+            timings.wall_seconds,
+            timings.parse_seconds,
+            timings.db_write_seconds,
+            timings.backpressure_seconds,
+            timings.writer_idle_seconds,
+            timings.bound_by,
+        )
 
-        if frameworks_used:
+        if frameworks_used and self.shard is None and not self._checkpointing:
             await self.ingestion.upsert_codebase_frameworks(
                 self.codebase_name, frameworks_used
             )
+        self._report_progress(writer, run_started)
@@ -0,0 +1,88 @@
+"""Split a codebase's source files into byte-balanced shards.
+
+A shard is a contiguous range of the sorted file paths rather than an explicit
+file list: Temporal payloads stay small for monorepos with 100k files, and
+every shard activity rediscovers the same files from the shared checkout and
+keeps the ones inside its range. Contiguous ranges also keep a directory's
+files together, which helps the parse cache and the database's index locality.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable, Sequence
+import math
+
+from code_confluence_flow_bridge.models.workflow.repo_workflow_base import (
+    CodebaseShard,
+)
+
+
+def measure_file_sizes(file_paths: Iterable[str]) -> list[tuple[str, int]]:
+    """Return ``(path, size in bytes)`` pairs sorted by path.
+
+    Unreadable files count as empty; the shard that owns them surfaces the
+    read error when it parses them.
+    """
+    sized_paths: list[tuple[str, int]] = []
+    for file_path in file_paths:
+        try:
+            size = os.path.getsize(file_path)
+        except OSError:
+            size = 0
+        sized_paths.append((file_path, size))
+    sized_paths.sort()
+    return sized_paths
+
+
+def split_into_shards(
+    sized_paths: Sequence[tuple[str, int]], target_bytes: int, max_shards: int
+) -> list[CodebaseShard]:
+    """Cut path-sorted ``sized_paths`` into ranges of roughly equal byte size.
+
+    The shard count is the total size divided by ``target_bytes``, capped at
+    ``max_shards`` and at the number of files, so a single shard is returned
+    when the codebase is smaller than ``target_bytes``.
+    """
+    if not sized_paths:
+        return []
+    if target_bytes <= 0 or max_shards <= 0:
+        raise ValueError(
+            f"Invalid shard bounds target_bytes={target_bytes} max_shards={max_shards}"
+        )
+
+    total_bytes = sum(size for _, size in sized_paths)
+    shard_count = max(
+        1, min(max_shards, len(sized_paths), math.ceil(total_bytes / target_bytes))
+    )
+    bytes_per_shard = total_bytes / shard_count
+
+    shards: list[CodebaseShard] = []
+    start = 0
+    shard_bytes = 0
+    for index, (_, size) in enumerate(sized_paths):
+        shard_bytes += size
+        remaining_files = len(sized_paths) - index - 1
+        remaining_shards = shard_count - len(shards) - 1
+        if remaining_files and remaining_shards <= 0:
+            continue
+        if remaining_files > remaining_shards:
+            # Cut at whichever boundary lands closer to the per-shard target,
+            # unless every remaining file is needed to fill the last shards.
+            next_size = sized_paths[index + 1][1]
+            undershoot = bytes_per_shard - shard_bytes
+            overshoot = shard_bytes + next_size - bytes_per_shard
+            if undershoot > 0 and overshoot <= undershoot:
+                continue
+        shards.append(
+            CodebaseShard(
+                shard_index=len(shards),
+                first_path=sized_paths[start][0],
+                last_path=sized_paths[index][0],
+                file_count=index - start + 1,
+                total_bytes=shard_bytes,
+            )
+        )
+        start = index + 1
+        shard_bytes = 0
+    return shards
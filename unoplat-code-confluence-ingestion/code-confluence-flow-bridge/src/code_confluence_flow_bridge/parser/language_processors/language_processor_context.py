@@ -13,6 +13,12 @@ from code_confluence_flow_bridge.engine.framework_detection_service import (
 from code_confluence_flow_bridge.models.configuration.settings import (
     EnvironmentSettings,
 )
+from code_confluence_flow_bridge.parser.language_processors.parse_cache import (
+    ParseCache,
+)
+from code_confluence_flow_bridge.parser.language_processors.process_pool_engine import (
+    ProcessPoolParsingEngine,
+)
 
 
 class LanguageProcessorContext(BaseModel):
@@ -26,5 +32,7 @@ class LanguageProcessorContext(BaseModel):
     programming_language_metadata: ProgrammingLanguageMetadata
     env_config: EnvironmentSettings
     framework_detection_service: Optional[FrameworkDetectionService] = None
+    parsing_engine: Optional[ProcessPoolParsingEngine] = None
+    parse_cache: Optional[ParseCache] = None
     concurrency_limit: int
     increment_files_processed: Callable[[int], None]
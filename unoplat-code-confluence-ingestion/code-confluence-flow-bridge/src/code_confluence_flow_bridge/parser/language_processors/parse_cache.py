@@ -0,0 +1,247 @@
+"""Content-addressed cache of per-file parse results persisted across runs.
+
+Vendored and copied files recur across repositories and codebases, so parse
+results are keyed by the file's md5 checksum rather than its path. Each cache
+is opened for a namespace combining the language and the framework catalog
+version, which keeps detections from a previous catalog from being replayed.
+
+Entries live in a single SQLite file shared by every worker process of the
+host. Its total payload size is bounded and the least recently used entries
+are evicted once the bound is exceeded.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+import json
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+# Bump when the cached payload layout or the parsing pipeline output changes.
+PARSE_CACHE_SCHEMA_VERSION = 1
+PARSE_CACHE_FILE_NAME = "parse-cache.sqlite3"
+
+# Fields of a parsed-file payload that depend only on file content; the path
+# and checksum are supplied by the caller on a hit.
+CachedParse = Dict[str, Any]
+
+# Evict down to this fraction of the bound so eviction is not re-triggered by
+# every following insert.
+_EVICTION_TARGET_RATIO = 0.9
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS parse_cache_entries (
+    cache_key TEXT PRIMARY KEY,
+    payload BLOB NOT NULL,
+    payload_size INTEGER NOT NULL,
+    last_access_ns INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS parse_cache_entries_last_access
+    ON parse_cache_entries (last_access_ns);
+CREATE TABLE IF NOT EXISTS parse_cache_stats (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    total_size INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO parse_cache_stats (id, total_size) VALUES (1, 0);
+"""
+
+
+@dataclass(frozen=True)
+class ParseCacheConfig:
+    """Picklable description of a cache, so pool workers can open their own."""
+
+    path: str
+    max_bytes: int
+    namespace: str
+
+
+def default_parse_cache_path(repositories_base_path: str) -> Path:
+    """Return the cache file location under ``repositories_base_path``."""
+    return (
+        Path(os.path.expanduser(repositories_base_path))
+        / ".cache"
+        / PARSE_CACHE_FILE_NAME
+    )
+
+
+def parse_cache_namespace(language: str, catalog_version: Optional[str]) -> str:
+    """Build the namespace for ``language`` parsed against ``catalog_version``.
+
+    ``catalog_version`` is ``None`` when framework detection is disabled, which
+    yields payloads without detections and therefore a separate namespace.
+    """
+    return (
+        f"v{PARSE_CACHE_SCHEMA_VERSION}:{language}:{catalog_version or 'no-detection'}"
+    )
+
+
+class ParseCache:
+    """SQLite-backed, size-bounded LRU cache of parse payloads.
+
+    Lookups and writes never raise: a corrupt or locked cache degrades to a
+    miss and is logged, since parsing the file again is always correct.
+    """
+
+    def __init__(self, path: str | Path, max_bytes: int, namespace: str) -> None:
+        if max_bytes <= 0:
+            raise ValueError(f"Invalid max_bytes={max_bytes}; expected >= 1.")
+
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.namespace = namespace
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection: Optional[sqlite3.Connection] = sqlite3.connect(
+            self.path, timeout=30, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("PRAGMA mmap_size=268435456")
+        self._connection.executescript(_SCHEMA)
+
+    def _cache_key(self, checksum: str) -> str:
+        return f"{self.namespace}:{checksum}"
+
+    def get(self, checksum: str) -> Optional[CachedParse]:
+        """Return the payload cached for ``checksum`` and mark it recently used."""
+        if not checksum:
+            return None
+
+        cache_key = self._cache_key(checksum)
+        try:
+            with self._lock:
+                connection = self._require_connection()
+                row = connection.execute(
+                    "SELECT payload FROM parse_cache_entries WHERE cache_key = ?",
+                    (cache_key,),
+                ).fetchone()
+                if row is not None:
+                    connection.execute(
+                        "UPDATE parse_cache_entries SET last_access_ns = ? WHERE cache_key = ?",
+                        (time.time_ns(), cache_key),
+                    )
+        except sqlite3.Error as exc:
+            logger.warning(
+                "Parse cache lookup failed | path={} | error={}", self.path, exc
+            )
+            return None
+
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, checksum: str, payload: CachedParse) -> None:
+        """Store ``payload`` for ``checksum`` and evict LRU entries over the bound."""
+        if not checksum:
+            return
+
+        encoded = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        if len(encoded) > self.max_bytes:
+            return
+
+        cache_key = self._cache_key(checksum)
+        try:
+            with self._lock:
+                connection = self._require_connection()
+                connection.execute("BEGIN IMMEDIATE")
+                try:
+                    previous = connection.execute(
+                        "SELECT payload_size FROM parse_cache_entries WHERE cache_key = ?",
+                        (cache_key,),
+                    ).fetchone()
+                    connection.execute(
+                        "INSERT OR REPLACE INTO parse_cache_entries "
+                        "(cache_key, payload, payload_size, last_access_ns) "
+                        "VALUES (?, ?, ?, ?)",
+                        (cache_key, encoded, len(encoded), time.time_ns()),
+                    )
+                    size_delta = len(encoded) - (previous[0] if previous else 0)
+                    total_size = connection.execute(
+                        "UPDATE parse_cache_stats SET total_size = total_size + ? "
+                        "WHERE id = 1 RETURNING total_size",
+                        (size_delta,),
+                    ).fetchone()[0]
+                    if total_size > self.max_bytes:
+                        self._evict(connection, total_size)
+                    connection.execute("COMMIT")
+                except BaseException:
+                    connection.execute("ROLLBACK")
+                    raise
+        except sqlite3.Error as exc:
+            logger.warning(
+                "Parse cache write failed | path={} | error={}", self.path, exc
+            )
+
+    def _evict(self, connection: sqlite3.Connection, total_size: int) -> None:
+        """Delete least recently used entries until under the eviction target."""
+        target_size = int(self.max_bytes * _EVICTION_TARGET_RATIO)
+        evicted_keys: list[str] = []
+        freed = 0
+        for cache_key, payload_size in connection.execute(
+            "SELECT cache_key, payload_size FROM parse_cache_entries "
+            "ORDER BY last_access_ns"
+        ):
+            if total_size - freed <= target_size:
+                break
+            evicted_keys.append(cache_key)
+            freed += payload_size
+
+        connection.executemany(
+            "DELETE FROM parse_cache_entries WHERE cache_key = ?",
+            [(cache_key,) for cache_key in evicted_keys],
+        )
+        connection.execute(
+            "UPDATE parse_cache_stats SET total_size = total_size - ? WHERE id = 1",
+            (freed,),
+        )
+        logger.debug(
+            "Evicted parse cache entries | path={} | entries={} | freed_bytes={}",
+            self.path,
+            len(evicted_keys),
+            freed,
+        )
+
+    def total_size(self) -> int:
+        """Return the summed payload size of every cached entry."""
+        with self._lock:
+            row = (
+                self._require_connection()
+                .execute("SELECT total_size FROM parse_cache_stats WHERE id = 1")
+                .fetchone()
+            )
+        return int(row[0])
+
+    def _require_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            raise sqlite3.ProgrammingError("Parse cache is closed")
+        return self._connection
+
+    def close(self) -> None:
+        with self._lock:
+            connection, self._connection = self._connection, None
+        if connection is not None:
+            connection.close()
+
+
+def open_parse_cache(config: ParseCacheConfig) -> Optional[ParseCache]:
+    """Open the cache, returning ``None`` (caching disabled) if that fails."""
+    try:
+        return ParseCache(config.path, config.max_bytes, config.namespace)
+    except (OSError, sqlite3.Error) as exc:
+        logger.warning(
+            "Parse cache unavailable, parsing without it | path={} | error={}",
+            config.path,
+            exc,
+        )
+        return None
@@ -0,0 +1,326 @@
+"""Process-pool parsing engine for tree-sitter language processors.
+
+Tree-sitter capture walking, callee matching and pydantic model construction
+hold the GIL, so thread offloading stops scaling after a couple of cores. This
+engine runs the whole per-file pipeline in worker processes that preload the
+language service, detector and framework feature index once, and ship back a
+compact payload the parent rehydrates into an `UnoplatFile`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+import hashlib
+import multiprocessing
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from loguru import logger
+from unoplat_code_confluence_commons.base_models import (
+    AnnotationLikeInfo,
+    CallExpressionInfo,
+    DataModelPosition,
+    Detection,
+    FeatureSpec,
+    InheritanceInfo,
+)
+
+from code_confluence_flow_bridge.engine.detector.data_model_detector import (
+    detect_data_model,
+)
+from code_confluence_flow_bridge.engine.framework_feature_index import (
+    FrameworkFeatureIndex,
+)
+from code_confluence_flow_bridge.engine.programming_language.common.language_service import (
+    LanguageServiceSpec,
+)
+from code_confluence_flow_bridge.engine.programming_language.common.source_context import (
+    BaseSourceContext,
+    SourceContextBuilder,
+)
+from code_confluence_flow_bridge.engine.programming_language.compiled_query_warmup import (
+    prewarm_feature_specs,
+)
+from code_confluence_flow_bridge.engine.programming_language.python.language_service import (
+    create_python_language_service,
+)
+from code_confluence_flow_bridge.engine.programming_language.python.python_tree_sitter_framework_detector import (
+    PythonTreeSitterFrameworkDetector,
+)
+from code_confluence_flow_bridge.engine.programming_language.typescript.language_service import (
+    create_typescript_language_service,
+)
+from code_confluence_flow_bridge.engine.programming_language.typescript.typescript_tree_sitter_framework_detector import (
+    TypeScriptTreeSitterFrameworkDetector,
+)
+from code_confluence_flow_bridge.models.code_confluence_parsing_models.unoplat_file import (
+    UnoplatFile,
+)
+from code_confluence_flow_bridge.parser.language_processors.parse_cache import (
+    CachedParse,
+    ParseCache,
+    ParseCacheConfig,
+    open_parse_cache,
+)
+
+# (detection model name, model_dump()) pairs keep the concrete subclass across
+# the process boundary without pickling pydantic internals.
+SerializedDetection = tuple[str, Dict[str, Any]]
+ParsedFilePayload = Dict[str, Any]
+
+_DETECTION_MODELS: Dict[str, type[Detection]] = {
+    model.__name__: model
+    for model in (Detection, AnnotationLikeInfo, CallExpressionInfo, InheritanceInfo)
+}
+
+_LANGUAGE_SERVICE_FACTORIES: Dict[str, Callable[[], LanguageServiceSpec]] = {
+    "python": create_python_language_service,
+    "typescript": create_typescript_language_service,
+}
+
+_DETECTOR_FACTORIES: Dict[str, Callable[[], Any]] = {
+    "python": PythonTreeSitterFrameworkDetector,
+    "typescript": TypeScriptTreeSitterFrameworkDetector,
+}
+
+
+@dataclass
+class _ParsingWorkerState:
+    """Per-process collaborators built once by the pool initializer."""
+
+    language: str
+    source_context_builder: SourceContextBuilder
+    detector: Optional[Any]
+    feature_index: FrameworkFeatureIndex
+    parse_cache: Optional[ParseCache] = None
+
+
+_worker_state: Optional[_ParsingWorkerState] = None
+
+
+def _initialize_parsing_worker(
+    language: str,
+    feature_spec_payloads: Sequence[Dict[str, Any]],
+    detect_frameworks: bool,
+    parse_cache_config: Optional[ParseCacheConfig] = None,
+) -> None:
+    """Pool initializer: build the parser, detector and feature index once.
+
+    Detection queries are compiled here as well, so the first file a worker
+    receives does not pay for compiling the whole catalog.
+    """
+    global _worker_state
+    language_service = _LANGUAGE_SERVICE_FACTORIES[language]()
+    detector_factory = _DETECTOR_FACTORIES.get(language)
+    feature_index = FrameworkFeatureIndex(
+        language,
+        [FeatureSpec.model_validate(payload) for payload in feature_spec_payloads],
+    )
+    detector = (
+        detector_factory()
+        if detect_frameworks and detector_factory is not None
+        else None
+    )
+    if detector is not None:
+        prewarm_feature_specs(language, feature_index.feature_specs)
+    _worker_state = _ParsingWorkerState(
+        language=language,
+        source_context_builder=language_service.create_source_context_builder(),
+        detector=detector,
+        feature_index=feature_index,
+        parse_cache=(
+            open_parse_cache(parse_cache_config)
+            if parse_cache_config is not None
+            else None
+        ),
+    )
+
+
+def _detect_in_worker(
+    state: _ParsingWorkerState, source_context: BaseSourceContext
+) -> list[Detection]:
+    if state.detector is None or not source_context.import_aliases:
+        return []
+    feature_specs = state.feature_index.resolve(sorted(source_context.import_aliases))
+    if not feature_specs:
+        return []
+    return state.detector.detect(source_context, feature_specs)
+
+
+def _parse_file_in_worker(file_path: str) -> Optional[ParsedFilePayload]:
+    """Read, parse and detect a single file inside a pool worker."""
+    state = _worker_state
+    if state is None:
+        raise RuntimeError("Parsing worker used before initialization")
+
+    try:
+        with open(file_path, "rb") as source_file:
+            content_bytes = source_file.read()
+        checksum = hashlib.md5(content_bytes).hexdigest()
+
+        if state.parse_cache is not None:
+            cached_parse = state.parse_cache.get(checksum)
+            if cached_parse is not None:
+                return {**cached_parse, "file_path": file_path, "checksum": checksum}
+
+        source_context = state.source_context_builder.from_bytes(content_bytes)
+        has_data_model, data_model_positions = detect_data_model(
+            source_context=source_context,
+            language=state.language,
+        )
+
+        detections: list[SerializedDetection] = []
+        detection_failed = False
+        try:
+            detections = [
+                (type(detection).__name__, detection.model_dump(mode="json"))
+                for detection in _detect_in_worker(state, source_context)
+            ]
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.warning(
+                "Framework feature detection failed | file_path={} | error={}",
+                file_path,
+                str(exc),
+            )
+            detection_failed = True
+
+        payload: ParsedFilePayload = {
+            "file_path": file_path,
+            "checksum": checksum,
+            "imports": source_context.imports or [],
+            "detections": detections,
+            "has_data_model": has_data_model,
+            "data_model_positions": data_model_positions.model_dump(mode="json"),
+        }
+        # A swallowed detection failure must not be served from the cache later.
+        if state.parse_cache is not None and not detection_failed:
+            state.parse_cache.put(checksum, cacheable_parse(payload))
+        return payload
+
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        logger.error("Failed to process file | file_path={} | error={}", file_path, exc)
+        return None
+
+
+def cacheable_parse(payload: ParsedFilePayload) -> CachedParse:
+    """Strip the path-specific fields so a payload can be shared by content."""
+    return {
+        key: value
+        for key, value in payload.items()
+        if key not in ("file_path", "checksum")
+    }
+
+
+def serialize_parsed_file(parsed_file: UnoplatFile) -> ParsedFilePayload:
+    """Inverse of `rehydrate_parsed_file` for files parsed in-process."""
+    return {
+        "file_path": parsed_file.file_path,
+        "checksum": parsed_file.checksum,
+        "imports": parsed_file.imports or [],
+        "detections": [
+            (type(detection).__name__, detection.model_dump(mode="json"))
+            for detection in parsed_file.custom_features_list or []
+        ],
+        "has_data_model": parsed_file.has_data_model,
+        "data_model_positions": parsed_file.data_model_positions.model_dump(
+            mode="json"
+        ),
+    }
+
+
+def rehydrate_parsed_file(payload: ParsedFilePayload) -> UnoplatFile:
+    """Rebuild an `UnoplatFile` from a worker payload."""
+    detections = [
+        _DETECTION_MODELS.get(model_name, Detection).model_validate(data)
+        for model_name, data in payload["detections"]
+    ]
+    return UnoplatFile(
+        file_path=payload["file_path"],
+        checksum=payload["checksum"],
+        imports=payload["imports"],
+        custom_features_list=detections or None,
+        has_data_model=payload["has_data_model"],
+        data_model_positions=DataModelPosition.model_validate(
+            payload["data_model_positions"]
+        ),
+    )
+
+
+class ProcessPoolParsingEngine:
+    """Parse source files in a `ProcessPoolExecutor` with preloaded workers.
+
+    Workers are started with the ``spawn`` method: forking a process that runs
+    the FastAPI app and Temporal worker threads is not safe.
+    """
+
+    def __init__(
+        self,
+        language: str,
+        max_workers: int,
+        feature_specs: Sequence[FeatureSpec],
+        *,
+        detect_frameworks: bool = True,
+        parse_cache_config: Optional[ParseCacheConfig] = None,
+    ) -> None:
+        if language not in _LANGUAGE_SERVICE_FACTORIES:
+            raise ValueError(
+                f"Unsupported language for process-pool parsing: '{language}'"
+            )
+        if max_workers <= 0:
+            raise ValueError(f"Invalid max_workers={max_workers}; expected >= 1.")
+
+        self.language = language
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_initialize_parsing_worker,
+            initargs=(
+                language,
+                [spec.model_dump(mode="json") for spec in feature_specs],
+                detect_frameworks,
+                parse_cache_config,
+            ),
+        )
+        logger.info(
+            "Started process-pool parsing engine | language={} | workers={} | feature_specs={}",
+            language,
+            max_workers,
+            len(feature_specs),
+        )
+
+    @property
+    def is_available(self) -> bool:
+        """False once shut down or after a worker crashed and broke the pool."""
+        return self._executor is not None
+
+    async def parse_file(self, file_path: str) -> Optional[UnoplatFile]:
+        """Parse ``file_path`` in a worker process.
+
+        Raises:
+            BrokenProcessPool: If a worker died; the engine becomes unavailable
+                so callers can fall back to in-process parsing.
+        """
+        executor = self._executor
+        if executor is None:
+            raise BrokenProcessPool("Process-pool parsing engine is not available")
+
+        loop = asyncio.get_running_loop()
+        try:
+            payload = await loop.run_in_executor(
+                executor, _parse_file_in_worker, file_path
+            )
+        except BrokenProcessPool:
+            self.shutdown()
+            raise
+        if payload is None:
+            return None
+        return rehydrate_parsed_file(payload)
+
+    def shutdown(self) -> None:
+        """Stop the workers and drop queued work."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
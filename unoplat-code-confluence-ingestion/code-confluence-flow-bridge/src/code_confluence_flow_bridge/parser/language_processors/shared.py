@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from concurrent.futures.process import BrokenProcessPool
 import hashlib
 from typing import Optional
 
@@ -22,6 +23,11 @@ from code_confluence_flow_bridge.models.code_confluence_parsing_models.unoplat_f
 from code_confluence_flow_bridge.parser.language_processors.base import (
     LanguageCodebaseProcessor,
 )
+from code_confluence_flow_bridge.parser.language_processors.process_pool_engine import (
+    cacheable_parse,
+    rehydrate_parsed_file,
+    serialize_parsed_file,
+)
 
 
 class SharedTreeSitterLanguageProcessor(LanguageCodebaseProcessor):
@@ -50,6 +56,17 @@ class SharedTreeSitterLanguageProcessor(LanguageCodebaseProcessor):
 
     async def extract_file_data(self, file_path: str) -> Optional[UnoplatFile]:
         """Read, parse, detect metadata, and emit an `UnoplatFile`."""
+        parsing_engine = self.context.parsing_engine
+        if parsing_engine is not None and parsing_engine.is_available:
+            try:
+                return await parsing_engine.parse_file(file_path)
+            except BrokenProcessPool as exc:
+                logger.error(
+                    "Process-pool parsing engine failed; falling back to in-process parsing | file_path={} | error={}",
+                    file_path,
+                    exc,
+                )
+
         metadata = self.context.programming_language_metadata
 
         try:
@@ -59,6 +76,14 @@ class SharedTreeSitterLanguageProcessor(LanguageCodebaseProcessor):
             checksum = await asyncio.to_thread(
                 self._calculate_file_checksum, content_bytes
             )
+            parse_cache = self.context.parse_cache
+            if parse_cache is not None:
+                cached_parse = await asyncio.to_thread(parse_cache.get, checksum)
+                if cached_parse is not None:
+                    return rehydrate_parsed_file(
+                        {**cached_parse, "file_path": file_path, "checksum": checksum}
+                    )
+
             source_context = await asyncio.to_thread(
                 self.language_service.create_source_context_builder().from_bytes,
                 content_bytes,
@@ -70,6 +95,7 @@ class SharedTreeSitterLanguageProcessor(LanguageCodebaseProcessor):
             )
 
             custom_features_list: Optional[list[Detection]] = None
+            detection_failed = False
             if self.context.framework_detection_service is not None:
                 try:
                     detections = await self.context.framework_detection_service.detect_features(
@@ -83,8 +109,9 @@ class SharedTreeSitterLanguageProcessor(LanguageCodebaseProcessor):
                         file_path,
                         str(exc),
                     )
+                    detection_failed = True
 
-            return UnoplatFile(
+            parsed_file = UnoplatFile(
                 file_path=file_path,
                 checksum=checksum,
                 imports=source_context.imports or [],
@@ -92,6 +119,14 @@ class SharedTreeSitterLanguageProcessor(LanguageCodebaseProcessor):
                 has_data_model=has_data_model,
                 data_model_positions=data_model_positions,
             )
+            # A swallowed detection failure must not be served from the cache later.
+            if parse_cache is not None and not detection_failed:
+                await asyncio.to_thread(
+                    parse_cache.put,
+                    checksum,
+                    cacheable_parse(serialize_parsed_file(parsed_file)),
+                )
+            return parsed_file
 
         except Exception as exc:  # pylint: disable=broad-exception-caught
             logger.error(
@@ -40,6 +40,9 @@ from code_confluence_flow_bridge.parser.package_manager.shared.ordered_detection
 from code_confluence_flow_bridge.parser.package_manager.shared.ripgrep import (
     find_files,
 )
+from code_confluence_flow_bridge.parser.repository_inventory import (
+    RepositoryInventory,
+)
 
 
 # todo: check async/sync operations . it will be important to be performant when we enable batch ingestions or any other batch operations
@@ -80,7 +83,12 @@ class PythonRipgrepDetector:
         self._initialized = True
 
     async def detect_codebases(
-        self, git_url: str, github_token: str, *, ref: Optional[str] = None
+        self,
+        git_url: str,
+        github_token: str,
+        *,
+        ref: Optional[str] = None,
+        inventory: Optional[RepositoryInventory] = None,
     ) -> List[CodebaseConfig]:
         """
         Main detection method to detect Python codebases from a GitHub repository URL or local path.
@@ -90,6 +98,8 @@ class PythonRipgrepDetector:
         Args:
             git_url: GitHub repository URL (supports HTTPS and SSH formats) or local path
             github_token: GitHub personal access token for authentication
+            inventory: Shared walk of the checkout at ``git_url``; when given, it
+                replaces this detector's own ripgrep file discovery
 
         Returns:
             List of CodebaseConfig objects for detected codebases
@@ -115,26 +125,27 @@ class PythonRipgrepDetector:
             repo_path = str(cloned_path)
 
         # Fast detection using ripgrep with breadth-first processing
-        inventory, detections = await self._fast_detect(repo_path)
+        file_nodes, detections = await self._fast_detect(repo_path, inventory)
 
         # Build codebase config objects
         codebase_configs: List[CodebaseConfig] = []
         for directory_path, manager_name in detections.items():
             codebase_config: CodebaseConfig = await self._build_codebase_config(
-                directory_path, manager_name, inventory, repo_path
+                directory_path, manager_name, file_nodes, repo_path, inventory
             )
             codebase_configs.append(codebase_config)
 
         return codebase_configs
 
     async def _fast_detect(
-        self, repo_path: str
+        self, repo_path: str, inventory: Optional[RepositoryInventory] = None
     ) -> Tuple[List[FileNode], Dict[str, str]]:
         """
         Fast detection using ripgrep for file discovery.
 
         Args:
             repo_path: Path to repository
+            inventory: Pre-walked repository files used instead of ripgrep
 
         Returns:
             Tuple of (inventory, detections) where detections maps directory to manager
@@ -144,11 +155,17 @@ class PythonRipgrepDetector:
 
         # Find all relevant files in one ripgrep call
         file_patterns: List[str] = self._extract_file_patterns()
-        all_files: List[str] = await find_files(
-            patterns=file_patterns,
-            search_path=repo_path,
-            ignore_dirs=self.language_rules.ignores,
-        )
+        if inventory is not None:
+            all_files: List[str] = inventory.select(
+                file_patterns, self.language_rules.ignores
+            )
+        else:
+            all_files = await find_files(
+                patterns=file_patterns,
+                search_path=repo_path,
+                ignore_dirs=self.language_rules.ignores,
+            )
+        await self.ordered_detector.prime_signature_matches(repo_path, all_files)
 
         # Build inventory
         inventory: List[FileNode] = [
@@ -234,6 +251,7 @@ class PythonRipgrepDetector:
         manager_name: str,
         inventory: List[FileNode],
         repo_path: str,
+        repository_inventory: Optional[RepositoryInventory] = None,
     ) -> CodebaseConfig:
         """Build CodebaseConfig object for detected codebase."""
         # Find manifest path if exists
@@ -249,7 +267,7 @@ class PythonRipgrepDetector:
 
         # Detect root packages using ripgrep
         root_packages: Optional[List[str]] = await find_python_mains(
-            repo_path, directory_path
+            repo_path, directory_path, repository_inventory
         )
 
         # Build programming language metadata
@@ -3,20 +3,28 @@
 from __future__ import annotations
 
 import os
-from typing import List
+from typing import List, Optional
 
 from code_confluence_flow_bridge.parser.package_manager.shared.ripgrep import (
     find_files,
 )
+from code_confluence_flow_bridge.parser.repository_inventory import (
+    RepositoryInventory,
+)
 
 
-async def find_python_mains(search_path: str, codebase_subdir: str = ".") -> List[str]:
+async def find_python_mains(
+    search_path: str,
+    codebase_subdir: str = ".",
+    inventory: Optional[RepositoryInventory] = None,
+) -> List[str]:
     """
     Find all main.py files for Python root package detection.
 
     Args:
         search_path: Repository root path
         codebase_subdir: Subdirectory within repo to search (default: "." for repo root)
+        inventory: Pre-walked repository files used instead of ripgrep
 
     Returns:
         List of directory paths containing main.py files, relative to codebase_subdir
@@ -32,7 +40,15 @@ async def find_python_mains(search_path: str, codebase_subdir: str = ".") -> Lis
         prefix = codebase_subdir + "/"
 
     # Find all main.py files
-    main_files: List[str] = await find_files(["main.py"], full_search_path)
+    main_files: List[str]
+    if inventory is not None:
+        main_files = [
+            main_file
+            for main_file in inventory.select(["main.py"])
+            if main_file.startswith(prefix)
+        ]
+    else:
+        main_files = await find_files(["main.py"], full_search_path)
 
     # Extract package directories
     packages: List[str] = []
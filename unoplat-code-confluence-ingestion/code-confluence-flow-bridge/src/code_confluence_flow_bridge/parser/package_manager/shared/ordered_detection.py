@@ -9,6 +9,7 @@ or complex tie-breaking logic needed.
 from __future__ import annotations
 
 import os
+import asyncio
 from collections.abc import Sequence
 import fnmatch
 
@@ -22,14 +23,22 @@ from code_confluence_flow_bridge.models.detection.shared.rules import (
     ManagerRule,
     Signature,
 )
-from code_confluence_flow_bridge.parser.package_manager.shared.ripgrep import (
-    search_absence_in_file,
-    search_in_file,
+from code_confluence_flow_bridge.parser.package_manager.shared.signature_scan import (
+    SignatureMatchTable,
+    collect_content_patterns,
+    match_file_patterns,
+    scan_signature_contents,
 )
 
 
 class OrderedDetector:
-    """Simple ordered detection: first match wins."""
+    """Simple ordered detection: first match wins.
+
+    Content signatures are evaluated against a ``file -> matched patterns``
+    table. Callers holding a repository inventory should populate it with
+    :meth:`prime_signature_matches`; files missing from the table are scanned
+    in-process on first use.
+    """
 
     def __init__(self, language_rules: LanguageRules) -> None:
         """
@@ -39,6 +48,41 @@ class OrderedDetector:
             language_rules: Rules containing managers and their signatures
         """
         self.language_rules: LanguageRules = language_rules
+        self._content_patterns: dict[str, frozenset[str]] = collect_content_patterns(
+            language_rules
+        )
+        self._signature_matches: SignatureMatchTable = {}
+
+    async def prime_signature_matches(
+        self, repo_path: str, file_paths: Sequence[str]
+    ) -> None:
+        """
+        Replace the signature match table with one bulk scan of ``file_paths``.
+
+        Args:
+            repo_path: Absolute path to repository root
+            file_paths: Repo-relative candidate files discovered for this repository
+        """
+        self._signature_matches = await scan_signature_contents(
+            repo_path, file_paths, self.language_rules
+        )
+        logger.debug(
+            "Primed ordered detection signature table: repo={}, manifests={}",
+            repo_path,
+            len(self._signature_matches),
+        )
+
+    async def _matched_patterns(self, file_path: str) -> frozenset[str]:
+        """Return the patterns matched in ``file_path``, scanning it on a miss."""
+        matched = self._signature_matches.get(file_path)
+        if matched is None:
+            matched = await asyncio.to_thread(
+                match_file_patterns,
+                file_path,
+                self._content_patterns.get(os.path.basename(file_path), ()),
+            )
+            self._signature_matches[file_path] = matched
+        return matched
 
     async def detect_manager(
         self, directory_path: str, available_files: Sequence[str], repo_path: str
@@ -227,19 +271,20 @@ class OrderedDetector:
         if not os.path.exists(file_path):
             return False
 
+        if not signature.contains and not signature.contains_absence:
+            return True
+
+        matched_patterns: frozenset[str] = await self._matched_patterns(file_path)
+
         # Check positive content requirement
-        if signature.contains:
-            contains_found: bool = await search_in_file(file_path, signature.contains)
-            if not contains_found:
-                return False
+        if signature.contains and signature.contains not in matched_patterns:
+            return False
 
         # Check negative content requirements (contains_absence)
-        if signature.contains_absence:
-            absence_satisfied: bool = await search_absence_in_file(
-                file_path, signature.contains_absence
-            )
-            if not absence_satisfied:
-                return False
+        if signature.contains_absence and not matched_patterns.isdisjoint(
+            signature.contains_absence
+        ):
+            return False
 
         return True
 
@@ -0,0 +1,100 @@
+"""Bulk content scan of manifest files for package-manager signatures.
+
+Content signatures (``contains`` / ``contains_absence``) only ever target a
+handful of small manifests, so instead of spawning a ripgrep process per file
+and per pattern, every candidate manifest is read once in-process and checked
+against all literal patterns the rules declare for its filename. The result is
+a ``file -> matched patterns`` table that ordered detection evaluates without
+further I/O.
+"""
+
+from __future__ import annotations
+
+import os
+import asyncio
+from collections.abc import Iterable, Mapping
+
+from loguru import logger
+
+from code_confluence_flow_bridge.models.detection.shared.rules import (
+    LanguageRules,
+)
+
+# Absolute file path -> literal patterns found in that file.
+SignatureMatchTable = dict[str, frozenset[str]]
+
+
+def collect_content_patterns(
+    language_rules: LanguageRules,
+) -> dict[str, frozenset[str]]:
+    """Map each signature filename to every literal pattern checked against it."""
+    patterns_by_file: dict[str, set[str]] = {}
+    for manager_rule in language_rules.managers:
+        for signature in manager_rule.signatures:
+            if not signature.file:
+                continue
+            patterns: list[str] = list(signature.contains_absence or [])
+            if signature.contains:
+                patterns.append(signature.contains)
+            if patterns:
+                patterns_by_file.setdefault(signature.file, set()).update(patterns)
+    return {
+        file_name: frozenset(patterns)
+        for file_name, patterns in patterns_by_file.items()
+    }
+
+
+def match_file_patterns(file_path: str, patterns: Iterable[str]) -> frozenset[str]:
+    """Return the subset of literal ``patterns`` present in ``file_path``.
+
+    Matching is byte-wise like ``rg -F``; unreadable files match nothing.
+    """
+    try:
+        with open(file_path, "rb") as handle:
+            content = handle.read()
+    except OSError as exc:
+        logger.debug(
+            "Signature scan could not read file | path={} | error={}", file_path, exc
+        )
+        return frozenset()
+    return frozenset(
+        pattern for pattern in patterns if pattern.encode("utf-8") in content
+    )
+
+
+def _scan_files(
+    repo_path: str,
+    file_paths: Iterable[str],
+    patterns_by_file: Mapping[str, frozenset[str]],
+) -> SignatureMatchTable:
+    table: SignatureMatchTable = {}
+    for file_path in file_paths:
+        patterns = patterns_by_file.get(os.path.basename(file_path))
+        if not patterns:
+            continue
+        absolute_path = os.path.join(repo_path, file_path)
+        table[absolute_path] = match_file_patterns(absolute_path, patterns)
+    return table
+
+
+async def scan_signature_contents(
+    repo_path: str,
+    file_paths: Iterable[str],
+    language_rules: LanguageRules,
+) -> SignatureMatchTable:
+    """Scan every candidate manifest once against all rule content patterns.
+
+    Args:
+        repo_path: Absolute path to the repository root
+        file_paths: Repo-relative paths of candidate files (e.g. a ripgrep inventory)
+        language_rules: Rules whose ``contains``/``contains_absence`` patterns apply
+
+    Returns:
+        Table keyed by absolute path of each scanned manifest
+    """
+    patterns_by_file = collect_content_patterns(language_rules)
+    if not patterns_by_file:
+        return {}
+    return await asyncio.to_thread(
+        _scan_files, repo_path, list(file_paths), patterns_by_file
+    )
@@ -75,6 +75,24 @@ from code_confluence_flow_bridge.parser.package_manager.typescript.detectors.wor
     group_files_by_directory,
     rebase_workspace_glob,
 )
+from code_confluence_flow_bridge.parser.repository_inventory import (
+    RepositoryInventory,
+)
+
+
+def _files_containing(
+    repo_path: str, file_paths: Sequence[str], needle: bytes
+) -> list[str]:
+    """Return the repo-relative ``file_paths`` whose content contains ``needle``."""
+    matches: list[str] = []
+    for file_path in file_paths:
+        try:
+            with open(os.path.join(repo_path, file_path), "rb") as handle:
+                if needle in handle.read():
+                    matches.append(file_path)
+        except OSError:
+            continue
+    return matches
 
 
 class TypeScriptRipgrepDetector:
@@ -95,6 +113,7 @@ class TypeScriptRipgrepDetector:
         self._initialized: bool = False
         self._typescript_dependency_dirs_cache: dict[str, set[str]] = {}
         self._tsconfig_dirs_cache: dict[str, set[str]] = {}
+        self._repository_inventories: dict[str, RepositoryInventory] = {}
 
     async def initialize_rules(self) -> None:
         """Load detection rules for TypeScript from YAML."""
@@ -112,13 +131,20 @@ class TypeScriptRipgrepDetector:
         return await load_typescript_language_rules(self.rules_path)
 
     async def detect_codebases(
-        self, git_url: str, github_token: str, *, ref: Optional[str] = None
+        self,
+        git_url: str,
+        github_token: str,
+        *,
+        ref: Optional[str] = None,
+        inventory: Optional[RepositoryInventory] = None,
     ) -> list[CodebaseConfig]:
         """Detect all TypeScript codebases in a repository and return their configurations.
 
         Accepts either a remote GitHub URL (cloned on-demand) or a local filesystem path.
         Delegates to _scan_and_classify_codebases for the core detection algorithm, then
-        wraps each detected directory into a CodebaseConfig.
+        wraps each detected directory into a CodebaseConfig. When a shared
+        ``inventory`` of the checkout is supplied, every file lookup is answered
+        from it instead of separate ripgrep walks.
 
         Example — monorepo with workspaces:
             git_url = "https://github.com/org/turbo-monorepo"
@@ -145,7 +171,21 @@ class TypeScriptRipgrepDetector:
             )
             repo_path = str(cloned_path)
 
-        repository_scan, detections = await self._scan_and_classify_codebases(repo_path)
+        if inventory is None:
+            repository_scan, detections = await self._scan_and_classify_codebases(
+                repo_path
+            )
+        else:
+            # A fresh walk supersedes directory sets cached by earlier runs.
+            self._typescript_dependency_dirs_cache.pop(repo_path, None)
+            self._tsconfig_dirs_cache.pop(repo_path, None)
+            self._repository_inventories[repo_path] = inventory
+            try:
+                repository_scan, detections = await self._scan_and_classify_codebases(
+                    repo_path
+                )
+            finally:
+                self._repository_inventories.pop(repo_path, None)
 
         configs: list[CodebaseConfig] = []
         for directory_path, detected in detections.items():
@@ -211,15 +251,20 @@ class TypeScriptRipgrepDetector:
 
     async def _scan_repository(self, repo_path: str) -> TypeScriptRepositoryScan:
         """Run one ripgrep-backed inventory scan and reuse it across detector phases."""
-        if self.language_rules is None:
+        if self.language_rules is None or self.ordered_detector is None:
             raise RuntimeError("Detector not initialized")
 
         file_patterns = self._collect_ripgrep_search_patterns()
-        all_files = await find_files(
-            patterns=file_patterns,
-            search_path=repo_path,
-            ignore_dirs=self.language_rules.ignores,
-        )
+        inventory = self._repository_inventories.get(repo_path)
+        if inventory is not None:
+            all_files = inventory.select(file_patterns, self.language_rules.ignores)
+        else:
+            all_files = await find_files(
+                patterns=file_patterns,
+                search_path=repo_path,
+                ignore_dirs=self.language_rules.ignores,
+            )
+        await self.ordered_detector.prime_signature_matches(repo_path, all_files)
         dirs_to_files = group_files_by_directory(all_files)
         inventory = tuple(
             FileNode(path=file_path, kind="file", size=None) for file_path in all_files
@@ -886,9 +931,19 @@ class TypeScriptRipgrepDetector:
             return cached_dirs
 
         ignore_dirs = self.language_rules.ignores if self.language_rules else None
-        candidates = await find_files_with_content(
-            '"typescript"', "package.json", repo_path, ignore_dirs=ignore_dirs
-        )
+        inventory = self._repository_inventories.get(repo_path)
+        if inventory is not None:
+            package_json_files = inventory.select(["package.json"], ignore_dirs or ())
+            candidates = await asyncio.to_thread(
+                _files_containing,
+                repo_path,
+                package_json_files,
+                b'"typescript"',
+            )
+        else:
+            candidates = await find_files_with_content(
+                '"typescript"', "package.json", repo_path, ignore_dirs=ignore_dirs
+            )
         candidate_dirs = {os.path.dirname(path) or "." for path in candidates}
         self._typescript_dependency_dirs_cache[repo_path] = candidate_dirs
         logger.debug(
@@ -919,9 +974,13 @@ class TypeScriptRipgrepDetector:
             return cached_dirs
 
         ignore_dirs = self.language_rules.ignores if self.language_rules else None
-        tsconfig_files = await find_files(
-            ["tsconfig*.json"], repo_path, ignore_dirs=ignore_dirs
-        )
+        inventory = self._repository_inventories.get(repo_path)
+        if inventory is not None:
+            tsconfig_files = inventory.select(["tsconfig*.json"], ignore_dirs or ())
+        else:
+            tsconfig_files = await find_files(
+                ["tsconfig*.json"], repo_path, ignore_dirs=ignore_dirs
+            )
         tsconfig_dirs = {os.path.dirname(path) or "." for path in tsconfig_files}
         self._tsconfig_dirs_cache[repo_path] = tsconfig_dirs
         logger.debug(
@@ -0,0 +1,271 @@
+"""Long-lived parsing collaborators shared by codebase processing activities.
+
+A Temporal worker processes many codebases back to back. Building detection
+services, reloading the framework catalog and spawning a process pool for
+every activity dominates the cost of small codebases, so one
+:class:`ParsingRuntime` is built at worker start and injected into each
+`CodeConfluenceCodebaseParser`.
+
+The runtime holds the per-language framework detection services and the
+framework catalog, and keeps process-pool parsing engines alive across
+activities. It also pre-compiles the framework and data-model queries.
+Everything keyed on the framework catalog is rebuilt when the catalog
+version changes, so a framework definition reload is picked up by the next
+activity.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable, Iterable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Optional, Protocol
+
+from loguru import logger
+from unoplat_code_confluence_commons.programming_language_metadata import (
+    ProgrammingLanguage,
+)
+
+from code_confluence_flow_bridge.engine.detector.data_model_detector_factory import (
+    DataModelDetectorFactory,
+    UnsupportedLanguageForDataModelDetectionError,
+)
+from code_confluence_flow_bridge.engine.framework_detection_service import (
+    FrameworkDetectionService,
+)
+from code_confluence_flow_bridge.engine.framework_feature_index import (
+    get_framework_feature_index,
+)
+from code_confluence_flow_bridge.engine.programming_language.compiled_query_warmup import (
+    SUPPORTED_QUERY_LANGUAGES,
+    prewarm_framework_queries,
+)
+from code_confluence_flow_bridge.engine.programming_language.python.python_framework_detection_service import (
+    PythonFrameworkDetectionService,
+)
+from code_confluence_flow_bridge.engine.programming_language.typescript.typescript_framework_detection_service import (
+    TypeScriptFrameworkDetectionService,
+)
+from code_confluence_flow_bridge.models.configuration.settings import (
+    EnvironmentSettings,
+)
+from code_confluence_flow_bridge.parser.language_processors.parse_cache import (
+    ParseCacheConfig,
+)
+from code_confluence_flow_bridge.parser.language_processors.process_pool_engine import (
+    ProcessPoolParsingEngine,
+)
+
+_DETECTION_SERVICE_FACTORIES: dict[str, Callable[[], FrameworkDetectionService]] = {
+    "python": PythonFrameworkDetectionService,
+    "typescript": TypeScriptFrameworkDetectionService,
+}
+
+# (language, detect_frameworks, max_workers, catalog_version, parse_cache_config)
+_EngineKey = tuple[str, bool, int, Optional[str], Optional[ParseCacheConfig]]
+
+
+class FrameworkCatalogSource(Protocol):
+    """Subset of the relational ingestion used to load the framework catalog."""
+
+    async def get_framework_libraries_for_language(
+        self, language: str
+    ) -> list[str]: ...
+
+    async def get_framework_features_for_language(
+        self, language: str
+    ) -> list[tuple[str, str, str]]: ...
+
+
+@dataclass(frozen=True)
+class FrameworkCatalog:
+    """Frameworks and features a detection may reference when it is stored."""
+
+    frameworks: frozenset[str]
+    features: frozenset[tuple[str, str, str]]
+
+
+@dataclass
+class _EngineSlot:
+    key: _EngineKey
+    engine: ProcessPoolParsingEngine
+    leases: int = 0
+    retired: bool = False
+
+
+class ParsingRuntime:
+    """Per-worker cache of parsing collaborators.
+
+    Activities run on the worker's event loop, so shared state is guarded by
+    ``asyncio`` locks rather than thread locks.
+    """
+
+    def __init__(
+        self,
+        settings: EnvironmentSettings,
+        languages: Iterable[str] = SUPPORTED_QUERY_LANGUAGES,
+    ) -> None:
+        self.settings = settings
+        self.languages: tuple[str, ...] = tuple(
+            language.lower() for language in languages
+        )
+        self._detection_services: dict[str, FrameworkDetectionService] = {}
+        self._catalogs: dict[str, tuple[str, FrameworkCatalog]] = {}
+        self._catalog_lock = asyncio.Lock()
+        self._engines: dict[str, _EngineSlot] = {}
+        self._engine_lock = asyncio.Lock()
+
+    async def warm_up(self) -> None:
+        """Build detection services and compile every query before polling."""
+        for language in self.languages:
+            self.framework_detection_service(language)
+            try:
+                strategy = DataModelDetectorFactory.get_strategy(
+                    ProgrammingLanguage(language)
+                )
+            except (ValueError, UnsupportedLanguageForDataModelDetectionError):
+                continue
+            strategy.warm_up()
+        await prewarm_framework_queries(self.languages)
+
+    def framework_detection_service(
+        self, language: str
+    ) -> Optional[FrameworkDetectionService]:
+        """Return the shared detection service for ``language``, if supported."""
+        normalized_language = language.lower()
+        service = self._detection_services.get(normalized_language)
+        if service is None:
+            factory = _DETECTION_SERVICE_FACTORIES.get(normalized_language)
+            if factory is None:
+                return None
+            service = factory()
+            self._detection_services[normalized_language] = service
+        return service
+
+    async def get_framework_catalog(
+        self, language: str, source: FrameworkCatalogSource
+    ) -> FrameworkCatalog:
+        """Return the framework catalog, reloading it when the catalog version moves.
+
+        An empty feature index (for example after a failed load) is never
+        cached, mirroring `get_framework_feature_index`.
+        """
+        normalized_language = language.lower()
+        feature_index = await get_framework_feature_index(normalized_language)
+        catalog_version = feature_index.catalog_version if len(feature_index) else None
+
+        cached = self._catalogs.get(normalized_language)
+        if cached is not None and catalog_version is not None:
+            if cached[0] == catalog_version:
+                return cached[1]
+
+        async with self._catalog_lock:
+            cached = self._catalogs.get(normalized_language)
+            if cached is not None and cached[0] == catalog_version:
+                return cached[1]
+            catalog = FrameworkCatalog(
+                frameworks=frozenset(
+                    await source.get_framework_libraries_for_language(
+                        normalized_language
+                    )
+                ),
+                features=frozenset(
+                    await source.get_framework_features_for_language(
+                        normalized_language
+                    )
+                ),
+            )
+            if catalog_version is not None:
+                self._catalogs[normalized_language] = (catalog_version, catalog)
+            return catalog
+
+    @asynccontextmanager
+    async def lease_parsing_engine(
+        self,
+        language: str,
+        *,
+        detect_frameworks: bool,
+        parse_cache_config: Optional[ParseCacheConfig] = None,
+    ) -> AsyncIterator[Optional[ProcessPoolParsingEngine]]:
+        """Lend the worker-wide process-pool engine for ``language``.
+
+        The engine is shared by concurrent leases and kept alive between
+        activities. An engine built for another catalog version, cache namespace
+        or pool size is retired and shut down once its last lease ends. Yields
+        ``None`` when the process pool is disabled.
+        """
+        max_workers = self.settings.codebase_parser_process_pool_workers
+        if max_workers <= 0:
+            yield None
+            return
+
+        slot = await self._acquire_engine_slot(
+            language.lower(), detect_frameworks, max_workers, parse_cache_config
+        )
+        try:
+            yield slot.engine
+        finally:
+            slot.leases -= 1
+            if slot.retired and slot.leases == 0:
+                await asyncio.to_thread(slot.engine.shutdown)
+
+    async def _acquire_engine_slot(
+        self,
+        language: str,
+        detect_frameworks: bool,
+        max_workers: int,
+        parse_cache_config: Optional[ParseCacheConfig],
+    ) -> _EngineSlot:
+        feature_specs = ()
+        catalog_version: Optional[str] = None
+        if detect_frameworks:
+            feature_index = await get_framework_feature_index(language)
+            feature_specs = feature_index.feature_specs
+            catalog_version = feature_index.catalog_version
+
+        key: _EngineKey = (
+            language,
+            detect_frameworks,
+            max_workers,
+            catalog_version,
+            parse_cache_config,
+        )
+        async with self._engine_lock:
+            slot = self._engines.get(language)
+            if slot is None or slot.key != key or not slot.engine.is_available:
+                if slot is not None:
+                    await self._retire(slot)
+                slot = _EngineSlot(
+                    key=key,
+                    engine=ProcessPoolParsingEngine(
+                        language,
+                        max_workers,
+                        feature_specs,
+                        detect_frameworks=detect_frameworks,
+                        parse_cache_config=parse_cache_config,
+                    ),
+                )
+                self._engines[language] = slot
+            else:
+                logger.debug(
+                    "Reusing process-pool parsing engine | language={} | leases={}",
+                    language,
+                    slot.leases,
+                )
+            slot.leases += 1
+            return slot
+
+    async def _retire(self, slot: _EngineSlot) -> None:
+        slot.retired = True
+        if slot.leases == 0:
+            await asyncio.to_thread(slot.engine.shutdown)
+
+    async def shutdown(self) -> None:
+        """Stop every pooled engine; call once the worker stopped polling."""
+        async with self._engine_lock:
+            slots = list(self._engines.values())
+            self._engines.clear()
+        for slot in slots:
+            await asyncio.to_thread(slot.engine.shutdown)
+        logger.info("Parsing runtime shut down | engines={}", len(slots))
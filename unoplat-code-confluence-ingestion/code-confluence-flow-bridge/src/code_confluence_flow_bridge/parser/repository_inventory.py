@@ -0,0 +1,372 @@
+"""Single-walk file inventory of a cloned repository.
+
+Codebase detection (Python and TypeScript) and the codebase parser all need the
+repository's file list. Instead of each running its own ``rg --files`` or
+``os.walk``, the clone is walked once into a :class:`RepositoryInventory` that
+groups paths by directory and indexes them by basename and extension.
+
+Detection runs in the API process and receives the inventory directly. Parsing
+runs in worker activities, so the git activity persists a snapshot inside the
+clone's git directory, tagged with the checked-out commit. The parser reuses it
+while ``HEAD`` still matches and walks the tree itself otherwise.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import defaultdict
+from collections.abc import Iterable, Iterator, Sequence
+import fnmatch
+from functools import lru_cache
+import json
+from pathlib import Path
+import posixpath
+from typing import Optional
+
+from git import GitCommandError, InvalidGitRepositoryError, NoSuchPathError, Repo
+from loguru import logger
+
+# Bump when the snapshot layout changes.
+INVENTORY_SNAPSHOT_VERSION = 2
+INVENTORY_SNAPSHOT_FILE_NAME = "unoplat-inventory.json"
+
+# Directories no consumer ever reads from: VCS metadata, dependency installs and
+# build outputs are ignored by the detector rules and by the codebase parser
+# alike, so they are pruned during the walk instead of filtered afterwards.
+INVENTORY_PRUNED_DIRECTORY_NAMES: frozenset[str] = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        "node_modules",
+        "__pycache__",
+        "dist",
+        "build",
+    }
+)
+
+
+def _directory_of(relative_path: str) -> str:
+    return posixpath.dirname(relative_path) or "."
+
+
+def _is_in_ignored_directory(
+    relative_path: str,
+    ignored_names: frozenset[str],
+    ignored_paths: Sequence[str],
+    include_hidden_directories: bool,
+) -> bool:
+    directory_parts = relative_path.split("/")[:-1]
+    for part in directory_parts:
+        if part in ignored_names:
+            return True
+        if not include_hidden_directories and part.startswith("."):
+            return True
+    if ignored_paths:
+        directory = "/" + "/".join(directory_parts) + "/"
+        return any(f"/{ignored_path}/" in directory for ignored_path in ignored_paths)
+    return False
+
+
+def _is_gitignored(relative_path: str, gitignored: frozenset[str]) -> bool:
+    if relative_path in gitignored:
+        return True
+    directory_parts = relative_path.split("/")[:-1]
+    return any(
+        "/".join(directory_parts[: depth + 1]) + "/" in gitignored
+        for depth in range(len(directory_parts))
+    )
+
+
+def read_gitignored_paths(repository_root: str | Path) -> frozenset[str]:
+    """Return the paths ``.gitignore`` rules exclude at ``repository_root``.
+
+    git applies the same sources ripgrep honours (``.gitignore`` files at any
+    depth, ``.git/info/exclude`` and ``core.excludesFile``). Like ripgrep,
+    tracked files matching a rule are included. Wholly ignored directories are
+    reported once, with a trailing ``/``.
+    """
+    try:
+        output = Repo(repository_root).git.ls_files(
+            "-z",
+            "--cached",
+            "--others",
+            "--ignored",
+            "--exclude-standard",
+            "--directory",
+        )
+    except (
+        InvalidGitRepositoryError,
+        NoSuchPathError,
+        GitCommandError,
+        ValueError,
+    ) as exc:
+        logger.debug(
+            "Repository ignore rules unavailable | root={} | error={}",
+            repository_root,
+            exc,
+        )
+        return frozenset()
+    return frozenset(path for path in output.split("\0") if path)
+
+
+def read_head_commit(repository_root: str | Path) -> Optional[str]:
+    """Return the commit checked out at ``repository_root``, if it is a git repo."""
+    try:
+        return Repo(repository_root).head.commit.hexsha
+    except (InvalidGitRepositoryError, NoSuchPathError, ValueError) as exc:
+        logger.debug(
+            "Repository HEAD unavailable | root={} | error={}", repository_root, exc
+        )
+        return None
+
+
+def resolve_git_directory(repository_root: str | Path) -> Optional[Path]:
+    """Return the git directory of ``repository_root``.
+
+    Worktrees checked out from the mirror cache have a ``.git`` file pointing at
+    their private git directory instead of a ``.git`` directory.
+    """
+    dot_git = Path(repository_root) / ".git"
+    if dot_git.is_dir():
+        return dot_git
+    if dot_git.is_file():
+        content = dot_git.read_text(encoding="utf-8").strip()
+        if content.startswith("gitdir:"):
+            git_directory = Path(content.removeprefix("gitdir:").strip())
+            if not git_directory.is_absolute():
+                git_directory = Path(repository_root) / git_directory
+            return git_directory
+    return None
+
+
+def find_repository_root(path: str | Path) -> Optional[Path]:
+    """Return the nearest ancestor of ``path`` (inclusive) that is a git checkout."""
+    candidate = Path(path).resolve()
+    for directory in (candidate, *candidate.parents):
+        if (directory / ".git").exists():
+            return directory
+    return None
+
+
+class RepositoryInventory:
+    """Repo-relative POSIX paths of every file in a checkout, walked once.
+
+    Attributes:
+        root: Absolute path of the repository root.
+        files: Sorted repo-relative paths of all files outside pruned directories.
+        head: Commit checked out when the inventory was built, if known.
+        gitignored: Files and directories (with a trailing ``/``) excluded by
+            the repository's ignore rules; only :meth:`select` applies them.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        files: Iterable[str],
+        head: Optional[str] = None,
+        gitignored: Iterable[str] = (),
+    ) -> None:
+        self.root = root
+        self.files: tuple[str, ...] = tuple(sorted(files))
+        self.head = head
+        self.gitignored: frozenset[str] = frozenset(gitignored)
+
+        by_directory: dict[str, list[str]] = defaultdict(list)
+        by_basename: dict[str, list[str]] = defaultdict(list)
+        by_extension: dict[str, list[str]] = defaultdict(list)
+        for relative_path in self.files:
+            basename = posixpath.basename(relative_path)
+            by_directory[_directory_of(relative_path)].append(relative_path)
+            by_basename[basename].append(relative_path)
+            by_extension[posixpath.splitext(basename)[1]].append(relative_path)
+        self._by_directory = {key: tuple(value) for key, value in by_directory.items()}
+        self._by_basename = {key: tuple(value) for key, value in by_basename.items()}
+        self._by_extension = {key: tuple(value) for key, value in by_extension.items()}
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    @classmethod
+    def build(
+        cls,
+        root: str | Path,
+        *,
+        pruned_directory_names: frozenset[str] = INVENTORY_PRUNED_DIRECTORY_NAMES,
+    ) -> RepositoryInventory:
+        """Walk ``root`` once, skipping ``pruned_directory_names`` at any depth."""
+        root_path = Path(root).resolve()
+        files: list[str] = []
+        for current_root, dirnames, filenames in os.walk(root_path):
+            dirnames[:] = [
+                dirname for dirname in dirnames if dirname not in pruned_directory_names
+            ]
+            relative_root = Path(current_root).relative_to(root_path).as_posix()
+            prefix = "" if relative_root == "." else f"{relative_root}/"
+            files.extend(f"{prefix}{filename}" for filename in filenames)
+
+        head = read_head_commit(root_path)
+        inventory = cls(
+            str(root_path),
+            files,
+            head=head,
+            gitignored=read_gitignored_paths(root_path) if head is not None else (),
+        )
+        logger.debug(
+            "Built repository inventory | root={} | files={} | directories={}",
+            inventory.root,
+            len(inventory.files),
+            len(inventory._by_directory),
+        )
+        return inventory
+
+    def files_in_directory(self, directory: str) -> tuple[str, ...]:
+        """Return the files directly inside repo-relative ``directory``."""
+        return self._by_directory.get(directory, ())
+
+    def files_named(self, basename: str) -> tuple[str, ...]:
+        """Return every file whose basename is exactly ``basename``."""
+        return self._by_basename.get(basename, ())
+
+    def files_with_extension(self, extension: str) -> tuple[str, ...]:
+        """Return every file with ``extension`` (including the leading dot)."""
+        return self._by_extension.get(extension, ())
+
+    def select(
+        self,
+        patterns: Iterable[str],
+        ignore_dirs: Iterable[str] = (),
+        *,
+        include_hidden_directories: bool = False,
+    ) -> list[str]:
+        """Return sorted files whose basename matches any of ``patterns``.
+
+        Mirrors ``rg --files -g <pattern> -g '!<ignore>/'``: patterns match the
+        basename, files excluded by the repository's ``.gitignore`` rules are
+        dropped, ``ignore_dirs`` entries drop any file below a directory with
+        that name (or that sub-path when the entry contains ``/``), and hidden
+        directories are skipped unless ``include_hidden_directories`` is set.
+        ``.ignore`` and ``.rgignore`` files are not read.
+        """
+        matched: set[str] = set()
+        for pattern in patterns:
+            if any(char in pattern for char in "*?["):
+                for basename, paths in self._by_basename.items():
+                    if fnmatch.fnmatchcase(basename, pattern):
+                        matched.update(paths)
+            else:
+                matched.update(self.files_named(pattern))
+
+        ignore_entries = [entry.strip("/") for entry in ignore_dirs if entry]
+        ignored_names = frozenset(entry for entry in ignore_entries if "/" not in entry)
+        ignored_paths = [entry for entry in ignore_entries if "/" in entry]
+        return sorted(
+            path
+            for path in matched
+            if not _is_in_ignored_directory(
+                path, ignored_names, ignored_paths, include_hidden_directories
+            )
+            and not _is_gitignored(path, self.gitignored)
+        )
+
+    def files_under(
+        self, directory: str | Path, extensions: Iterable[str]
+    ) -> Iterator[Path]:
+        """Yield absolute paths of files below ``directory`` with ``extensions``.
+
+        Args:
+            directory: Absolute path or repo-relative POSIX path inside the root
+            extensions: File extensions to include, with their leading dot
+        """
+        directory_path = Path(directory)
+        if directory_path.is_absolute():
+            relative_directory = (
+                directory_path.resolve().relative_to(self.root).as_posix()
+            )
+        else:
+            relative_directory = directory_path.as_posix()
+        prefix = "" if relative_directory in ("", ".") else f"{relative_directory}/"
+
+        root_path = Path(self.root)
+        for extension in extensions:
+            for relative_path in self.files_with_extension(extension):
+                if relative_path.startswith(prefix):
+                    yield root_path / relative_path
+
+    def covers(self, path: str | Path) -> bool:
+        """Return whether absolute ``path`` lies inside this inventory's root."""
+        return Path(path).resolve().is_relative_to(self.root)
+
+    def save_snapshot(self) -> Optional[Path]:
+        """Persist the inventory in the clone's git directory for later stages."""
+        if self.head is None:
+            return None
+        git_directory = resolve_git_directory(self.root)
+        if git_directory is None:
+            return None
+
+        snapshot_path = git_directory / INVENTORY_SNAPSHOT_FILE_NAME
+        payload = {
+            "version": INVENTORY_SNAPSHOT_VERSION,
+            "root": self.root,
+            "head": self.head,
+            "files": self.files,
+            "gitignored": sorted(self.gitignored),
+        }
+        temporary_path = snapshot_path.with_suffix(".tmp")
+        temporary_path.write_text(
+            json.dumps(payload, separators=(",", ":")), encoding="utf-8"
+        )
+        os.replace(temporary_path, snapshot_path)
+        return snapshot_path
+
+    @classmethod
+    def load_snapshot(cls, path: str | Path) -> Optional[RepositoryInventory]:
+        """Return the persisted inventory of the repository containing ``path``.
+
+        ``None`` is returned when no snapshot exists or when ``HEAD`` has moved
+        since it was written, in which case callers walk the tree themselves.
+        """
+        repository_root = find_repository_root(path)
+        if repository_root is None:
+            return None
+        git_directory = resolve_git_directory(repository_root)
+        if git_directory is None:
+            return None
+        snapshot_path = git_directory / INVENTORY_SNAPSHOT_FILE_NAME
+        try:
+            mtime_ns = snapshot_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+        inventory = _load_snapshot(str(snapshot_path), mtime_ns)
+        if inventory is None or inventory.root != str(repository_root):
+            return None
+        if inventory.head != read_head_commit(repository_root):
+            logger.debug(
+                "Ignoring stale repository inventory snapshot | root={} | snapshot_head={}",
+                repository_root,
+                inventory.head,
+            )
+            return None
+        return inventory
+
+
+@lru_cache(maxsize=8)
+def _load_snapshot(snapshot_path: str, mtime_ns: int) -> Optional[RepositoryInventory]:
+    # Keyed by mtime so codebases of the same clone parsed in one worker
+    # process share a single decoded inventory.
+    try:
+        payload = json.loads(Path(snapshot_path).read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        logger.warning(
+            "Unreadable repository inventory snapshot | path={} | error={}",
+            snapshot_path,
+            exc,
+        )
+        return None
+    if payload.get("version") != INVENTORY_SNAPSHOT_VERSION:
+        return None
+    return RepositoryInventory(
+        payload["root"], payload["files"], payload["head"], payload["gitignored"]
+    )
@@ -1,6 +1,7 @@
 from temporalio import workflow
 
 with workflow.unsafe.imports_passed_through():
+    import asyncio
     from datetime import timedelta
 
     from unoplat_code_confluence_commons.programming_language_metadata import (
@@ -15,6 +16,8 @@ with workflow.unsafe.imports_passed_through():
     from code_confluence_flow_bridge.models.workflow.repo_workflow_base import (
         CodebaseChildWorkflowEnvelope,
         CodebaseProcessingActivityEnvelope,
+        CodebaseShardPlan,
+        CodebaseShardProcessingEnvelope,
         PackageManagerMetadataIngestionEnvelope,
         PackageMetadataActivityEnvelope,
     )
@@ -118,15 +121,73 @@ class CodebaseChildWorkflow:
             dependencies=list(parsed_metadata.dependencies.keys()),
             programming_language_metadata=programming_language_metadata,
             trace_id=trace_id,
+            incremental_refresh=envelope.incremental_refresh,
         )
 
+        # Large codebases fan out across the worker pool; unsharded runs, and
+        # histories recorded before sharding existed, skip the planning activity.
+        if envelope.codebase_sharding:
+            shard_plan: CodebaseShardPlan = await workflow.execute_activity(
+                activity=GenericCodebaseProcessingActivity.plan_codebase_shards,
+                args=[codebase_processing_envelope],
+                start_to_close_timeout=timedelta(hours=1),
+                retry_policy=ActivityRetriesConfig.DEFAULT,
+            )
+            if shard_plan.shards:
+                await self._process_codebase_shards(
+                    codebase_processing_envelope, shard_plan
+                )
+                workflow.logger.info(
+                    "Codebase workflow completed successfully for %s (%d shards)",
+                    codebase_qualified_name,
+                    len(shard_plan.shards),
+                )
+                return
+
         await workflow.execute_activity(
             activity=GenericCodebaseProcessingActivity.process_codebase_generic,
             args=[codebase_processing_envelope],
             start_to_close_timeout=timedelta(weeks=1),
+            # Progress is heartbeated; a stalled worker is retried from the
+            # last committed chunk instead of waiting out the week.
+            heartbeat_timeout=timedelta(minutes=5),
             retry_policy=ActivityRetriesConfig.DEFAULT,
         )
 
         workflow.logger.info(
             "Codebase workflow completed successfully for %s", codebase_qualified_name
         )
+
+    async def _process_codebase_shards(
+        self,
+        envelope: CodebaseProcessingActivityEnvelope,
+        shard_plan: CodebaseShardPlan,
+    ) -> None:
+        """Parse every shard in parallel, then record the codebase frameworks."""
+        workflow.logger.info(
+            "Processing %s in %d parallel shards",
+            envelope.codebase_qualified_name,
+            len(shard_plan.shards),
+        )
+        await asyncio.gather(
+            *(
+                workflow.execute_activity(
+                    activity=GenericCodebaseProcessingActivity.process_codebase_shard,
+                    args=[
+                        CodebaseShardProcessingEnvelope(
+                            **envelope.model_dump(), shard=shard
+                        )
+                    ],
+                    start_to_close_timeout=timedelta(days=1),
+                    heartbeat_timeout=timedelta(minutes=5),
+                    retry_policy=ActivityRetriesConfig.DEFAULT,
+                )
+                for shard in shard_plan.shards
+            )
+        )
+        await workflow.execute_activity(
+            activity=GenericCodebaseProcessingActivity.merge_codebase_shards,
+            args=[envelope],
+            start_to_close_timeout=timedelta(minutes=10),
+            retry_policy=ActivityRetriesConfig.DEFAULT,
+        )
@@ -21,6 +21,10 @@ from code_confluence_flow_bridge.logging.trace_utils import (
     seed_and_bind_logger_from_trace_id,
 )
 from code_confluence_flow_bridge.processor.db.postgres.db import get_session_cm
+from code_confluence_flow_bridge.processor.db.postgres.workflow_status_events import (
+    codebase_run_event,
+    notify_workflow_status,
+)
 
 
 class ChildWorkflowDbActivity:
@@ -143,6 +147,9 @@ class ChildWorkflowDbActivity:
                         f"Updated codebase workflow run: {workflow_run_id} for {repository_name}/{repository_owner_name}/{codebase_folder} with status {status.value}"
                     )
 
+                # Delivered to /repository-status-stream subscribers on commit
+                await notify_workflow_status(session, codebase_run_event(workflow_run))
+
         except ApplicationError:
             # Re-raise without wrapping to preserve error context
             raise
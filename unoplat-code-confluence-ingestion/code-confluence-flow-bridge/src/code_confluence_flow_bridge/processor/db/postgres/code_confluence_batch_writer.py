@@ -0,0 +1,85 @@
+"""Buffered writer that flushes parsed files to PostgreSQL in batches."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List
+
+from loguru import logger
+
+from code_confluence_flow_bridge.models.code_confluence_parsing_models.unoplat_file import (
+    UnoplatFile,
+)
+from code_confluence_flow_bridge.processor.db.postgres.code_confluence_relational_ingestion import (
+    CodeConfluenceRelationalIngestion,
+)
+
+
+class CodeConfluenceFileBatchWriter:
+    """Collect `UnoplatFile` rows and their feature rows, then flush them together.
+
+    File rows are always written before the feature rows buffered with them so
+    the ``file_path`` foreign key holds inside a single flush.
+    """
+
+    def __init__(
+        self,
+        ingestion: CodeConfluenceRelationalIngestion,
+        codebase_qualified_name: str,
+        *,
+        file_batch_size: int,
+    ) -> None:
+        if file_batch_size <= 0:
+            raise ValueError(
+                f"Invalid file_batch_size={file_batch_size}; expected >= 1."
+            )
+        self.ingestion = ingestion
+        self.codebase_qualified_name = codebase_qualified_name
+        self.file_batch_size = file_batch_size
+
+        self._pending_files: List[UnoplatFile] = []
+        self._pending_feature_rows: List[Dict[str, Any]] = []
+        self.files_written = 0
+        self.feature_rows_written = 0
+        self.flush_count = 0
+
+    @property
+    def pending_file_count(self) -> int:
+        return len(self._pending_files)
+
+    async def add(
+        self,
+        file_data: UnoplatFile,
+        feature_rows: Iterable[Dict[str, Any]] = (),
+    ) -> None:
+        """Buffer one parsed file and flush once the batch size is reached."""
+        self._pending_files.append(file_data)
+        self._pending_feature_rows.extend(
+            {**feature_row, "file_path": file_data.file_path}
+            for feature_row in feature_rows
+        )
+        if len(self._pending_files) >= self.file_batch_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write every buffered file row, then every buffered feature row."""
+        if not self._pending_files and not self._pending_feature_rows:
+            return
+
+        files = self._pending_files
+        feature_rows = self._pending_feature_rows
+        self._pending_files = []
+        self._pending_feature_rows = []
+
+        await self.ingestion.upsert_files(self.codebase_qualified_name, files)
+        await self.ingestion.upsert_file_feature_rows(feature_rows)
+
+        self.files_written += len(files)
+        self.feature_rows_written += len(feature_rows)
+        self.flush_count += 1
+        logger.debug(
+            "Flushed file batch | codebase={} | files={} | feature_rows={} | total_files={}",
+            self.codebase_qualified_name,
+            len(files),
+            len(feature_rows),
+            self.files_written,
+        )
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, TypeVar
 
-from sqlalchemy import select
+from sqlalchemy import delete, func, select
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from unoplat_code_confluence_commons.base_models import (
@@ -32,6 +32,38 @@ from code_confluence_flow_bridge.models.code_confluence_parsing_models.unoplat_g
 from code_confluence_flow_bridge.models.code_confluence_parsing_models.unoplat_package_manager_metadata import (
     UnoplatPackageManagerMetadata,
 )
+from code_confluence_flow_bridge.processor.db.postgres.framework_catalog_models import (
+    CodebaseFrameworkCatalogVersion,
+)
+from code_confluence_flow_bridge.processor.db.postgres.framework_query_service import (
+    get_framework_catalog_version,
+)
+
+# asyncpg rejects statements carrying more than 32767 bind parameters, so
+# multi-row inserts are split into chunks that stay under that ceiling.
+MAX_BIND_PARAMETERS = 32767
+
+FILE_FEATURE_CONFLICT_COLUMNS: tuple[str, ...] = (
+    "file_path",
+    "feature_language",
+    "feature_library",
+    "feature_capability_key",
+    "feature_operation_key",
+    "start_line",
+    "end_line",
+)
+
+
+_RowT = TypeVar("_RowT")
+
+
+def _chunk_rows(
+    rows: Sequence[_RowT], columns_per_row: int
+) -> Iterator[Sequence[_RowT]]:
+    """Yield row chunks whose bind parameter count fits a single statement."""
+    chunk_size = max(1, MAX_BIND_PARAMETERS // max(1, columns_per_row))
+    for start in range(0, len(rows), chunk_size):
+        yield rows[start : start + chunk_size]
 
 
 def _dump_model(value: Any) -> Any:
@@ -168,8 +200,11 @@ class CodeConfluenceRelationalIngestion:
         codebase_qualified_name: str,
         files: Iterable[UnoplatFile],
     ) -> None:
+        # A multi-row ON CONFLICT DO UPDATE may not touch the same row twice,
+        # so duplicate paths collapse to the last payload seen.
+        payloads_by_path: Dict[str, Dict[str, Any]] = {}
         for file_item in files:
-            payload = {
+            payloads_by_path[file_item.file_path] = {
                 "file_path": file_item.file_path,
                 "codebase_qualified_name": codebase_qualified_name,
                 "checksum": file_item.checksum,
@@ -177,11 +212,19 @@ class CodeConfluenceRelationalIngestion:
                 "has_data_model": file_item.has_data_model,
                 "data_model_positions": _dump_model(file_item.data_model_positions),
             }
+        if not payloads_by_path:
+            return
 
-            stmt = insert(UnoplatCodeConfluenceFile).values(**payload)
+        payloads = list(payloads_by_path.values())
+        for chunk in _chunk_rows(payloads, len(payloads[0])):
+            stmt = insert(UnoplatCodeConfluenceFile).values(list(chunk))
             stmt = stmt.on_conflict_do_update(
                 index_elements=["file_path"],
-                set_=payload,
+                set_={
+                    column: stmt.excluded[column]
+                    for column in payloads[0]
+                    if column != "file_path"
+                },
             )
             await self.session.execute(stmt)
 
@@ -190,13 +233,19 @@ class CodeConfluenceRelationalIngestion:
         codebase_qualified_name: str,
         frameworks: Iterable[tuple[str, str]],
     ) -> None:
-        for language, library in frameworks:
-            payload = {
+        payloads = [
+            {
                 "codebase_qualified_name": codebase_qualified_name,
                 "framework_language": language,
                 "framework_library": library,
             }
-            stmt = insert(UnoplatCodeConfluenceCodebaseFramework).values(**payload)
+            for language, library in dict.fromkeys(frameworks)
+        ]
+        if not payloads:
+            return
+
+        for chunk in _chunk_rows(payloads, len(payloads[0])):
+            stmt = insert(UnoplatCodeConfluenceCodebaseFramework).values(list(chunk))
             stmt = stmt.on_conflict_do_nothing(
                 index_elements=[
                     "codebase_qualified_name",
@@ -211,9 +260,22 @@ class CodeConfluenceRelationalIngestion:
         file_path: str,
         feature_rows: Iterable[Dict[str, Any]],
     ) -> None:
-        for feature_row in feature_rows:
-            payload = {
-                "file_path": file_path,
+        await self.upsert_file_feature_rows(
+            {**feature_row, "file_path": file_path} for feature_row in feature_rows
+        )
+
+    async def upsert_file_feature_rows(
+        self,
+        feature_rows: Iterable[Dict[str, Any]],
+    ) -> None:
+        """Insert feature rows spanning any number of files in multi-row batches.
+
+        Each row must carry its own ``file_path``; the owning file rows have to
+        be written first because of the foreign key on ``file_path``.
+        """
+        payloads = [
+            {
+                "file_path": feature_row["file_path"],
                 "feature_language": feature_row["feature_language"],
                 "feature_library": feature_row["feature_library"],
                 "feature_capability_key": feature_row["feature_capability_key"],
@@ -226,20 +288,115 @@ class CodeConfluenceRelationalIngestion:
                 or "completed",
                 "evidence_json": feature_row.get("evidence_json"),
             }
-            stmt = insert(UnoplatCodeConfluenceFileFrameworkFeature).values(**payload)
+            for feature_row in feature_rows
+        ]
+        if not payloads:
+            return
+
+        for chunk in _chunk_rows(payloads, len(payloads[0])):
+            stmt = insert(UnoplatCodeConfluenceFileFrameworkFeature).values(
+                list(chunk)
+            )
             stmt = stmt.on_conflict_do_nothing(
-                index_elements=[
-                    "file_path",
-                    "feature_language",
-                    "feature_library",
-                    "feature_capability_key",
-                    "feature_operation_key",
-                    "start_line",
-                    "end_line",
-                ]
+                index_elements=list(FILE_FEATURE_CONFLICT_COLUMNS)
             )
             await self.session.execute(stmt)
 
+    async def upsert_codebase_frameworks_from_features(
+        self, codebase_qualified_name: str
+    ) -> int:
+        """Record every framework with a stored feature span in the codebase.
+
+        Sharded ingestion writes feature rows from several activities, so the
+        codebase's frameworks are derived from the rows once they all finished.
+        """
+        stmt = (
+            select(
+                UnoplatCodeConfluenceFileFrameworkFeature.feature_language,
+                UnoplatCodeConfluenceFileFrameworkFeature.feature_library,
+            )
+            .join(
+                UnoplatCodeConfluenceFile,
+                UnoplatCodeConfluenceFile.file_path
+                == UnoplatCodeConfluenceFileFrameworkFeature.file_path,
+            )
+            .where(
+                UnoplatCodeConfluenceFile.codebase_qualified_name
+                == codebase_qualified_name
+            )
+            .distinct()
+        )
+        result = await self.session.execute(stmt)
+        frameworks = [(row[0], row[1]) for row in result]
+        await self.upsert_codebase_frameworks(codebase_qualified_name, frameworks)
+        return len(frameworks)
+
+    async def get_file_checksums(
+        self, codebase_qualified_name: str
+    ) -> Dict[str, Optional[str]]:
+        """Return the stored ``file_path -> checksum`` map for a codebase."""
+        stmt = select(
+            UnoplatCodeConfluenceFile.file_path,
+            UnoplatCodeConfluenceFile.checksum,
+        ).where(
+            UnoplatCodeConfluenceFile.codebase_qualified_name
+            == codebase_qualified_name
+        )
+        result = await self.session.execute(stmt)
+        return {row[0]: row[1] for row in result}
+
+    async def delete_file_features(self, file_paths: Iterable[str]) -> None:
+        """Delete every framework feature span recorded for the given files."""
+        paths = list(dict.fromkeys(file_paths))
+        for chunk in _chunk_rows(paths, 1):
+            await self.session.execute(
+                delete(UnoplatCodeConfluenceFileFrameworkFeature).where(
+                    UnoplatCodeConfluenceFileFrameworkFeature.file_path.in_(chunk)
+                )
+            )
+
+    async def delete_files(self, file_paths: Iterable[str]) -> None:
+        """Delete file rows together with their framework feature spans."""
+        paths = list(dict.fromkeys(file_paths))
+        if not paths:
+            return
+
+        await self.delete_file_features(paths)
+        for chunk in _chunk_rows(paths, 1):
+            await self.session.execute(
+                delete(UnoplatCodeConfluenceFile).where(
+                    UnoplatCodeConfluenceFile.file_path.in_(chunk)
+                )
+            )
+
+    async def get_framework_catalog_version(self) -> Optional[str]:
+        """Return the content hash of the loaded framework catalog."""
+        return await get_framework_catalog_version(self.session)
+
+    async def get_codebase_catalog_version(
+        self, codebase_qualified_name: str
+    ) -> Optional[str]:
+        """Return the catalog version the codebase's features were detected with."""
+        return await self.session.scalar(
+            select(CodebaseFrameworkCatalogVersion.content_hash).where(
+                CodebaseFrameworkCatalogVersion.codebase_qualified_name
+                == codebase_qualified_name
+            )
+        )
+
+    async def upsert_codebase_catalog_version(
+        self, codebase_qualified_name: str, content_hash: str
+    ) -> None:
+        stmt = insert(CodebaseFrameworkCatalogVersion).values(
+            codebase_qualified_name=codebase_qualified_name,
+            content_hash=content_hash,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["codebase_qualified_name"],
+            set_={"content_hash": content_hash, "parsed_at": func.now()},
+        )
+        await self.session.execute(stmt)
+
     async def get_framework_libraries_for_language(self, language: str) -> List[str]:
         stmt = select(Framework.library).where(Framework.language == language)
         result = await self.session.execute(stmt)
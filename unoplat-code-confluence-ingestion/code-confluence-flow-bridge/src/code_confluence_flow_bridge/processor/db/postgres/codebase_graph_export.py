@@ -0,0 +1,160 @@
+"""Stream a codebase's ingested graph out of PostgreSQL as NDJSON.
+
+Every table is read through a server-side cursor (``AsyncSession.stream``)
+with a fixed fetch size, and records are encoded into bounded chunks, so the
+memory used by an export does not grow with the size of the codebase.
+
+Each line is one JSON object tagged by ``record_type``, in this order:
+
+- ``codebase``: the codebase row itself
+- ``codebase_framework``: a framework detected in the codebase
+- ``file``: a source file with its imports and data-model positions
+- ``file_framework_feature``: a framework feature usage span inside a file
+"""
+
+from collections.abc import AsyncIterable, AsyncIterator
+import json
+from typing import Any, Dict, Optional
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session
+from unoplat_code_confluence_commons.relational_models import (
+    UnoplatCodeConfluenceCodebase,
+    UnoplatCodeConfluenceCodebaseFramework,
+    UnoplatCodeConfluenceFile,
+    UnoplatCodeConfluenceFileFrameworkFeature,
+)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Rows fetched per server-side cursor round trip
+EXPORT_FETCH_SIZE = 1000
+
+# Flush encoded lines once a chunk reaches this many bytes
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+SessionLike = AsyncSession | async_scoped_session[AsyncSession]
+
+
+async def get_export_codebase(
+    session: SessionLike, codebase_qualified_name: str
+) -> Optional[Dict[str, Any]]:
+    """Return the ``codebase`` record, or None when the codebase is not ingested."""
+    result = await session.execute(
+        select(
+            UnoplatCodeConfluenceCodebase.qualified_name,
+            UnoplatCodeConfluenceCodebase.repository_qualified_name,
+            UnoplatCodeConfluenceCodebase.name,
+            UnoplatCodeConfluenceCodebase.codebase_folder,
+            UnoplatCodeConfluenceCodebase.programming_language,
+            UnoplatCodeConfluenceCodebase.root_packages,
+        ).where(UnoplatCodeConfluenceCodebase.qualified_name == codebase_qualified_name)
+    )
+    row = result.mappings().one_or_none()
+    if row is None:
+        return None
+    return {"record_type": "codebase", **row}
+
+
+async def _stream_records(
+    session: SessionLike, record_type: str, stmt: Select[Any]
+) -> AsyncIterator[Dict[str, Any]]:
+    result = await session.stream(stmt.execution_options(yield_per=EXPORT_FETCH_SIZE))
+    async for row in result.mappings():
+        yield {"record_type": record_type, **row}
+
+
+async def stream_codebase_graph(
+    session: SessionLike, codebase_record: Dict[str, Any]
+) -> AsyncIterator[Dict[str, Any]]:
+    """Yield the export records of one codebase, one table at a time.
+
+    Args:
+        session: Session with an open transaction, kept for the whole stream
+        codebase_record: Record returned by ``get_export_codebase``
+    """
+    codebase_qualified_name = codebase_record["qualified_name"]
+    yield codebase_record
+
+    framework_model = UnoplatCodeConfluenceCodebaseFramework
+    async for record in _stream_records(
+        session,
+        "codebase_framework",
+        select(
+            framework_model.framework_language.label("language"),
+            framework_model.framework_library.label("library"),
+        )
+        .where(framework_model.codebase_qualified_name == codebase_qualified_name)
+        .order_by(
+            framework_model.framework_language, framework_model.framework_library
+        ),
+    ):
+        yield record
+
+    async for record in _stream_records(
+        session,
+        "file",
+        select(
+            UnoplatCodeConfluenceFile.file_path,
+            UnoplatCodeConfluenceFile.checksum,
+            UnoplatCodeConfluenceFile.imports,
+            UnoplatCodeConfluenceFile.has_data_model,
+            UnoplatCodeConfluenceFile.data_model_positions,
+        )
+        .where(
+            UnoplatCodeConfluenceFile.codebase_qualified_name == codebase_qualified_name
+        )
+        .order_by(UnoplatCodeConfluenceFile.file_path),
+    ):
+        yield record
+
+    feature_model = UnoplatCodeConfluenceFileFrameworkFeature
+    async for record in _stream_records(
+        session,
+        "file_framework_feature",
+        select(
+            feature_model.file_path,
+            feature_model.feature_language.label("language"),
+            feature_model.feature_library.label("library"),
+            feature_model.feature_capability_key.label("capability_key"),
+            feature_model.feature_operation_key.label("operation_key"),
+            feature_model.start_line,
+            feature_model.end_line,
+            feature_model.match_text,
+            feature_model.match_confidence,
+            feature_model.validation_status,
+            feature_model.evidence_json,
+        )
+        .join(
+            UnoplatCodeConfluenceFile,
+            UnoplatCodeConfluenceFile.file_path == feature_model.file_path,
+        )
+        .where(
+            UnoplatCodeConfluenceFile.codebase_qualified_name == codebase_qualified_name
+        )
+        .order_by(
+            feature_model.file_path, feature_model.start_line, feature_model.end_line
+        ),
+    ):
+        yield record
+
+
+async def encode_ndjson(
+    records: AsyncIterable[Dict[str, Any]], chunk_bytes: int = EXPORT_CHUNK_BYTES
+) -> AsyncIterator[bytes]:
+    """Encode records as NDJSON lines, grouped into chunks of about ``chunk_bytes``."""
+    buffer: list[bytes] = []
+    buffered = 0
+    async for record in records:
+        line = (
+            json.dumps(record, separators=(",", ":"), ensure_ascii=False, default=str)
+            + "\n"
+        ).encode("utf-8")
+        buffer.append(line)
+        buffered += len(line)
+        if buffered >= chunk_bytes:
+            yield b"".join(buffer)
+            buffer.clear()
+            buffered = 0
+    if buffer:
+        yield b"".join(buffer)
@@ -0,0 +1,56 @@
+"""SQLAlchemy models for framework catalog versions owned by flow-bridge."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKeyConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+from unoplat_code_confluence_commons.base_models.sql_base import SQLBase
+
+
+class FrameworkCatalogVersion(SQLBase):
+    """Content hash of the framework definitions currently loaded into Postgres."""
+
+    __tablename__ = "framework_catalog_version"
+
+    catalog_name: Mapped[str] = mapped_column(
+        primary_key=True, comment="Definition set, e.g. framework_definitions"
+    )
+    content_hash: Mapped[str] = mapped_column(
+        comment="sha256 of the canonical JSON definition set"
+    )
+    loaded_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        comment="When this version was applied",
+    )
+
+
+class CodebaseFrameworkCatalogVersion(SQLBase):
+    """Catalog version a codebase's framework features were last detected with.
+
+    An incremental refresh only re-parses changed files, so it falls back to
+    re-parsing every file when this differs from the loaded catalog.
+    """
+
+    __tablename__ = "codebase_framework_catalog_version"
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["codebase_qualified_name"],
+            ["code_confluence_codebase.qualified_name"],
+            ondelete="CASCADE",
+        ),
+    )
+
+    codebase_qualified_name: Mapped[str] = mapped_column(primary_key=True)
+    content_hash: Mapped[str] = mapped_column(
+        comment="FrameworkCatalogVersion.content_hash used for detection"
+    )
+    parsed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        comment="When the codebase was last parsed with this version",
+    )
@@ -1,14 +1,24 @@
-"""Load framework definition JSON files and bulk-insert them into Postgres."""
+"""Load framework definition JSON files and sync them into Postgres.
+
+The definition set is versioned by a content hash stored in
+``framework_catalog_version``. A replica starting with the same definitions
+skips the reload. Otherwise only the rows that differ are inserted, updated or
+deleted, so concurrent readers never observe an empty catalog.
+"""
 
 import os
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+import hashlib
 import json
 import logging
 import pathlib
 import time
-from typing import Any, Dict, cast
+from typing import Any, Dict, Optional, TypeVar, cast
 
-from sqlalchemy import delete, func, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, event, func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session
 from unoplat_code_confluence_commons.base_models import (
     FeatureAbsolutePath,
     Framework,
@@ -16,12 +26,162 @@ from unoplat_code_confluence_commons.base_models import (
     FrameworkFeaturePayload,
 )
 
+from code_confluence_flow_bridge.engine.framework_feature_index import (
+    invalidate_framework_feature_indexes,
+)
 from code_confluence_flow_bridge.models.configuration.settings import (
     EnvironmentSettings,
 )
+from code_confluence_flow_bridge.processor.db.postgres.code_confluence_relational_ingestion import (
+    MAX_BIND_PARAMETERS,
+)
+from code_confluence_flow_bridge.processor.db.postgres.framework_catalog_models import (
+    FrameworkCatalogVersion,
+)
+from code_confluence_flow_bridge.processor.db.postgres.framework_query_service import (
+    FRAMEWORK_CATALOG_NAME,
+    get_framework_catalog_version,
+)
 
 logger = logging.getLogger(__name__)
 
+# Bump when parse_json_data normalises definitions differently, so unchanged
+# JSON is still re-applied after a loader upgrade.
+_CATALOG_SCHEMA_VERSION = 1
+
+# Serialises catalog syncs of replicas starting at the same time.
+_CATALOG_SYNC_LOCK_ID = 0x46524D4B  # "FRMK"
+
+_T = TypeVar("_T")
+
+FrameworkKey = tuple[str, str]
+FeatureKey = tuple[str, str, str, str]
+AbsolutePathKey = tuple[str, str, str, str, str]
+
+
+def compute_catalog_version(framework_data: Dict[str, Any]) -> str:
+    """Return the sha256 content hash of a combined definition set."""
+    canonical = json.dumps(
+        {"schema": _CATALOG_SCHEMA_VERSION, "definitions": framework_data},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CatalogRows:
+    """Framework catalog rows keyed by primary key."""
+
+    frameworks: Dict[FrameworkKey, Dict[str, Optional[str]]] = field(
+        default_factory=dict
+    )
+    features: Dict[FeatureKey, Dict[str, object]] = field(default_factory=dict)
+    absolute_paths: set[AbsolutePathKey] = field(default_factory=set)
+
+    @classmethod
+    def from_models(
+        cls,
+        frameworks: Iterable[Framework],
+        features: Iterable[FrameworkFeature],
+        absolute_paths: Iterable[FeatureAbsolutePath],
+    ) -> "CatalogRows":
+        return cls(
+            frameworks={
+                (framework.language, framework.library): {
+                    "docs_url": framework.docs_url,
+                    "description": framework.description,
+                }
+                for framework in frameworks
+            },
+            features={
+                (
+                    feature.language,
+                    feature.library,
+                    feature.capability_key,
+                    feature.operation_key,
+                ): feature.feature_definition
+                for feature in features
+            },
+            absolute_paths={
+                (
+                    path.language,
+                    path.library,
+                    path.capability_key,
+                    path.operation_key,
+                    path.absolute_path,
+                )
+                for path in absolute_paths
+            },
+        )
+
+
+@dataclass
+class CatalogDiff:
+    """Rows to write and keys to delete to turn one catalog into another."""
+
+    upsert_frameworks: list[FrameworkKey] = field(default_factory=list)
+    delete_frameworks: list[FrameworkKey] = field(default_factory=list)
+    upsert_features: list[FeatureKey] = field(default_factory=list)
+    delete_features: list[FeatureKey] = field(default_factory=list)
+    insert_absolute_paths: list[AbsolutePathKey] = field(default_factory=list)
+    delete_absolute_paths: list[AbsolutePathKey] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not any(
+            (
+                self.upsert_frameworks,
+                self.delete_frameworks,
+                self.upsert_features,
+                self.delete_features,
+                self.insert_absolute_paths,
+                self.delete_absolute_paths,
+            )
+        )
+
+
+def compute_catalog_diff(current: CatalogRows, desired: CatalogRows) -> CatalogDiff:
+    """Compare the stored catalog with the desired one, row by row."""
+    return CatalogDiff(
+        upsert_frameworks=sorted(
+            key
+            for key, values in desired.frameworks.items()
+            if current.frameworks.get(key) != values
+        ),
+        delete_frameworks=sorted(current.frameworks.keys() - desired.frameworks.keys()),
+        upsert_features=sorted(
+            key
+            for key, definition in desired.features.items()
+            if current.features.get(key) != definition
+        ),
+        delete_features=sorted(current.features.keys() - desired.features.keys()),
+        insert_absolute_paths=sorted(desired.absolute_paths - current.absolute_paths),
+        delete_absolute_paths=sorted(current.absolute_paths - desired.absolute_paths),
+    )
+
+
+def invalidate_feature_indexes_after_commit(session: AsyncSession) -> None:
+    """Invalidate cached feature indexes once ``session`` commits its transaction.
+
+    A rollback leaves the stored catalog, and so the cached indexes, unchanged.
+    """
+    # get_session_cm yields a task-scoped proxy that does not expose sync_session
+    async_session = session() if isinstance(session, async_scoped_session) else session
+    event.listen(
+        async_session.sync_session,
+        "after_commit",
+        lambda _session: invalidate_framework_feature_indexes(),
+        once=True,
+    )
+
+
+def _chunks(rows: Sequence[_T], columns_per_row: int) -> Iterator[Sequence[_T]]:
+    size = max(1, MAX_BIND_PARAMETERS // max(1, columns_per_row))
+    for start in range(0, len(rows), size):
+        yield rows[start : start + size]
+
 
 def _normalize_concept_name(raw_concept: object) -> str:
     """Map a raw concept value to a known concept name, defaulting to AnnotationLike."""
@@ -75,6 +235,8 @@ class FrameworkDefinitionLoader:
         """Initialize loader with path from environment settings."""
         self.definitions_path = pathlib.Path(env_settings.framework_definitions_path)
         self._loaded = False
+        # Content hash of the definitions last synced by this loader
+        self.catalog_version: Optional[str] = None
 
         # Debug environment variable loading
         logger.info(
@@ -260,64 +422,232 @@ class FrameworkDefinitionLoader:
 
         return FrameworkFeaturePayload.model_validate(payload_data)
 
+    async def _read_catalog_rows(self, session: AsyncSession) -> CatalogRows:
+        """Read the stored catalog as plain key tuples, without ORM identity."""
+        rows = CatalogRows()
+        framework_result = await session.execute(
+            select(
+                Framework.language,
+                Framework.library,
+                Framework.docs_url,
+                Framework.description,
+            )
+        )
+        for language, library, docs_url, description in framework_result:
+            rows.frameworks[(language, library)] = {
+                "docs_url": docs_url,
+                "description": description,
+            }
+        feature_result = await session.execute(
+            select(
+                FrameworkFeature.language,
+                FrameworkFeature.library,
+                FrameworkFeature.capability_key,
+                FrameworkFeature.operation_key,
+                FrameworkFeature.feature_definition,
+            )
+        )
+        for (
+            language,
+            library,
+            capability_key,
+            operation_key,
+            definition,
+        ) in feature_result:
+            rows.features[(language, library, capability_key, operation_key)] = (
+                definition
+            )
+        path_result = await session.execute(
+            select(
+                FeatureAbsolutePath.language,
+                FeatureAbsolutePath.library,
+                FeatureAbsolutePath.capability_key,
+                FeatureAbsolutePath.operation_key,
+                FeatureAbsolutePath.absolute_path,
+            )
+        )
+        rows.absolute_paths = {tuple(row) for row in path_result}  # type: ignore[misc]
+        return rows
+
+    async def _apply_catalog_diff(
+        self, session: AsyncSession, desired: CatalogRows, diff: CatalogDiff
+    ) -> None:
+        """Apply ``diff`` with multi-row statements, children deleted first."""
+        path_columns = (
+            FeatureAbsolutePath.language,
+            FeatureAbsolutePath.library,
+            FeatureAbsolutePath.capability_key,
+            FeatureAbsolutePath.operation_key,
+            FeatureAbsolutePath.absolute_path,
+        )
+        feature_columns = (
+            FrameworkFeature.language,
+            FrameworkFeature.library,
+            FrameworkFeature.capability_key,
+            FrameworkFeature.operation_key,
+        )
+        framework_columns = (Framework.language, Framework.library)
+
+        for model, columns, keys in (
+            (FeatureAbsolutePath, path_columns, diff.delete_absolute_paths),
+            (FrameworkFeature, feature_columns, diff.delete_features),
+            (Framework, framework_columns, diff.delete_frameworks),
+        ):
+            for chunk in _chunks(keys, len(columns)):
+                await session.execute(
+                    delete(model)
+                    .where(tuple_(*columns).in_(chunk))
+                    .execution_options(synchronize_session=False)
+                )
+
+        framework_rows = [
+            {"language": key[0], "library": key[1], **desired.frameworks[key]}
+            for key in diff.upsert_frameworks
+        ]
+        for chunk in _chunks(framework_rows, 4):
+            stmt = insert(Framework).values(list(chunk))
+            await session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=["language", "library"],
+                    set_={
+                        "docs_url": stmt.excluded.docs_url,
+                        "description": stmt.excluded.description,
+                    },
+                )
+            )
+
+        feature_rows = [
+            {
+                "language": key[0],
+                "library": key[1],
+                "capability_key": key[2],
+                "operation_key": key[3],
+                "feature_definition": desired.features[key],
+            }
+            for key in diff.upsert_features
+        ]
+        for chunk in _chunks(feature_rows, 5):
+            stmt = insert(FrameworkFeature).values(list(chunk))
+            await session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[
+                        "language",
+                        "library",
+                        "capability_key",
+                        "operation_key",
+                    ],
+                    set_={"feature_definition": stmt.excluded.feature_definition},
+                )
+            )
+
+        path_rows = [
+            {
+                "language": key[0],
+                "library": key[1],
+                "capability_key": key[2],
+                "operation_key": key[3],
+                "absolute_path": key[4],
+            }
+            for key in diff.insert_absolute_paths
+        ]
+        for chunk in _chunks(path_rows, 5):
+            await session.execute(
+                insert(FeatureAbsolutePath).values(list(chunk)).on_conflict_do_nothing()
+            )
+
+    async def _store_catalog_version(
+        self, session: AsyncSession, content_hash: str
+    ) -> None:
+        stmt = insert(FrameworkCatalogVersion).values(
+            catalog_name=FRAMEWORK_CATALOG_NAME, content_hash=content_hash
+        )
+        await session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["catalog_name"],
+                set_={
+                    "content_hash": stmt.excluded.content_hash,
+                    "loaded_at": func.now(),
+                },
+            )
+        )
+
     async def load_framework_definitions_at_startup(
         self, session: AsyncSession
     ) -> Dict[str, Any]:
         """
-        Load framework definitions at startup with optimized bulk insertion.
-        Uses atomic clear + repopulate strategy for consistency.
+        Sync framework definitions into Postgres at startup.
+
+        Skips the sync when the stored catalog version matches the content hash
+        of the definitions on disk; otherwise applies only the changed rows.
+        The caller's transaction makes the sync atomic.
         """
         logger.info("Starting framework definitions loading...")
         start_time = time.time()
 
-        # Check if already loaded (idempotency)
-        existing_count: int = (
-            await session.scalar(select(func.count(Framework.language))) or 0
-        )  # type: ignore
-        if existing_count > 0 and self._loaded:
+        framework_data = self.load_framework_definitions()
+        catalog_version = compute_catalog_version(framework_data)
+
+        # Replicas starting together wait here; the later ones then see the
+        # version written by the first and skip.
+        await session.execute(select(func.pg_advisory_xact_lock(_CATALOG_SYNC_LOCK_ID)))
+        stored_version = await get_framework_catalog_version(session)
+        if stored_version == catalog_version:
+            existing_count: int = (
+                await session.scalar(select(func.count(Framework.language))) or 0
+            )
+            self.catalog_version = catalog_version
+            self._loaded = True
             logger.info(
-                f"Framework definitions already loaded ({existing_count} frameworks). Skipping."
+                f"Framework catalog {catalog_version[:12]} already loaded ({existing_count} frameworks). Skipping."
             )
-            return {"skipped": True, "existing_count": existing_count}
+            return {
+                "skipped": True,
+                "existing_count": existing_count,
+                "catalog_version": catalog_version,
+                "total_time": time.time() - start_time,
+            }
 
-        # Load and parse definitions
-        framework_data = self.load_framework_definitions()
         frameworks, features, absolute_paths = self.parse_json_data(framework_data)
+        desired = CatalogRows.from_models(frameworks, features, absolute_paths)
         parsing_time = time.time() - start_time
 
         logger.info(
             f"Parsed {len(frameworks)} frameworks, {len(features)} features, {len(absolute_paths)} paths in {parsing_time:.3f}s"
         )
 
-        # Atomic operation: clear existing + repopulate
         db_start_time = time.time()
+        diff = compute_catalog_diff(await self._read_catalog_rows(session), desired)
+        await self._apply_catalog_diff(session, desired, diff)
+        await self._store_catalog_version(session, catalog_version)
 
-        # Clear in correct order (foreign key dependencies)
-        logger.debug("Clearing existing framework definitions...")
-
-        await session.execute(delete(FeatureAbsolutePath))  # type: ignore
-        await session.execute(delete(FrameworkFeature))  # type: ignore
-        await session.execute(delete(Framework))  # type: ignore
-
-        # Bulk insert all records using add_all (optimal for our data size)
-        logger.debug("Bulk inserting framework definitions...")
-        session.add_all(frameworks)
-        session.add_all(features)
-        session.add_all(absolute_paths)
+        if not diff.is_empty:
+            # Cached feature indexes were built from the rows just changed.
+            # Dropping them before the caller commits would let a concurrent
+            # lookup rebuild them from the pre-commit catalog.
+            invalidate_feature_indexes_after_commit(session)
 
         db_time = time.time() - db_start_time
         total_time = time.time() - start_time
 
+        self.catalog_version = catalog_version
         self._loaded = True
 
         metrics = {
+            "catalog_version": catalog_version,
+            "previous_catalog_version": stored_version,
             "parsing_time": parsing_time,
             "db_time": db_time,
             "total_time": total_time,
             "frameworks_count": len(frameworks),
             "features_count": len(features),
             "absolute_paths_count": len(absolute_paths),
+            "frameworks_upserted": len(diff.upsert_frameworks),
+            "frameworks_deleted": len(diff.delete_frameworks),
+            "features_upserted": len(diff.upsert_features),
+            "features_deleted": len(diff.delete_features),
+            "absolute_paths_inserted": len(diff.insert_absolute_paths),
+            "absolute_paths_deleted": len(diff.delete_absolute_paths),
         }
 
-        logger.info("Framework definitions loaded successfully: {}", metrics)
+        logger.info(f"Framework definitions synced successfully: {metrics}")
         return metrics
@@ -16,6 +16,13 @@ from unoplat_code_confluence_commons.base_models import (
     FrameworkFeature,
 )
 
+from code_confluence_flow_bridge.processor.db.postgres.framework_catalog_models import (
+    FrameworkCatalogVersion,
+)
+
+# Row of ``framework_catalog_version`` written by FrameworkDefinitionLoader
+FRAMEWORK_CATALOG_NAME = "framework_definitions"
+
 
 def _resolve_base_confidence(feature: FrameworkFeature) -> float | None:
     if feature.concept != Concept.CALL_EXPRESSION:
@@ -195,3 +202,23 @@ async def get_all_framework_features_for_language(
             f"Failed to query all framework features for language {language}: {e}"
         )
         return []
+
+
+async def get_framework_catalog_version(session: AsyncSession) -> str | None:
+    """
+    Return the content hash of the framework definitions last synced at startup.
+
+    Caches derived from the framework catalog can key on this value; it only
+    changes when the definition files change.
+
+    Args:
+        session: Database session
+
+    Returns:
+        The catalog version, or None before the first sync
+    """
+    return await session.scalar(
+        select(FrameworkCatalogVersion.content_hash).where(
+            FrameworkCatalogVersion.catalog_name == FRAMEWORK_CATALOG_NAME
+        )
+    )
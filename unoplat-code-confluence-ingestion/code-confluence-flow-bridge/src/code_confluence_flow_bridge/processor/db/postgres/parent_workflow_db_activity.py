@@ -21,6 +21,10 @@ from code_confluence_flow_bridge.logging.trace_utils import (
     seed_and_bind_logger_from_trace_id,
 )
 from code_confluence_flow_bridge.processor.db.postgres.db import get_session_cm
+from code_confluence_flow_bridge.processor.db.postgres.workflow_status_events import (
+    notify_workflow_status,
+    repository_run_event,
+)
 
 
 class ParentWorkflowDbActivity:
@@ -166,6 +170,9 @@ class ParentWorkflowDbActivity:
                         status.value,
                     )
 
+                # Delivered to /repository-status-stream subscribers on commit
+                await notify_workflow_status(session, repository_run_event(workflow_run))
+
         except Exception as e:
             log.error(f"Failed to update repository workflow status: {e}")
             raise
@@ -0,0 +1,179 @@
+"""Push workflow status changes to API subscribers through Postgres LISTEN/NOTIFY.
+
+The status DB activities publish a ``WorkflowStatusEvent`` with ``pg_notify``
+in the transaction that writes the run, so it is delivered only once the new
+status is committed and visible to readers. Each API process holds one
+listening connection, opened outside the engine's pool so it never takes a
+slot from request handlers, and fans every notification out to its in-process
+subscribers, so the number of watchers does not add database load.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any, Optional
+
+import asyncpg
+from loguru import logger
+from pydantic import ValidationError
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session
+from unoplat_code_confluence_commons.base_models import (
+    CodebaseWorkflowRun,
+    RepositoryWorkflowRun,
+)
+from unoplat_code_confluence_commons.workflow_models import JobStatus
+
+from code_confluence_flow_bridge.models.github.github_repo import WorkflowStatusEvent
+from code_confluence_flow_bridge.processor.db.postgres.db import (
+    DB_HOST,
+    DB_NAME,
+    DB_PASSWORD,
+    DB_PORT,
+    DB_USER,
+)
+
+WORKFLOW_STATUS_CHANNEL = "workflow_status"
+
+# Events buffered per subscriber; the oldest is dropped when a client lags
+SUBSCRIBER_QUEUE_SIZE = 256
+
+# Delay before re-establishing a lost listening connection
+LISTEN_RECONNECT_DELAY_SECONDS = 5.0
+
+
+def repository_run_event(run: RepositoryWorkflowRun) -> WorkflowStatusEvent:
+    return WorkflowStatusEvent(
+        scope="repository",
+        repository_name=run.repository_name,
+        repository_owner_name=run.repository_owner_name,
+        repository_workflow_run_id=run.repository_workflow_run_id,
+        operation=run.operation,
+        status=JobStatus(run.status),
+        has_error_report=bool(run.error_report),
+        started_at=run.started_at,
+        completed_at=run.completed_at,
+    )
+
+
+def codebase_run_event(run: CodebaseWorkflowRun) -> WorkflowStatusEvent:
+    return WorkflowStatusEvent(
+        scope="codebase",
+        repository_name=run.repository_name,
+        repository_owner_name=run.repository_owner_name,
+        repository_workflow_run_id=run.repository_workflow_run_id,
+        codebase_folder=run.codebase_folder,
+        codebase_workflow_run_id=run.codebase_workflow_run_id,
+        status=JobStatus(run.status),
+        has_error_report=bool(run.error_report),
+        started_at=run.started_at,
+        completed_at=run.completed_at,
+    )
+
+
+async def notify_workflow_status(
+    session: AsyncSession | async_scoped_session[AsyncSession],
+    event: WorkflowStatusEvent,
+) -> None:
+    """Queue ``event`` for delivery when the session's transaction commits."""
+    await session.execute(
+        select(func.pg_notify(WORKFLOW_STATUS_CHANNEL, event.model_dump_json()))
+    )
+
+
+class WorkflowStatusBroadcaster:
+    """Listens on the status channel and fans events out to subscriber queues."""
+
+    def __init__(self, channel: str = WORKFLOW_STATUS_CHANNEL) -> None:
+        self.channel = channel
+        self._subscribers: set[asyncio.Queue[WorkflowStatusEvent]] = set()
+        self._listen_task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def start(self) -> None:
+        if self._listen_task is None:
+            self._listen_task = asyncio.create_task(self._listen_forever())
+
+    async def stop(self) -> None:
+        if self._listen_task is None:
+            return
+        self._listen_task.cancel()
+        try:
+            await self._listen_task
+        except asyncio.CancelledError:
+            pass
+        self._listen_task = None
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[asyncio.Queue[WorkflowStatusEvent]]:
+        queue: asyncio.Queue[WorkflowStatusEvent] = asyncio.Queue(
+            maxsize=SUBSCRIBER_QUEUE_SIZE
+        )
+        self._subscribers.add(queue)
+        try:
+            yield queue
+        finally:
+            self._subscribers.discard(queue)
+
+    def publish(self, event: WorkflowStatusEvent) -> None:
+        """Deliver ``event`` to every subscriber without blocking on slow ones."""
+        for queue in self._subscribers:
+            if queue.full():
+                # Events carry the full run status, so dropping the oldest
+                # only loses intermediate states
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+    def _on_notification(
+        self, connection: Any, pid: int, channel: str, payload: str
+    ) -> None:
+        try:
+            event = WorkflowStatusEvent.model_validate_json(payload)
+        except ValidationError as exc:
+            logger.warning(
+                "Ignoring malformed workflow status notification | error={}", exc
+            )
+            return
+        self.publish(event)
+
+    async def _listen_forever(self) -> None:
+        while True:
+            try:
+                await self._listen_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning(
+                    "Workflow status listener failed, reconnecting | channel={} | error={}",
+                    self.channel,
+                    exc,
+                )
+            await asyncio.sleep(LISTEN_RECONNECT_DELAY_SECONDS)
+
+    async def _listen_once(self) -> None:
+        connection = await asyncpg.connect(
+            user=DB_USER,
+            password=DB_PASSWORD,
+            host=DB_HOST,
+            port=int(DB_PORT),
+            database=DB_NAME,
+        )
+        connection_lost = asyncio.Event()
+
+        def _on_termination(_connection: Any) -> None:
+            connection_lost.set()
+
+        connection.add_termination_listener(_on_termination)
+        try:
+            await connection.add_listener(self.channel, self._on_notification)
+            logger.info(
+                "Listening for workflow status changes | channel={}", self.channel
+            )
+            await connection_lost.wait()
+        finally:
+            connection.remove_termination_listener(_on_termination)
+            if not connection.is_closed():
+                await connection.close()
@@ -5,9 +5,14 @@ This activity replaces the legacy CodebaseProcessingActivity with a new language
 approach that uses TreeSitterStructuralSignatureExtractor and PostgreSQL ingestion.
 """
 
+import asyncio
+import contextlib
+from datetime import timedelta
 import traceback
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Optional
 
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session
 from temporalio import activity
 from temporalio.exceptions import ApplicationError
 
@@ -16,10 +21,18 @@ from code_confluence_flow_bridge.logging.trace_utils import (
 )
 from code_confluence_flow_bridge.models.workflow.repo_workflow_base import (
     CodebaseProcessingActivityEnvelope,
+    CodebaseProcessingProgress,
+    CodebaseShard,
+    CodebaseShardPlan,
+    CodebaseShardProcessingEnvelope,
 )
 from code_confluence_flow_bridge.parser.code_confluence_codebase_parser import (
     CodeConfluenceCodebaseParser,
 )
+from code_confluence_flow_bridge.parser.parsing_runtime import ParsingRuntime
+from code_confluence_flow_bridge.processor.db.postgres.code_confluence_relational_ingestion import (
+    CodeConfluenceRelationalIngestion,
+)
 from code_confluence_flow_bridge.processor.db.postgres.db import (
     get_session_cm,
 )
@@ -27,14 +40,119 @@ from code_confluence_flow_bridge.processor.db.postgres.db import (
 if TYPE_CHECKING:
     from loguru import Logger
 
+# Liveness heartbeat while no batch is flushed; keep well below the
+# workflow's heartbeat_timeout for this activity.
+HEARTBEAT_INTERVAL = timedelta(seconds=30)
+
+
+def _resume_progress(log: "Logger") -> Optional[CodebaseProcessingProgress]:
+    """Return the progress heartbeated by the previous attempt, if any."""
+    details = activity.info().heartbeat_details
+    if not details:
+        return None
+    try:
+        return CodebaseProcessingProgress.model_validate(details[0])
+    except ValidationError as exc:
+        log.warning("Ignoring unreadable heartbeat details | error={}", exc)
+        return None
+
+
+class _ProgressHeartbeat:
+    """Heartbeats the latest parser progress on every flush and on a timer."""
+
+    def __init__(
+        self, log: "Logger", progress: Optional[CodebaseProcessingProgress]
+    ) -> None:
+        self._log = log
+        self.progress = progress or CodebaseProcessingProgress()
+
+    def record(self, progress: CodebaseProcessingProgress) -> None:
+        self.progress = progress
+        activity.heartbeat(progress.model_dump())
+        self._log.debug(
+            "Codebase processing progress | files_written={} | files_committed={} | files_per_second={:.1f}",
+            progress.files_written,
+            progress.files_committed,
+            progress.files_per_second,
+        )
+
+    async def run(self) -> None:
+        while True:
+            activity.heartbeat(self.progress.model_dump())
+            await asyncio.sleep(HEARTBEAT_INTERVAL.total_seconds())
+
 
 class GenericCodebaseProcessingActivity:
     """
     New Temporal activity for processing codebases with PostgreSQL insertion.
 
-    Uses the revamped architecture with language-agnostic parsing.
+    Uses the revamped architecture with language-agnostic parsing. Large
+    codebases can instead be planned into shards, parsed by parallel
+    `process_codebase_shard` activities and finished by `merge_codebase_shards`.
     """
 
+    def __init__(self, parsing_runtime: Optional[ParsingRuntime] = None) -> None:
+        # Shared by every codebase this worker processes; see ParsingRuntime.
+        self.parsing_runtime = parsing_runtime
+
+    @staticmethod
+    def _bind_logger(envelope: CodebaseProcessingActivityEnvelope) -> "Logger":
+        info = activity.info()
+        return seed_and_bind_logger_from_trace_id(
+            trace_id=envelope.trace_id,
+            workflow_id=info.workflow_id,
+            workflow_run_id=info.workflow_run_id,
+            activity_id=info.activity_id,
+            activity_name=info.activity_type,
+        )
+
+    @staticmethod
+    def _processing_error(
+        envelope: CodebaseProcessingActivityEnvelope,
+        error: Exception,
+        activity_name: str,
+        log: "Logger",
+    ) -> ApplicationError:
+        log.error(
+            "Generic codebase processing failed | activity={} | codebase_qualified_name={} | codebase_path={} | error={} | traceback={}",
+            activity_name,
+            envelope.codebase_qualified_name,
+            envelope.codebase_path,
+            str(error),
+            traceback.format_exc(),
+        )
+        return ApplicationError(
+            f"Codebase processing failed for {envelope.codebase_qualified_name}",
+            {
+                "trace_id": envelope.trace_id,
+                "codebase_qualified_name": envelope.codebase_qualified_name,
+                "codebase_path": envelope.codebase_path,
+                "repository_qualified_name": envelope.repository_qualified_name,
+                "programming_language": envelope.programming_language_metadata.language.value,
+                "error": str(error),
+                "activity_name": activity_name,
+                "traceback": traceback.format_exc(),
+            },
+        )
+
+    def _build_parser(
+        self,
+        envelope: CodebaseProcessingActivityEnvelope,
+        session: AsyncSession | async_scoped_session[AsyncSession],
+        **parser_options: Any,
+    ) -> CodeConfluenceCodebaseParser:
+        return CodeConfluenceCodebaseParser(
+            codebase_name=envelope.codebase_qualified_name,
+            codebase_path=envelope.codebase_path,
+            root_packages=envelope.root_packages,
+            programming_language_metadata=envelope.programming_language_metadata,
+            trace_id=envelope.trace_id,
+            session=session,
+            parsing_runtime=self.parsing_runtime,
+            incremental_refresh=envelope.incremental_refresh,
+            **parser_options,
+        )
+
     @activity.defn
     async def process_codebase_generic(
         self, envelope: CodebaseProcessingActivityEnvelope
@@ -48,76 +166,141 @@ class GenericCodebaseProcessingActivity:
         Raises:
             ApplicationError: If processing fails with full context for Temporal retry
         """
-        # Extract parameters from envelope
-        codebase_path = envelope.codebase_path
-        codebase_qualified_name = envelope.codebase_qualified_name
-        programming_language_metadata = envelope.programming_language_metadata
-        trace_id = envelope.trace_id
-
-        # Set up logger with trace context
-        info = activity.info()
-        workflow_id: str = info.workflow_id
-        workflow_run_id: str = info.workflow_run_id
-        activity_id: str = info.activity_id
-        activity_name: str = info.activity_type
-        log: Logger = seed_and_bind_logger_from_trace_id(
-            trace_id=trace_id,
-            workflow_id=workflow_id,
-            workflow_run_id=workflow_run_id,
-            activity_id=activity_id,
-            activity_name=activity_name,
-        )
-
+        log = self._bind_logger(envelope)
         try:
             log.info(
-            "Starting generic codebase processing | codebase_qualified_name={} | codebase_path={} | programming_language={}",
-            codebase_qualified_name,
-            codebase_path,
-            programming_language_metadata.language.value,
-        )
+                "Starting generic codebase processing | codebase_qualified_name={} | codebase_path={} | programming_language={}",
+                envelope.codebase_qualified_name,
+                envelope.codebase_path,
+                envelope.programming_language_metadata.language.value,
+            )
 
             # Process codebase with parser (AST generation and parsing, PostgreSQL insertion)
             await self._process_codebase_with_parser(envelope, log)
 
             log.info(
                 "Generic codebase processing completed successfully | codebase_qualified_name={}",
-                codebase_qualified_name,
+                envelope.codebase_qualified_name,
             )
 
         except Exception as e:
-            log.error(
-                "Generic codebase processing failed | codebase_qualified_name={} | codebase_path={} | error={} | traceback={}",
-                codebase_qualified_name,
-                codebase_path,
-                str(e),
-                traceback.format_exc(),
-            )
+            raise self._processing_error(
+                envelope, e, "process_codebase_generic", log
+            ) from e
+
+    @activity.defn
+    async def plan_codebase_shards(
+        self, envelope: CodebaseProcessingActivityEnvelope
+    ) -> CodebaseShardPlan:
+        """
+        Split a large codebase into shards parsed by parallel activities.
 
-            raise ApplicationError(
-                f"Codebase processing failed for {codebase_qualified_name}",
-                {
-                    "trace_id": trace_id,
-                    "codebase_qualified_name": codebase_qualified_name,
-                    "codebase_path": codebase_path,
-                    "repository_qualified_name": envelope.repository_qualified_name,
-                    "programming_language": programming_language_metadata.language.value,
-                    "error": str(e),
-                    "activity_name": "process_codebase_generic",
-                    "traceback": traceback.format_exc(),
-                },
+        An empty plan means the codebase is processed by `process_codebase_generic`.
+
+        Raises:
+            ApplicationError: If discovery or the incremental refresh plan fails
+        """
+        log = self._bind_logger(envelope)
+        try:
+            async with get_session_cm() as session:
+                parser = self._build_parser(envelope, session)
+                shards = await parser.plan_shards()
+        except Exception as e:
+            raise self._processing_error(
+                envelope, e, "plan_codebase_shards", log
+            ) from e
+
+        log.info(
+            "Planned codebase shards | codebase_qualified_name={} | shards={}",
+            envelope.codebase_qualified_name,
+            len(shards),
+        )
+        return CodebaseShardPlan(shards=shards)
+
+    @activity.defn
+    async def process_codebase_shard(
+        self, envelope: CodebaseShardProcessingEnvelope
+    ) -> None:
+        """
+        Parse and store the files of one shard of a codebase.
+
+        Raises:
+            ApplicationError: If processing fails with full context for Temporal retry
+        """
+        log = self._bind_logger(envelope)
+        try:
+            log.info(
+                "Starting codebase shard processing | codebase_qualified_name={} | shard={} | files={} | bytes={}",
+                envelope.codebase_qualified_name,
+                envelope.shard.shard_index,
+                envelope.shard.file_count,
+                envelope.shard.total_bytes,
+            )
+            await self._process_codebase_with_parser(
+                envelope, log, shard=envelope.shard
             )
+        except Exception as e:
+            raise self._processing_error(
+                envelope, e, "process_codebase_shard", log
+            ) from e
+
+    @activity.defn
+    async def merge_codebase_shards(
+        self, envelope: CodebaseProcessingActivityEnvelope
+    ) -> None:
+        """
+        Record the codebase's frameworks and catalog version once every shard
+        has been stored.
+
+        Raises:
+            ApplicationError: If the frameworks cannot be written
+        """
+        log = self._bind_logger(envelope)
+        try:
+            async with get_session_cm() as session:
+                ingestion = CodeConfluenceRelationalIngestion(session)
+                framework_count = (
+                    await ingestion.upsert_codebase_frameworks_from_features(
+                        envelope.codebase_qualified_name
+                    )
+                )
+                catalog_version = await ingestion.get_framework_catalog_version()
+                if catalog_version is not None:
+                    await ingestion.upsert_codebase_catalog_version(
+                        envelope.codebase_qualified_name, catalog_version
+                    )
+        except Exception as e:
+            raise self._processing_error(
+                envelope, e, "merge_codebase_shards", log
+            ) from e
+
+        log.info(
+            "Merged codebase shards | codebase_qualified_name={} | frameworks={}",
+            envelope.codebase_qualified_name,
+            framework_count,
+        )
 
     async def _process_codebase_with_parser(
-        self, envelope: CodebaseProcessingActivityEnvelope, log: "Logger"
+        self,
+        envelope: CodebaseProcessingActivityEnvelope,
+        log: "Logger",
+        shard: Optional[CodebaseShard] = None,
     ) -> None:
         """
         Process codebase using CodeConfluenceCodebaseParser with PostgreSQL ingestion.
 
+        Chunks committed by a previous attempt are recovered from its last
+        heartbeat, so a retry resumes instead of starting over.
+
         Args:
             envelope: Activity envelope with codebase parameters
+            shard: Path range to restrict parsing to, when sharded
         """
         parser: CodeConfluenceCodebaseParser | None = None
         files_processed: int = 0
+        resume_from = _resume_progress(log)
+        heartbeat = _ProgressHeartbeat(log, resume_from)
+        heartbeat_task = asyncio.create_task(heartbeat.run())
         try:
             log.info(
                 "Starting generic parser processing | codebase_qualified_name={} | programming_language={} | root_packages={} ",
@@ -127,21 +310,22 @@ class GenericCodebaseProcessingActivity:
             )
 
             async with get_session_cm() as session:
-                parser = CodeConfluenceCodebaseParser(
-                    codebase_name=envelope.codebase_qualified_name,
-                    codebase_path=envelope.codebase_path,
-                    root_packages=envelope.root_packages,
-                    programming_language_metadata=envelope.programming_language_metadata,
-                    trace_id=envelope.trace_id,
-                    session=session,
+                parser = self._build_parser(
+                    envelope,
+                    session,
+                    resume_from=resume_from,
+                    progress_callback=heartbeat.record,
+                    shard=shard,
                 )
                 await parser.process_and_insert_codebase()
                 files_processed = getattr(parser, "files_processed", 0)
 
             log.info(
-                "Parser processing completed successfully | codebase_qualified_name={} | files_processed={}",
+                "Parser processing completed successfully | codebase_qualified_name={} | files_processed={} | files_per_second={:.1f} | checkpoints={}",
                 envelope.codebase_qualified_name,
                 files_processed,
+                heartbeat.progress.files_per_second,
+                heartbeat.progress.checkpoints,
             )
 
         except Exception as e:
@@ -152,6 +336,10 @@ class GenericCodebaseProcessingActivity:
                 files_processed,
             )
             raise
+        finally:
+            heartbeat_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await heartbeat_task
 
 
 # Note: Activity instances are now created in main.py with proper dependency injection
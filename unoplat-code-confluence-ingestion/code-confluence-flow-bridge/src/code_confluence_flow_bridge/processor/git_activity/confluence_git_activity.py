@@ -4,6 +4,7 @@ from temporalio import activity
 from temporalio.exceptions import ApplicationError
 
 from code_confluence_flow_bridge.confluence_git.github_helper import GithubHelper
+from code_confluence_flow_bridge.logging.logger_protocol import StructuredLogger
 from code_confluence_flow_bridge.logging.trace_utils import (
     seed_and_bind_logger_from_trace_id,
 )
@@ -13,6 +14,10 @@ from code_confluence_flow_bridge.models.code_confluence_parsing_models.unoplat_g
 from code_confluence_flow_bridge.models.workflow.repo_workflow_base import (
     GitActivityEnvelope,
 )
+from code_confluence_flow_bridge.parser.repository_inventory import (
+    RepositoryInventory,
+    find_repository_root,
+)
 
 
 class GitActivity:
@@ -72,6 +77,8 @@ class GitActivity:
                 repo_request, github_token
             )
 
+            self._persist_repository_inventory(activity_data, log)
+
             log.debug(
                 "Successfully processed git activity | git_url={} | provider={} | status=success",
                 repo_request.repository_git_url,
@@ -107,3 +114,36 @@ class GitActivity:
                 {"activity_id": activity_id or ""},
                 type="GIT_ACTIVITY_ERROR",
             )
+
+    @staticmethod
+    def _persist_repository_inventory(
+        git_repository: UnoplatGitRepository, log: StructuredLogger
+    ) -> None:
+        """Walk the fresh checkout once so codebase parsing can skip its own walk.
+
+        The snapshot is an optimisation only; failing to write it is logged and
+        parsing falls back to walking each codebase.
+        """
+        if not git_repository.codebases:
+            return
+        repository_root = find_repository_root(
+            git_repository.codebases[0].codebase_path
+        )
+        if repository_root is None:
+            return
+        try:
+            inventory = RepositoryInventory.build(repository_root)
+            snapshot_path = inventory.save_snapshot()
+        except OSError as exc:
+            log.warning(
+                "Failed to persist repository inventory | root={} | error={}",
+                repository_root,
+                exc,
+            )
+            return
+        log.info(
+            "Persisted repository inventory | root={} | files={} | snapshot={}",
+            repository_root,
+            len(inventory),
+            snapshot_path,
+        )
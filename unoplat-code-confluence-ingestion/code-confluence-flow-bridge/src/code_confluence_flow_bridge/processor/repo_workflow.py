@@ -71,6 +71,13 @@ class RepoWorkflow:
             workflow.logger.info(
                 "Starting repository workflow for %s", repo_request.repository_git_url
             )
+            if envelope.commit_range is not None:
+                workflow.logger.info(
+                    "Refreshing pushed commits %s..%s (%d pushes)",
+                    envelope.commit_range.before_sha,
+                    envelope.commit_range.after_sha,
+                    envelope.commit_range.push_count,
+                )
 
             workflow.logger.info("Executing git activity to process repository")
             # Create GitActivityEnvelope
@@ -137,6 +144,8 @@ class RepoWorkflow:
                         package_manager_metadata=unoplat_codebase.package_manager_metadata,
                         trace_id=trace_id,
                         parent_workflow_run_id=workflow_run_id,
+                        incremental_refresh=envelope.incremental_refresh,
+                        codebase_sharding=envelope.codebase_sharding,
                     )
                     child_handle: ChildWorkflowHandle[CodebaseChildWorkflow, None] = (
                         await workflow.start_child_workflow(
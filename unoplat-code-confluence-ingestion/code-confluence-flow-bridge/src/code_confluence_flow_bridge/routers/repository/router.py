@@ -1,14 +1,21 @@
-"""Repository-scoped API endpoints (status, data, metadata, delete, refresh)."""
+"""Repository-scoped API endpoints.
+
+Covers status (polled and streamed), data, metadata, export, delete and refresh.
+"""
 
 import asyncio
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack
 from typing import Any, Dict, Optional, cast
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from loguru import logger
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import QueryableAttribute, selectinload
 from sqlmodel import select
+from starlette.background import BackgroundTask
 from temporalio.client import Client, WorkflowHandle
 from unoplat_code_confluence_commons.base_models import (
     CodebaseWorkflowRun,
@@ -41,11 +48,24 @@ from code_confluence_flow_bridge.models.github.github_repo import (
     RepositoryAddResponse,
     RepositoryRefreshRequest,
     RepositoryRequestConfiguration,
+    WorkflowStatusEvent,
 )
 from code_confluence_flow_bridge.models.github.repository_git_url import (
     parse_repository_git_url,
 )
-from code_confluence_flow_bridge.processor.db.postgres.db import get_session
+from code_confluence_flow_bridge.processor.db.postgres.codebase_graph_export import (
+    NDJSON_MEDIA_TYPE,
+    encode_ndjson,
+    get_export_codebase,
+    stream_codebase_graph,
+)
+from code_confluence_flow_bridge.processor.db.postgres.db import (
+    get_session,
+    get_session_cm,
+)
+from code_confluence_flow_bridge.processor.db.postgres.workflow_status_events import (
+    WorkflowStatusBroadcaster,
+)
 from code_confluence_flow_bridge.processor.repo_workflow import RepoWorkflow
 from code_confluence_flow_bridge.routers.repository.idempotency_service import (
     get_active_repository_operation,
@@ -65,6 +85,7 @@ from code_confluence_flow_bridge.utility.provider_urls import (
 from code_confluence_flow_bridge.utility.runtime_deps import (
     get_codebase_detectors,
     get_temporal_client_dep,
+    get_workflow_status_broadcaster,
 )
 from code_confluence_flow_bridge.utility.token_utils import (
     fetch_repository_provider_token,
@@ -76,6 +97,9 @@ from code_confluence_flow_bridge.utility.workflow_helpers import (
 
 router = APIRouter(prefix="", tags=["Repository"])
 
+# Comment line sent on idle status streams so proxies keep them open
+STATUS_STREAM_KEEPALIVE_SECONDS = 15.0
+
 
 # ---------------------------------------------------------------------------
 # GET /repository-status
@@ -152,6 +176,95 @@ async def get_repository_status(
         )
 
 
+# ---------------------------------------------------------------------------
+# GET /repository-status-stream
+# ---------------------------------------------------------------------------
+
+
+def _sse_message(event: str, data: str) -> str:
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+@router.get(
+    "/repository-status-stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def stream_repository_status(
+    request: Request,
+    repository_name: Optional[str] = Query(
+        None, description="Only push changes of this repository"
+    ),
+    repository_owner_name: Optional[str] = Query(
+        None, description="Only push changes of repositories of this owner"
+    ),
+    workflow_run_id: Optional[str] = Query(
+        None, description="Only push changes of this repository workflow run"
+    ),
+    broadcaster: WorkflowStatusBroadcaster = Depends(get_workflow_status_broadcaster),
+) -> StreamingResponse:
+    """
+    Push repository and codebase workflow status changes as server-sent events.
+
+    Replaces polling `/repository-status`: each `status` event carries the full
+    current status of one run. When all three filters are given, the stream
+    starts with a `snapshot` event holding the `/repository-status` payload.
+    """
+    # Subscribe before reading the snapshot so no change between the two is
+    # lost; the snapshot session is released before the stream starts.
+    subscription = AsyncExitStack()
+    queue = await subscription.enter_async_context(broadcaster.subscribe())
+    snapshot: Optional[GithubRepoStatus] = None
+    if repository_name and repository_owner_name and workflow_run_id:
+        try:
+            async with get_session_cm() as session:
+                snapshot = await get_repository_status(
+                    repository_name=repository_name,
+                    repository_owner_name=repository_owner_name,
+                    workflow_run_id=workflow_run_id,
+                    session=session,
+                )
+        except BaseException:
+            await subscription.aclose()
+            raise
+
+    def _matches(event: WorkflowStatusEvent) -> bool:
+        return (
+            (repository_name is None or event.repository_name == repository_name)
+            and (
+                repository_owner_name is None
+                or event.repository_owner_name == repository_owner_name
+            )
+            and (
+                workflow_run_id is None
+                or event.repository_workflow_run_id == workflow_run_id
+            )
+        )
+
+    async def _events() -> AsyncIterator[str]:
+        async with subscription:
+            if snapshot is not None:
+                yield _sse_message("snapshot", snapshot.model_dump_json())
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(
+                        queue.get(), timeout=STATUS_STREAM_KEEPALIVE_SECONDS
+                    )
+                except TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if _matches(event):
+                    yield _sse_message("status", event.model_dump_json())
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        # Drops the subscription if the stream is never iterated
+        background=BackgroundTask(subscription.aclose),
+    )
+
+
 # ---------------------------------------------------------------------------
 # GET /repository-data
 # ---------------------------------------------------------------------------
@@ -274,6 +387,53 @@ async def get_codebase_metadata(
         )
 
 
+# ---------------------------------------------------------------------------
+# GET /codebase-export
+# ---------------------------------------------------------------------------
+
+
+@router.get(
+    "/codebase-export",
+    response_class=StreamingResponse,
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}},
+)
+async def export_codebase_graph(
+    codebase_qualified_name: str = Query(
+        ..., description="Qualified name of the ingested codebase to export"
+    ),
+    session: AsyncSession = Depends(get_session),
+) -> StreamingResponse:
+    """
+    Stream a codebase's files, imports, data-model positions and framework
+    feature usages as NDJSON.
+
+    Rows are read through server-side cursors and sent as a chunked response,
+    so multi-GB codebases are exported in constant memory.
+    """
+    codebase_record = await get_export_codebase(session, codebase_qualified_name)
+    if codebase_record is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Codebase not found: {}".format(codebase_qualified_name),
+        )
+
+    async def _records() -> AsyncIterator[Dict[str, Any]]:
+        # The request-scoped session is released before the body streams, so
+        # the cursors run in a session owned by the response.
+        async with get_session_cm() as export_session:
+            async for record in stream_codebase_graph(export_session, codebase_record):
+                yield record
+
+    logger.info(
+        "Streaming codebase export | codebase_qualified_name={}",
+        codebase_qualified_name,
+    )
+    return StreamingResponse(
+        encode_ndjson(_records()),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
+
+
 # ---------------------------------------------------------------------------
 # DELETE /delete-repository
 # ---------------------------------------------------------------------------
@@ -1,11 +1,19 @@
 """Codebase detection orchestration and Protocol definition."""
 
-from typing import Protocol, runtime_checkable
+import os
+import asyncio
+from typing import Optional, Protocol, runtime_checkable
 
 from fastapi import HTTPException
 from unoplat_code_confluence_commons.configuration_models import CodebaseConfig
 
 from code_confluence_flow_bridge.logging.logger_protocol import StructuredLogger
+from code_confluence_flow_bridge.parser.package_manager.shared.git_utils import (
+    clone_repo_if_missing,
+)
+from code_confluence_flow_bridge.parser.repository_inventory import (
+    RepositoryInventory,
+)
 
 
 @runtime_checkable
@@ -18,10 +26,27 @@ class CodebaseDetector(Protocol):
 
     async def initialize_rules(self) -> None: ...
     async def detect_codebases(
-        self, git_url: str, github_token: str
+        self,
+        git_url: str,
+        github_token: str,
+        *,
+        inventory: Optional[RepositoryInventory] = None,
     ) -> list[CodebaseConfig]: ...
 
 
+async def prepare_repository_inventory(
+    git_url: str, github_token: str
+) -> RepositoryInventory:
+    """Check out ``git_url`` (unless it is a local path) and walk it once."""
+    repo_path = git_url
+    if not os.path.exists(git_url):
+        cloned_path = await asyncio.to_thread(
+            clone_repo_if_missing, git_url, github_token, depth=1
+        )
+        repo_path = str(cloned_path)
+    return await asyncio.to_thread(RepositoryInventory.build, repo_path)
+
+
 async def detect_codebases_multi_language(
     git_url: str,
     github_token: str,
@@ -32,9 +57,10 @@ async def detect_codebases_multi_language(
     Detect codebases using all configured language detectors.
 
     This function runs detection across all supported programming languages
-    (Python, TypeScript, etc.) and aggregates the results. It handles errors
-    gracefully by logging failures per language and continuing with other
-    detectors.
+    (Python, TypeScript, etc.) and aggregates the results. The repository is
+    checked out and walked once, and the resulting inventory is shared by every
+    detector. It handles errors gracefully by logging failures per language and
+    continuing with other detectors.
 
     Args:
         git_url: GitHub repository URL or local filesystem path
@@ -46,17 +72,35 @@ async def detect_codebases_multi_language(
         List of detected CodebaseConfig across all languages
 
     Raises:
-        HTTPException: If all detectors fail to find any codebases
+        HTTPException: If the repository cannot be checked out, or if all
+            detectors fail to find any codebases
     """
     aggregated_codebases: list[CodebaseConfig] = []
     errors: dict[str, str] = {}
 
+    try:
+        inventory = await prepare_repository_inventory(git_url, github_token)
+    except Exception as exc:
+        request_logger.error(
+            "Repository checkout for codebase detection failed | repo={} | error={}",
+            git_url,
+            exc,
+        )
+        raise HTTPException(
+            status_code=500, detail=f"Repository checkout failed: {exc}"
+        ) from exc
+    request_logger.info(
+        "Repository inventory ready | repo={} | files={}", git_url, len(inventory)
+    )
+
     for language, detector in detectors.items():
         try:
             request_logger.info(
                 "Running {} codebase detection for {}", language, git_url
             )
-            codebases = await detector.detect_codebases(git_url, github_token)
+            codebases = await detector.detect_codebases(
+                inventory.root, github_token, inventory=inventory
+            )
             aggregated_codebases.extend(codebases)
             request_logger.info(
                 "{} detection completed - found {} codebases",
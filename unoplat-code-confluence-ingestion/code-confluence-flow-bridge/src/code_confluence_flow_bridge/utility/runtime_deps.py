@@ -3,9 +3,13 @@
 from fastapi import Request
 from temporalio.client import Client
 
+from code_confluence_flow_bridge.github_app.push_refresh import PushRefreshDebouncer
 from code_confluence_flow_bridge.models.configuration.settings import (
     EnvironmentSettings,
 )
+from code_confluence_flow_bridge.processor.db.postgres.workflow_status_events import (
+    WorkflowStatusBroadcaster,
+)
 from code_confluence_flow_bridge.utility.detection import CodebaseDetector
 
 
@@ -25,3 +29,17 @@ def get_codebase_detectors(request: Request) -> dict[str, CodebaseDetector]:
     """Retrieve the codebase detector registry from ``app.state``."""
     detectors: dict[str, CodebaseDetector] = request.app.state.codebase_detectors
     return detectors
+
+
+def get_workflow_status_broadcaster(request: Request) -> WorkflowStatusBroadcaster:
+    """Retrieve the ``WorkflowStatusBroadcaster`` from ``app.state``."""
+    broadcaster: WorkflowStatusBroadcaster = (
+        request.app.state.workflow_status_broadcaster
+    )
+    return broadcaster
+
+
+def get_push_refresh_debouncer(request: Request) -> PushRefreshDebouncer:
+    """Retrieve the ``PushRefreshDebouncer`` from ``app.state``."""
+    debouncer: PushRefreshDebouncer = request.app.state.push_refresh_debouncer
+    return debouncer
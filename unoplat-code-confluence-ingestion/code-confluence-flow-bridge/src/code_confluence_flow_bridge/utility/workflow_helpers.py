@@ -1,5 +1,7 @@
 """Workflow start, monitoring, and status helpers for Temporal workflows."""
 
+from typing import Optional
+
 from loguru import logger
 from temporalio.client import Client, WorkflowHandle
 from unoplat_code_confluence_commons.base_models import RepositoryWorkflowOperation
@@ -12,9 +14,13 @@ from code_confluence_flow_bridge.models.github.github_repo import (
     RepositoryRequestConfiguration,
 )
 from code_confluence_flow_bridge.models.workflow.repo_workflow_base import (
+    CommitRange,
     RepoWorkflowRunEnvelope,
 )
 from code_confluence_flow_bridge.processor.repo_workflow import RepoWorkflow
+from code_confluence_flow_bridge.utility.environment_utils import (
+    get_environment_settings,
+)
 
 CANCELLABLE_PARENT_WORKFLOW_OPERATIONS: set[RepositoryWorkflowOperation] = {
     RepositoryWorkflowOperation.AGENTS_GENERATION,
@@ -47,12 +53,24 @@ async def start_workflow(
     github_token: str,
     workflow_id: str,
     trace_id: str,
+    incremental_refresh: Optional[bool] = None,
+    commit_range: Optional[CommitRange] = None,
 ) -> WorkflowHandle[RepoWorkflow, UnoplatGitRepository]:
     """
     Start a Temporal workflow for the given repository request and workflow id.
+
+    ``incremental_refresh`` overrides the worker's incremental parsing setting
+    for this run; ``commit_range`` records the pushes that triggered it.
+    Whether codebases may be sharded is recorded from the current settings.
     """
+    settings = get_environment_settings()
     envelope = RepoWorkflowRunEnvelope(
-        repo_request=repo_request, github_token=github_token, trace_id=trace_id
+        repo_request=repo_request,
+        github_token=github_token,
+        trace_id=trace_id,
+        incremental_refresh=incremental_refresh,
+        commit_range=commit_range,
+        codebase_sharding=settings.codebase_parser_shard_target_mb > 0,
     )
     workflow_handle: WorkflowHandle[RepoWorkflow, UnoplatGitRepository] = (
         await temporal_client.start_workflow(
@@ -0,0 +1,197 @@
+"""Deterministic synthetic codebases for the ingestion benchmarks.
+
+Files are spread over packages of ``FILES_PER_PACKAGE`` modules and cycle
+through a few shapes (API routers, data models, plain helpers) so that the
+hot paths all get exercised: imports with aliases, framework feature
+detection, and data model detection. File sizes vary with the file index but
+the same index always produces the same bytes, so baselines stay comparable.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable
+
+FILES_PER_PACKAGE = 100
+
+PYTHON_SHAPES = ("router", "model", "helper")
+TYPESCRIPT_SHAPES = ("client", "store", "helper")
+
+
+def _python_router(index: int) -> str:
+    endpoints = "\n".join(
+        f"""
+@router.get("/items/{index}/{endpoint}")
+async def read_item_{endpoint}(item_id: int, db=Depends(get_db)) -> ItemOut:
+    payload = await fetch_payload(item_id, offset={endpoint})
+    return ItemOut(id=item_id, name=str(payload))
+"""
+        for endpoint in range(2 + index % 4)
+    )
+    return f'''"""Router module {index}."""
+
+from fastapi import APIRouter, Depends
+from fastapi import HTTPException as HttpError
+import httpx as http_client
+
+from .helpers_{index % 7} import fetch_payload
+from .models_{index % 5} import ItemOut
+
+router = APIRouter(prefix="/v{index % 3}")
+
+
+def get_db():
+    return http_client.AsyncClient()
+
+{endpoints}
+
+async def fail_{index}() -> None:
+    raise HttpError(status_code=404)
+'''
+
+
+def _python_model(index: int) -> str:
+    fields = "\n".join(
+        f"    field_{field}: int = Field(default={field}, ge=0)"
+        for field in range(3 + index % 8)
+    )
+    return f'''"""Models module {index}."""
+
+from typing import Optional
+
+from pydantic import BaseModel, Field
+import pydantic as pd
+
+
+class ItemOut(BaseModel):
+    id: int
+    name: Optional[str] = None
+{fields}
+
+
+class Settings{index}(pd.BaseModel):
+    enabled: bool = True
+'''
+
+
+def _python_helper(index: int) -> str:
+    helpers = "\n".join(
+        f"""
+def transform_{helper}(values: list[int]) -> list[int]:
+    total = 0
+    for value in values:
+        if value % {helper + 2} == 0:
+            total += value * {helper + 1}
+        else:
+            total -= value
+    return [total, len(values), {index}]
+"""
+        for helper in range(4 + index % 6)
+    )
+    return f'''"""Helper module {index}."""
+
+import json
+import os.path as osp
+from collections import defaultdict as dd
+
+
+async def fetch_payload(item_id: int, offset: int = 0) -> str:
+    return json.dumps({{"id": item_id, "offset": offset, "base": osp.sep}})
+
+{helpers}
+
+GROUPS = dd(list)
+'''
+
+
+def _typescript_client(index: int) -> str:
+    calls = "\n".join(
+        f"""
+export async function fetchResource{call}(id: number): Promise<Resource> {{
+  const response = await api.get<Resource>(`/resources/${{id}}/{call}`);
+  return normalize(response.data, {call});
+}}
+"""
+        for call in range(2 + index % 4)
+    )
+    return f"""import axios from "axios";
+import {{ normalize }} from "../shared/normalize_{index % 7}";
+import type {{ Resource }} from "./types_{index % 5}";
+
+const api = axios.create({{ baseURL: "/api/v{index % 3}" }});
+{calls}"""
+
+
+def _typescript_store(index: int) -> str:
+    fields = "\n".join(f"  field{field}: number;" for field in range(3 + index % 8))
+    return f"""import {{ create }} from "zustand";
+
+export interface Resource {{
+  id: number;
+  name?: string;
+{fields}
+}}
+
+interface ResourceState {{
+  items: Resource[];
+  add: (item: Resource) => void;
+}}
+
+export const useResourceStore{index} = create<ResourceState>()((set) => ({{
+  items: [],
+  add: (item) => set((state) => ({{ items: [...state.items, item] }})),
+}}));
+"""
+
+
+def _typescript_helper(index: int) -> str:
+    helpers = "\n".join(
+        f"""
+export function transform{helper}(values: number[]): number[] {{
+  let total = 0;
+  for (const value of values) {{
+    total += value % {helper + 2} === 0 ? value * {helper + 1} : -value;
+  }}
+  return [total, values.length, {index}];
+}}
+"""
+        for helper in range(4 + index % 6)
+    )
+    return f"""import * as path from "path";
+import {{ format as formatDate }} from "date-fns";
+
+export const separator{index} = path.sep;
+export const stamp{index} = () => formatDate(new Date(), "yyyy-MM-dd");
+{helpers}"""
+
+
+_PYTHON_RENDERERS: dict[str, Callable[[int], str]] = {
+    "router": _python_router,
+    "model": _python_model,
+    "helper": _python_helper,
+}
+_TYPESCRIPT_RENDERERS: dict[str, Callable[[int], str]] = {
+    "client": _typescript_client,
+    "store": _typescript_store,
+    "helper": _typescript_helper,
+}
+
+
+def generate_corpus(root: Path, language: str, file_count: int) -> Path:
+    """Write ``file_count`` source files for ``language`` under ``root``."""
+    if language == "python":
+        shapes, renderers, suffix = PYTHON_SHAPES, _PYTHON_RENDERERS, ".py"
+    elif language == "typescript":
+        shapes, renderers, suffix = TYPESCRIPT_SHAPES, _TYPESCRIPT_RENDERERS, ".ts"
+    else:
+        raise ValueError(f"No synthetic corpus for language={language}")
+
+    for index in range(file_count):
+        package = root / f"package_{index // FILES_PER_PACKAGE:04d}"
+        if index % FILES_PER_PACKAGE == 0:
+            package.mkdir(parents=True, exist_ok=True)
+        shape = shapes[index % len(shapes)]
+        (package / f"{shape}_{index}{suffix}").write_text(
+            renderers[shape](index), encoding="utf-8"
+        )
+    return root
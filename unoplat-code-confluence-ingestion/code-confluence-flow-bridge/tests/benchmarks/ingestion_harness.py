@@ -0,0 +1,323 @@
+"""Measurement helpers shared by the ingestion benchmarks.
+
+A scenario runs ``CodeConfluenceCodebaseParser`` end to end and then again
+stage by stage over the same files, and produces an ``IngestionReport``.
+Reports are compared against the baseline recorded on the same kind of
+machine, ``baselines/<machine key>.json``, and can be re-recorded from a run;
+timings from another machine say nothing about this one. Peak RSS is the
+process high-water mark, so scenarios run in ascending corpus size and each
+report includes everything before it.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+import json
+import math
+from pathlib import Path
+import platform
+import resource
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from code_confluence_flow_bridge.engine.detector.data_model_detector import (
+    detect_data_model,
+)
+from code_confluence_flow_bridge.engine.framework_detection_service import (
+    FrameworkDetectionService,
+)
+from code_confluence_flow_bridge.engine.framework_feature_index import (
+    FrameworkFeatureIndex,
+)
+from code_confluence_flow_bridge.engine.programming_language.common.language_service import (
+    LanguageServiceSpec,
+)
+from code_confluence_flow_bridge.engine.programming_language.common.source_context import (
+    BaseSourceContext,
+)
+from code_confluence_flow_bridge.models.configuration.settings import (
+    EnvironmentSettings,
+)
+from code_confluence_flow_bridge.processor.db.postgres.framework_loader import (
+    FrameworkDefinitionLoader,
+)
+from code_confluence_flow_bridge.processor.db.postgres.framework_query_service import (
+    _build_feature_spec,
+    _resolve_base_confidence,
+)
+from tree_sitter_language_pack import get_parser
+
+FLOW_BRIDGE_ROOT = Path(__file__).resolve().parents[2]
+FRAMEWORK_DEFINITIONS_PATH = FLOW_BRIDGE_ROOT / "framework-definitions"
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+
+# Per-file stages timed by ``measure_file_stages``, in pipeline order
+FILE_STAGES = ("read", "parse", "import_aliases", "detection")
+
+
+@dataclass
+class IngestionReport:
+    """Throughput, latency and memory of one benchmark scenario.
+
+    Attributes:
+        scenario: Stable key used to look the baseline up.
+        files: Source files ingested.
+        files_per_second: End-to-end parser throughput, discovery included.
+        p50_ms: Median per-file latency across the timed stages.
+        p99_ms: 99th percentile per-file latency across the timed stages.
+        peak_rss_mb: Process resident set high-water mark after the scenario.
+        stage_seconds: Total seconds spent in each stage.
+    """
+
+    scenario: str
+    files: int
+    files_per_second: float
+    p50_ms: float
+    p99_ms: float
+    peak_rss_mb: float
+    stage_seconds: Dict[str, float] = field(default_factory=dict)
+
+    def summary(self) -> str:
+        stages = " | ".join(
+            f"{stage}={seconds:.2f}s" for stage, seconds in self.stage_seconds.items()
+        )
+        return (
+            f"{self.scenario} | files={self.files}"
+            f" | files/s={self.files_per_second:.0f}"
+            f" | p50={self.p50_ms:.2f}ms | p99={self.p99_ms:.2f}ms"
+            f" | peak_rss={self.peak_rss_mb:.0f}MiB | {stages}"
+        )
+
+
+def percentile(values: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of ``values`` (``fraction`` in [0, 1])."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+def peak_rss_mb() -> float:
+    """Return the process's peak resident set size in MiB."""
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return max_rss / divisor
+
+
+def build_offline_feature_index(language: str) -> FrameworkFeatureIndex:
+    """Build the feature index from the bundled definitions, without Postgres."""
+    loader = FrameworkDefinitionLoader(
+        EnvironmentSettings(FRAMEWORK_DEFINITIONS_PATH=str(FRAMEWORK_DEFINITIONS_PATH))
+    )
+    _, features, absolute_paths = loader.parse_json_data(
+        loader.load_framework_definitions()
+    )
+    paths_by_feature: Dict[tuple[str, str, str, str], List[str]] = defaultdict(list)
+    for path in absolute_paths:
+        paths_by_feature[
+            (path.language, path.library, path.capability_key, path.operation_key)
+        ].append(path.absolute_path)
+
+    feature_specs = [
+        _build_feature_spec(
+            feature,
+            paths_by_feature[
+                (
+                    feature.language,
+                    feature.library,
+                    feature.capability_key,
+                    feature.operation_key,
+                )
+            ],
+            _resolve_base_confidence(feature),
+        )
+        for feature in features
+        if feature.language == language
+    ]
+    return FrameworkFeatureIndex(language, feature_specs)
+
+
+class InMemoryIngestion:
+    """Stands in for ``CodeConfluenceRelationalIngestion`` to isolate the CPU path."""
+
+    def __init__(self, feature_index: FrameworkFeatureIndex) -> None:
+        self._feature_index = feature_index
+        self.files_written = 0
+        self.feature_rows_written = 0
+
+    async def get_file_checksums(
+        self, codebase_qualified_name: str
+    ) -> Dict[str, Optional[str]]:
+        return {}
+
+    async def delete_files(self, file_paths: Any) -> None:
+        return None
+
+    async def delete_file_features(self, file_paths: Any) -> None:
+        return None
+
+    async def get_framework_catalog_version(self) -> Optional[str]:
+        return self._feature_index.catalog_version
+
+    async def get_codebase_catalog_version(
+        self, codebase_qualified_name: str
+    ) -> Optional[str]:
+        return None
+
+    async def upsert_codebase_catalog_version(
+        self, codebase_qualified_name: str, content_hash: str
+    ) -> None:
+        return None
+
+    async def get_framework_libraries_for_language(self, language: str) -> List[str]:
+        return sorted({spec.library for spec in self._feature_index.feature_specs})
+
+    async def get_framework_features_for_language(
+        self, language: str
+    ) -> List[tuple[str, str, str]]:
+        return [
+            (spec.library, spec.capability_key, spec.operation_key)
+            for spec in self._feature_index.feature_specs
+        ]
+
+    async def upsert_files(self, codebase_qualified_name: str, files: Any) -> None:
+        self.files_written += len(list(files))
+
+    async def upsert_file_feature_rows(self, feature_rows: Any) -> None:
+        self.feature_rows_written += len(list(feature_rows))
+
+    async def upsert_codebase_frameworks(
+        self, codebase_qualified_name: str, frameworks: Any
+    ) -> None:
+        return None
+
+
+async def measure_file_stages(
+    language: str,
+    language_service: LanguageServiceSpec,
+    detection_service: FrameworkDetectionService,
+    file_paths: Sequence[str],
+) -> tuple[Dict[str, float], List[float]]:
+    """Run the per-file pipeline serially, timing each stage.
+
+    Mirrors ``SharedTreeSitterLanguageProcessor.extract_file_data`` with the
+    source context split into its parse and import alias steps.
+
+    Returns:
+        Total seconds per stage, and each file's latency in seconds
+    """
+    builder = language_service.create_source_context_builder()
+    parser = get_parser(builder.language_name)
+    stage_seconds = dict.fromkeys(FILE_STAGES, 0.0)
+    latencies: List[float] = []
+
+    for file_path in file_paths:
+        started = time.perf_counter()
+        source_bytes = Path(file_path).read_bytes()
+        read_done = time.perf_counter()
+
+        tree = parser.parse(source_bytes)
+        parse_done = time.perf_counter()
+
+        import_nodes = builder.import_extractor.extract_import_nodes(tree.root_node)
+        imports = [
+            source_bytes[node.start_byte : node.end_byte].decode(
+                "utf-8", errors="ignore"
+            )
+            for node in import_nodes
+        ]
+        import_aliases = builder.alias_strategy.build_import_aliases_from_nodes(
+            import_nodes, source_bytes
+        )
+        aliases_done = time.perf_counter()
+
+        source_context = BaseSourceContext(
+            source_bytes=source_bytes,
+            tree=tree,
+            root_node=tree.root_node,
+            imports=imports,
+            import_aliases=import_aliases,
+        )
+        detect_data_model(source_context=source_context, language=language)
+        await detection_service.detect_features(
+            source_context=source_context, programming_language=language
+        )
+        detection_done = time.perf_counter()
+
+        stage_seconds["read"] += read_done - started
+        stage_seconds["parse"] += parse_done - read_done
+        stage_seconds["import_aliases"] += aliases_done - parse_done
+        stage_seconds["detection"] += detection_done - aliases_done
+        latencies.append(detection_done - started)
+
+    return stage_seconds, latencies
+
+
+def machine_key() -> str:
+    """Name the baselines of this machine: OS, architecture, CPUs and Python.
+
+    ``INGESTION_BENCHMARK_MACHINE`` overrides it, for example with the name of a
+    CI runner class whose baseline is cached between runs.
+    """
+    override = os.getenv("INGESTION_BENCHMARK_MACHINE")
+    if override:
+        return override
+    return (
+        f"{platform.system()}-{platform.machine()}-{os.cpu_count()}cpu"
+        f"-py{sys.version_info.major}.{sys.version_info.minor}"
+    ).lower()
+
+
+def baseline_path(machine: Optional[str] = None) -> Path:
+    return BASELINE_DIR / f"{machine or machine_key()}.json"
+
+
+def load_baselines(path: Path) -> Dict[str, Any]:
+    if not path.exists():
+        return {"machine": None, "scenarios": {}}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def record_baseline(report: IngestionReport, path: Optional[Path] = None) -> None:
+    """Store ``report`` as this machine's baseline for its scenario."""
+    path = path or baseline_path()
+    baselines = load_baselines(path)
+    baselines["machine"] = {
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "cpus": os.cpu_count(),
+    }
+    baselines["scenarios"][report.scenario] = asdict(report)
+    baselines["scenarios"] = dict(sorted(baselines["scenarios"].items()))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(baselines, indent=2) + "\n", encoding="utf-8")
+
+
+def find_regressions(
+    report: IngestionReport, tolerance: float, path: Optional[Path] = None
+) -> List[str]:
+    """Describe each metric that is worse than its baseline by over ``tolerance``.
+
+    Only this machine's baselines are compared against; scenarios without one
+    never regress.
+    """
+    baseline = load_baselines(path or baseline_path())["scenarios"].get(report.scenario)
+    if baseline is None:
+        return []
+
+    regressions: List[str] = []
+    if report.files_per_second < baseline["files_per_second"] * (1 - tolerance):
+        regressions.append(
+            f"files/s {report.files_per_second:.0f} < baseline {baseline['files_per_second']:.0f}"
+        )
+    for metric in ("p50_ms", "p99_ms", "peak_rss_mb"):
+        if getattr(report, metric) > baseline[metric] * (1 + tolerance):
+            regressions.append(
+                f"{metric} {getattr(report, metric):.2f} > baseline {baseline[metric]:.2f}"
+            )
+    return regressions
@@ -0,0 +1,317 @@
+"""Throughput benchmarks for codebase ingestion.
+
+Each scenario runs ``CodeConfluenceCodebaseParser`` end to end, then times
+discovery, read, parse, import alias resolution and framework detection per
+file over the same files, and compares files/s, p50/p99 per-file latency and
+peak RSS with the baselines recorded on this kind of machine in
+``baselines/<machine key>.json``.
+
+Scenarios:
+
+- Synthetic Python and TypeScript corpora, 1k files by default. Set
+  ``INGESTION_BENCHMARK_SIZES=1000,10000,100000`` for the larger ones.
+- This service's own source tree, as a real-world Python codebase. It changes
+  with every commit, so it is reported but never compared with a baseline.
+- ``INGESTION_BENCHMARK_REPO=/path/to/checkout`` (with
+  ``INGESTION_BENCHMARK_REPO_LANGUAGE``, default ``python``) adds a local
+  repository of your choice.
+- ``INGESTION_BENCHMARK_POSTGRES=1`` also writes a synthetic corpus to the
+  Postgres configured by ``DB_*``; point it at a throwaway instance such as
+  ``docker compose -f docker-compose-dependencies-test.yml up postgresql``.
+  It runs once in a single transaction and once committing a checkpoint every
+  ``INGESTION_BENCHMARK_CHECKPOINT_FILES`` files (default 250).
+
+In-memory scenarios swap the database writer for an in-memory one, so they
+measure the CPU path; the Postgres scenario adds the real write cost.
+
+Run with ``pytest -m benchmark -s tests/benchmarks/test_ingestion_benchmark.py``.
+Set ``INGESTION_BENCHMARK_UPDATE_BASELINE=1`` to record this machine's
+baselines, and ``INGESTION_BENCHMARK_TOLERANCE`` (default 0.3) to loosen the
+comparison. A machine without recorded baselines only reports. To gate CI,
+record a baseline on the runner from the target branch under a fixed
+``INGESTION_BENCHMARK_MACHINE`` name, then compare pull requests with it.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import time
+from typing import Any, Optional
+import uuid
+
+from code_confluence_flow_bridge.engine import framework_feature_index as index_module
+from code_confluence_flow_bridge.engine.framework_feature_index import (
+    invalidate_framework_feature_indexes,
+)
+from code_confluence_flow_bridge.models.configuration.settings import (
+    EnvironmentSettings,
+)
+from code_confluence_flow_bridge.parser.code_confluence_codebase_parser import (
+    CodeConfluenceCodebaseParser,
+)
+from code_confluence_flow_bridge.processor.db.postgres.db import (
+    create_db_and_tables,
+    get_session_cm,
+)
+from code_confluence_flow_bridge.processor.db.postgres.framework_loader import (
+    FrameworkDefinitionLoader,
+)
+import pytest
+from sqlalchemy import delete
+from unoplat_code_confluence_commons.programming_language_metadata import (
+    PackageManagerType,
+    ProgrammingLanguage,
+    ProgrammingLanguageMetadata,
+)
+from unoplat_code_confluence_commons.relational_models import (
+    UnoplatCodeConfluenceCodebase,
+    UnoplatCodeConfluenceGitRepository,
+)
+
+from tests.benchmarks.ingestion_corpus import generate_corpus
+from tests.benchmarks.ingestion_harness import (
+    FLOW_BRIDGE_ROOT,
+    FRAMEWORK_DEFINITIONS_PATH,
+    IngestionReport,
+    InMemoryIngestion,
+    build_offline_feature_index,
+    find_regressions,
+    measure_file_stages,
+    peak_rss_mb,
+    percentile,
+    record_baseline,
+)
+
+CORPUS_SIZES = sorted(
+    int(size)
+    for size in os.getenv("INGESTION_BENCHMARK_SIZES", "1000").split(",")
+    if size.strip()
+)
+TOLERANCE = float(os.getenv("INGESTION_BENCHMARK_TOLERANCE", "0.3"))
+UPDATE_BASELINE = os.getenv("INGESTION_BENCHMARK_UPDATE_BASELINE") == "1"
+CHECKPOINT_FILES = int(os.getenv("INGESTION_BENCHMARK_CHECKPOINT_FILES", "250"))
+
+LANGUAGE_METADATA = {
+    "python": ProgrammingLanguageMetadata(
+        language=ProgrammingLanguage.PYTHON, package_manager=PackageManagerType.UV
+    ),
+    "typescript": ProgrammingLanguageMetadata(
+        language=ProgrammingLanguage.TYPESCRIPT,
+        package_manager=PackageManagerType.NPM,
+    ),
+}
+
+
+def _settings(checkpoint_files: int = 0) -> EnvironmentSettings:
+    # Off by default: the in-memory writer has no transaction to checkpoint
+    return EnvironmentSettings(
+        FRAMEWORK_DEFINITIONS_PATH=str(FRAMEWORK_DEFINITIONS_PATH),
+        CODEBASE_PARSER_CHECKPOINT_FILES=checkpoint_files,
+    )
+
+
+def _build_parser(
+    codebase_name: str,
+    codebase_path: Path,
+    language: str,
+    session: Any,
+    checkpoint_files: int = 0,
+) -> CodeConfluenceCodebaseParser:
+    return CodeConfluenceCodebaseParser(
+        codebase_name=codebase_name,
+        codebase_path=str(codebase_path),
+        root_packages=[],
+        programming_language_metadata=LANGUAGE_METADATA[language],
+        trace_id="ingestion-benchmark",
+        session=session,
+        code_confluence_env=_settings(checkpoint_files),
+    )
+
+
+async def _run_scenario(
+    scenario: str,
+    codebase_path: Path,
+    language: str,
+    session: Any,
+    in_memory: Optional[InMemoryIngestion] = None,
+    checkpoint_files: int = 0,
+) -> IngestionReport:
+    parser = _build_parser(scenario, codebase_path, language, session, checkpoint_files)
+    if in_memory is not None:
+        parser.ingestion = in_memory  # type: ignore[assignment]
+
+    started = time.perf_counter()
+    await parser.process_and_insert_codebase()
+    end_to_end_seconds = time.perf_counter() - started
+
+    discovery_started = time.perf_counter()
+    file_paths = sorted(parser.discover_source_files())
+    discovery_seconds = time.perf_counter() - discovery_started
+    assert file_paths, f"No {language} files under {codebase_path}"
+    assert parser.files_processed == len(file_paths)
+
+    assert parser.framework_detection_service is not None
+    stage_seconds, latencies = await measure_file_stages(
+        language,
+        parser.language_processor.language_service,  # type: ignore[attr-defined]
+        parser.framework_detection_service,
+        file_paths,
+    )
+    return IngestionReport(
+        scenario=scenario,
+        files=len(file_paths),
+        files_per_second=len(file_paths) / end_to_end_seconds,
+        p50_ms=percentile(latencies, 0.50) * 1000,
+        p99_ms=percentile(latencies, 0.99) * 1000,
+        peak_rss_mb=peak_rss_mb(),
+        stage_seconds={
+            "discovery": discovery_seconds,
+            **stage_seconds,
+            "db_write": parser.stage_timings.db_write_seconds,
+            "end_to_end": end_to_end_seconds,
+        },
+    )
+
+
+def _check(report: IngestionReport, *, compare: bool = True) -> None:
+    print(f"\ningestion | {report.summary()}")
+    if not compare:
+        return
+    if UPDATE_BASELINE:
+        record_baseline(report)
+        return
+    regressions = find_regressions(report, TOLERANCE)
+    assert not regressions, f"{report.scenario} regressed: {'; '.join(regressions)}"
+
+
+async def _run_in_memory(
+    monkeypatch: pytest.MonkeyPatch,
+    scenario: str,
+    codebase_path: Path,
+    language: str,
+    *,
+    compare: bool = True,
+) -> None:
+    feature_index = build_offline_feature_index(language)
+    monkeypatch.setitem(index_module._feature_indexes, language, feature_index)
+    in_memory = InMemoryIngestion(feature_index)
+
+    report = await _run_scenario(
+        scenario, codebase_path, language, session=object(), in_memory=in_memory
+    )
+
+    assert in_memory.files_written == report.files
+    _check(report, compare=compare)
+
+
+@pytest.fixture(scope="module")
+def corpus_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    return tmp_path_factory.mktemp("ingestion-corpora")
+
+
+def _synthetic_corpus(corpus_root: Path, language: str, size: int) -> Path:
+    codebase_path = corpus_root / f"{language}-{size}"
+    if not codebase_path.exists():
+        generate_corpus(codebase_path, language, size)
+    return codebase_path
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("size", CORPUS_SIZES)
+@pytest.mark.parametrize("language", ["python", "typescript"])
+async def test_synthetic_corpus_ingestion_benchmark(
+    monkeypatch: pytest.MonkeyPatch, corpus_root: Path, language: str, size: int
+) -> None:
+    await _run_in_memory(
+        monkeypatch,
+        f"synthetic-{language}-{size}",
+        _synthetic_corpus(corpus_root, language, size),
+        language,
+    )
+
+
+@pytest.mark.benchmark
+async def test_flow_bridge_source_ingestion_benchmark(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    await _run_in_memory(
+        monkeypatch,
+        "real-flow-bridge-src",
+        FLOW_BRIDGE_ROOT / "src" / "code_confluence_flow_bridge",
+        "python",
+        compare=False,
+    )
+
+
+@pytest.mark.benchmark
+async def test_local_repository_ingestion_benchmark(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    repository_path = os.getenv("INGESTION_BENCHMARK_REPO")
+    if not repository_path:
+        pytest.skip("Set INGESTION_BENCHMARK_REPO to benchmark a local checkout")
+    language = os.getenv("INGESTION_BENCHMARK_REPO_LANGUAGE", "python")
+    codebase_path = Path(repository_path).expanduser().resolve()
+
+    await _run_in_memory(
+        monkeypatch, f"real-{codebase_path.name}-{language}", codebase_path, language
+    )
+
+
+@pytest.mark.benchmark
+@pytest.mark.integration
+@pytest.mark.parametrize("checkpoint_files", [0, CHECKPOINT_FILES])
+async def test_postgres_ingestion_benchmark(
+    corpus_root: Path, checkpoint_files: int
+) -> None:
+    if os.getenv("INGESTION_BENCHMARK_POSTGRES") != "1":
+        pytest.skip("Set INGESTION_BENCHMARK_POSTGRES=1 with DB_* pointing at Postgres")
+    size = CORPUS_SIZES[0]
+    codebase_path = _synthetic_corpus(corpus_root, "python", size)
+    repository_name = f"benchmark-{uuid.uuid4().hex[:8]}"
+    codebase_name = f"{repository_name}_codebase"
+
+    await create_db_and_tables()
+    async with get_session_cm() as session:
+        await FrameworkDefinitionLoader(
+            _settings()
+        ).load_framework_definitions_at_startup(session)
+        session.add(
+            UnoplatCodeConfluenceGitRepository(
+                qualified_name=repository_name,
+                repository_url=f"https://example.invalid/{repository_name}",
+                repository_name=repository_name,
+            )
+        )
+        session.add(
+            UnoplatCodeConfluenceCodebase(
+                qualified_name=codebase_name,
+                repository_qualified_name=repository_name,
+                name=codebase_name,
+                codebase_path=str(codebase_path),
+                programming_language="python",
+            )
+        )
+    invalidate_framework_feature_indexes()
+
+    try:
+        async with get_session_cm() as session:
+            report = await _run_scenario(
+                codebase_name,
+                codebase_path,
+                "python",
+                session,
+                checkpoint_files=checkpoint_files,
+            )
+        report.scenario = f"postgres-python-{size}" + (
+            f"-checkpoint-{checkpoint_files}" if checkpoint_files else ""
+        )
+        _check(report)
+    finally:
+        async with get_session_cm() as session:
+            await session.execute(
+                delete(UnoplatCodeConfluenceGitRepository).where(
+                    UnoplatCodeConfluenceGitRepository.qualified_name == repository_name
+                )
+            )
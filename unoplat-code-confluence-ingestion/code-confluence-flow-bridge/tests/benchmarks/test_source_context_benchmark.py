@@ -0,0 +1,95 @@
+"""Micro-benchmark: per-file cost of building a source context.
+
+Compares the single-parse builder with the previous pipeline, which parsed the
+file, re-parsed it inside ``tree_sitter_language_pack.process`` to find
+imports, and parsed every import statement again to resolve aliases.
+
+Benchmarks are deselected by default; run them with
+``pytest -m benchmark -s tests/benchmarks`` to see the report.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import time
+from typing import Callable, Dict, List, Tuple
+
+from code_confluence_flow_bridge.engine.programming_language.common.language_service import (
+    LanguageServiceSpec,
+)
+from code_confluence_flow_bridge.engine.programming_language.python.language_service import (
+    create_python_language_service,
+)
+import pytest
+from tree_sitter_language_pack import ProcessConfig, get_parser, process
+
+SOURCE_ROOT = (
+    Path(__file__).resolve().parents[2] / "src" / "code_confluence_flow_bridge"
+)
+ROUNDS = 5
+
+ImportsAndAliases = Tuple[List[str], Dict[str, str]]
+
+
+def _legacy_source_context(
+    language_service: LanguageServiceSpec, source_bytes: bytes
+) -> ImportsAndAliases:
+    get_parser(language_service.language_name).parse(source_bytes)
+    result = process(
+        source_bytes.decode("utf-8", errors="ignore"),
+        ProcessConfig(
+            language=language_service.language_name,
+            structure=False,
+            imports=True,
+            exports=False,
+            comments=False,
+            docstrings=False,
+            symbols=False,
+            diagnostics=False,
+        ),
+    )
+    imports = [
+        source_bytes[
+            import_info["span"]["start_byte"] : import_info["span"]["end_byte"]
+        ].decode("utf-8", errors="ignore")
+        for import_info in result.get("imports", [])
+    ]
+    return imports, language_service.alias_strategy.build_import_aliases(imports)
+
+
+def _best_of(rounds: int, run: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+@pytest.mark.benchmark
+def test_single_parse_source_context_benchmark() -> None:
+    language_service = create_python_language_service()
+    builder = language_service.create_source_context_builder()
+    sources = [path.read_bytes() for path in sorted(SOURCE_ROOT.rglob("*.py"))]
+
+    for source_bytes in sources:
+        context = builder.from_bytes(source_bytes)
+        assert (context.imports, context.import_aliases) == _legacy_source_context(
+            language_service, source_bytes
+        )
+
+    legacy_seconds = _best_of(
+        ROUNDS,
+        lambda: [_legacy_source_context(language_service, src) for src in sources],
+    )
+    single_parse_seconds = _best_of(
+        ROUNDS, lambda: [builder.from_bytes(src) for src in sources]
+    )
+
+    per_file_us = 1e6 / len(sources)
+    print(
+        f"\nsource context | files={len(sources)}"
+        f" | legacy={legacy_seconds * per_file_us:.1f}us/file"
+        f" | single_parse={single_parse_seconds * per_file_us:.1f}us/file"
+        f" | speedup={legacy_seconds / single_parse_seconds:.2f}x"
+    )
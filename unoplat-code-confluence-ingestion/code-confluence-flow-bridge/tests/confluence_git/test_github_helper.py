@@ -2,15 +2,20 @@
 import os
 import json
 from pathlib import Path
+import shutil
 from urllib.parse import quote
 
 from dotenv import load_dotenv
+from git import Repo
 
 # Third Party
 import pytest
 from code_confluence_flow_bridge.confluence_git.github_helper import (
+    CloneStrategy,
     GithubHelper,
     _build_authenticated_url,
+    _checkout_mirror_worktree,
+    _sync_repository_mirror,
 )
 from code_confluence_flow_bridge.models.github.github_repo import (
     RepositoryRequestConfiguration,
@@ -315,3 +320,93 @@ class TestGithubHelper:
         """Test GitHub connection - remains synchronous as it just validates the token"""
         assert github_pat_token is not None
         # ... rest of your test
+
+
+def _make_source_repository(path: Path) -> Repo:
+    """Create a local repository with two commits on ``main``."""
+    source = Repo.init(path, initial_branch="main")
+    source.git.config("user.email", "tests@example.com")
+    source.git.config("user.name", "tests")
+    # Partial clones over file:// need the server side to honour filters.
+    source.git.config("uploadpack.allowFilter", "true")
+    for version in ("1", "2"):
+        (path / "app.py").write_text(f"VERSION = {version}\n")
+        source.git.add("app.py")
+        source.git.commit("-m", f"version {version}")
+    return source
+
+
+class TestRepositoryMirror:
+    @pytest.mark.parametrize("strategy", ["full", "shallow", "partial"])
+    def test_worktree_is_checked_out_from_bare_mirror(
+        self, tmp_path: Path, strategy: CloneStrategy
+    ) -> None:
+        source = _make_source_repository(tmp_path / "source")
+        source_url = (tmp_path / "source").as_uri()
+        mirror_path = str(tmp_path / ".mirrors" / "org" / "repo.git")
+        worktree_path = str(tmp_path / "repo")
+
+        mirror = _sync_repository_mirror(
+            mirror_path, source_url, source_url, strategy, {}
+        )
+        _checkout_mirror_worktree(
+            mirror, worktree_path, "main", source_url, source_url, {}
+        )
+
+        assert mirror.bare
+        assert (Path(worktree_path) / "app.py").read_text() == "VERSION = 2\n"
+        assert (Path(worktree_path) / ".git").is_file()
+        commit_count = int(mirror.git.rev_list("--count", "refs/heads/main"))
+        assert commit_count == (1 if strategy == "shallow" else 2)
+        if strategy == "partial":
+            assert mirror.git.config("remote.origin.partialclonefilter") == (
+                "blob:none"
+            )
+        assert source.head.commit.hexsha == Repo(worktree_path).head.commit.hexsha
+
+    def test_refresh_fetches_new_commits_and_discards_local_edits(
+        self, tmp_path: Path
+    ) -> None:
+        source = _make_source_repository(tmp_path / "source")
+        source_url = (tmp_path / "source").as_uri()
+        mirror_path = str(tmp_path / ".mirrors" / "org" / "repo.git")
+        worktree_path = tmp_path / "repo"
+        mirror = _sync_repository_mirror(
+            mirror_path, source_url, source_url, "full", {}
+        )
+        _checkout_mirror_worktree(
+            mirror, str(worktree_path), "main", source_url, source_url, {}
+        )
+        (worktree_path / "app.py").write_text("LOCAL = True\n")
+        (worktree_path / "scratch.py").write_text("")
+        (tmp_path / "source" / "app.py").write_text("VERSION = 3\n")
+        source.git.commit("-am", "version 3")
+
+        mirror = _sync_repository_mirror(
+            mirror_path, source_url, source_url, "full", {}
+        )
+        _checkout_mirror_worktree(
+            mirror, str(worktree_path), "main", source_url, source_url, {}
+        )
+
+        assert (worktree_path / "app.py").read_text() == "VERSION = 3\n"
+        assert not (worktree_path / "scratch.py").exists()
+
+    def test_deleted_worktree_is_recreated(self, tmp_path: Path) -> None:
+        _make_source_repository(tmp_path / "source")
+        source_url = (tmp_path / "source").as_uri()
+        mirror_path = str(tmp_path / ".mirrors" / "org" / "repo.git")
+        worktree_path = tmp_path / "repo"
+        mirror = _sync_repository_mirror(
+            mirror_path, source_url, source_url, "full", {}
+        )
+        _checkout_mirror_worktree(
+            mirror, str(worktree_path), "main", source_url, source_url, {}
+        )
+        shutil.rmtree(worktree_path)
+
+        _checkout_mirror_worktree(
+            mirror, str(worktree_path), "main", source_url, source_url, {}
+        )
+
+        assert (worktree_path / "app.py").exists()
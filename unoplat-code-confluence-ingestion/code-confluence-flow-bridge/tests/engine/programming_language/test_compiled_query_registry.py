@@ -0,0 +1,128 @@
+"""Unit tests for the shared compiled-query registry."""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+from code_confluence_flow_bridge.engine.framework_feature_index import (
+    invalidate_framework_feature_indexes,
+)
+from code_confluence_flow_bridge.engine.programming_language.common.compiled_query_registry import (
+    COMPILED_QUERY_REGISTRY,
+    CompiledQueryRegistry,
+    LanguageFeatureQuery,
+    compile_language_feature_query,
+    feature_query_key,
+)
+from code_confluence_flow_bridge.engine.programming_language.compiled_query_warmup import (
+    prewarm_feature_specs,
+)
+from code_confluence_flow_bridge.engine.programming_language.python.python_framework_query_builder import (
+    PythonFrameworkQueryBuilder,
+)
+from code_confluence_flow_bridge.engine.programming_language.typescript.typescript_framework_query_builder import (
+    TypeScriptFrameworkQueryBuilder,
+)
+from unoplat_code_confluence_commons.base_models import (
+    Concept,
+    FeatureSpec,
+    LocatorStrategy,
+    TargetLevel,
+)
+
+
+def _call_spec(
+    library: str, callee_regex: str, *, operation_key: str = "get"
+) -> FeatureSpec:
+    return FeatureSpec(
+        capability_key="http_client",
+        operation_key=operation_key,
+        library=library,
+        absolute_paths=[f"{library}.get"],
+        target_level=TargetLevel.FUNCTION,
+        concept=Concept.CALL_EXPRESSION,
+        locator_strategy=LocatorStrategy.DIRECT,
+        construct_query={"callee_regex": callee_regex},
+        base_confidence=0.9,
+    )
+
+
+def test_build_query_is_served_from_registry_by_natural_key() -> None:
+    registry_before = COMPILED_QUERY_REGISTRY.stats()
+    builder = PythonFrameworkQueryBuilder()
+    spec = _call_spec("registry_http", r"^registry_http\.get$")
+
+    first = builder.build_query(spec)
+    # A fresh builder and an equal-but-distinct spec object share the entry.
+    second = PythonFrameworkQueryBuilder().build_query(spec.model_copy(deep=True))
+
+    stats = COMPILED_QUERY_REGISTRY.stats()
+    assert first is second
+    assert COMPILED_QUERY_REGISTRY.contains(feature_query_key("python", spec))
+    assert stats.misses - registry_before.misses == 1
+    assert stats.hits - registry_before.hits == 1
+
+
+def test_changed_definition_recompiles_under_same_identity() -> None:
+    builder = PythonFrameworkQueryBuilder()
+    original = builder.build_query(_call_spec("edited_http", r"^edited_http\.get$"))
+
+    edited = builder.build_query(_call_spec("edited_http", r"^edited_http\.post$"))
+
+    assert edited is not original
+
+
+def test_languages_do_not_share_entries() -> None:
+    spec = _call_spec("shared_name", r"^shared_name\.get$")
+
+    python_query = PythonFrameworkQueryBuilder().build_query(spec)
+    typescript_query = TypeScriptFrameworkQueryBuilder().build_query(spec)
+
+    assert python_query is not typescript_query
+
+
+def test_language_query_is_shared_across_import_mixes() -> None:
+    registry = CompiledQueryRegistry()
+    compiled: list[list[str]] = []
+    spec_a = _call_spec("a", r"^a\.get$")
+    spec_b = _call_spec("b", r"^b\.get$")
+
+    def compile_query(specs: Sequence[FeatureSpec]) -> LanguageFeatureQuery:
+        compiled.append([spec.library for spec in specs])
+        # A stand-in combined query keeps the test independent of tree-sitter.
+        return compile_language_feature_query(
+            "python", specs, lambda spec: None, lambda specs: None
+        )
+
+    registry.get_language_query("python", [spec_a, spec_b], compile_query)
+    registry.get_language_query("python", [spec_a], compile_query)
+    registry.get_language_query("python", [spec_b], compile_query)
+    spec_c = _call_spec("c", r"^c\.get$")
+    language_query = registry.get_language_query("python", [spec_c], compile_query)
+
+    stats = registry.stats()
+    assert compiled == [["a", "b"], ["a", "b", "c"]]
+    assert (stats.combined_hits, stats.combined_misses) == (2, 2)
+    assert stats.combined_query_count == 1
+    assert language_query.spec_indexes("python", [spec_c, spec_a]) == [2, 0]
+    assert (
+        language_query.spec_indexes("python", [_call_spec("a", r"^a\.post$")]) is None
+    )
+
+
+def test_prewarm_compiles_catalog_and_invalidation_clears_it() -> None:
+    specs = [
+        _call_spec("warm_http", r"^warm_http\.get$"),
+        _call_spec("warm_http", r"^warm_http\.post$", operation_key="post"),
+    ]
+
+    assert prewarm_feature_specs("python", specs) == 2
+    assert prewarm_feature_specs("cobol", specs) == 0
+    assert all(
+        COMPILED_QUERY_REGISTRY.contains(feature_query_key("python", spec))
+        for spec in specs
+    )
+
+    invalidate_framework_feature_indexes()
+
+    assert not COMPILED_QUERY_REGISTRY.contains(feature_query_key("python", specs[0]))
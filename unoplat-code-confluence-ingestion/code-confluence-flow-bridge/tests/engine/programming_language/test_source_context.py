@@ -0,0 +1,109 @@
+"""Tests for single-parse source context construction."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from code_confluence_flow_bridge.engine.programming_language.common import (
+    source_context as source_context_module,
+)
+from code_confluence_flow_bridge.engine.programming_language.python.language_service import (
+    create_python_language_service,
+)
+from code_confluence_flow_bridge.engine.programming_language.typescript.language_service import (
+    create_typescript_language_service,
+)
+import pytest
+
+PYTHON_SOURCE = b"""from __future__ import annotations
+import os, fastapi as fp
+from sqlalchemy.orm import (Session, relationship as rel)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def handler():
+    from httpx import AsyncClient
+"""
+
+TYPESCRIPT_SOURCE = b"""import Next from 'next/server';
+import type { NextRequest as NR } from "next/server";
+import * as ns from 'lodash';
+import 'reflect-metadata';
+import fs = require('fs');
+export { z } from 'zod';
+"""
+
+
+class _CountingParser:
+    def __init__(self, parser: Any) -> None:
+        self._parser = parser
+        self.parse_calls = 0
+
+    def parse(self, source_bytes: bytes) -> Any:
+        self.parse_calls += 1
+        return self._parser.parse(source_bytes)
+
+
+def test_python_imports_and_aliases_come_from_the_file_tree(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    counting_parser = _CountingParser(source_context_module.get_parser("python"))
+    monkeypatch.setattr(
+        source_context_module, "get_parser", lambda _language: counting_parser
+    )
+
+    context = (
+        create_python_language_service()
+        .create_source_context_builder()
+        .from_bytes(PYTHON_SOURCE)
+    )
+
+    assert counting_parser.parse_calls == 1
+    assert context.imports == [
+        "import os, fastapi as fp",
+        "from sqlalchemy.orm import (Session, relationship as rel)",
+        "import orjson",
+        "from httpx import AsyncClient",
+    ]
+    assert context.import_aliases == {
+        "os": "os",
+        "fastapi": "fp",
+        "sqlalchemy.orm.Session": "Session",
+        "sqlalchemy.orm.relationship": "rel",
+        "orjson": "orjson",
+        "httpx.AsyncClient": "AsyncClient",
+    }
+
+
+def test_typescript_imports_and_aliases_come_from_the_file_tree() -> None:
+    context = (
+        create_typescript_language_service()
+        .create_source_context_builder()
+        .from_bytes(TYPESCRIPT_SOURCE)
+    )
+
+    assert context.imports == [
+        "import Next from 'next/server';",
+        'import type { NextRequest as NR } from "next/server";',
+        "import * as ns from 'lodash';",
+        "import 'reflect-metadata';",
+        "import fs = require('fs');",
+    ]
+    assert context.import_aliases == {
+        "next/server": "Next",
+        "next/server.NextRequest": "NR",
+    }
+
+
+def test_string_based_aliases_match_tree_based_aliases() -> None:
+    language_service = create_python_language_service()
+    context = language_service.create_source_context_builder().from_bytes(PYTHON_SOURCE)
+
+    assert (
+        language_service.alias_strategy.build_import_aliases(context.imports)
+        == context.import_aliases
+    )
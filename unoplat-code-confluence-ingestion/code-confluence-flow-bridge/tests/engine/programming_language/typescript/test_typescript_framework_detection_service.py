@@ -1,7 +1,5 @@
 """Regression tests for the TypeScript framework detection service."""
 
-from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
 from json import loads
 from pathlib import Path
 from typing import cast
@@ -13,6 +11,9 @@ from unoplat_code_confluence_commons.base_models import (
     LocatorStrategy,
 )
 
+from code_confluence_flow_bridge.engine.framework_feature_index import (
+    FrameworkFeatureIndex,
+)
 from code_confluence_flow_bridge.engine.programming_language.typescript import (
     typescript_framework_detection_service as service_module,
 )
@@ -48,28 +49,16 @@ async def test_default_axios_import_loads_definition_and_detects_request(
         construct_query=operation["construct_query"],
         base_confidence=operation["base_confidence"],
     )
-    queried_imports: list[str] = []
-
-    @asynccontextmanager
-    async def fake_session_cm() -> AsyncIterator[object]:
-        yield object()
+    loaded_languages: list[str] = []
 
-    async def fake_exact_import_query(
-        _session: object,
-        language: str,
-        imports: list[str],
-    ) -> list[FeatureSpec]:
-        assert language == "typescript"
-        queried_imports.extend(imports)
-        if set(imports).intersection(spec.absolute_paths):
-            return [spec]
-        return []
+    async def fake_feature_index(language: str) -> FrameworkFeatureIndex:
+        loaded_languages.append(language)
+        return FrameworkFeatureIndex(language, [spec])
 
-    monkeypatch.setattr(service_module, "get_session_cm", fake_session_cm)
     monkeypatch.setattr(
         service_module,
-        "get_framework_features_for_imports",
-        fake_exact_import_query,
+        "get_framework_feature_index",
+        fake_feature_index,
     )
 
     source = f'import {local_binding} from "axios"\n{local_binding}.get("/users")\n'
@@ -79,6 +68,6 @@ async def test_default_axios_import_loads_definition_and_detects_request(
         "typescript",
     )
 
-    assert queried_imports == ["axios"]
+    assert loaded_languages == ["typescript"]
     assert len(detections) == 1
     assert cast(CallExpressionInfo, detections[0]).callee == f"{local_binding}.get"
@@ -0,0 +1,115 @@
+"""Unit tests for the in-memory framework feature index."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from code_confluence_flow_bridge.engine import framework_feature_index as index_module
+from code_confluence_flow_bridge.engine.framework_feature_index import (
+    FrameworkFeatureIndex,
+    get_framework_feature_index,
+    invalidate_framework_feature_indexes,
+)
+import pytest
+from unoplat_code_confluence_commons.base_models import FeatureSpec, LocatorStrategy
+
+
+def _spec(library: str, operation_key: str, *absolute_paths: str) -> FeatureSpec:
+    return FeatureSpec(
+        capability_key="rest_api",
+        operation_key=operation_key,
+        library=library,
+        absolute_paths=list(absolute_paths),
+        target_level="function",
+        concept="AnnotationLike",
+        locator_strategy=LocatorStrategy.DIRECT,
+    )
+
+
+FASTAPI_GET = _spec("fastapi", "get", "fastapi.FastAPI", "fastapi.APIRouter")
+FASTAPI_DEPENDS = _spec("fastapi", "depends", "fastapi.params.Depends")
+CLICKHOUSE = _spec("clickhouse", "query", "clickhouse.Client")
+
+
+def test_resolve_matches_features_under_any_ancestor_of_an_import() -> None:
+    index = FrameworkFeatureIndex(
+        "python", [FASTAPI_GET, FASTAPI_DEPENDS, CLICKHOUSE]
+    )
+
+    # Ancestors of each import are expanded, matching the SQL lookup semantics,
+    # so any import from a package surfaces every feature of that package.
+    assert index.resolve(["fastapi.FastAPI"]) == [FASTAPI_GET, FASTAPI_DEPENDS]
+    assert index.resolve(["fastapi.params.Depends.extra"]) == [
+        FASTAPI_GET,
+        FASTAPI_DEPENDS,
+    ]
+    assert index.resolve(["clickhouse"]) == [CLICKHOUSE]
+
+
+def test_resolve_does_not_match_sibling_packages_sharing_a_prefix() -> None:
+    index = FrameworkFeatureIndex("python", [FASTAPI_GET, CLICKHOUSE])
+
+    assert index.resolve(["click", "fast"]) == []
+    assert index.resolve([" ", ""]) == []
+
+
+def test_resolve_deduplicates_specs_in_catalog_order() -> None:
+    index = FrameworkFeatureIndex("python", [CLICKHOUSE, FASTAPI_GET])
+
+    assert index.resolve(
+        ["fastapi.APIRouter", "fastapi.FastAPI", "clickhouse.Client"]
+    ) == [CLICKHOUSE, FASTAPI_GET]
+
+
+async def test_index_is_cached_until_invalidated(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    loads: list[str] = []
+
+    @asynccontextmanager
+    async def fake_session_cm() -> AsyncIterator[object]:
+        yield object()
+
+    async def fake_load_all(_session: object, language: str) -> list[FeatureSpec]:
+        loads.append(language)
+        return [FASTAPI_GET]
+
+    monkeypatch.setattr(index_module, "get_session_cm", fake_session_cm)
+    monkeypatch.setattr(
+        index_module, "get_all_framework_features_for_language", fake_load_all
+    )
+    invalidate_framework_feature_indexes()
+
+    first = await get_framework_feature_index("Python")
+    second = await get_framework_feature_index("python")
+    assert first is second
+    assert loads == ["python"]
+
+    invalidate_framework_feature_indexes()
+    await get_framework_feature_index("python")
+    assert loads == ["python", "python"]
+
+    invalidate_framework_feature_indexes()
+
+
+async def test_empty_catalog_is_not_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    loads: list[str] = []
+
+    @asynccontextmanager
+    async def fake_session_cm() -> AsyncIterator[object]:
+        yield object()
+
+    async def fake_load_all(_session: object, language: str) -> list[FeatureSpec]:
+        loads.append(language)
+        return []
+
+    monkeypatch.setattr(index_module, "get_session_cm", fake_session_cm)
+    monkeypatch.setattr(
+        index_module, "get_all_framework_features_for_language", fake_load_all
+    )
+    invalidate_framework_feature_indexes()
+
+    assert len(await get_framework_feature_index("typescript")) == 0
+    await get_framework_feature_index("typescript")
+    assert loads == ["typescript", "typescript"]
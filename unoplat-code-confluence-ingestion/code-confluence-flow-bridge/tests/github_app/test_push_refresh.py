@@ -0,0 +1,128 @@
+"""Unit tests for turning GitHub push webhooks into debounced refreshes."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List, Tuple
+
+from code_confluence_flow_bridge.github_app.models import PushEvent
+from code_confluence_flow_bridge.github_app.push_refresh import (
+    NULL_COMMIT_SHA,
+    PushRefreshDebouncer,
+    parse_push_event,
+)
+from code_confluence_flow_bridge.models.workflow.repo_workflow_base import (
+    CommitRange,
+)
+
+
+def _payload(**overrides: Any) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {
+        "ref": "refs/heads/main",
+        "before": "a" * 40,
+        "after": "b" * 40,
+        "deleted": False,
+        "repository": {
+            "name": "code-confluence",
+            "owner": {"login": "unoplat"},
+            "default_branch": "main",
+        },
+    }
+    payload.update(overrides)
+    return payload
+
+
+def _push(after_sha: str, before_sha: str = "0" * 39 + "1") -> PushEvent:
+    return PushEvent(
+        repository_name="code-confluence",
+        repository_owner_name="unoplat",
+        before_sha=before_sha,
+        after_sha=after_sha,
+    )
+
+
+class _RecordingStarter:
+    def __init__(self, *results: bool) -> None:
+        self._results = list(results)
+        self.calls: List[Tuple[str, str, CommitRange]] = []
+        self.started = asyncio.Event()
+
+    async def __call__(
+        self, repository_name: str, repository_owner_name: str, commits: CommitRange
+    ) -> bool:
+        self.calls.append((repository_name, repository_owner_name, commits))
+        self.started.set()
+        return self._results.pop(0) if self._results else True
+
+
+def test_parse_push_event_keeps_default_branch_pushes() -> None:
+    event = parse_push_event(_payload())
+
+    assert event == PushEvent(
+        repository_name="code-confluence",
+        repository_owner_name="unoplat",
+        before_sha="a" * 40,
+        after_sha="b" * 40,
+    )
+
+
+def test_parse_push_event_ignores_other_refs_and_deletions() -> None:
+    assert parse_push_event(_payload(ref="refs/heads/feature")) is None
+    assert parse_push_event(_payload(ref="refs/tags/v1.0.0")) is None
+    assert parse_push_event(_payload(deleted=True)) is None
+    assert parse_push_event(_payload(after=NULL_COMMIT_SHA)) is None
+
+
+async def test_burst_of_pushes_starts_one_refresh_for_the_whole_range() -> None:
+    starter = _RecordingStarter()
+    debouncer = PushRefreshDebouncer(
+        starter, quiet_seconds=0.05, max_delay_seconds=5, retry_seconds=1
+    )
+
+    debouncer.enqueue(_push("1" * 40, before_sha="0" * 39 + "1"))
+    debouncer.enqueue(_push("2" * 40, before_sha="1" * 40))
+    debouncer.enqueue(_push("3" * 40, before_sha="2" * 40))
+    await asyncio.wait_for(starter.started.wait(), timeout=5)
+
+    assert starter.calls == [
+        (
+            "code-confluence",
+            "unoplat",
+            CommitRange(before_sha="0" * 39 + "1", after_sha="3" * 40, push_count=3),
+        )
+    ]
+    assert debouncer.pending_count == 0
+    await debouncer.shutdown()
+
+
+async def test_max_delay_bounds_a_steady_stream_of_pushes() -> None:
+    starter = _RecordingStarter()
+    debouncer = PushRefreshDebouncer(
+        starter, quiet_seconds=10, max_delay_seconds=0.05, retry_seconds=1
+    )
+
+    debouncer.enqueue(_push("1" * 40))
+    debouncer.enqueue(_push("2" * 40))
+    await asyncio.wait_for(starter.started.wait(), timeout=5)
+
+    assert len(starter.calls) == 1
+    await debouncer.shutdown()
+
+
+async def test_busy_repository_is_retried_with_later_pushes_folded_in() -> None:
+    starter = _RecordingStarter(False, True)
+    debouncer = PushRefreshDebouncer(
+        starter, quiet_seconds=0, max_delay_seconds=0, retry_seconds=0.05
+    )
+
+    debouncer.enqueue(_push("1" * 40))
+    await asyncio.wait_for(starter.started.wait(), timeout=5)
+    debouncer.enqueue(_push("2" * 40, before_sha="1" * 40))
+    while len(starter.calls) < 2:
+        await asyncio.sleep(0.01)
+
+    retried = starter.calls[1][2]
+    assert retried.before_sha == "0" * 39 + "1"
+    assert retried.after_sha == "2" * 40
+    assert retried.push_count == 2
+    await debouncer.shutdown()
@@ -0,0 +1,201 @@
+"""Shared fakes and fixtures for the codebase parser unit tests."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any, AsyncGenerator, Callable, Dict, Iterable, List, Optional
+
+from code_confluence_flow_bridge.models.code_confluence_parsing_models.unoplat_file import (
+    UnoplatFile,
+)
+from code_confluence_flow_bridge.models.configuration.settings import (
+    EnvironmentSettings,
+)
+from code_confluence_flow_bridge.models.workflow.repo_workflow_base import (
+    CodebaseProcessingProgress,
+    CodebaseShard,
+)
+from code_confluence_flow_bridge.parser import (
+    code_confluence_codebase_parser as parser_module,
+)
+from code_confluence_flow_bridge.parser.code_confluence_codebase_parser import (
+    CodeConfluenceCodebaseParser,
+)
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session
+from unoplat_code_confluence_commons.programming_language_metadata import (
+    PackageManagerType,
+    ProgrammingLanguage,
+    ProgrammingLanguageMetadata,
+)
+
+ParserBuilder = Callable[..., CodeConfluenceCodebaseParser]
+
+
+class FakeLanguageProcessor:
+    """Yields an empty ``UnoplatFile`` per path, optionally crashing midway."""
+
+    def __init__(self, fail_after: Optional[int] = None) -> None:
+        self.fail_after = fail_after
+
+    async def iter_files(
+        self, file_paths: Iterable[str]
+    ) -> AsyncGenerator[UnoplatFile, None]:
+        for index, file_path in enumerate(file_paths):
+            if index == self.fail_after:
+                raise RuntimeError("parser crashed")
+            await asyncio.sleep(0)
+            yield UnoplatFile(file_path=file_path)
+
+
+class RecordingIngestion:
+    """Stands in for the relational ingestion and records what the parser writes.
+
+    Once bound to a session, written paths also go to its ``written_file``
+    table and every commit records how many files had been written by then.
+    """
+
+    def __init__(self) -> None:
+        self.stored_checksums: Dict[str, Optional[str]] = {}
+        self.catalog_version: Optional[str] = "catalog-v1"
+        self.codebase_catalog_version: Optional[str] = "catalog-v1"
+        self.fail_on_flush = False
+        self.session: Optional[AsyncSession | async_scoped_session[AsyncSession]] = None
+        self.written_paths: List[str] = []
+        self.framework_calls: List[Any] = []
+        self.deleted_files: List[str] = []
+        self.cleared_feature_files: List[str] = []
+        self.committed_file_counts: List[int] = []
+
+    def bind(
+        self, session: AsyncSession | async_scoped_session[AsyncSession]
+    ) -> RecordingIngestion:
+        self.session = session
+        async_session = (
+            session() if isinstance(session, async_scoped_session) else session
+        )
+        event.listen(
+            async_session.sync_session,
+            "after_commit",
+            lambda _session: self.committed_file_counts.append(len(self.written_paths)),
+        )
+        return self
+
+    async def get_file_checksums(
+        self, codebase_qualified_name: str
+    ) -> Dict[str, Optional[str]]:
+        return self.stored_checksums
+
+    async def delete_files(self, file_paths: Any) -> None:
+        self.deleted_files.extend(sorted(file_paths))
+
+    async def delete_file_features(self, file_paths: Any) -> None:
+        self.cleared_feature_files.extend(file_paths)
+
+    async def get_framework_catalog_version(self) -> Optional[str]:
+        return self.catalog_version
+
+    async def get_codebase_catalog_version(
+        self, codebase_qualified_name: str
+    ) -> Optional[str]:
+        return self.codebase_catalog_version
+
+    async def upsert_codebase_catalog_version(
+        self, codebase_qualified_name: str, content_hash: str
+    ) -> None:
+        self.codebase_catalog_version = content_hash
+
+    async def get_framework_libraries_for_language(self, language: str) -> List[str]:
+        return []
+
+    async def get_framework_features_for_language(self, language: str) -> List[Any]:
+        return []
+
+    async def upsert_files(self, codebase_qualified_name: str, files: Any) -> None:
+        if self.fail_on_flush:
+            raise RuntimeError("database unavailable")
+        paths = [item.file_path for item in files]
+        if self.session is not None:
+            await self.session.execute(
+                text("INSERT INTO written_file (path) VALUES (:path)"),
+                [{"path": path} for path in paths],
+            )
+        else:
+            await asyncio.sleep(0)
+        self.written_paths.extend(paths)
+
+    async def upsert_file_feature_rows(self, feature_rows: Any) -> None:
+        list(feature_rows)
+
+    async def upsert_codebase_frameworks(
+        self, codebase_qualified_name: str, frameworks: Any
+    ) -> None:
+        self.framework_calls.append(frameworks)
+
+
+@pytest.fixture
+def ingestion() -> RecordingIngestion:
+    return RecordingIngestion()
+
+
+@pytest.fixture
+def session_ingestion(
+    ingestion: RecordingIngestion, monkeypatch: pytest.MonkeyPatch
+) -> RecordingIngestion:
+    """Bind every ingestion the parser builds, including checkpoint sessions."""
+    monkeypatch.setattr(
+        parser_module, "CodeConfluenceRelationalIngestion", ingestion.bind
+    )
+    return ingestion
+
+
+@pytest.fixture
+def build_parser(ingestion: RecordingIngestion) -> ParserBuilder:
+    """Build a Python/uv parser over ``codebase_path`` that writes to ``ingestion``.
+
+    Framework detection is off. ``fake_processor`` swaps in the
+    ``FakeLanguageProcessor`` so arbitrary paths can be parsed without files,
+    and extra keyword arguments are ``EnvironmentSettings`` overrides.
+    Checkpoints default to off because only a bound session can commit them.
+    """
+
+    def _build(
+        codebase_path: Optional[Path] = None,
+        *,
+        session: Optional[AsyncSession | async_scoped_session[AsyncSession]] = None,
+        fake_processor: bool = False,
+        fail_after: Optional[int] = None,
+        resume_from: Optional[CodebaseProcessingProgress] = None,
+        progress: Optional[List[CodebaseProcessingProgress]] = None,
+        shard: Optional[CodebaseShard] = None,
+        incremental_refresh: Optional[bool] = None,
+        **settings: Any,
+    ) -> CodeConfluenceCodebaseParser:
+        parser = CodeConfluenceCodebaseParser(
+            codebase_name="org_repo_codebase",
+            codebase_path=str(codebase_path or Path.cwd()),
+            root_packages=[],
+            programming_language_metadata=ProgrammingLanguageMetadata(
+                language=ProgrammingLanguage.PYTHON,
+                package_manager=PackageManagerType.UV,
+            ),
+            trace_id="trace",
+            session=object() if session is None else session,  # type: ignore[arg-type]
+            code_confluence_env=EnvironmentSettings(
+                **{"CODEBASE_PARSER_CHECKPOINT_FILES": 0, **settings}
+            ),
+            resume_from=resume_from,
+            progress_callback=None if progress is None else progress.append,
+            shard=shard,
+            incremental_refresh=incremental_refresh,
+        )
+        parser.framework_detection_service = None
+        parser.language_processor.context.framework_detection_service = None
+        if fake_processor or fail_after is not None:
+            parser.language_processor = FakeLanguageProcessor(fail_after)  # type: ignore[assignment]
+        parser.ingestion = ingestion  # type: ignore[assignment]
+        return parser
+
+    return _build
@@ -0,0 +1,150 @@
+"""Tests for the content-addressed parse cache."""
+
+from pathlib import Path
+from typing import List, Optional
+
+from code_confluence_flow_bridge.engine.framework_detection_service import (
+    FrameworkDetectionService,
+)
+from code_confluence_flow_bridge.engine.programming_language.common.source_context import (
+    BaseSourceContext,
+)
+from code_confluence_flow_bridge.models.configuration.settings import (
+    EnvironmentSettings,
+)
+from code_confluence_flow_bridge.parser.language_processors.language_processor_context import (
+    LanguageProcessorContext,
+)
+from code_confluence_flow_bridge.parser.language_processors.parse_cache import (
+    ParseCache,
+    ParseCacheConfig,
+    open_parse_cache,
+    parse_cache_namespace,
+)
+from code_confluence_flow_bridge.parser.language_processors.python_processor import (
+    PythonLanguageProcessor,
+)
+from unoplat_code_confluence_commons.base_models import Detection
+from unoplat_code_confluence_commons.programming_language_metadata import (
+    PackageManagerType,
+    ProgrammingLanguage,
+    ProgrammingLanguageMetadata,
+)
+
+SOURCE = """from dataclasses import dataclass
+
+
+@dataclass
+class User:
+    name: str
+"""
+
+
+class _FailOnceDetectionService(FrameworkDetectionService):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def detect_features(
+        self, source_context: BaseSourceContext, programming_language: str
+    ) -> List[Detection]:
+        self.calls += 1
+        if self.calls == 1:
+            raise RuntimeError("detector unavailable")
+        return []
+
+
+def _python_processor(
+    tmp_path: Path,
+    parse_cache: ParseCache,
+    framework_detection_service: Optional[FrameworkDetectionService] = None,
+) -> PythonLanguageProcessor:
+    return PythonLanguageProcessor(
+        LanguageProcessorContext(
+            codebase_name="unit-test-python",
+            codebase_path=tmp_path,
+            root_packages=[],
+            programming_language_metadata=ProgrammingLanguageMetadata(
+                language=ProgrammingLanguage.PYTHON,
+                package_manager=PackageManagerType.UV,
+            ),
+            env_config=EnvironmentSettings(),
+            framework_detection_service=framework_detection_service,
+            parse_cache=parse_cache,
+            concurrency_limit=1,
+            increment_files_processed=lambda _: None,
+        )
+    )
+
+
+def test_entries_are_isolated_by_namespace(tmp_path: Path) -> None:
+    cache_path = tmp_path / "parse-cache.sqlite3"
+    current = ParseCache(cache_path, 1024, parse_cache_namespace("python", "v1"))
+    newer_catalog = ParseCache(cache_path, 1024, parse_cache_namespace("python", "v2"))
+
+    current.put("abc", {"imports": ["os"]})
+
+    assert current.get("abc") == {"imports": ["os"]}
+    assert newer_catalog.get("abc") is None
+    assert (current.hits, newer_catalog.misses) == (1, 1)
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path: Path) -> None:
+    # Each entry encodes to 56 bytes, so three fit under the bound and four do not.
+    payload = {"imports": ["x" * 40]}
+    cache = ParseCache(tmp_path / "parse-cache.sqlite3", 200, "ns")
+    cache.put("first", payload)
+    cache.put("second", payload)
+    cache.put("third", payload)
+    # Touch "first" so "second" becomes the least recently used entry.
+    assert cache.get("first") is not None
+
+    cache.put("fourth", payload)
+
+    assert cache.get("second") is None
+    assert cache.get("first") is not None
+    assert cache.get("fourth") is not None
+    assert cache.total_size() <= 200
+
+
+def test_unusable_cache_path_disables_caching(tmp_path: Path) -> None:
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("")
+
+    config = ParseCacheConfig(str(blocker / "parse-cache.sqlite3"), 1024, "ns")
+
+    assert open_parse_cache(config) is None
+
+
+async def test_identical_content_is_parsed_once_across_paths(tmp_path: Path) -> None:
+    cache = ParseCache(tmp_path / "parse-cache.sqlite3", 1 << 20, "ns")
+    original = tmp_path / "models.py"
+    vendored = tmp_path / "vendor" / "models.py"
+    vendored.parent.mkdir()
+    original.write_text(SOURCE, encoding="utf-8")
+    vendored.write_text(SOURCE, encoding="utf-8")
+    processor = _python_processor(tmp_path, cache)
+
+    parsed = await processor.extract_file_data(str(original))
+    replayed = await processor.extract_file_data(str(vendored))
+
+    assert parsed is not None and replayed is not None
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert replayed.file_path == str(vendored)
+    assert replayed.model_copy(update={"file_path": parsed.file_path}) == parsed
+    assert replayed.has_data_model
+
+
+async def test_failed_detection_is_not_cached(tmp_path: Path) -> None:
+    cache = ParseCache(tmp_path / "parse-cache.sqlite3", 1 << 20, "ns")
+    source_path = tmp_path / "models.py"
+    source_path.write_text(SOURCE, encoding="utf-8")
+    detection_service = _FailOnceDetectionService()
+    processor = _python_processor(tmp_path, cache, detection_service)
+
+    assert await processor.extract_file_data(str(source_path)) is not None
+    assert await processor.extract_file_data(str(source_path)) is not None
+    assert await processor.extract_file_data(str(source_path)) is not None
+
+    # The failed first parse is retried; only the successful one is replayed.
+    assert detection_service.calls == 2
+    assert (cache.hits, cache.misses) == (1, 2)
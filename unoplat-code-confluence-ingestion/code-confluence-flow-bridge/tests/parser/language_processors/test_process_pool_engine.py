@@ -0,0 +1,164 @@
+"""Tests for the process-pool parsing engine."""
+
+from collections.abc import Iterator
+from pathlib import Path
+from typing import cast
+
+from code_confluence_flow_bridge.engine.framework_feature_index import (
+    FrameworkFeatureIndex,
+)
+from code_confluence_flow_bridge.engine.programming_language.python import (
+    python_framework_detection_service as service_module,
+)
+from code_confluence_flow_bridge.engine.programming_language.python.python_framework_detection_service import (
+    PythonFrameworkDetectionService,
+)
+from code_confluence_flow_bridge.models.configuration.settings import (
+    EnvironmentSettings,
+)
+from code_confluence_flow_bridge.parser.language_processors.language_processor_context import (
+    LanguageProcessorContext,
+)
+from code_confluence_flow_bridge.parser.language_processors.process_pool_engine import (
+    ProcessPoolParsingEngine,
+    rehydrate_parsed_file,
+)
+from code_confluence_flow_bridge.parser.language_processors.python_processor import (
+    PythonLanguageProcessor,
+)
+import pytest
+from unoplat_code_confluence_commons.base_models import (
+    CallExpressionInfo,
+    Concept,
+    FeatureSpec,
+    LocatorStrategy,
+    TargetLevel,
+)
+from unoplat_code_confluence_commons.programming_language_metadata import (
+    PackageManagerType,
+    ProgrammingLanguage,
+    ProgrammingLanguageMetadata,
+)
+
+HTTPX_GET = FeatureSpec(
+    capability_key="http_client",
+    operation_key="get",
+    library="httpx",
+    absolute_paths=["httpx.get"],
+    target_level=TargetLevel.FUNCTION,
+    concept=Concept.CALL_EXPRESSION,
+    locator_strategy=LocatorStrategy.DIRECT,
+    base_confidence=0.9,
+)
+
+SOURCE = """import httpx
+from dataclasses import dataclass
+
+
+@dataclass
+class User:
+    name: str
+
+
+def load() -> None:
+    httpx.get("https://example.com/users")
+"""
+
+
+@pytest.fixture(scope="module")
+def parsing_engine() -> Iterator[ProcessPoolParsingEngine]:
+    engine = ProcessPoolParsingEngine("python", 1, [HTTPX_GET])
+    yield engine
+    engine.shutdown()
+
+
+def _python_processor(
+    tmp_path: Path, parsing_engine: ProcessPoolParsingEngine | None
+) -> PythonLanguageProcessor:
+    return PythonLanguageProcessor(
+        LanguageProcessorContext(
+            codebase_name="unit-test-python",
+            codebase_path=tmp_path,
+            root_packages=[],
+            programming_language_metadata=ProgrammingLanguageMetadata(
+                language=ProgrammingLanguage.PYTHON,
+                package_manager=PackageManagerType.UV,
+            ),
+            env_config=EnvironmentSettings(),
+            framework_detection_service=PythonFrameworkDetectionService(),
+            parsing_engine=parsing_engine,
+            concurrency_limit=1,
+            increment_files_processed=lambda _: None,
+        )
+    )
+
+
+async def test_process_pool_matches_in_process_parsing(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    parsing_engine: ProcessPoolParsingEngine,
+) -> None:
+    async def fake_feature_index(language: str) -> FrameworkFeatureIndex:
+        return FrameworkFeatureIndex(language, [HTTPX_GET])
+
+    monkeypatch.setattr(
+        service_module, "get_framework_feature_index", fake_feature_index
+    )
+    source_path = tmp_path / "client.py"
+    source_path.write_text(SOURCE, encoding="utf-8")
+
+    in_process = await _python_processor(tmp_path, None).extract_file_data(
+        str(source_path)
+    )
+    pooled = await _python_processor(tmp_path, parsing_engine).extract_file_data(
+        str(source_path)
+    )
+
+    assert parsing_engine.is_available
+    assert pooled is not None and in_process is not None
+    assert pooled == in_process
+    assert pooled.has_data_model
+    assert pooled.custom_features_list is not None
+    assert isinstance(pooled.custom_features_list[0], CallExpressionInfo)
+    assert cast(CallExpressionInfo, pooled.custom_features_list[0]).callee == (
+        "httpx.get"
+    )
+
+
+async def test_process_pool_returns_none_for_unreadable_file(
+    tmp_path: Path, parsing_engine: ProcessPoolParsingEngine
+) -> None:
+    assert await parsing_engine.parse_file(str(tmp_path / "missing.py")) is None
+
+
+def test_rehydrate_keeps_base_detection_for_unknown_model_names() -> None:
+    parsed = rehydrate_parsed_file(
+        {
+            "file_path": "/repo/a.py",
+            "checksum": "abc",
+            "imports": [],
+            "detections": [
+                (
+                    "FutureDetection",
+                    {
+                        "capability_key": "http_client",
+                        "operation_key": "get",
+                        "library": "httpx",
+                        "match_text": "httpx.get()",
+                        "start_line": 1,
+                        "end_line": 1,
+                    },
+                )
+            ],
+            "has_data_model": False,
+            "data_model_positions": {},
+        }
+    )
+
+    assert parsed.custom_features_list is not None
+    assert parsed.custom_features_list[0].library == "httpx"
+
+
+def test_engine_rejects_unsupported_language() -> None:
+    with pytest.raises(ValueError):
+        ProcessPoolParsingEngine("cobol", 1, [])
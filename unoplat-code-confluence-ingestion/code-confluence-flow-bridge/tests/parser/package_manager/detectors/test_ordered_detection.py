@@ -0,0 +1,108 @@
+from pathlib import Path
+
+from code_confluence_flow_bridge.models.detection.shared.rules import LanguageRules
+from code_confluence_flow_bridge.parser.package_manager.python.detectors.rules_loader import (
+    load_python_language_rules,
+)
+from code_confluence_flow_bridge.parser.package_manager.shared import (
+    signature_scan,
+)
+from code_confluence_flow_bridge.parser.package_manager.shared.ordered_detection import (
+    OrderedDetector,
+)
+from code_confluence_flow_bridge.parser.package_manager.shared.signature_scan import (
+    collect_content_patterns,
+    scan_signature_contents,
+)
+import pytest
+
+RULES_PATH = (
+    Path(__file__).resolve().parents[4]
+    / "src/code_confluence_flow_bridge/parser/package_manager/shared/rules.yaml"
+)
+
+
+@pytest.fixture
+async def python_rules() -> LanguageRules:
+    return await load_python_language_rules(str(RULES_PATH))
+
+
+def _write_pyproject(repo: Path, directory: str, content: str) -> str:
+    target = repo / directory / "pyproject.toml"
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(content, encoding="utf-8")
+    return str(target.relative_to(repo))
+
+
+def test_collect_content_patterns_groups_by_file(python_rules: LanguageRules) -> None:
+    assert collect_content_patterns(python_rules) == {
+        "pyproject.toml": frozenset({"[tool.uv]", "[tool.poetry]", "[project]"})
+    }
+
+
+async def test_scan_builds_file_to_pattern_table(
+    tmp_path: Path, python_rules: LanguageRules
+) -> None:
+    poetry = _write_pyproject(tmp_path, "a", "[project]\n[tool.poetry]\n")
+    pip = _write_pyproject(tmp_path, "b", "[project]\nname = 'b'\n")
+    (tmp_path / "b" / "setup.py").write_text("[tool.uv]\n", encoding="utf-8")
+
+    table = await scan_signature_contents(
+        str(tmp_path), [poetry, pip, "b/setup.py"], python_rules
+    )
+
+    assert table == {
+        str(tmp_path / poetry): frozenset({"[project]", "[tool.poetry]"}),
+        str(tmp_path / pip): frozenset({"[project]"}),
+    }
+
+
+async def test_primed_detector_evaluates_rules_without_reading_files(
+    tmp_path: Path, python_rules: LanguageRules, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    files = [
+        _write_pyproject(tmp_path, ".", "[tool.uv]\n"),
+        _write_pyproject(tmp_path, "poetry_app", "[tool.poetry]\n"),
+        _write_pyproject(tmp_path, "pip_app", "[project]\nname = 'pip_app'\n"),
+        _write_pyproject(tmp_path, "mixed", "[project]\n[tool.uv]\n"),
+    ]
+    detector = OrderedDetector(python_rules)
+    await detector.prime_signature_matches(str(tmp_path), files)
+
+    def _unexpected_read(*_: object) -> frozenset[str]:
+        raise AssertionError("primed detection must not read manifests again")
+
+    monkeypatch.setattr(signature_scan, "match_file_patterns", _unexpected_read)
+    monkeypatch.setattr(
+        "code_confluence_flow_bridge.parser.package_manager.shared.ordered_detection.match_file_patterns",
+        _unexpected_read,
+    )
+
+    detected = {
+        directory: await detector.detect_manager(
+            directory, [f"{directory}/pyproject.toml"], str(tmp_path)
+        )
+        for directory in (".", "poetry_app", "pip_app", "mixed")
+    }
+
+    assert detected == {
+        ".": "uv",
+        "poetry_app": "poetry",
+        "pip_app": "pip",
+        "mixed": "uv",
+    }
+
+
+async def test_unprimed_detector_scans_files_on_demand(
+    tmp_path: Path, python_rules: LanguageRules
+) -> None:
+    _write_pyproject(tmp_path, "app", "[project]\n[tool.poetry]\n")
+    detector = OrderedDetector(python_rules)
+
+    result = await detector.detect_manager_result(
+        "app", ["app/pyproject.toml"], str(tmp_path)
+    )
+
+    assert result is not None
+    assert result.manager_name == "poetry"
+    assert result.evidence_value == "pyproject.toml"
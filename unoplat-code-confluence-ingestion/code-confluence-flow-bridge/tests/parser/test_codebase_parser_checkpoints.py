@@ -0,0 +1,164 @@
+"""Unit tests for chunked commits and resuming a retried codebase ingestion."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+import contextlib
+from pathlib import Path
+from typing import List
+
+from code_confluence_flow_bridge.models.workflow.repo_workflow_base import (
+    CodebaseProcessingProgress,
+)
+from code_confluence_flow_bridge.parser.code_confluence_codebase_parser import (
+    _CommitMarker,
+)
+from code_confluence_flow_bridge.processor.db.postgres.db import get_session_cm
+from sqlalchemy import text
+
+from tests.parser.conftest import ParserBuilder, RecordingIngestion
+from tests.utils.sqlite_session_utils import sqlite_engine_for_current_loop
+
+
+@contextlib.asynccontextmanager
+async def _sqlite_database(tmp_path: Path) -> AsyncIterator[None]:
+    """Back ``get_session_cm`` with a SQLite file; each session gets its own connection."""
+    database_url = f"sqlite+aiosqlite:///{tmp_path / 'ingestion.sqlite3'}"
+    async with sqlite_engine_for_current_loop(database_url) as engine:
+        async with engine.begin() as connection:
+            await connection.execute(text("CREATE TABLE written_file (path TEXT)"))
+        yield
+
+
+async def _durable_paths() -> List[str]:
+    async with get_session_cm() as session:
+        result = await session.execute(text("SELECT path FROM written_file"))
+        return [row[0] for row in result]
+
+
+async def test_process_files_commits_a_checkpoint_every_chunk(
+    tmp_path: Path,
+    build_parser: ParserBuilder,
+    session_ingestion: RecordingIngestion,
+) -> None:
+    async with _sqlite_database(tmp_path):
+        progress: List[CodebaseProcessingProgress] = []
+
+        # The activity holds this session, inside get_session_cm's begin() block,
+        # for the whole run; checkpoints must not try to commit it.
+        async with get_session_cm() as session:
+            parser = build_parser(
+                session=session,
+                fake_processor=True,
+                progress=progress,
+                CODEBASE_PARSER_FILE_BATCH_SIZE=100,
+                CODEBASE_PARSER_CHECKPOINT_FILES=200,
+            )
+
+            await parser.process_files(
+                [f"/repo/mod_{index}.py" for index in range(450)]
+            )
+
+            assert session_ingestion.committed_file_counts == [200, 400, 450]
+
+        assert parser.checkpoints == 2
+        assert [item.files_committed for item in progress] == [0, 200, 200, 400, 450]
+        assert progress[-1].files_written == 450
+        assert progress[-1].files_per_second > 0
+        assert len(await _durable_paths()) == 450
+
+
+async def test_failed_run_keeps_only_committed_checkpoints(
+    tmp_path: Path,
+    build_parser: ParserBuilder,
+    session_ingestion: RecordingIngestion,
+) -> None:
+    async with _sqlite_database(tmp_path):
+        with contextlib.suppress(RuntimeError):
+            async with get_session_cm() as session:
+                parser = build_parser(
+                    session=session,
+                    fail_after=350,
+                    CODEBASE_PARSER_FILE_BATCH_SIZE=100,
+                    CODEBASE_PARSER_CHECKPOINT_FILES=200,
+                )
+
+                await parser.process_files(
+                    [f"/repo/mod_{index}.py" for index in range(450)]
+                )
+
+        # The window holding files 201-300 was flushed but never committed.
+        assert len(session_ingestion.written_paths) == 300
+        assert len(await _durable_paths()) == 200
+
+
+async def test_process_files_keeps_one_transaction_when_checkpoints_disabled(
+    tmp_path: Path,
+    build_parser: ParserBuilder,
+    session_ingestion: RecordingIngestion,
+) -> None:
+    async with _sqlite_database(tmp_path):
+        async with get_session_cm() as session:
+            parser = build_parser(
+                session=session,
+                fake_processor=True,
+                CODEBASE_PARSER_FILE_BATCH_SIZE=100,
+            )
+
+            await parser.process_files(
+                [f"/repo/mod_{index}.py" for index in range(450)]
+            )
+
+            assert session_ingestion.committed_file_counts == []
+
+        assert session_ingestion.committed_file_counts == [450]
+        assert len(await _durable_paths()) == 450
+
+
+async def test_full_refresh_resumes_after_files_committed_by_this_run(
+    tmp_path: Path,
+    build_parser: ParserBuilder,
+    session_ingestion: RecordingIngestion,
+) -> None:
+    async with _sqlite_database(tmp_path):
+        committed = (tmp_path / "a_committed.py").resolve()
+        pending = (tmp_path / "b_pending.py").resolve()
+        stale = (tmp_path / "c_stale.py").resolve()
+        for index, path in enumerate((committed, pending, stale)):
+            path.write_text(f"VALUE = {index}\n", encoding="utf-8")
+        # A row left by an earlier ingestion whose checksum still matches must not
+        # be mistaken for one this run committed.
+        session_ingestion.stored_checksums = {str(stale): "unused"}
+        progress: List[CodebaseProcessingProgress] = []
+
+        async with get_session_cm() as session:
+            parser = build_parser(
+                tmp_path,
+                session=session,
+                resume_from=CodebaseProcessingProgress(
+                    files_committed=1, checkpoints=1, committed_through=str(committed)
+                ),
+                progress=progress,
+                CODEBASE_PARSER_FILE_BATCH_SIZE=100,
+                CODEBASE_PARSER_CHECKPOINT_FILES=200,
+            )
+            await parser.process_and_insert_codebase()
+
+        # Files are parsed concurrently, so they are written in completion order
+        assert sorted(session_ingestion.written_paths) == [str(pending), str(stale)]
+        assert parser.files_unchanged == 1
+        assert progress[-1].files_committed == 1 + 2
+        assert progress[-1].files_skipped == 1
+        assert progress[-1].checkpoints == 1
+        assert progress[-1].committed_through == str(stale)
+
+
+def test_commit_marker_only_advances_over_a_fully_committed_prefix() -> None:
+    marker = _CommitMarker(["a", "b", "c", "d"], committed_through=None)
+
+    marker.mark_committed(["b"])
+    assert marker.committed_through is None
+    marker.mark_committed(["a", "d"])
+    assert marker.committed_through == "b"
+    marker.mark_committed(["c"])
+    assert marker.committed_through == "d"
@@ -0,0 +1,118 @@
+"""Unit tests for checksum-based incremental re-ingestion."""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+from tests.parser.conftest import ParserBuilder, RecordingIngestion
+
+
+def _md5(content: str) -> str:
+    return hashlib.md5(content.encode("utf-8")).hexdigest()
+
+
+def _write_codebase(tmp_path: Path) -> tuple[Path, Path, Path]:
+    unchanged = tmp_path / "unchanged.py"
+    modified = tmp_path / "modified.py"
+    added = tmp_path / "added.py"
+    unchanged.write_text("VALUE = 1\n", encoding="utf-8")
+    modified.write_text("VALUE = 2\n", encoding="utf-8")
+    added.write_text("VALUE = 3\n", encoding="utf-8")
+    return unchanged.resolve(), modified.resolve(), added.resolve()
+
+
+async def test_incremental_refresh_parses_only_changed_files(
+    tmp_path: Path, build_parser: ParserBuilder, ingestion: RecordingIngestion
+) -> None:
+    unchanged, modified, added = _write_codebase(tmp_path)
+    removed = str(tmp_path / "removed.py")
+    ingestion.stored_checksums = {
+        str(unchanged): _md5("VALUE = 1\n"),
+        str(modified): _md5("VALUE = 1\n"),
+        removed: _md5("gone\n"),
+    }
+    parser = build_parser(tmp_path, CODEBASE_PARSER_INCREMENTAL_REFRESH=True)
+
+    await parser.process_and_insert_codebase()
+
+    assert sorted(ingestion.written_paths) == sorted([str(modified), str(added)])
+    assert ingestion.deleted_files == [removed]
+    assert ingestion.cleared_feature_files == [str(modified)]
+    assert parser.files_unchanged == 1
+    assert parser.files_removed == 1
+
+
+async def test_catalog_change_reparses_every_file(
+    tmp_path: Path, build_parser: ParserBuilder, ingestion: RecordingIngestion
+) -> None:
+    unchanged, modified, added = _write_codebase(tmp_path)
+    removed = str(tmp_path / "removed.py")
+    ingestion.stored_checksums = {
+        str(unchanged): _md5("VALUE = 1\n"),
+        str(modified): _md5("VALUE = 1\n"),
+        removed: _md5("gone\n"),
+    }
+    ingestion.catalog_version = "catalog-v2"
+    parser = build_parser(tmp_path, CODEBASE_PARSER_INCREMENTAL_REFRESH=True)
+
+    await parser.process_and_insert_codebase()
+
+    # Unchanged files still carry detections from the previous catalog
+    assert sorted(ingestion.written_paths) == sorted(
+        [str(unchanged), str(modified), str(added)]
+    )
+    assert sorted(ingestion.cleared_feature_files) == sorted(
+        [str(unchanged), str(modified)]
+    )
+    assert ingestion.deleted_files == [removed]
+    assert parser.files_unchanged == 0
+    assert ingestion.codebase_catalog_version == "catalog-v2"
+
+
+async def test_incremental_refresh_deletes_rows_when_nothing_changed(
+    tmp_path: Path, build_parser: ParserBuilder, ingestion: RecordingIngestion
+) -> None:
+    source = tmp_path / "only.py"
+    source.write_text("VALUE = 1\n", encoding="utf-8")
+    removed = str(tmp_path / "removed.py")
+    ingestion.stored_checksums = {
+        str(source.resolve()): _md5("VALUE = 1\n"),
+        removed: None,
+    }
+    parser = build_parser(tmp_path, CODEBASE_PARSER_INCREMENTAL_REFRESH=True)
+
+    await parser.process_and_insert_codebase()
+
+    assert ingestion.written_paths == []
+    assert ingestion.deleted_files == [removed]
+
+
+async def test_full_refresh_ignores_stored_checksums(
+    tmp_path: Path, build_parser: ParserBuilder, ingestion: RecordingIngestion
+) -> None:
+    unchanged, modified, added = _write_codebase(tmp_path)
+    ingestion.stored_checksums = {str(unchanged): _md5("VALUE = 1\n")}
+    parser = build_parser(tmp_path, CODEBASE_PARSER_INCREMENTAL_REFRESH=False)
+
+    await parser.process_and_insert_codebase()
+
+    assert sorted(ingestion.written_paths) == sorted(
+        [str(unchanged), str(modified), str(added)]
+    )
+    assert ingestion.deleted_files == []
+
+
+async def test_run_override_forces_incremental_refresh(
+    tmp_path: Path, build_parser: ParserBuilder, ingestion: RecordingIngestion
+) -> None:
+    unchanged, modified, added = _write_codebase(tmp_path)
+    ingestion.stored_checksums = {str(unchanged): _md5("VALUE = 1\n")}
+    parser = build_parser(
+        tmp_path, incremental_refresh=True, CODEBASE_PARSER_INCREMENTAL_REFRESH=False
+    )
+
+    await parser.process_and_insert_codebase()
+
+    assert sorted(ingestion.written_paths) == sorted([str(modified), str(added)])
+    assert parser.files_unchanged == 1
@@ -0,0 +1,54 @@
+"""Unit tests for the parser's producer/consumer insertion queue."""
+
+from __future__ import annotations
+
+import asyncio
+
+from code_confluence_flow_bridge.parser.code_confluence_codebase_parser import (
+    ParserStageTimings,
+)
+import pytest
+
+from tests.parser.conftest import ParserBuilder, RecordingIngestion
+
+
+@pytest.mark.asyncio
+async def test_process_files_streams_every_file_through_writer_task(
+    build_parser: ParserBuilder, ingestion: RecordingIngestion
+) -> None:
+    parser = build_parser(
+        fake_processor=True,
+        CODEBASE_PARSER_FILE_BATCH_SIZE=100,
+        CODEBASE_PARSER_INSERTION_QUEUE_SIZE=200,
+    )
+    file_paths = [f"/repo/mod_{index}.py" for index in range(450)]
+
+    await parser.process_files(file_paths)
+
+    assert ingestion.written_paths == file_paths
+    assert ingestion.framework_calls == []
+    assert parser.stage_timings.wall_seconds > 0
+    assert parser.stage_timings.bound_by in {"cpu", "db"}
+
+
+@pytest.mark.asyncio
+async def test_process_files_surfaces_writer_failure_when_queue_is_full(
+    build_parser: ParserBuilder, ingestion: RecordingIngestion
+) -> None:
+    ingestion.fail_on_flush = True
+    parser = build_parser(
+        fake_processor=True,
+        CODEBASE_PARSER_FILE_BATCH_SIZE=100,
+        CODEBASE_PARSER_INSERTION_QUEUE_SIZE=200,
+    )
+    file_paths = [f"/repo/mod_{index}.py" for index in range(1000)]
+
+    with pytest.raises(RuntimeError, match="database unavailable"):
+        await asyncio.wait_for(parser.process_files(file_paths), timeout=5)
+
+
+def test_stage_timings_report_db_bound_when_parser_waits_on_writer() -> None:
+    timings = ParserStageTimings(backpressure_seconds=3.0, writer_idle_seconds=0.5)
+
+    assert timings.bound_by == "db"
+    assert ParserStageTimings(writer_idle_seconds=1.0).bound_by == "cpu"
@@ -0,0 +1,83 @@
+"""Unit tests for splitting a codebase into parallel parsing shards."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+from code_confluence_flow_bridge.models.workflow.repo_workflow_base import (
+    CodebaseShard,
+)
+from code_confluence_flow_bridge.parser.codebase_sharding import split_into_shards
+import pytest
+
+from tests.parser.conftest import ParserBuilder, RecordingIngestion
+
+
+def test_split_balances_bytes_and_keeps_ranges_contiguous() -> None:
+    sized_paths = [(f"/repo/{name}.py", 10) for name in "abcdefgh"]
+
+    sized_paths[0] = ("/repo/a.py", 40)
+
+    shards = split_into_shards(sized_paths, target_bytes=40, max_shards=8)
+
+    assert [(shard.first_path, shard.last_path) for shard in shards] == [
+        ("/repo/a.py", "/repo/a.py"),
+        ("/repo/b.py", "/repo/e.py"),
+        ("/repo/f.py", "/repo/h.py"),
+    ]
+    assert [shard.total_bytes for shard in shards] == [40, 40, 30]
+    assert [shard.shard_index for shard in shards] == [0, 1, 2]
+
+
+def test_split_respects_shard_cap_and_small_codebases() -> None:
+    sized_paths = [(f"/repo/{index:02d}.py", 100) for index in range(20)]
+
+    assert len(split_into_shards(sized_paths, target_bytes=10, max_shards=4)) == 4
+    assert len(split_into_shards(sized_paths, target_bytes=10_000, max_shards=4)) == 1
+    assert split_into_shards([], target_bytes=10, max_shards=4) == []
+    with pytest.raises(ValueError):
+        split_into_shards(sized_paths, target_bytes=0, max_shards=4)
+
+
+async def test_plan_shards_covers_every_discovered_file(
+    tmp_path: Path, build_parser: ParserBuilder
+) -> None:
+    for name in ("a", "b", "c", "d"):
+        (tmp_path / f"{name}.py").write_text("#" * 600_000, encoding="utf-8")
+
+    assert await build_parser(tmp_path).plan_shards() == []
+    shards = await build_parser(
+        tmp_path, CODEBASE_PARSER_SHARD_TARGET_MB=1
+    ).plan_shards()
+
+    assert len(shards) == 3
+    assert shards[0].first_path == str((tmp_path / "a.py").resolve())
+    assert shards[-1].last_path == str((tmp_path / "d.py").resolve())
+    assert sum(shard.file_count for shard in shards) == 4
+
+
+async def test_shard_parses_only_its_range_and_defers_frameworks(
+    tmp_path: Path, build_parser: ParserBuilder, ingestion: RecordingIngestion
+) -> None:
+    for name in ("a", "b", "c"):
+        (tmp_path / f"{name}.py").write_text("VALUE = 1\n", encoding="utf-8")
+    shard = CodebaseShard(
+        shard_index=1,
+        first_path=str((tmp_path / "b.py").resolve()),
+        last_path=str((tmp_path / "c.py").resolve()),
+        file_count=2,
+        total_bytes=20,
+    )
+    parser = build_parser(tmp_path, shard=shard)
+
+    def _build_feature_rows(file_data: Any, frameworks_used: set) -> list:
+        frameworks_used.add(("python", "fastapi"))
+        return []
+
+    parser._build_feature_rows = _build_feature_rows  # type: ignore[method-assign]
+
+    await parser.process_and_insert_codebase()
+
+    assert sorted(ingestion.written_paths) == [shard.first_path, shard.last_path]
+    assert ingestion.framework_calls == []
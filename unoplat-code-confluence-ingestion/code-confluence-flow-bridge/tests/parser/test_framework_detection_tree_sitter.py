@@ -11,6 +11,7 @@ from code_confluence_flow_bridge.engine.programming_language.python.python_sourc
 )
 from code_confluence_flow_bridge.engine.programming_language.python.python_tree_sitter_framework_detector import (
     PythonTreeSitterFrameworkDetector,
+    _is_feature_imported,
 )
 from code_confluence_flow_bridge.models.configuration.settings import (
     EnvironmentSettings,
@@ -22,6 +23,7 @@ from code_confluence_flow_bridge.processor.db.postgres.framework_query_service i
     _build_feature_spec,
     _resolve_base_confidence,
 )
+import tree_sitter
 from unoplat_code_confluence_commons.base_models import (
     CallExpressionInfo,
     Concept,
@@ -1408,3 +1410,26 @@ class User(BM):
     assert inheritance_detection.feature_key == "data_model.data_model"
     assert inheritance_detection.subclass == "User"
     assert inheritance_detection.superclass == "BM"
+
+
+def test_combined_query_matches_per_spec_queries() -> None:
+    repo_root = Path(__file__).resolve().parents[2]
+    source_dir = repo_root / "src" / "code_confluence_flow_bridge"
+    feature_specs = _load_python_feature_specs()
+    detector = PythonTreeSitterFrameworkDetector()
+
+    # Detection filters the catalog-wide language query down to each file's imports.
+    language_query = detector._query_builder.build_language_query(feature_specs)
+    spec_indexes = language_query.spec_indexes("python", feature_specs)
+    assert spec_indexes is not None and None not in spec_indexes
+
+    for source_path in sorted(source_dir.rglob("*.py"))[:60]:
+        context = PythonSourceContext.from_bytes(source_path.read_bytes())
+        expected = []
+        for spec in feature_specs:
+            query = detector._query_builder.build_query(spec)
+            matches = tree_sitter.QueryCursor(query).matches(context.root_node)
+            if _is_feature_imported(spec.absolute_paths, context.import_aliases):
+                expected.extend(detector._detect_feature(context, spec, matches))
+
+        assert detector.detect(context, feature_specs) == expected, source_path
@@ -0,0 +1,132 @@
+"""Unit tests for the worker-wide parsing runtime."""
+
+from __future__ import annotations
+
+from code_confluence_flow_bridge.engine.detector.data_model_detector_factory import (
+    DataModelDetectorFactory,
+)
+from code_confluence_flow_bridge.engine.framework_feature_index import (
+    FrameworkFeatureIndex,
+)
+from code_confluence_flow_bridge.models.configuration.settings import (
+    EnvironmentSettings,
+)
+from code_confluence_flow_bridge.parser import parsing_runtime
+from code_confluence_flow_bridge.parser.language_processors.parse_cache import (
+    ParseCacheConfig,
+)
+from code_confluence_flow_bridge.parser.parsing_runtime import ParsingRuntime
+import pytest
+from unoplat_code_confluence_commons.programming_language_metadata import (
+    ProgrammingLanguage,
+)
+
+
+class _CountingCatalogSource:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def get_framework_libraries_for_language(self, language: str) -> list[str]:
+        self.calls += 1
+        return ["fastapi"]
+
+    async def get_framework_features_for_language(
+        self, language: str
+    ) -> list[tuple[str, str, str]]:
+        return [("fastapi", "rest_api", "route")]
+
+
+def _runtime(workers: int = 1) -> ParsingRuntime:
+    return ParsingRuntime(
+        EnvironmentSettings(CODEBASE_PARSER_PROCESS_POOL_WORKERS=workers),
+        languages=("python",),
+    )
+
+
+async def test_engine_is_reused_across_leases_until_its_key_changes() -> None:
+    runtime = _runtime()
+
+    async with runtime.lease_parsing_engine("python", detect_frameworks=False) as first:
+        async with runtime.lease_parsing_engine(
+            "python", detect_frameworks=False
+        ) as concurrent:
+            assert concurrent is first
+    async with runtime.lease_parsing_engine(
+        "python", detect_frameworks=False
+    ) as second:
+        assert second is first
+    assert first is not None and first.is_available
+
+    cache_config = ParseCacheConfig(path="unused.sqlite", max_bytes=1, namespace="v2")
+    async with runtime.lease_parsing_engine(
+        "python", detect_frameworks=False, parse_cache_config=cache_config
+    ) as replacement:
+        assert replacement is not first
+        assert not first.is_available
+
+    await runtime.shutdown()
+    assert replacement is not None and not replacement.is_available
+
+
+async def test_retired_engine_outlives_its_open_lease() -> None:
+    runtime = _runtime()
+    cache_config = ParseCacheConfig(path="unused.sqlite", max_bytes=1, namespace="v2")
+
+    async with runtime.lease_parsing_engine("python", detect_frameworks=False) as stale:
+        async with runtime.lease_parsing_engine(
+            "python", detect_frameworks=False, parse_cache_config=cache_config
+        ):
+            assert stale is not None and stale.is_available
+    assert not stale.is_available
+
+    await runtime.shutdown()
+
+
+async def test_disabled_process_pool_yields_no_engine() -> None:
+    runtime = _runtime(workers=0)
+
+    async with runtime.lease_parsing_engine("python", detect_frameworks=True) as engine:
+        assert engine is None
+
+
+async def test_framework_catalog_is_reloaded_only_when_version_changes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    runtime = _runtime()
+    source = _CountingCatalogSource()
+    feature_index = FrameworkFeatureIndex("python", [])
+    feature_index.catalog_version = "v1"
+    index_size = {"value": 1}
+    monkeypatch.setattr(FrameworkFeatureIndex, "__len__", lambda _: index_size["value"])
+
+    async def _get_index(language: str) -> FrameworkFeatureIndex:
+        return feature_index
+
+    monkeypatch.setattr(parsing_runtime, "get_framework_feature_index", _get_index)
+
+    catalog = await runtime.get_framework_catalog("python", source)
+    assert await runtime.get_framework_catalog("python", source) is catalog
+    assert catalog.frameworks == frozenset({"fastapi"})
+    assert source.calls == 1
+
+    feature_index.catalog_version = "v2"
+    await runtime.get_framework_catalog("python", source)
+    assert source.calls == 2
+
+    index_size["value"] = 0
+    await runtime.get_framework_catalog("python", source)
+    await runtime.get_framework_catalog("python", source)
+    assert source.calls == 4
+
+
+def test_detection_service_and_data_model_strategy_are_shared() -> None:
+    runtime = _runtime()
+
+    service = runtime.framework_detection_service("python")
+
+    assert service is not None
+    assert runtime.framework_detection_service("Python") is service
+    assert runtime.framework_detection_service("go") is None
+    assert DataModelDetectorFactory.get_strategy(
+        ProgrammingLanguage.PYTHON
+    ) is DataModelDetectorFactory.get_strategy(ProgrammingLanguage.PYTHON)
@@ -0,0 +1,172 @@
+"""Unit tests for the shared single-walk repository inventory."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from code_confluence_flow_bridge.models.configuration.settings import (
+    EnvironmentSettings,
+)
+from code_confluence_flow_bridge.parser.code_confluence_codebase_parser import (
+    CodeConfluenceCodebaseParser,
+)
+from code_confluence_flow_bridge.parser.package_manager.python.detectors.ripgrep_detector import (
+    PythonRipgrepDetector,
+)
+from code_confluence_flow_bridge.parser.repository_inventory import (
+    RepositoryInventory,
+)
+from git import Actor, Repo
+from unoplat_code_confluence_commons.programming_language_metadata import (
+    PackageManagerType,
+    ProgrammingLanguage,
+    ProgrammingLanguageMetadata,
+)
+
+_AUTHOR = Actor("Inventory Test", "inventory@example.com")
+
+
+def _write(root: Path, relative_path: str, content: str = "") -> None:
+    target = root / relative_path
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(content, encoding="utf-8")
+
+
+def _commit_all(repo: Repo, message: str) -> None:
+    repo.git.add(A=True)
+    repo.index.commit(message, author=_AUTHOR, committer=_AUTHOR)
+
+
+def _build_repository(root: Path) -> Repo:
+    _write(root, "pyproject.toml", "[project]\nname = 'svc'\n")
+    _write(root, "svc/main.py", "VALUE = 1\n")
+    _write(root, "svc/util.py", "VALUE = 2\n")
+    _write(root, "svc/README.md", "svc\n")
+    _write(root, "web/package.json", "{}\n")
+    _write(root, "node_modules/dep/package.json", "{}\n")
+    _write(root, "docs/_build/package.json", "{}\n")
+    _write(root, ".github/package.json", "{}\n")
+    _write(root, "tests/package.json", "{}\n")
+    repo = Repo.init(root)
+    _commit_all(repo, "initial")
+    return repo
+
+
+def test_build_prunes_and_indexes_files(tmp_path: Path) -> None:
+    repo = _build_repository(tmp_path)
+
+    inventory = RepositoryInventory.build(tmp_path)
+
+    assert inventory.root == str(tmp_path.resolve())
+    assert inventory.head == repo.head.commit.hexsha
+    assert not any(
+        path.startswith((".git/", "node_modules/")) for path in inventory.files
+    )
+    assert inventory.files_in_directory("svc") == (
+        "svc/README.md",
+        "svc/main.py",
+        "svc/util.py",
+    )
+    assert inventory.files_named("main.py") == ("svc/main.py",)
+    assert inventory.files_with_extension(".py") == ("svc/main.py", "svc/util.py")
+
+
+def test_select_mirrors_ripgrep_globs_and_ignores(tmp_path: Path) -> None:
+    _build_repository(tmp_path)
+    inventory = RepositoryInventory.build(tmp_path)
+
+    assert inventory.select(
+        ["package.json", "pyproject.toml"], ["docs/_build", "tests"]
+    ) == [
+        "pyproject.toml",
+        "web/package.json",
+    ]
+    assert inventory.select(["*.toml"]) == ["pyproject.toml"]
+    assert ".github/package.json" in inventory.select(
+        ["package.json"], include_hidden_directories=True
+    )
+
+
+def test_select_applies_gitignore_rules_like_ripgrep(tmp_path: Path) -> None:
+    repo = _build_repository(tmp_path)
+    _write(tmp_path, ".gitignore", "generated/\n*.local.json\n")
+    _write(tmp_path, "web/package.local.json", "{}\n")
+    repo.git.add("-f", "web/package.local.json")
+    _commit_all(repo, "ignore generated output")
+    _write(tmp_path, "generated/client/package.json", "{}\n")
+
+    inventory = RepositoryInventory.build(tmp_path)
+
+    # The walk still records ignored files; only select() drops them.
+    assert "generated/client/package.json" in inventory.files
+    assert inventory.select(["package.json"], ["docs/_build", "tests"]) == [
+        "web/package.json"
+    ]
+    assert inventory.select(["*.json"], ["docs/_build", "tests"]) == [
+        "web/package.json"
+    ]
+
+    assert inventory.save_snapshot() is not None
+    loaded = RepositoryInventory.load_snapshot(tmp_path)
+    assert loaded is not None
+    assert loaded.gitignored == inventory.gitignored
+
+
+def test_snapshot_round_trip_is_invalidated_by_new_commit(tmp_path: Path) -> None:
+    repo = _build_repository(tmp_path)
+    inventory = RepositoryInventory.build(tmp_path)
+
+    assert inventory.save_snapshot() is not None
+    loaded = RepositoryInventory.load_snapshot(tmp_path / "svc")
+    assert loaded is not None
+    assert loaded.files == inventory.files
+
+    _write(tmp_path, "svc/extra.py", "VALUE = 3\n")
+    _commit_all(repo, "add extra")
+
+    assert RepositoryInventory.load_snapshot(tmp_path / "svc") is None
+
+
+def test_parser_discovers_same_files_from_inventory_as_walk(tmp_path: Path) -> None:
+    _build_repository(tmp_path)
+    _write(tmp_path, "svc/.venv/lib/site.py", "")
+    _write(tmp_path, "svc/fixtures/sample.py", "")
+
+    def _discover(inventory: RepositoryInventory | None) -> list[str]:
+        parser = CodeConfluenceCodebaseParser(
+            codebase_name="org_repo_svc",
+            codebase_path=str(tmp_path / "svc"),
+            root_packages=[],
+            programming_language_metadata=ProgrammingLanguageMetadata(
+                language=ProgrammingLanguage.PYTHON,
+                package_manager=PackageManagerType.UV,
+            ),
+            trace_id="trace",
+            session=object(),  # type: ignore[arg-type]
+            code_confluence_env=EnvironmentSettings(),
+            repository_inventory=inventory,
+        )
+        return sorted(parser.discover_source_files())
+
+    walked = _discover(None)
+
+    assert walked == [
+        str((tmp_path / "svc/main.py").resolve()),
+        str((tmp_path / "svc/util.py").resolve()),
+    ]
+    assert _discover(RepositoryInventory.build(tmp_path)) == walked
+
+
+async def test_python_detector_uses_shared_inventory(tmp_path: Path) -> None:
+    _build_repository(tmp_path)
+    inventory = RepositoryInventory.build(tmp_path)
+    detector = PythonRipgrepDetector()
+    await detector.initialize_rules()
+
+    configs = await detector.detect_codebases(inventory.root, "", inventory=inventory)
+
+    assert [config.codebase_folder for config in configs] == ["."]
+    assert configs[0].programming_language_metadata.package_manager == (
+        PackageManagerType.PIP
+    )
+    assert configs[0].root_packages == ["svc"]
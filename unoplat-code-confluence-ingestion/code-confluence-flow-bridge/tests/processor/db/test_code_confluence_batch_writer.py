@@ -0,0 +1,183 @@
+"""Unit tests for multi-row relational upserts and the buffered file writer."""
+
+from __future__ import annotations
+
+from typing import Any, List
+
+from code_confluence_flow_bridge.models.code_confluence_parsing_models.unoplat_file import (
+    UnoplatFile,
+)
+from code_confluence_flow_bridge.processor.db.postgres.code_confluence_batch_writer import (
+    CodeConfluenceFileBatchWriter,
+)
+from code_confluence_flow_bridge.processor.db.postgres.code_confluence_relational_ingestion import (
+    MAX_BIND_PARAMETERS,
+    CodeConfluenceRelationalIngestion,
+)
+import pytest
+from sqlalchemy.dialects import postgresql
+
+
+class _RecordingSession:
+    """Minimal AsyncSession stand-in that records executed statements."""
+
+    def __init__(self) -> None:
+        self.statements: List[Any] = []
+
+    async def execute(self, stmt: Any) -> None:
+        self.statements.append(stmt)
+
+
+def _feature_row(start_line: int) -> dict[str, object]:
+    return {
+        "feature_language": "python",
+        "feature_library": "fastapi",
+        "feature_capability_key": "rest_api",
+        "feature_operation_key": "get",
+        "start_line": start_line,
+        "end_line": start_line + 1,
+        "match_text": "@app.get('/')",
+        "match_confidence": 1.0,
+        "validation_status": "completed",
+        "evidence_json": None,
+    }
+
+
+def _compiled_params(stmt: Any) -> dict[str, Any]:
+    return stmt.compile(dialect=postgresql.dialect()).params
+
+
+@pytest.mark.asyncio
+async def test_upsert_files_emits_one_multi_row_statement() -> None:
+    session = _RecordingSession()
+    ingestion = CodeConfluenceRelationalIngestion(session)  # type: ignore[arg-type]
+
+    files = [UnoplatFile(file_path=f"/repo/mod_{index}.py") for index in range(50)]
+    await ingestion.upsert_files("org_repo_codebase", files)
+
+    assert len(session.statements) == 1
+    compiled = str(session.statements[0].compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (file_path) DO UPDATE" in compiled
+    assert "excluded.checksum" in compiled
+    assert len(_compiled_params(session.statements[0])) == 50 * 6
+
+
+@pytest.mark.asyncio
+async def test_upsert_files_collapses_duplicate_paths() -> None:
+    session = _RecordingSession()
+    ingestion = CodeConfluenceRelationalIngestion(session)  # type: ignore[arg-type]
+
+    await ingestion.upsert_files(
+        "org_repo_codebase",
+        [
+            UnoplatFile(file_path="/repo/a.py", checksum="old"),
+            UnoplatFile(file_path="/repo/a.py", checksum="new"),
+        ],
+    )
+
+    params = _compiled_params(session.statements[0])
+    assert [value for key, value in params.items() if key.startswith("checksum")] == [
+        "new"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_upsert_file_feature_rows_splits_by_bind_parameter_limit() -> None:
+    session = _RecordingSession()
+    ingestion = CodeConfluenceRelationalIngestion(session)  # type: ignore[arg-type]
+
+    rows_per_statement = MAX_BIND_PARAMETERS // 11
+    rows = [
+        {**_feature_row(index), "file_path": "/repo/a.py"}
+        for index in range(rows_per_statement + 5)
+    ]
+    await ingestion.upsert_file_feature_rows(rows)
+
+    assert len(session.statements) == 2
+    assert len(_compiled_params(session.statements[1])) == 5 * 11
+
+
+@pytest.mark.asyncio
+async def test_upsert_codebase_frameworks_skips_empty_input() -> None:
+    session = _RecordingSession()
+    ingestion = CodeConfluenceRelationalIngestion(session)  # type: ignore[arg-type]
+
+    await ingestion.upsert_codebase_frameworks("org_repo_codebase", [])
+
+    assert session.statements == []
+
+
+@pytest.mark.asyncio
+async def test_delete_files_removes_feature_spans_before_file_rows() -> None:
+    session = _RecordingSession()
+    ingestion = CodeConfluenceRelationalIngestion(session)  # type: ignore[arg-type]
+
+    await ingestion.delete_files(["/repo/a.py", "/repo/b.py", "/repo/a.py"])
+
+    compiled = [
+        str(stmt.compile(dialect=postgresql.dialect())) for stmt in session.statements
+    ]
+    assert len(compiled) == 2
+    assert compiled[0].startswith("DELETE FROM code_confluence_file_framework_feature")
+    assert compiled[1].startswith("DELETE FROM code_confluence_file ")
+    assert list(_compiled_params(session.statements[1]).values()) == [
+        ["/repo/a.py", "/repo/b.py"]
+    ]
+
+
+@pytest.mark.asyncio
+async def test_delete_files_skips_empty_input() -> None:
+    session = _RecordingSession()
+    ingestion = CodeConfluenceRelationalIngestion(session)  # type: ignore[arg-type]
+
+    await ingestion.delete_files([])
+
+    assert session.statements == []
+
+
+class _RecordingIngestion:
+    def __init__(self) -> None:
+        self.calls: List[tuple[str, Any]] = []
+
+    async def upsert_files(self, codebase_qualified_name: str, files: Any) -> None:
+        self.calls.append(("files", [item.file_path for item in files]))
+
+    async def upsert_file_feature_rows(self, feature_rows: Any) -> None:
+        self.calls.append(("features", [row["file_path"] for row in feature_rows]))
+
+
+@pytest.mark.asyncio
+async def test_batch_writer_flushes_files_before_features_per_batch() -> None:
+    ingestion = _RecordingIngestion()
+    writer = CodeConfluenceFileBatchWriter(
+        ingestion,  # type: ignore[arg-type]
+        "org_repo_codebase",
+        file_batch_size=2,
+    )
+
+    await writer.add(UnoplatFile(file_path="/repo/a.py"), [_feature_row(1)])
+    assert ingestion.calls == []
+
+    await writer.add(UnoplatFile(file_path="/repo/b.py"))
+    await writer.add(UnoplatFile(file_path="/repo/c.py"), [_feature_row(3)])
+    await writer.flush()
+
+    assert ingestion.calls == [
+        ("files", ["/repo/a.py", "/repo/b.py"]),
+        ("features", ["/repo/a.py"]),
+        ("files", ["/repo/c.py"]),
+        ("features", ["/repo/c.py"]),
+    ]
+    assert writer.files_written == 3
+    assert writer.feature_rows_written == 2
+    assert writer.flush_count == 2
+    assert writer.pending_file_count == 0
+
+
+def test_batch_writer_rejects_non_positive_batch_size() -> None:
+    with pytest.raises(ValueError):
+        CodeConfluenceFileBatchWriter(
+            _RecordingIngestion(),  # type: ignore[arg-type]
+            "org_repo_codebase",
+            file_batch_size=0,
+        )
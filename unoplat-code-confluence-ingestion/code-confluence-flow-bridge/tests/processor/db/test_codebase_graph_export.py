@@ -0,0 +1,72 @@
+"""Unit tests for the streaming NDJSON export of an ingested codebase."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, AsyncIterator, Dict, List
+
+from code_confluence_flow_bridge.processor.db.postgres.codebase_graph_export import (
+    EXPORT_FETCH_SIZE,
+    encode_ndjson,
+    stream_codebase_graph,
+)
+
+
+class _StreamedResult:
+    def __init__(self, rows: List[Dict[str, Any]]) -> None:
+        self._rows = rows
+
+    async def mappings(self) -> AsyncIterator[Dict[str, Any]]:
+        for row in self._rows:
+            yield row
+
+
+class _StreamingSession:
+    def __init__(self, *tables: List[Dict[str, Any]]) -> None:
+        self._tables = list(tables)
+        self.fetch_sizes: List[Any] = []
+
+    async def stream(self, stmt: Any) -> _StreamedResult:
+        self.fetch_sizes.append(stmt.get_execution_options().get("yield_per"))
+        return _StreamedResult(self._tables.pop(0))
+
+
+async def _collect(records: AsyncIterator[Any]) -> List[Any]:
+    return [record async for record in records]
+
+
+async def test_stream_tags_each_table_and_uses_server_side_cursors() -> None:
+    session = _StreamingSession(
+        [{"language": "python", "library": "fastapi"}],
+        [{"file_path": "/repo/app.py", "imports": ["fastapi"]}],
+        [{"file_path": "/repo/app.py", "start_line": 3, "end_line": 5}],
+    )
+    codebase_record = {"record_type": "codebase", "qualified_name": "org_repo_app"}
+
+    records = await _collect(
+        stream_codebase_graph(session, codebase_record)  # type: ignore[arg-type]
+    )
+
+    assert [record["record_type"] for record in records] == [
+        "codebase",
+        "codebase_framework",
+        "file",
+        "file_framework_feature",
+    ]
+    assert records[2]["imports"] == ["fastapi"]
+    assert session.fetch_sizes == [EXPORT_FETCH_SIZE] * 3
+
+
+async def test_encode_ndjson_groups_lines_into_bounded_chunks() -> None:
+    async def _records() -> AsyncIterator[Dict[str, Any]]:
+        for index in range(10):
+            yield {"record_type": "file", "file_path": f"/repo/{index}.py"}
+
+    chunks = await _collect(encode_ndjson(_records(), chunk_bytes=100))
+
+    assert len(chunks) > 1
+    assert all(len(chunk) < 200 for chunk in chunks)
+    lines = b"".join(chunks).decode("utf-8").splitlines()
+    assert [json.loads(line)["file_path"] for line in lines] == [
+        f"/repo/{index}.py" for index in range(10)
+    ]
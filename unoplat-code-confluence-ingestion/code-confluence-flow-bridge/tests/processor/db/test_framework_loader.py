@@ -5,11 +5,23 @@ from pathlib import Path
 from code_confluence_flow_bridge.models.configuration.settings import (
     EnvironmentSettings,
 )
+from code_confluence_flow_bridge.processor.db.postgres import (
+    framework_loader as framework_loader_module,
+)
+from code_confluence_flow_bridge.processor.db.postgres.db import get_session_cm
 from code_confluence_flow_bridge.processor.db.postgres.framework_loader import (
+    CatalogRows,
     FrameworkDefinitionLoader,
+    compute_catalog_diff,
+    compute_catalog_version,
+    invalidate_feature_indexes_after_commit,
 )
+import pytest
+from sqlalchemy import text
 from unoplat_code_confluence_commons.base_models import Concept
 
+from tests.utils.sqlite_session_utils import sqlite_engine_for_current_loop
+
 
 def _build_loader(definitions_path: Path) -> FrameworkDefinitionLoader:
     # EnvironmentSettings is a BaseSettings model with alias
@@ -234,3 +246,117 @@ def test_parse_json_data_rejects_base_confidence_for_non_call_expression(
         assert "only for CallExpression" in str(exc)
     else:
         raise AssertionError("Expected non-CallExpression confidence to raise")
+
+
+def test_catalog_version_ignores_key_order_and_tracks_content() -> None:
+    definitions = {"python": {"fastapi": {"docs_url": "a", "capabilities": {}}}}
+    reordered = {"python": {"fastapi": {"capabilities": {}, "docs_url": "a"}}}
+    changed = {"python": {"fastapi": {"docs_url": "b", "capabilities": {}}}}
+
+    assert compute_catalog_version(definitions) == compute_catalog_version(reordered)
+    assert compute_catalog_version(definitions) != compute_catalog_version(changed)
+    assert len(compute_catalog_version({})) == 64
+
+
+def test_catalog_diff_only_touches_changed_rows() -> None:
+    current = CatalogRows(
+        frameworks={
+            ("python", "fastapi"): {"docs_url": "a", "description": None},
+            ("python", "flask"): {"docs_url": "f", "description": None},
+        },
+        features={
+            ("python", "fastapi", "rest_api", "get"): {"concept": "AnnotationLike"},
+            ("python", "flask", "rest_api", "route"): {"concept": "AnnotationLike"},
+        },
+        absolute_paths={
+            ("python", "fastapi", "rest_api", "get", "fastapi.FastAPI.get"),
+            ("python", "flask", "rest_api", "route", "flask.Flask.route"),
+        },
+    )
+    desired = CatalogRows(
+        frameworks={
+            ("python", "fastapi"): {"docs_url": "a", "description": "web"},
+        },
+        features={
+            ("python", "fastapi", "rest_api", "get"): {"concept": "AnnotationLike"},
+            ("python", "fastapi", "rest_api", "post"): {"concept": "AnnotationLike"},
+        },
+        absolute_paths={
+            ("python", "fastapi", "rest_api", "get", "fastapi.FastAPI.get"),
+            ("python", "fastapi", "rest_api", "post", "fastapi.FastAPI.post"),
+        },
+    )
+
+    diff = compute_catalog_diff(current, desired)
+
+    assert diff.upsert_frameworks == [("python", "fastapi")]
+    assert diff.delete_frameworks == [("python", "flask")]
+    assert diff.upsert_features == [("python", "fastapi", "rest_api", "post")]
+    assert diff.delete_features == [("python", "flask", "rest_api", "route")]
+    assert diff.insert_absolute_paths == [
+        ("python", "fastapi", "rest_api", "post", "fastapi.FastAPI.post")
+    ]
+    assert diff.delete_absolute_paths == [
+        ("python", "flask", "rest_api", "route", "flask.Flask.route")
+    ]
+    assert compute_catalog_diff(desired, desired).is_empty
+
+
+def test_catalog_rows_from_parsed_definitions(tmp_path: Path) -> None:
+    loader = _build_loader(tmp_path)
+    frameworks, features, absolute_paths = loader.parse_json_data(
+        {
+            "python": {
+                "fastapi": {
+                    "docs_url": "https://fastapi.tiangolo.com",
+                    "capabilities": {
+                        "rest_api": {
+                            "operations": {
+                                "get": {
+                                    "concept": "AnnotationLike",
+                                    "absolute_paths": ["fastapi.FastAPI.get"],
+                                }
+                            }
+                        }
+                    },
+                }
+            }
+        }
+    )
+
+    rows = CatalogRows.from_models(frameworks, features, absolute_paths)
+
+    assert rows.frameworks == {
+        ("python", "fastapi"): {
+            "docs_url": "https://fastapi.tiangolo.com",
+            "description": None,
+        }
+    }
+    assert list(rows.features) == [("python", "fastapi", "rest_api", "get")]
+    assert rows.absolute_paths == {
+        ("python", "fastapi", "rest_api", "get", "fastapi.FastAPI.get")
+    }
+
+
+async def test_feature_indexes_are_invalidated_only_after_commit(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    invalidations: list[str] = []
+    monkeypatch.setattr(
+        framework_loader_module,
+        "invalidate_framework_feature_indexes",
+        lambda: invalidations.append("invalidated"),
+    )
+
+    async with sqlite_engine_for_current_loop():
+        async with get_session_cm() as session:
+            invalidate_feature_indexes_after_commit(session)
+            await session.execute(text("SELECT 1"))
+            assert invalidations == []
+        assert invalidations == ["invalidated"]
+
+        with pytest.raises(RuntimeError):
+            async with get_session_cm() as session:
+                invalidate_feature_indexes_after_commit(session)
+                raise RuntimeError("sync failed")
+        assert invalidations == ["invalidated"]
@@ -0,0 +1,226 @@
+"""Unit tests for fanning workflow status notifications out to stream subscribers."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+import contextlib
+from datetime import datetime, timezone
+from typing import Any, List
+
+from code_confluence_flow_bridge.models.github.github_repo import (
+    GithubRepoStatus,
+    WorkflowStatusEvent,
+)
+from code_confluence_flow_bridge.processor.db.postgres import workflow_status_events
+from code_confluence_flow_bridge.processor.db.postgres.workflow_status_events import (
+    WorkflowStatusBroadcaster,
+)
+from code_confluence_flow_bridge.routers.repository import router as router_module
+from code_confluence_flow_bridge.routers.repository.router import (
+    stream_repository_status,
+)
+from fastapi import HTTPException
+import pytest
+from unoplat_code_confluence_commons.workflow_models import JobStatus
+
+
+def _event(repository_name: str, status: JobStatus) -> WorkflowStatusEvent:
+    return WorkflowStatusEvent(
+        scope="codebase",
+        repository_name=repository_name,
+        repository_owner_name="unoplat",
+        repository_workflow_run_id="run-1",
+        codebase_folder="backend",
+        codebase_workflow_run_id="child-run-1",
+        status=status,
+    )
+
+
+class _ConnectedRequest:
+    def __init__(self) -> None:
+        self.disconnected = False
+
+    async def is_disconnected(self) -> bool:
+        return self.disconnected
+
+
+async def test_notifications_reach_every_subscriber() -> None:
+    broadcaster = WorkflowStatusBroadcaster()
+    event = _event("code-confluence", JobStatus.RUNNING)
+
+    async with broadcaster.subscribe() as first, broadcaster.subscribe() as second:
+        broadcaster._on_notification(
+            None, 1, "workflow_status", event.model_dump_json()
+        )
+        broadcaster._on_notification(None, 1, "workflow_status", "not json")
+
+        assert first.get_nowait() == event
+        assert second.get_nowait() == event
+        assert first.empty()
+
+    assert broadcaster.subscriber_count == 0
+
+
+async def test_lagging_subscriber_keeps_the_latest_events(monkeypatch: Any) -> None:
+    monkeypatch.setattr(workflow_status_events, "SUBSCRIBER_QUEUE_SIZE", 2)
+    broadcaster = WorkflowStatusBroadcaster()
+
+    async with broadcaster.subscribe() as queue:
+        for status in (JobStatus.SUBMITTED, JobStatus.RUNNING, JobStatus.COMPLETED):
+            broadcaster.publish(_event("code-confluence", status))
+
+        assert [queue.get_nowait().status for _ in range(2)] == [
+            JobStatus.RUNNING,
+            JobStatus.COMPLETED,
+        ]
+
+
+async def test_status_stream_pushes_only_matching_runs() -> None:
+    broadcaster = WorkflowStatusBroadcaster()
+    request = _ConnectedRequest()
+    response = await stream_repository_status(
+        request,  # type: ignore[arg-type]
+        repository_name="code-confluence",
+        repository_owner_name=None,
+        workflow_run_id=None,
+        broadcaster=broadcaster,
+    )
+    messages: List[str] = []
+
+    async def _consume() -> None:
+        async for message in response.body_iterator:
+            messages.append(str(message))
+            request.disconnected = True
+
+    consumer = asyncio.create_task(_consume())
+    while broadcaster.subscriber_count == 0:
+        await asyncio.sleep(0)
+    broadcaster.publish(_event("other-repo", JobStatus.RUNNING))
+    broadcaster.publish(_event("code-confluence", JobStatus.COMPLETED))
+    await asyncio.wait_for(consumer, timeout=5)
+
+    assert response.media_type == "text/event-stream"
+    assert len(messages) == 1
+    assert messages[0].startswith("event: status\ndata: ")
+    assert '"repository_name":"code-confluence"' in messages[0]
+    assert broadcaster.subscriber_count == 0
+
+
+@contextlib.asynccontextmanager
+async def _released_session() -> AsyncIterator[object]:
+    yield object()
+
+
+async def test_status_stream_subscribes_before_reading_the_snapshot(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    broadcaster = WorkflowStatusBroadcaster()
+    request = _ConnectedRequest()
+
+    async def _snapshot(**kwargs: Any) -> GithubRepoStatus:
+        # A change committed while the snapshot is read must still be pushed.
+        broadcaster.publish(_event("code-confluence", JobStatus.COMPLETED))
+        return GithubRepoStatus(
+            repository_name="code-confluence",
+            repository_owner_name="unoplat",
+            repository_workflow_run_id="run-1",
+            repository_workflow_id="workflow-1",
+            started_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            status=JobStatus.RUNNING,
+        )
+
+    monkeypatch.setattr(router_module, "get_session_cm", _released_session)
+    monkeypatch.setattr(router_module, "get_repository_status", _snapshot)
+
+    response = await stream_repository_status(
+        request,  # type: ignore[arg-type]
+        repository_name="code-confluence",
+        repository_owner_name="unoplat",
+        workflow_run_id="run-1",
+        broadcaster=broadcaster,
+    )
+    messages: List[str] = []
+    async for message in response.body_iterator:
+        messages.append(str(message))
+        if len(messages) == 2:
+            request.disconnected = True
+
+    assert messages[0].startswith("event: snapshot\ndata: ")
+    assert messages[1].startswith("event: status\ndata: ")
+    assert '"status":"COMPLETED"' in messages[1]
+    assert broadcaster.subscriber_count == 0
+
+
+async def test_status_stream_releases_subscription_when_run_is_missing(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    broadcaster = WorkflowStatusBroadcaster()
+
+    async def _missing(**kwargs: Any) -> GithubRepoStatus:
+        raise HTTPException(status_code=404, detail="not found")
+
+    monkeypatch.setattr(router_module, "get_session_cm", _released_session)
+    monkeypatch.setattr(router_module, "get_repository_status", _missing)
+
+    with pytest.raises(HTTPException):
+        await stream_repository_status(
+            _ConnectedRequest(),  # type: ignore[arg-type]
+            repository_name="code-confluence",
+            repository_owner_name="unoplat",
+            workflow_run_id="run-1",
+            broadcaster=broadcaster,
+        )
+
+    assert broadcaster.subscriber_count == 0
+
+
+class _FakeListenConnection:
+    def __init__(self) -> None:
+        self.listeners: dict[str, Any] = {}
+        self.termination_listeners: list[Any] = []
+        self.closed = False
+
+    def add_termination_listener(self, callback: Any) -> None:
+        self.termination_listeners.append(callback)
+
+    def remove_termination_listener(self, callback: Any) -> None:
+        self.termination_listeners.remove(callback)
+
+    async def add_listener(self, channel: str, callback: Any) -> None:
+        self.listeners[channel] = callback
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+async def test_listener_uses_a_dedicated_connection_outside_the_pool(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    connection = _FakeListenConnection()
+
+    async def _connect(**kwargs: Any) -> _FakeListenConnection:
+        return connection
+
+    monkeypatch.setattr(workflow_status_events.asyncpg, "connect", _connect)
+    broadcaster = WorkflowStatusBroadcaster()
+    event = _event("code-confluence", JobStatus.RUNNING)
+
+    async with broadcaster.subscribe() as queue:
+        listening = asyncio.create_task(broadcaster._listen_once())
+        while not connection.listeners:
+            await asyncio.sleep(0)
+        connection.listeners["workflow_status"](
+            connection, 1, "workflow_status", event.model_dump_json()
+        )
+        for callback in list(connection.termination_listeners):
+            callback(connection)
+        await asyncio.wait_for(listening, timeout=5)
+
+        assert queue.get_nowait() == event
+
+    assert connection.closed
+    assert connection.termination_listeners == []
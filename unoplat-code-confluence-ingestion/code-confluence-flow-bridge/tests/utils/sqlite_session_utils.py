@@ -0,0 +1,51 @@
+"""
+In-memory SQLite engine bound to the production session helpers.
+
+``get_session_cm`` looks its engine up per event loop; registering an
+aiosqlite engine for the running loop lets tests exercise the real session
+and transaction handling without a Postgres container.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from code_confluence_flow_bridge.processor.db.postgres import db
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import StaticPool
+
+
+@asynccontextmanager
+async def sqlite_engine_for_current_loop(
+    url: str = "sqlite+aiosqlite://",
+) -> AsyncIterator[AsyncEngine]:
+    """Route ``get_session_cm`` for the running loop to a SQLite engine.
+
+    The default in-memory database uses a StaticPool so every session sees the
+    same data. Pass a file URL when sessions need their own connections, for
+    example to observe what another session has committed.
+    """
+    loop_id = id(asyncio.get_running_loop())
+    previous = db._engine_per_loop.get(loop_id)
+    engine = (
+        create_async_engine(url, poolclass=StaticPool)
+        if url == "sqlite+aiosqlite://"
+        else create_async_engine(url)
+    )
+    db._engine_per_loop[loop_id] = (
+        engine,
+        async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession),
+    )
+    try:
+        yield engine
+    finally:
+        if previous is None:
+            db._engine_per_loop.pop(loop_id, None)
+        else:
+            db._engine_per_loop[loop_id] = previous
+        await engine.dispose()
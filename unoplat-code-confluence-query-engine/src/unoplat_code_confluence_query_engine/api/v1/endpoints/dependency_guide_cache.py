@@ -0,0 +1,43 @@
+"""Explicit invalidation of the fleet-wide dependency guide cache."""
+
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query, status
+from loguru import logger
+from pydantic import BaseModel
+
+from unoplat_code_confluence_query_engine.db.postgres.dependency_guide_cache_repository import (
+    invalidate_dependency_guides,
+)
+
+router = APIRouter(prefix="/v1/dependency-guide-cache", tags=["dependency-guide-cache"])
+
+
+class DependencyGuideCacheInvalidationResponse(BaseModel):
+    deleted: int
+
+
+@router.delete("", response_model=DependencyGuideCacheInvalidationResponse)
+async def invalidate_dependency_guide_cache(
+    programming_language: Optional[str] = Query(default=None),
+    package_manager: Optional[str] = Query(default=None),
+    name: Optional[str] = Query(
+        default=None, description="Normalized dependency or family name"
+    ),
+    expired_only: bool = Query(default=False),
+) -> DependencyGuideCacheInvalidationResponse:
+    """Delete cached guides matching every given filter; no filters clears the cache."""
+    try:
+        deleted = await invalidate_dependency_guides(
+            programming_language=programming_language,
+            package_manager=package_manager,
+            target_name=name,
+            expired_only=expired_only,
+        )
+    except Exception as e:
+        logger.error("Error invalidating dependency guide cache: {}", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to invalidate dependency guide cache",
+        )
+    return DependencyGuideCacheInvalidationResponse(deleted=deleted)
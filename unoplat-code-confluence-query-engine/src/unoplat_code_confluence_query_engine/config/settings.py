@@ -310,12 +310,92 @@ class EnvironmentSettings(BaseSettings):
         le=60.0,
     )
 
+    # Codebase agent scheduling
+    codebase_agent_max_concurrency: int = Field(
+        default=3,
+        alias="CODEBASE_AGENT_MAX_CONCURRENCY",
+        description="Independent agents a codebase workflow runs at once; 1 runs them sequentially",
+        ge=1,
+        le=8,
+    )
+
+    # Call-expression discovery
+    call_expression_discovery_max_concurrency: int = Field(
+        default=4,
+        alias="CALL_EXPRESSION_DISCOVERY_MAX_CONCURRENCY",
+        description="Call-expression discoverer runs a codebase workflow keeps in flight at once",
+        ge=1,
+        le=32,
+    )
+    call_expression_discovery_batch_size: int = Field(
+        default=4,
+        alias="CALL_EXPRESSION_DISCOVERY_BATCH_SIZE",
+        description="Operations of one library handled by a single discoverer run; 1 keeps every operation isolated",
+        ge=1,
+        le=16,
+    )
+
+    # Dependency guide generation
+    dependency_guide_max_concurrency: int = Field(
+        default=4,
+        alias="DEPENDENCY_GUIDE_MAX_CONCURRENCY",
+        description="Dependency guide agent runs a codebase workflow keeps in flight at once",
+        ge=1,
+        le=32,
+    )
+    dependency_guide_provider_concurrency: str = Field(
+        default="ollama=1",
+        alias="DEPENDENCY_GUIDE_PROVIDER_CONCURRENCY",
+        description="Comma-separated provider_key=limit overrides of the dependency guide concurrency, for providers with tighter rate limits",
+    )
+
+    dependency_guide_cache_enabled: bool = Field(
+        default=True,
+        alias="DEPENDENCY_GUIDE_CACHE_ENABLED",
+        description="Reuse and store dependency guide entries in the fleet-wide Postgres cache",
+    )
+    dependency_guide_cache_ttl_days: int = Field(
+        default=30,
+        alias="DEPENDENCY_GUIDE_CACHE_TTL_DAYS",
+        description="Days a cached dependency guide entry is reused before it is regenerated",
+        ge=1,
+        le=365,
+    )
+
+    # Agent event buffering (per worker)
+    agent_event_flush_interval_s: float = Field(
+        default=0.5,
+        alias="AGENT_EVENT_FLUSH_INTERVAL_S",
+        description="Seconds between flushes of buffered agent events; also bounds how often the run snapshot row is touched",
+        ge=0.05,
+        le=10.0,
+    )
+    agent_event_batch_size: int = Field(
+        default=200,
+        alias="AGENT_EVENT_BATCH_SIZE",
+        description="Buffered agent events that trigger a flush before the interval elapses",
+        ge=1,
+        le=1000,
+    )
+
     @computed_field  # type: ignore[prop-decorator]
     @property
     def retry_status_codes_list(self) -> list[int]:
         """Parse retry status codes string into list of integers."""
         return [int(code.strip()) for code in self.retry_status_codes.split(",")]
 
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def dependency_guide_provider_concurrency_map(self) -> dict[str, int]:
+        """Parse provider concurrency overrides into provider_key -> limit."""
+        overrides: dict[str, int] = {}
+        for item in self.dependency_guide_provider_concurrency.split(","):
+            if "=" not in item:
+                continue
+            provider_key, limit = item.split("=", 1)
+            overrides[provider_key.strip()] = max(1, int(limit.strip()))
+        return overrides
+
     @computed_field  # type: ignore[prop-decorator]
     @property
     def postgres_url(self) -> str:
@@ -78,3 +78,47 @@ async def fetch_codebase_dependencies(codebase_path: str) -> list[str]:
     )
 
     return sorted(dependency_names, key=str.lower)
+
+
+async def fetch_codebase_dependency_versions(
+    codebase_path: str,
+) -> dict[str, dict[str, object]]:
+    """Fetch the version constraints of a codebase's runtime dependencies.
+
+    Reads the same "default" group as ``fetch_codebase_dependencies``.
+
+    Args:
+        codebase_path: Absolute path to the codebase
+
+    Returns:
+        Serialized UnoplatVersion per package name, e.g.
+        ``{"fastapi": {"specifier": ">=0.110", "minimum_version": "0.110", ...}}``.
+        Packages without version information map to an empty dict.
+    """
+    if not codebase_path:
+        return {}
+
+    async with get_startup_session() as session:
+        stmt = (
+            select(UnoplatCodeConfluencePackageManagerMetadata.dependencies)
+            .join(
+                UnoplatCodeConfluenceCodebase,
+                UnoplatCodeConfluencePackageManagerMetadata.codebase_qualified_name
+                == UnoplatCodeConfluenceCodebase.qualified_name,
+            )
+            .where(UnoplatCodeConfluenceCodebase.codebase_path == codebase_path)
+            .limit(1)
+        )
+        result = await session.execute(stmt)
+        row = result.scalar_one_or_none()
+
+    if not row:
+        return {}
+
+    dependencies_dict: DependenciesJsonb = row  # type: ignore[assignment]
+    default_group: dict[str, object] = dependencies_dict.get("default", {})
+    versions: dict[str, dict[str, object]] = {}
+    for package_name, dependency in default_group.items():
+        version = dependency.get("version") if isinstance(dependency, dict) else None
+        versions[package_name] = dict(version) if isinstance(version, dict) else {}
+    return versions
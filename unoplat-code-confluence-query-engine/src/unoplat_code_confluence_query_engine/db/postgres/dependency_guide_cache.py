@@ -0,0 +1,40 @@
+"""Fleet-wide cache of generated dependency guide entries."""
+
+from datetime import datetime
+
+from sqlalchemy import Index, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql.sqltypes import DateTime
+from unoplat_code_confluence_commons.base_models.sql_base import SQLBase
+
+
+class DependencyGuideCacheEntry(SQLBase):
+    """Generated purpose of one public dependency, shared across repositories."""
+
+    __tablename__ = "dependency_guide_cache"
+
+    programming_language: Mapped[str] = mapped_column(
+        primary_key=True, comment="Lowercased programming language"
+    )
+    package_manager: Mapped[str] = mapped_column(
+        primary_key=True, comment="Lowercased package manager"
+    )
+    target_name: Mapped[str] = mapped_column(
+        primary_key=True,
+        comment="Normalized dependency or family name from normalize_dependency_guide_targets",
+    )
+    major_version: Mapped[str] = mapped_column(
+        primary_key=True, comment="Major version, empty when unknown or mixed"
+    )
+    prompt_version: Mapped[str] = mapped_column(
+        primary_key=True, comment="Hash of the dependency guide prompt"
+    )
+    purpose: Mapped[str] = mapped_column(Text, comment="Generated purpose text")
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=func.now()
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), comment="Entries are ignored after this time"
+    )
+
+    __table_args__ = (Index("ix_dependency_guide_cache_expires_at", "expires_at"),)
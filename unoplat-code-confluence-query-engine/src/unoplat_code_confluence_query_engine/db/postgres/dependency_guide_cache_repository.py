@@ -0,0 +1,155 @@
+"""PostgreSQL repository for the fleet-wide dependency guide cache."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime, timedelta, timezone
+
+from loguru import logger
+from sqlalchemy import delete, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+
+from unoplat_code_confluence_query_engine.db.postgres.db import get_startup_session
+from unoplat_code_confluence_query_engine.db.postgres.dependency_guide_cache import (
+    DependencyGuideCacheEntry,
+)
+from unoplat_code_confluence_query_engine.models.runtime.dependency_guide_target import (
+    DependencyGuideTarget,
+)
+
+
+def _normalize_key_part(value: str) -> str:
+    return value.strip().lower()
+
+
+async def fetch_cached_dependency_guides(
+    programming_language: str,
+    package_manager: str,
+    targets: Sequence[DependencyGuideTarget],
+    prompt_version: str,
+) -> dict[str, str]:
+    """Return unexpired cached purposes keyed by target name.
+
+    Targets match on name and major version under the same language,
+    package manager and prompt version.
+    """
+    if not targets:
+        return {}
+
+    async with get_startup_session() as session:
+        result = await session.execute(
+            select(
+                DependencyGuideCacheEntry.target_name,
+                DependencyGuideCacheEntry.purpose,
+            ).where(
+                DependencyGuideCacheEntry.programming_language
+                == _normalize_key_part(programming_language),
+                DependencyGuideCacheEntry.package_manager
+                == _normalize_key_part(package_manager),
+                DependencyGuideCacheEntry.prompt_version == prompt_version,
+                tuple_(
+                    DependencyGuideCacheEntry.target_name,
+                    DependencyGuideCacheEntry.major_version,
+                ).in_([(target.name, target.major_version) for target in targets]),
+                DependencyGuideCacheEntry.expires_at > datetime.now(timezone.utc),
+            )
+        )
+        return {target_name: purpose for target_name, purpose in result.all()}
+
+
+async def upsert_dependency_guides(
+    programming_language: str,
+    package_manager: str,
+    guides: Sequence[tuple[DependencyGuideTarget, str]],
+    prompt_version: str,
+    ttl: timedelta,
+) -> int:
+    """Store generated purposes, refreshing the expiry of existing entries.
+
+    Returns:
+        Number of entries written
+    """
+    if not guides:
+        return 0
+
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            "programming_language": _normalize_key_part(programming_language),
+            "package_manager": _normalize_key_part(package_manager),
+            "target_name": target.name,
+            "major_version": target.major_version,
+            "prompt_version": prompt_version,
+            "purpose": purpose,
+            "created_at": now,
+            "expires_at": now + ttl,
+        }
+        # One row per key; a later duplicate would fail the upsert
+        for target, purpose in {
+            (target.name, target.major_version): (target, purpose)
+            for target, purpose in guides
+        }.values()
+    ]
+    stmt = insert(DependencyGuideCacheEntry).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[
+            DependencyGuideCacheEntry.programming_language,
+            DependencyGuideCacheEntry.package_manager,
+            DependencyGuideCacheEntry.target_name,
+            DependencyGuideCacheEntry.major_version,
+            DependencyGuideCacheEntry.prompt_version,
+        ],
+        set_={
+            "purpose": stmt.excluded.purpose,
+            "created_at": stmt.excluded.created_at,
+            "expires_at": stmt.excluded.expires_at,
+        },
+    )
+    async with get_startup_session() as session:
+        await session.execute(stmt)
+    return len(rows)
+
+
+async def invalidate_dependency_guides(
+    programming_language: str | None = None,
+    package_manager: str | None = None,
+    target_name: str | None = None,
+    expired_only: bool = False,
+) -> int:
+    """Delete cached entries matching every given filter.
+
+    With no filters the whole cache is cleared.
+
+    Returns:
+        Number of entries deleted
+    """
+    stmt = delete(DependencyGuideCacheEntry)
+    if programming_language is not None:
+        stmt = stmt.where(
+            DependencyGuideCacheEntry.programming_language
+            == _normalize_key_part(programming_language)
+        )
+    if package_manager is not None:
+        stmt = stmt.where(
+            DependencyGuideCacheEntry.package_manager
+            == _normalize_key_part(package_manager)
+        )
+    if target_name is not None:
+        stmt = stmt.where(DependencyGuideCacheEntry.target_name == target_name)
+    if expired_only:
+        stmt = stmt.where(
+            DependencyGuideCacheEntry.expires_at <= datetime.now(timezone.utc)
+        )
+
+    async with get_startup_session() as session:
+        result = await session.execute(stmt)
+    deleted = int(result.rowcount or 0)
+    logger.info(
+        "[dependency_guide_cache] Invalidated {} entries (language={}, package_manager={}, name={}, expired_only={})",
+        deleted,
+        programming_language,
+        package_manager,
+        target_name,
+        expired_only,
+    )
+    return deleted
@@ -15,6 +15,7 @@ from unoplat_code_confluence_query_engine.api.v1.endpoints import (
     ai_model_config,
     app_feedback,
     codebase_agent_rules,
+    dependency_guide_cache,
     flags,
     health,
     tool_config,
@@ -289,6 +290,7 @@ app.include_router(codebase_agent_rules.router)
 app.include_router(ai_model_config.router)
 app.include_router(ai_model_config.callback_router)
 app.include_router(flags.router)
+app.include_router(dependency_guide_cache.router)
 app.include_router(tool_config.router)
 app.include_router(app_feedback.router)
 app.include_router(health.router)
@@ -11,6 +11,10 @@ class DependencyGuideTarget(BaseModel):
         default_factory=list,
         description="Raw package names represented by this documentation target",
     )
+    major_version: str = Field(
+        default="",
+        description="Major version the target's guide is cached under; empty when unknown",
+    )
 
     model_config = ConfigDict(extra="forbid")
 
@@ -30,8 +34,19 @@ class DependencyGuideDelta(BaseModel):
         default_factory=list,
         description="Previously generated entry names no longer present in current targets",
     )
+    cached_names: list[str] = Field(
+        default_factory=list,
+        description="Targets whose entries came from the fleet-wide guide cache",
+    )
+    generation_concurrency: int = Field(
+        default=1,
+        ge=1,
+        description="Agent runs the workflow may keep in flight for targets_to_generate",
+    )
 
-    model_config = ConfigDict(extra="forbid")
+    # Activity result: workers on an older release must still decode fields
+    # added by newer ones during a rolling deploy
+    model_config = ConfigDict(extra="ignore")
 
 
 class UIDependencyFamilyMatchRule(BaseModel):
@@ -0,0 +1,63 @@
+"""Derive fleet-wide dependency guide cache keys for normalized targets."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+import re
+
+from unoplat_code_confluence_query_engine.models.runtime.dependency_guide_target import (
+    DependencyGuideTarget,
+)
+
+# Purpose the dependency guide agent returns for private or unresolved
+# packages; these describe one repository, so they are never shared
+INTERNAL_DEPENDENCY_PURPOSE = "internal_dependency"
+
+_MAJOR_VERSION_PATTERN = re.compile(r"(\d+)")
+# Most specific first: what is installed, then the lower bound, then the raw spec
+_VERSION_FIELDS = ("current_version", "minimum_version", "specifier")
+
+
+def extract_major_version(version: Mapping[str, object] | None) -> str:
+    """Return the major version from a serialized UnoplatVersion, or "" if unknown."""
+    if not version:
+        return ""
+    for field_name in _VERSION_FIELDS:
+        value = version.get(field_name)
+        if not isinstance(value, str):
+            continue
+        match = _MAJOR_VERSION_PATTERN.search(value)
+        if match is not None:
+            return str(int(match.group(1)))
+    return ""
+
+
+def assign_target_major_versions(
+    targets: list[DependencyGuideTarget],
+    dependency_versions: Mapping[str, Mapping[str, object]],
+) -> list[DependencyGuideTarget]:
+    """Attach the major version each target is cached under.
+
+    A family target takes the major version its source packages agree on, and
+    no version when they disagree.
+    """
+    versioned_targets: list[DependencyGuideTarget] = []
+    for target in targets:
+        source_packages = target.source_packages or [target.name]
+        major_versions = {
+            extract_major_version(dependency_versions.get(package_name))
+            for package_name in source_packages
+        }
+        major_version = major_versions.pop() if len(major_versions) == 1 else ""
+        versioned_targets.append(
+            target.model_copy(update={"major_version": major_version})
+        )
+    return versioned_targets
+
+
+def is_shareable_dependency_guide_purpose(purpose: str) -> bool:
+    """Whether a generated purpose can be reused by other repositories."""
+    normalized_purpose = purpose.strip()
+    return (
+        bool(normalized_purpose) and normalized_purpose != INTERNAL_DEPENDENCY_PURPOSE
+    )
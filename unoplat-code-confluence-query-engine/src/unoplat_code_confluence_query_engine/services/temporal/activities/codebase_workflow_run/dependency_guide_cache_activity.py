@@ -0,0 +1,72 @@
+"""Dependency guide cache activity for Temporal workflows."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+from loguru import logger
+from temporalio import activity
+
+from unoplat_code_confluence_query_engine.db.postgres.dependency_guide_cache_repository import (
+    upsert_dependency_guides,
+)
+from unoplat_code_confluence_query_engine.models.runtime.dependency_guide_target import (
+    DependencyGuideTarget,
+)
+from unoplat_code_confluence_query_engine.services.repository.dependency_guide_cache_service import (
+    is_shareable_dependency_guide_purpose,
+)
+from unoplat_code_confluence_query_engine.services.temporal.agent_assembly.agents.user_prompts.build_user_prompt_dependency_guide import (
+    build_dependency_guide_prompt_version,
+)
+
+
+class DependencyGuideCacheActivity:
+    """Activity for sharing generated dependency guides through Postgres."""
+
+    def __init__(self, enabled: bool = False, ttl: timedelta = timedelta(days=30)):
+        self.enabled = enabled
+        self.ttl = ttl
+
+    @activity.defn
+    async def store_generated_dependency_guides(
+        self,
+        programming_language: str,
+        package_manager: str,
+        targets: list[DependencyGuideTarget],
+        dependency_entries: list[dict[str, Any]],
+    ) -> int:
+        """Cache the public entries generated for ``targets``.
+
+        Internal dependencies and entries whose name does not match a target
+        are skipped.
+
+        Returns:
+            Number of entries cached
+        """
+        if not self.enabled:
+            return 0
+
+        targets_by_name = {target.name: target for target in targets}
+        guides = [
+            (targets_by_name[entry["name"]], str(entry["purpose"]))
+            for entry in dependency_entries
+            if entry.get("name") in targets_by_name
+            and is_shareable_dependency_guide_purpose(str(entry.get("purpose", "")))
+        ]
+        stored = await upsert_dependency_guides(
+            programming_language=programming_language,
+            package_manager=package_manager,
+            guides=guides,
+            prompt_version=build_dependency_guide_prompt_version(),
+            ttl=self.ttl,
+        )
+        logger.info(
+            "[dependency_guide_cache] Cached {} of {} generated entries for language={} package_manager={}",
+            stored,
+            len(dependency_entries),
+            programming_language,
+            package_manager,
+        )
+        return stored
@@ -9,6 +9,10 @@ from temporalio import activity
 
 from unoplat_code_confluence_query_engine.db.postgres.code_confluence_dependency_repository import (
     fetch_codebase_dependencies,
+    fetch_codebase_dependency_versions,
+)
+from unoplat_code_confluence_query_engine.db.postgres.dependency_guide_cache_repository import (
+    fetch_cached_dependency_guides,
 )
 from unoplat_code_confluence_query_engine.models.runtime.dependency_guide_target import (
     DependencyGuideDelta,
@@ -17,17 +21,29 @@ from unoplat_code_confluence_query_engine.models.runtime.dependency_guide_target
 from unoplat_code_confluence_query_engine.services.agents_md.validation.dependency_overview import (
     parse_dependency_overview_entries,
 )
-from unoplat_code_confluence_query_engine.services.temporal.agent_assembly.constants import (
-    DEPENDENCY_OVERVIEW_ARTIFACT,
+from unoplat_code_confluence_query_engine.services.repository.dependency_guide_cache_service import (
+    assign_target_major_versions,
 )
 from unoplat_code_confluence_query_engine.services.repository.dependency_guide_normalization_service import (
     normalize_dependency_guide_targets,
 )
+from unoplat_code_confluence_query_engine.services.temporal.agent_assembly.agents.user_prompts.build_user_prompt_dependency_guide import (
+    build_dependency_guide_prompt_version,
+)
+from unoplat_code_confluence_query_engine.services.temporal.agent_assembly.constants import (
+    DEPENDENCY_OVERVIEW_ARTIFACT,
+)
+from unoplat_code_confluence_query_engine.services.temporal.temporal_agents import (
+    get_cached_dependency_guide_concurrency,
+)
 
 
 class DependencyGuideFetchActivity:
     """Activity for fetching dependency names from PostgreSQL."""
 
+    def __init__(self, use_guide_cache: bool = False) -> None:
+        self.use_guide_cache = use_guide_cache
+
     @activity.defn
     async def fetch_codebase_dependencies(
         self,
@@ -61,7 +77,76 @@ class DependencyGuideFetchActivity:
         programming_language: str,
         package_manager: str,
     ) -> DependencyGuideDelta:
-        """Fetch current targets and diff them against existing dependencies_overview.md."""
+        """Fetch current targets and diff them against existing dependencies_overview.md.
+
+        Targets missing from the markdown are then looked up in the fleet-wide
+        guide cache when it is enabled; hits become reusable entries. The delta
+        also carries the worker's generation concurrency, so the workflow reads
+        it from history and replays with the same fan-out.
+        """
+        delta = await self._diff_dependency_guide_targets(
+            codebase_path=codebase_path,
+            programming_language=programming_language,
+            package_manager=package_manager,
+        )
+        if self.use_guide_cache and delta.targets_to_generate:
+            await self._apply_guide_cache(
+                delta, codebase_path, programming_language, package_manager
+            )
+        delta.generation_concurrency = get_cached_dependency_guide_concurrency()
+        return delta
+
+    async def _apply_guide_cache(
+        self,
+        delta: DependencyGuideDelta,
+        codebase_path: str,
+        programming_language: str,
+        package_manager: str,
+    ) -> None:
+        # The cache only saves work; when it is unreachable everything is generated
+        try:
+            targets = assign_target_major_versions(
+                delta.targets_to_generate,
+                await fetch_codebase_dependency_versions(codebase_path),
+            )
+            cached_purposes = await fetch_cached_dependency_guides(
+                programming_language=programming_language,
+                package_manager=package_manager,
+                targets=targets,
+                prompt_version=build_dependency_guide_prompt_version(),
+            )
+        except Exception as cache_error:
+            logger.warning(
+                "[dependency_guide_fetch] Guide cache lookup failed for codebase_path={}: {}",
+                codebase_path,
+                cache_error,
+            )
+            return
+
+        delta.reusable_entries.extend(
+            {"name": target.name, "purpose": cached_purposes[target.name]}
+            for target in targets
+            if target.name in cached_purposes
+        )
+        delta.cached_names = [
+            target.name for target in targets if target.name in cached_purposes
+        ]
+        delta.targets_to_generate = [
+            target for target in targets if target.name not in cached_purposes
+        ]
+        logger.info(
+            "[dependency_guide_fetch] Guide cache for codebase_path={}: hits={} misses={}",
+            codebase_path,
+            len(delta.cached_names),
+            len(delta.targets_to_generate),
+        )
+
+    async def _diff_dependency_guide_targets(
+        self,
+        codebase_path: str,
+        programming_language: str,
+        package_manager: str,
+    ) -> DependencyGuideDelta:
         dependency_targets = await self.fetch_codebase_dependencies(
             codebase_path=codebase_path,
             programming_language=programming_language,
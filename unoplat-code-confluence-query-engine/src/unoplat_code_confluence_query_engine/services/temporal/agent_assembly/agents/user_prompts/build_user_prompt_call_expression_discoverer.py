@@ -7,21 +7,21 @@ from unoplat_code_confluence_query_engine.models.repository.framework_feature_va
 
 
 def build_call_expression_discoverer_instructions() -> str:
-    """Build instructions for one operation-scoped provenance discovery run."""
+    """Build instructions for operation-scoped provenance discovery runs."""
     return (
-        "Inspect the repository for this one supplied catalog CallExpression operation only.\n"
+        "Inspect the repository for the supplied catalog CallExpression operations only; most runs supply one operation, batched runs supply several operations of the same library.\n"
         "Absolute paths, construct-query metadata, and existing spans are optional hints; an empty span list must not skip discovery.\n\n"
         "Rules\n"
         "- Search only inside the supplied codebase path. Trace related instances through assignments, exports, imports, aliases, attributes, and dependency injection.\n"
         "- Test and test-utility paths/files are out of scope.\n"
-        "- Accept only proven final calls whose receiver resolves to the configured framework value and whose callee matches this operation. Reject constructors, factories, configuration calls, lookalike receivers, mocks, repositories, routers, maps, caches, and helpers.\n"
+        "- Accept only proven final calls whose receiver resolves to the configured framework value and whose callee matches the operation. Reject constructors, factories, configuration calls, lookalike receivers, mocks, repositories, routers, maps, caches, and helpers.\n"
         "- Set final_confidence for every proven file/span. Do not write or infer evidence_json.\n"
-        "- Do not use sibling operations.\n"
+        "- Do not use catalog operations that were not supplied. Each supplied operation is a separate target: a span proves only the operation whose callee it matches.\n"
         "- Supplied spans that cannot be proven remain unchanged (pending/needs_review).\n"
-        "- If no production span exists: do not call the upsert tool; return created_count=0 and updated_count=0.\n"
-        "- If at least one production span is proven: call upsert_discovered_framework_feature_usages at least once using the exact supplied FrameworkFeatureIdentity and all distinct proven production spans.\n"
+        "- If no production span exists for an operation: do not call the upsert tool for it. When no supplied operation has one, return created_count=0 and updated_count=0.\n"
+        "- For each operation with at least one proven production span: call upsert_discovered_framework_feature_usages at least once using that operation's exact supplied FrameworkFeatureIdentity and all of its distinct proven production spans.\n"
         "- If the tool raises ModelRetry: correct only rejected/malformed paths or spans, retain the other proven production spans, and retry.\n"
-        "- After success, return the exact tool result."
+        "- After success, return the exact tool result, or the summed created_count and updated_count across all upsert calls when more than one operation was supplied."
     )
 
 
@@ -31,12 +31,7 @@ def build_call_expression_discoverer_prompt(
     operation: CallExpressionDiscoveryOperation,
 ) -> str:
     """Build an isolated discovery request for one catalog operation."""
-    target = {
-        "feature_language": capability.feature_language,
-        "feature_library": capability.feature_library,
-        "feature_capability_key": capability.feature_capability_key,
-        "feature_operation_key": operation.feature_operation_key,
-    }
+    target = _build_target_identity(capability, operation)
     return (
         "Discover proven final CallExpression usages for exactly this operation.\n\n"
         f"Codebase path: {codebase_path}\n"
@@ -46,3 +41,40 @@ def build_call_expression_discoverer_prompt(
         "Operation metadata and optional hints JSON:\n"
         f"{operation.model_dump_json(indent=2)}"
     )
+
+
+def build_call_expression_discoverer_batch_prompt(
+    codebase_path: str,
+    operations: list[
+        tuple[CallExpressionDiscoveryTarget, CallExpressionDiscoveryOperation]
+    ],
+) -> str:
+    """Build one discovery request covering several operations of a library."""
+    sections = [
+        (
+            f"Operation {index}\n"
+            "Exact target FrameworkFeatureIdentity JSON:\n"
+            f"{_build_target_identity(capability, operation)}\n\n"
+            "Operation metadata and optional hints JSON:\n"
+            f"{operation.model_dump_json(indent=2)}"
+        )
+        for index, (capability, operation) in enumerate(operations, start=1)
+    ]
+    return (
+        f"Discover proven final CallExpression usages for each of these {len(operations)} operations.\n\n"
+        f"Codebase path: {codebase_path}\n"
+        "All repository inspection must stay inside this codebase path.\n\n"
+        + "\n\n".join(sections)
+    )
+
+
+def _build_target_identity(
+    capability: CallExpressionDiscoveryTarget,
+    operation: CallExpressionDiscoveryOperation,
+) -> dict[str, str]:
+    return {
+        "feature_language": capability.feature_language,
+        "feature_library": capability.feature_library,
+        "feature_capability_key": capability.feature_capability_key,
+        "feature_operation_key": operation.feature_operation_key,
+    }
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+
 from unoplat_code_confluence_query_engine.models.runtime.dependency_guide_target import (
     DependencyGuideTarget,
 )
@@ -70,3 +72,14 @@ def build_dependency_guide_prompt(
         f"Document the library '{dependency_target.name}' for programming language "
         f"{programming_language}."
     )
+
+
+def build_dependency_guide_prompt_version() -> str:
+    """Hash the instructions and prompt so cached guides expire with prompt edits."""
+    prompt_template = build_dependency_guide_prompt(
+        dependency_target=DependencyGuideTarget(name="{name}"),
+        programming_language="{programming_language}",
+    )
+    return hashlib.sha256(
+        (build_dependency_guide_instructions() + prompt_template).encode("utf-8")
+    ).hexdigest()[:12]
@@ -167,12 +167,13 @@ async def event_stream_handler(
     """Handle streaming events with DB-first stateless tracking.
 
     This handler runs in the Temporal activity process.
-    Persists events to PostgreSQL via atomic CTEs for progress tracking.
+    Persists events to PostgreSQL through the worker's event buffer, which
+    batches tool events and writes final results through atomically.
     Falls back to logging-only if deps are not properly configured.
     """
     # Import here to avoid circular imports
     from unoplat_code_confluence_query_engine.services.temporal.service_registry import (  # noqa: PLC0415
-        get_snapshot_writer,
+        get_agent_event_buffer,
     )
 
     deps = ctx.deps
@@ -236,8 +237,8 @@ async def event_stream_handler(
         # Persist to DB if tracking is enabled
         if db_tracking_enabled and deps and owner_name and repo_name:
             try:
-                writer = get_snapshot_writer()
-                event_id = await writer.append_event_atomic(
+                event_buffer = get_agent_event_buffer()
+                event_id = await event_buffer.append_event(
                     owner_name=owner_name,
                     repo_name=repo_name,
                     codebase_name=codebase,
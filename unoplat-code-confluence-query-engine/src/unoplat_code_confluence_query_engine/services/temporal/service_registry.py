@@ -11,6 +11,9 @@ from pathlib import Path
 from unoplat_code_confluence_query_engine.services.mcp.mcp_server_manager import (
     MCPServerManager,
 )
+from unoplat_code_confluence_query_engine.services.tracking.repository_agent_event_buffer import (
+    RepositoryAgentEventBuffer,
+)
 from unoplat_code_confluence_query_engine.services.tracking.repository_agent_snapshot_service import (
     RepositoryAgentSnapshotWriter,
 )
@@ -25,6 +28,7 @@ class ServiceRegistry:
     def __init__(self) -> None:
         self._mcp_server_manager: MCPServerManager | None = None
         self._snapshot_writer: RepositoryAgentSnapshotWriter | None = None
+        self._event_buffer: RepositoryAgentEventBuffer | None = None
 
     @classmethod
     def get_instance(cls) -> "ServiceRegistry":
@@ -36,11 +40,15 @@ class ServiceRegistry:
     async def initialize(
         self,
         mcp_config_path: str | Path | None = None,
+        agent_event_flush_interval_s: float = 0.5,
+        agent_event_batch_size: int = 200,
     ) -> None:
         """Initialize services. Called by worker at startup.
 
         Args:
             mcp_config_path: Optional path to MCP servers config JSON file.
+            agent_event_flush_interval_s: Seconds between agent event flushes.
+            agent_event_batch_size: Buffered agent events that force a flush.
         """
         if self._initialized:
             return
@@ -52,11 +60,18 @@ class ServiceRegistry:
 
         # Initialize stateless snapshot writer
         self._snapshot_writer = RepositoryAgentSnapshotWriter()
+        self._event_buffer = RepositoryAgentEventBuffer(
+            self._snapshot_writer,
+            flush_interval_s=agent_event_flush_interval_s,
+            batch_size=agent_event_batch_size,
+        )
 
         self._initialized = True
 
     async def shutdown(self) -> None:
         """Cleanup services. Called by worker at shutdown."""
+        if self._event_buffer:
+            await self._event_buffer.close()
         self._initialized = False
 
     @property
@@ -87,6 +102,20 @@ class ServiceRegistry:
             raise RuntimeError("RepositoryAgentSnapshotWriter not initialized")
         return self._snapshot_writer
 
+    @property
+    def event_buffer(self) -> RepositoryAgentEventBuffer:
+        """Get the worker's RepositoryAgentEventBuffer instance.
+
+        Returns:
+            RepositoryAgentEventBuffer shared by the worker's activities.
+
+        Raises:
+            RuntimeError: If service not initialized.
+        """
+        if not self._event_buffer:
+            raise RuntimeError("RepositoryAgentEventBuffer not initialized")
+        return self._event_buffer
+
 
 def get_mcp_server_manager() -> MCPServerManager:
     """Get MCPServerManager from registry.
@@ -104,3 +133,12 @@ def get_snapshot_writer() -> RepositoryAgentSnapshotWriter:
         RepositoryAgentSnapshotWriter instance from the registry.
     """
     return ServiceRegistry.get_instance().snapshot_writer
+
+
+def get_agent_event_buffer() -> RepositoryAgentEventBuffer:
+    """Get the worker's RepositoryAgentEventBuffer from registry.
+
+    Returns:
+        RepositoryAgentEventBuffer instance from the registry.
+    """
+    return ServiceRegistry.get_instance().event_buffer
@@ -159,6 +159,10 @@ _temporal_agents: TemporalAgentRegistry | None = None
 _cached_model: Model | None = None
 _cached_model_settings: ModelSettings | None = None
 _cached_usage_limits: UsageLimits | None = None
+_cached_dependency_guide_concurrency: int = 1
+_cached_codebase_agent_concurrency: int = 1
+_cached_call_expression_discovery_concurrency: int = 1
+_cached_call_expression_discovery_batch_size: int = 1
 
 
 def get_temporal_agents() -> TemporalAgentRegistry:
@@ -181,6 +185,9 @@ def initialize_temporal_agents(
 ) -> TemporalAgentRegistry:
     """Initialize temporal agents with the given model."""
     global _temporal_agents, _cached_model, _cached_model_settings, _cached_usage_limits
+    global _cached_dependency_guide_concurrency, _cached_codebase_agent_concurrency
+    global _cached_call_expression_discovery_concurrency
+    global _cached_call_expression_discovery_batch_size
 
     retry_config = TemporalAgentRetryConfig(settings)
 
@@ -190,6 +197,16 @@ def initialize_temporal_agents(
     _cached_model = model
     _cached_model_settings = model_settings
     _cached_usage_limits = UsageLimits(request_limit=effective_limit)
+    _cached_dependency_guide_concurrency = resolve_dependency_guide_concurrency(
+        settings, provider_key
+    )
+    _cached_codebase_agent_concurrency = settings.codebase_agent_max_concurrency
+    _cached_call_expression_discovery_concurrency = (
+        settings.call_expression_discovery_max_concurrency
+    )
+    _cached_call_expression_discovery_batch_size = (
+        settings.call_expression_discovery_batch_size
+    )
 
     resolved_agents = _resolve_enabled_agents(settings.enabled_agents)
     logger.info(
@@ -206,13 +223,26 @@ def initialize_temporal_agents(
     )
 
     logger.info(
-        "Temporal agents initialized with {} agents (request_limit={})",
+        "Temporal agents initialized with {} agents (request_limit={}, dependency_guide_concurrency={}, codebase_agent_concurrency={})",
         _temporal_agents.enabled_agent_count(),
         effective_limit,
+        _cached_dependency_guide_concurrency,
+        _cached_codebase_agent_concurrency,
     )
     return _temporal_agents
 
 
+def resolve_dependency_guide_concurrency(
+    settings: EnvironmentSettings, provider_key: str | None
+) -> int:
+    """Cap dependency guide agent runs in flight for the model provider."""
+    if provider_key is not None:
+        override = settings.dependency_guide_provider_concurrency_map.get(provider_key)
+        if override is not None:
+            return override
+    return settings.dependency_guide_max_concurrency
+
+
 def get_cached_model() -> Model:
     """Get the cached model instance used for agents."""
     if _cached_model is None:
@@ -230,3 +260,23 @@ def get_cached_model_settings() -> ModelSettings | None:
 def get_cached_usage_limits() -> UsageLimits | None:
     """Get the cached usage limits."""
     return _cached_usage_limits
+
+
+def get_cached_dependency_guide_concurrency() -> int:
+    """Get the dependency guide concurrency resolved for the worker's provider."""
+    return _cached_dependency_guide_concurrency
+
+
+def get_cached_codebase_agent_concurrency() -> int:
+    """Get how many independent agents a codebase workflow runs at once."""
+    return _cached_codebase_agent_concurrency
+
+
+def get_cached_call_expression_discovery_concurrency() -> int:
+    """Get how many call-expression discoverer runs a codebase keeps in flight."""
+    return _cached_call_expression_discovery_concurrency
+
+
+def get_cached_call_expression_discovery_batch_size() -> int:
+    """Get how many operations of one library a discoverer run handles."""
+    return _cached_call_expression_discovery_batch_size
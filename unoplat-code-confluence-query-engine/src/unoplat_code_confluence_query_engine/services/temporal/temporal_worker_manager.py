@@ -8,6 +8,7 @@ of creating new workers per request.
 from __future__ import annotations
 
 import asyncio
+from datetime import timedelta
 from functools import partial
 from typing import TYPE_CHECKING
 
@@ -43,6 +44,9 @@ from unoplat_code_confluence_query_engine.services.temporal.activities.codebase_
 from unoplat_code_confluence_query_engine.services.temporal.activities.codebase_workflow_run.business_logic_post_process_activity import (
     BusinessLogicPostProcessActivity,
 )
+from unoplat_code_confluence_query_engine.services.temporal.activities.codebase_workflow_run.dependency_guide_cache_activity import (
+    DependencyGuideCacheActivity,
+)
 from unoplat_code_confluence_query_engine.services.temporal.activities.codebase_workflow_run.dependency_guide_completion_activity import (
     DependencyGuideCompletionActivity,
 )
@@ -192,6 +196,8 @@ class TemporalWorkerManager:
         self._registry = ServiceRegistry.get_instance()
         await self._registry.initialize(
             mcp_config_path=settings.mcp_servers_config_path,
+            agent_event_flush_interval_s=settings.agent_event_flush_interval_s,
+            agent_event_batch_size=settings.agent_event_batch_size,
         )
         logger.info(
             f"[temporal_worker_manager] Service registry initialized with MCP config: {settings.mcp_servers_config_path}"
@@ -303,7 +309,13 @@ class TemporalWorkerManager:
         snapshot_activity = RepositoryAgentSnapshotActivity()
         business_logic_post_process_activity = BusinessLogicPostProcessActivity()
         dependency_guide_completion_activity = DependencyGuideCompletionActivity()
-        dependency_guide_fetch_activity = DependencyGuideFetchActivity()
+        dependency_guide_fetch_activity = DependencyGuideFetchActivity(
+            use_guide_cache=settings.dependency_guide_cache_enabled
+        )
+        dependency_guide_cache_activity = DependencyGuideCacheActivity(
+            enabled=settings.dependency_guide_cache_enabled,
+            ttl=timedelta(days=settings.dependency_guide_cache_ttl_days),
+        )
         engineering_workflow_completion_activity = (
             EngineeringWorkflowCompletionActivity()
         )
@@ -365,6 +377,7 @@ class TemporalWorkerManager:
                 dependency_guide_completion_activity.emit_dependency_guide_completion,
                 dependency_guide_fetch_activity.fetch_codebase_dependencies,
                 dependency_guide_fetch_activity.fetch_dependency_guide_delta,
+                dependency_guide_cache_activity.store_generated_dependency_guides,
                 engineering_workflow_fetch_activity.fetch_previous_engineering_workflow,
                 engineering_workflow_completion_activity.emit_engineering_workflow_completion,
                 app_interfaces_activity.fetch_call_expression_discovery_targets,
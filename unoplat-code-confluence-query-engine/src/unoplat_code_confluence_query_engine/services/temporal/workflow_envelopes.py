@@ -35,6 +35,32 @@ class CodebaseAgentWorkflowResult(BaseModel):
     architecture_evidence: ArchitectureEvidenceSummary
 
 
+class CodebaseAgentLimits(BaseModel):
+    """Worker scheduling limits a repository run records in its workflow input.
+
+    Workflow code reads these instead of worker settings, so a replay on a
+    worker configured differently schedules the same commands. The defaults
+    reproduce runs started before the limits existed.
+    """
+
+    agent_concurrency: int = Field(
+        default=1,
+        ge=1,
+        description="Independent agents a codebase workflow runs at once",
+    )
+    call_expression_discovery_batch_size: int = Field(
+        default=1,
+        ge=1,
+        description="Operations of one library a call-expression discoverer run handles",
+    )
+    call_expression_discovery_concurrency: int = Field(
+        default=1,
+        ge=1,
+        description="Call-expression discoverer runs a codebase workflow keeps in flight",
+    )
+    model_config = ConfigDict(extra="ignore")
+
+
 class AgentSnapshotCodebasePatchEnvelope(BaseModel):
     """Envelope for atomically patching one codebase in agent_md_output."""
 
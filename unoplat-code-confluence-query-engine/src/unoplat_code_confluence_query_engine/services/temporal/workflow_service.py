@@ -11,9 +11,17 @@ from unoplat_code_confluence_commons.repo_models import RepositoryWorkflowOperat
 from unoplat_code_confluence_query_engine.models.repository.repository_ruleset_metadata import (
     RepositoryRulesetMetadata,
 )
+from unoplat_code_confluence_query_engine.services.temporal.temporal_agents import (
+    get_cached_call_expression_discovery_batch_size,
+    get_cached_call_expression_discovery_concurrency,
+    get_cached_codebase_agent_concurrency,
+)
 from unoplat_code_confluence_query_engine.services.temporal.temporal_worker_manager import (
     TASK_QUEUE,
 )
+from unoplat_code_confluence_query_engine.services.temporal.workflow_envelopes import (
+    CodebaseAgentLimits,
+)
 from unoplat_code_confluence_query_engine.services.temporal.workflows import (
     RepositoryAgentWorkflow,
 )
@@ -76,6 +84,15 @@ class TemporalWorkflowService:
                 codebase_metadata_list,
                 trace_id,
                 operation.value,
+                CodebaseAgentLimits(
+                    agent_concurrency=get_cached_codebase_agent_concurrency(),
+                    call_expression_discovery_batch_size=(
+                        get_cached_call_expression_discovery_batch_size()
+                    ),
+                    call_expression_discovery_concurrency=(
+                        get_cached_call_expression_discovery_concurrency()
+                    ),
+                ),
             ],
             id=workflow_id,
             task_queue=TASK_QUEUE,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any
+from functools import partial
+from typing import Any, cast
 
 from temporalio import common, workflow
 from temporalio.exceptions import ApplicationError
@@ -8,6 +9,9 @@ from temporalio.exceptions import ApplicationError
 with workflow.unsafe.imports_passed_through():
     from loguru import logger
 
+    from unoplat_code_confluence_query_engine.models.output.agent_md_output import (
+        Interfaces,
+    )
     from unoplat_code_confluence_query_engine.models.output.git_ref_info import (
         GitRefInfo,
     )
@@ -25,6 +29,7 @@ with workflow.unsafe.imports_passed_through():
     )
     from unoplat_code_confluence_query_engine.services.temporal.workflow_envelopes import (
         ArchitectureEvidenceSummary,
+        CodebaseAgentLimits,
         CodebaseAgentWorkflowResult,
     )
     from unoplat_code_confluence_query_engine.services.temporal.workflows.runners.agent_snapshot_patch_runner import (
@@ -36,6 +41,10 @@ with workflow.unsafe.imports_passed_through():
     from unoplat_code_confluence_query_engine.services.temporal.workflows.runners.business_domain_runner import (
         run_business_domain_agent,
     )
+    from unoplat_code_confluence_query_engine.services.temporal.workflows.runners.codebase_agent_dag_runner import (
+        CodebaseAgentNode,
+        run_codebase_agent_dag,
+    )
     from unoplat_code_confluence_query_engine.services.temporal.workflows.runners.dependency_guide_runner import (
         run_dependency_guide_agent,
     )
@@ -59,8 +68,9 @@ class CodebaseAgentWorkflow:
         repository_workflow_run_id: str,
         trace_id: str = "",
         git_ref_info: GitRefInfo | None = None,
+        limits: CodebaseAgentLimits | None = None,
     ) -> CodebaseAgentWorkflowResult:
-        """Execute all agents sequentially for a single codebase."""
+        """Execute all agents for a single codebase, concurrently where independent."""
         codebase_workflow_run_id = workflow.info().run_id
         logger.debug("[workflow] CodebaseAgentWorkflow.run START")
         logger.debug("[workflow] Validating codebase_metadata_dict...")
@@ -77,6 +87,8 @@ class CodebaseAgentWorkflow:
         )
 
         _ = trace_id
+        # Runs started without limits replay one agent and operation at a time
+        limits = limits or CodebaseAgentLimits()
 
         logger.debug("[workflow] Getting temporal agents...")
         temporal_agents = get_temporal_agents()
@@ -111,46 +123,46 @@ class CodebaseAgentWorkflow:
             codebase_metadata=codebase_metadata,
             git_ref_info=git_ref_info,
         )
-        await run_development_workflow_agent(
-            temporal_agents=temporal_agents,
-            repository_qualified_name=repository_qualified_name,
-            codebase_metadata=codebase_metadata,
-            repository_workflow_run_id=repository_workflow_run_id,
-            codebase_workflow_run_id=codebase_workflow_run_id,
-            programming_language_metadata=programming_language_metadata,
-            agent_stats=agent_stats,
-            agent_errors=agent_errors,
-        )
-        await run_dependency_guide_agent(
-            temporal_agents=temporal_agents,
-            repository_qualified_name=repository_qualified_name,
-            codebase_metadata=codebase_metadata,
-            repository_workflow_run_id=repository_workflow_run_id,
-            codebase_workflow_run_id=codebase_workflow_run_id,
-            programming_language_metadata=programming_language_metadata,
-            agent_stats=agent_stats,
-            agent_errors=agent_errors,
-        )
-        await run_business_domain_agent(
-            temporal_agents=temporal_agents,
-            repository_qualified_name=repository_qualified_name,
-            codebase_metadata=codebase_metadata,
-            repository_workflow_run_id=repository_workflow_run_id,
-            codebase_workflow_run_id=codebase_workflow_run_id,
-            programming_language_metadata=programming_language_metadata,
-            agent_stats=agent_stats,
-            agent_errors=agent_errors,
-        )
-        app_interfaces = await run_app_interfaces_agent(
-            temporal_agents=temporal_agents,
-            repository_qualified_name=repository_qualified_name,
-            codebase_metadata=codebase_metadata,
-            repository_workflow_run_id=repository_workflow_run_id,
-            codebase_workflow_run_id=codebase_workflow_run_id,
-            programming_language_metadata=programming_language_metadata,
-            agent_stats=agent_stats,
-            agent_errors=agent_errors,
+        runner_kwargs: dict[str, Any] = {
+            "temporal_agents": temporal_agents,
+            "repository_qualified_name": repository_qualified_name,
+            "codebase_metadata": codebase_metadata,
+            "repository_workflow_run_id": repository_workflow_run_id,
+            "codebase_workflow_run_id": codebase_workflow_run_id,
+            "programming_language_metadata": programming_language_metadata,
+            "agent_stats": agent_stats,
+            "agent_errors": agent_errors,
+        }
+        # Each snapshot patch and markdown artifact has one owner; AGENTS.md is
+        # shared by the agents owning managed-block sections, so they serialize.
+        agent_nodes = [
+            CodebaseAgentNode(
+                name="development_workflow_guide",
+                run=partial(run_development_workflow_agent, **runner_kwargs),
+                writes=frozenset({"AGENTS.md", "engineering_workflow"}),
+            ),
+            CodebaseAgentNode(
+                name="dependency_guide",
+                run=partial(run_dependency_guide_agent, **runner_kwargs),
+                writes=frozenset({"dependencies_overview.md", "dependency_guide"}),
+            ),
+            CodebaseAgentNode(
+                name="business_domain_guide",
+                run=partial(run_business_domain_agent, **runner_kwargs),
+                writes=frozenset(
+                    {"AGENTS.md", "business_domain_references.md", "business_logic"}
+                ),
+            ),
+            CodebaseAgentNode(
+                name="app_interfaces_agent",
+                run=partial(run_app_interfaces_agent, **runner_kwargs, limits=limits),
+                writes=frozenset({"app_interfaces.md", "app_interfaces"}),
+            ),
+        ]
+        agent_results = await run_codebase_agent_dag(
+            agent_nodes, limits.agent_concurrency
         )
+        app_interfaces = cast(Interfaces | None, agent_results["app_interfaces_agent"])
         codebase_statistics = aggregate_usage_statistics(agent_stats)
 
         if agent_errors:
@@ -20,6 +20,9 @@ with workflow.unsafe.imports_passed_through():
     from unoplat_code_confluence_query_engine.services.temporal.temporal_agents import (
         get_temporal_agents,
     )
+    from unoplat_code_confluence_query_engine.services.temporal.workflow_envelopes import (
+        CodebaseAgentLimits,
+    )
     from unoplat_code_confluence_query_engine.services.temporal.workflows.codebase_agent_workflow import (
         CodebaseAgentWorkflow,
     )
@@ -52,6 +55,7 @@ class RepositoryAgentWorkflow:
         codebase_metadata_list: list[dict[str, Any]],
         trace_id: str,
         operation: RepositoryWorkflowOperation,
+        limits: CodebaseAgentLimits | None = None,
     ) -> dict[str, Any]:
         """Execute agents for all codebases in a repository."""
         _ = operation
@@ -73,6 +77,7 @@ class RepositoryAgentWorkflow:
             repository_workflow_run_id=repository_workflow_run_id,
             trace_id=trace_id,
             git_ref_info=git_ref_info,
+            limits=limits or CodebaseAgentLimits(),
         )
         child_errors, successful_evidence = await collect_codebase_child_results(
             repository_qualified_name=repository_qualified_name,
@@ -30,6 +30,9 @@ with workflow.unsafe.imports_passed_through():
         enrich_agent_error_with_model_details,
         raise_if_temporal_cancellation,
     )
+    from unoplat_code_confluence_query_engine.services.temporal.workflow_envelopes import (
+        CodebaseAgentLimits,
+    )
     from unoplat_code_confluence_query_engine.services.temporal.workflows.runners.agent_snapshot_patch_runner import (
         persist_codebase_snapshot_patch,
     )
@@ -50,6 +53,7 @@ async def run_app_interfaces_agent(
     programming_language_metadata: dict[str, object],
     agent_stats: list[UsageStatistics],
     agent_errors: list[dict[str, object]],
+    limits: CodebaseAgentLimits,
 ) -> Interfaces | None:
     """Build, render, and return app interfaces when the language is supported."""
     _ = programming_language_metadata
@@ -81,6 +85,7 @@ async def run_app_interfaces_agent(
             targets=discovery_targets,
             agent_stats=agent_stats,
             agent_errors=agent_errors,
+            limits=limits,
         )
 
         logger.info(
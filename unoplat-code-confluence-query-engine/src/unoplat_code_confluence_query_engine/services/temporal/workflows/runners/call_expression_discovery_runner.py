@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+from dataclasses import replace
 import traceback
 
 from pydantic_ai.durable_exec.temporal import TemporalAgent
+from pydantic_ai.usage import UsageLimits
 from temporalio import workflow
 
 with workflow.unsafe.imports_passed_through():
+    import asyncio
+
     from loguru import logger
 
     from unoplat_code_confluence_query_engine.models.repository.framework_feature_validation_models import (
+        CallExpressionDiscoveryOperation,
         CallExpressionDiscoveryTarget,
         DiscoveredFrameworkFeatureUsagesUpsertResult,
     )
@@ -23,6 +28,7 @@ with workflow.unsafe.imports_passed_through():
         UsageStatistics,
     )
     from unoplat_code_confluence_query_engine.services.temporal.agent_assembly.agents.user_prompts.build_user_prompt_call_expression_discoverer import (
+        build_call_expression_discoverer_batch_prompt,
         build_call_expression_discoverer_prompt,
     )
     from unoplat_code_confluence_query_engine.services.temporal.statistics_helpers import (
@@ -37,6 +43,9 @@ with workflow.unsafe.imports_passed_through():
         enrich_agent_error_with_model_details,
         raise_if_temporal_cancellation,
     )
+    from unoplat_code_confluence_query_engine.services.temporal.workflow_envelopes import (
+        CodebaseAgentLimits,
+    )
 
 _DISCOVERY_LANGUAGES: frozenset[str] = frozenset({"python", "typescript"})
 
@@ -46,6 +55,44 @@ def is_call_expression_discovery_supported(programming_language: str) -> bool:
     return programming_language.lower() in _DISCOVERY_LANGUAGES
 
 
+# Operations handled by one discoverer run, as (capability, operation) pairs
+CallExpressionDiscoveryBatch = list[
+    tuple[CallExpressionDiscoveryTarget, CallExpressionDiscoveryOperation]
+]
+
+
+def plan_call_expression_discovery_batches(
+    targets: list[CallExpressionDiscoveryTarget],
+    batch_size: int,
+) -> list[CallExpressionDiscoveryBatch]:
+    """Group operations of the same library into batches of at most ``batch_size``.
+
+    Libraries keep the order they first appear in, and operations keep their
+    catalog order within a library. A ``batch_size`` of 1 yields one batch per
+    operation in the original capability/operation order.
+    """
+    if batch_size <= 1:
+        return [
+            [(capability, operation)]
+            for capability in targets
+            for operation in capability.operations
+        ]
+
+    operations_by_library: dict[tuple[str, str], CallExpressionDiscoveryBatch] = {}
+    for capability in targets:
+        library_operations = operations_by_library.setdefault(
+            (capability.feature_language, capability.feature_library), []
+        )
+        library_operations.extend(
+            (capability, operation) for operation in capability.operations
+        )
+    return [
+        library_operations[start : start + batch_size]
+        for library_operations in operations_by_library.values()
+        for start in range(0, len(library_operations), batch_size)
+    ]
+
+
 async def run_call_expression_discovery(
     *,
     temporal_agents: TemporalAgentRegistry,
@@ -56,8 +103,9 @@ async def run_call_expression_discovery(
     targets: list[CallExpressionDiscoveryTarget],
     agent_stats: list[UsageStatistics],
     agent_errors: list[dict[str, object]],
+    limits: CodebaseAgentLimits,
 ) -> None:
-    """Run exactly one isolated discoverer invocation per eligible operation."""
+    """Run discoverer invocations over same-library operation batches in parallel."""
     if (
         not is_call_expression_discovery_supported(
             codebase_metadata.codebase_programming_language
@@ -73,53 +121,178 @@ async def run_call_expression_discovery(
         agent_stats.append(create_zero_usage_statistics())
         return
 
-    for capability in targets:
-        for operation in capability.operations:
-            deps = AgentDependencies(
-                repository_qualified_name=repository_qualified_name,
+    # Runs started without limits replay one operation at a time
+    max_concurrency = limits.call_expression_discovery_concurrency
+    batches = plan_call_expression_discovery_batches(
+        targets, limits.call_expression_discovery_batch_size
+    )
+    logger.info(
+        "[workflow] Running call_expression_discoverer for {}: operations={} batches={} max_concurrency={}",
+        codebase_metadata.codebase_name,
+        sum(len(batch) for batch in batches),
+        len(batches),
+        max_concurrency,
+    )
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    await asyncio.gather(
+        *(
+            _discover_call_expression_batch(
+                discoverer_agent=discoverer_agent,
+                batch=batch,
+                semaphore=semaphore,
                 codebase_metadata=codebase_metadata,
+                repository_qualified_name=repository_qualified_name,
                 repository_workflow_run_id=repository_workflow_run_id,
                 codebase_workflow_run_id=codebase_workflow_run_id,
-                agent_name="call_expression_discoverer",
+                agent_stats=agent_stats,
+                agent_errors=agent_errors,
             )
-            try:
-                result = await discoverer_agent.run(
-                    build_call_expression_discoverer_prompt(
-                        codebase_metadata.codebase_path, capability, operation
-                    ),
-                    deps=deps,
-                    usage_limits=get_cached_usage_limits(),
-                    metadata=build_agent_run_metadata(deps),
-                )
-                agent_stats.append(extract_usage_statistics(result.usage))
-            except Exception as error:
-                raise_if_temporal_cancellation(error)
-                logger.error(
-                    "[workflow] call_expression_discoverer failed for {}:{}:{}:{}: {}",
-                    capability.feature_language,
-                    capability.feature_library,
-                    capability.feature_capability_key,
-                    operation.feature_operation_key,
-                    error,
-                )
-                entry: dict[str, object] = {
-                    "agent": "call_expression_discoverer",
-                    "codebase": codebase_metadata.codebase_name,
-                    "error": str(error),
-                    "traceback": traceback.format_exc(),
-                    "operation_identity": {
-                        "feature_language": capability.feature_language,
-                        "feature_library": capability.feature_library,
-                        "feature_capability_key": capability.feature_capability_key,
-                        "feature_operation_key": operation.feature_operation_key,
-                    },
-                }
-                agent_errors.append(
-                    enrich_agent_error_with_model_details(
-                        entry,
-                        error,
-                        "call_expression_discoverer",
-                        codebase_metadata.codebase_name,
+            for batch in batches
+        )
+    )
+
+
+async def _discover_call_expression_batch(
+    *,
+    discoverer_agent: TemporalAgent[
+        AgentDependencies, DiscoveredFrameworkFeatureUsagesUpsertResult
+    ],
+    batch: CallExpressionDiscoveryBatch,
+    semaphore: asyncio.Semaphore,
+    codebase_metadata: CodebaseMetadata,
+    repository_qualified_name: str,
+    repository_workflow_run_id: str,
+    codebase_workflow_run_id: str,
+    agent_stats: list[UsageStatistics],
+    agent_errors: list[dict[str, object]],
+) -> None:
+    """Run one discoverer invocation for a batch and record its usage or error.
+
+    Usage is recorded per invocation, so a batch's figures cover all of its
+    operations together. A failed batch of several operations is retried one
+    operation per run; only single-operation failures are reported.
+    """
+    if len(batch) == 1:
+        capability, operation = batch[0]
+        prompt = build_call_expression_discoverer_prompt(
+            codebase_metadata.codebase_path, capability, operation
+        )
+    else:
+        prompt = build_call_expression_discoverer_batch_prompt(
+            codebase_metadata.codebase_path, batch
+        )
+    deps = AgentDependencies(
+        repository_qualified_name=repository_qualified_name,
+        codebase_metadata=codebase_metadata,
+        repository_workflow_run_id=repository_workflow_run_id,
+        codebase_workflow_run_id=codebase_workflow_run_id,
+        agent_name="call_expression_discoverer",
+    )
+    operation_labels = [
+        _operation_label(capability, operation) for capability, operation in batch
+    ]
+    try:
+        # Leaving the block on error frees the slot for the fallback runs
+        async with semaphore:
+            started_at = workflow.now()
+            result = await discoverer_agent.run(
+                prompt,
+                deps=deps,
+                usage_limits=_batch_usage_limits(len(batch)),
+                metadata=build_agent_run_metadata(deps),
+            )
+    except Exception as error:
+        raise_if_temporal_cancellation(error)
+        latency_s = (workflow.now() - started_at).total_seconds()
+        if len(batch) > 1:
+            logger.warning(
+                "[workflow] call_expression_discoverer batch failed for {} after {:.1f}s, "
+                "retrying one operation per run: {}",
+                ", ".join(operation_labels),
+                latency_s,
+                error,
+            )
+            await asyncio.gather(
+                *(
+                    _discover_call_expression_batch(
+                        discoverer_agent=discoverer_agent,
+                        batch=[single],
+                        semaphore=semaphore,
+                        codebase_metadata=codebase_metadata,
+                        repository_qualified_name=repository_qualified_name,
+                        repository_workflow_run_id=repository_workflow_run_id,
+                        codebase_workflow_run_id=codebase_workflow_run_id,
+                        agent_stats=agent_stats,
+                        agent_errors=agent_errors,
                     )
+                    for single in batch
                 )
-                agent_stats.append(create_zero_usage_statistics())
+            )
+            return
+        ((capability, operation),) = batch
+        logger.error(
+            "[workflow] call_expression_discoverer failed for {} after {:.1f}s: {}",
+            ", ".join(operation_labels),
+            latency_s,
+            error,
+        )
+        entry: dict[str, object] = {
+            "agent": "call_expression_discoverer",
+            "codebase": codebase_metadata.codebase_name,
+            "error": str(error),
+            "traceback": traceback.format_exc(),
+            "operation_identity": {
+                "feature_language": capability.feature_language,
+                "feature_library": capability.feature_library,
+                "feature_capability_key": capability.feature_capability_key,
+                "feature_operation_key": operation.feature_operation_key,
+            },
+        }
+        agent_errors.append(
+            enrich_agent_error_with_model_details(
+                entry,
+                error,
+                "call_expression_discoverer",
+                codebase_metadata.codebase_name,
+            )
+        )
+        agent_stats.append(create_zero_usage_statistics())
+        return
+
+    latency_s = (workflow.now() - started_at).total_seconds()
+    usage = extract_usage_statistics(result.usage)
+    agent_stats.append(usage)
+    logger.info(
+        "[workflow] call_expression_discoverer operations {} latency_s={:.1f} "
+        "input_tokens={} output_tokens={} batch_size={}",
+        ", ".join(operation_labels),
+        latency_s,
+        usage.input_tokens,
+        usage.output_tokens,
+        len(batch),
+    )
+
+
+def _batch_usage_limits(batch_length: int) -> UsageLimits | None:
+    """Give a batched run the request budget of one run per operation."""
+    usage_limits = get_cached_usage_limits()
+    if usage_limits is None or usage_limits.request_limit is None:
+        return usage_limits
+    return replace(
+        usage_limits, request_limit=usage_limits.request_limit * batch_length
+    )
+
+
+def _operation_label(
+    capability: CallExpressionDiscoveryTarget,
+    operation: CallExpressionDiscoveryOperation,
+) -> str:
+    return ":".join(
+        (
+            capability.feature_language,
+            capability.feature_library,
+            capability.feature_capability_key,
+            operation.feature_operation_key,
+        )
+    )
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+from temporalio import workflow
+
+with workflow.unsafe.imports_passed_through():
+    from loguru import logger
+
+
+@dataclass(frozen=True)
+class CodebaseAgentNode:
+    """One codebase agent runner and the resources it reads and writes.
+
+    Resources are opaque names such as a snapshot section or a markdown
+    artifact. Two nodes conflict when one writes a resource the other reads
+    or writes; conflicting nodes run in declaration order.
+    """
+
+    name: str
+    run: Callable[[], Awaitable[object]]
+    reads: frozenset[str] = field(default_factory=frozenset)
+    writes: frozenset[str] = field(default_factory=frozenset)
+
+    def conflicts_with(self, other: CodebaseAgentNode) -> bool:
+        return bool(
+            self.writes & (other.reads | other.writes) or other.writes & self.reads
+        )
+
+
+def resolve_codebase_agent_dependencies(
+    nodes: list[CodebaseAgentNode],
+) -> dict[str, list[str]]:
+    """Map each node to the earlier declared nodes it must wait for."""
+    names = [node.name for node in nodes]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Duplicate codebase agent node names: {names}")
+    return {
+        node.name: [
+            earlier.name for earlier in nodes[:index] if node.conflicts_with(earlier)
+        ]
+        for index, node in enumerate(nodes)
+    }
+
+
+async def run_codebase_agent_dag(
+    nodes: list[CodebaseAgentNode],
+    max_concurrency: int,
+) -> dict[str, object]:
+    """Run codebase agent nodes concurrently where their resources allow.
+
+    A node starts once every conflicting earlier node has finished and a
+    concurrency slot is free. With ``max_concurrency`` of 1 nodes run one
+    after another in declaration order, which is the pre-DAG command order.
+
+    As in the sequential order, the first node to raise stops the run: nodes
+    that depend on it never start, nodes still running are cancelled, and the
+    error propagates.
+
+    Returns:
+        Result of each node keyed by node name
+    """
+    dependencies = resolve_codebase_agent_dependencies(nodes)
+    results: dict[str, object] = {}
+
+    if max_concurrency <= 1:
+        for node in nodes:
+            results[node.name] = await node.run()
+        return results
+
+    # Only set on success, so dependents of a failed node wait until cancelled
+    finished = {node.name: asyncio.Event() for node in nodes}
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _run_node(node: CodebaseAgentNode) -> None:
+        for dependency_name in dependencies[node.name]:
+            await finished[dependency_name].wait()
+        async with semaphore:
+            logger.debug("[workflow] Starting codebase agent node {}", node.name)
+            results[node.name] = await node.run()
+        finished[node.name].set()
+
+    logger.debug(
+        "[workflow] Running {} codebase agent nodes (max_concurrency={}, dependencies={})",
+        len(nodes),
+        max_concurrency,
+        dependencies,
+    )
+    tasks = [asyncio.create_task(_run_node(node)) for node in nodes]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    return {node.name: results[node.name] for node in nodes}
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
 import traceback
 from typing import Any
@@ -8,7 +9,11 @@ from temporalio import workflow
 
 with workflow.unsafe.imports_passed_through():
     from loguru import logger
+    from pydantic_ai.durable_exec.temporal import TemporalAgent
 
+    from unoplat_code_confluence_query_engine.models.output.agent_md_output import (
+        DependencyGuideEntry,
+    )
     from unoplat_code_confluence_query_engine.models.repository.repository_ruleset_metadata import (
         CodebaseMetadata,
     )
@@ -18,10 +23,14 @@ with workflow.unsafe.imports_passed_through():
     )
     from unoplat_code_confluence_query_engine.models.runtime.dependency_guide_target import (
         DependencyGuideDelta,
+        DependencyGuideTarget,
     )
     from unoplat_code_confluence_query_engine.models.statistics.agent_usage_statistics import (
         UsageStatistics,
     )
+    from unoplat_code_confluence_query_engine.services.temporal.activities.codebase_workflow_run.dependency_guide_cache_activity import (
+        DependencyGuideCacheActivity,
+    )
     from unoplat_code_confluence_query_engine.services.temporal.activities.codebase_workflow_run.dependency_guide_completion_activity import (
         DependencyGuideCompletionActivity,
     )
@@ -52,6 +61,45 @@ with workflow.unsafe.imports_passed_through():
     )
 
 
+async def _generate_dependency_guide_entry(
+    dependency_guide_agent: TemporalAgent[AgentDependencies, DependencyGuideEntry],
+    dependency_target: DependencyGuideTarget,
+    semaphore: asyncio.Semaphore,
+    repository_qualified_name: str,
+    codebase_metadata: CodebaseMetadata,
+    repository_workflow_run_id: str,
+    codebase_workflow_run_id: str,
+) -> tuple[dict[str, Any] | None, UsageStatistics]:
+    """Document one dependency once a concurrency slot is free."""
+    async with semaphore:
+        deps = AgentDependencies(
+            repository_qualified_name=repository_qualified_name,
+            codebase_metadata=codebase_metadata,
+            repository_workflow_run_id=repository_workflow_run_id,
+            codebase_workflow_run_id=codebase_workflow_run_id,
+            agent_name="dependency_guide_item",
+        )
+        try:
+            result = await dependency_guide_agent.run(
+                build_dependency_guide_prompt(
+                    dependency_target=dependency_target,
+                    programming_language=codebase_metadata.codebase_programming_language,
+                ),
+                deps=deps,
+                usage_limits=get_cached_usage_limits(),
+                metadata=build_agent_run_metadata(deps),
+            )
+            return result.output.model_dump(), extract_usage_statistics(result.usage)
+        except Exception as dep_error:
+            raise_if_temporal_cancellation(dep_error)
+            logger.warning(
+                "[workflow] Failed to document dependency '{}': {}",
+                dependency_target.name,
+                dep_error,
+            )
+            return None, create_zero_usage_statistics()
+
+
 async def run_dependency_guide_agent(
     temporal_agents: TemporalAgentRegistry,
     repository_qualified_name: str,
@@ -87,11 +135,13 @@ async def run_dependency_guide_agent(
         )
 
         logger.info(
-            "[workflow] Dependency-guide delta for {}: reusable={} generate={} removed={}",
+            "[workflow] Dependency-guide delta for {}: reusable={} cached={} generate={} removed={} concurrency={}",
             codebase_metadata.codebase_name,
             len(dependency_delta.reusable_entries),
+            len(dependency_delta.cached_names),
             len(dependency_delta.targets_to_generate),
             len(dependency_delta.removed_names),
+            dependency_delta.generation_concurrency,
         )
 
         dependency_entries: list[dict[str, Any]] = list(
@@ -99,38 +149,51 @@ async def run_dependency_guide_agent(
         )
         dependency_agent_stats: list[UsageStatistics] = []
 
-        for dependency_target in dependency_delta.targets_to_generate:
-            deps = AgentDependencies(
-                repository_qualified_name=repository_qualified_name,
-                codebase_metadata=codebase_metadata,
-                repository_workflow_run_id=repository_workflow_run_id,
-                codebase_workflow_run_id=codebase_workflow_run_id,
-                agent_name="dependency_guide_item",
-            )
-            try:
-                result = await dependency_guide_agent.run(
-                    build_dependency_guide_prompt(
-                        dependency_target=dependency_target,
-                        programming_language=codebase_metadata.codebase_programming_language,
-                    ),
-                    deps=deps,
-                    usage_limits=get_cached_usage_limits(),
-                    metadata=build_agent_run_metadata(deps),
+        # The concurrency comes from the fetch activity's result, so replays
+        # fan out the same way; gather keeps results in target order
+        semaphore = asyncio.Semaphore(dependency_delta.generation_concurrency)
+        generated = await asyncio.gather(
+            *(
+                _generate_dependency_guide_entry(
+                    dependency_guide_agent,
+                    dependency_target,
+                    semaphore,
+                    repository_qualified_name,
+                    codebase_metadata,
+                    repository_workflow_run_id,
+                    codebase_workflow_run_id,
                 )
+                for dependency_target in dependency_delta.targets_to_generate
+            )
+        )
+        generated_entries: list[dict[str, Any]] = []
+        for entry_dict, usage_statistics in generated:
+            if entry_dict is not None:
+                generated_entries.append(entry_dict)
+            dependency_agent_stats.append(usage_statistics)
+        dependency_entries.extend(generated_entries)
 
-                entry_dict = result.output.model_dump()
-                dependency_entries.append(entry_dict)
-                dependency_agent_stats.append(
-                    extract_usage_statistics(result.usage)
+        # Histories recorded before the guide cache existed replay without it
+        if generated_entries and workflow.patched("dependency-guide-cache-store"):
+            try:
+                await workflow.execute_activity(
+                    DependencyGuideCacheActivity.store_generated_dependency_guides,
+                    args=[
+                        codebase_metadata.codebase_programming_language,
+                        codebase_metadata.codebase_package_manager,
+                        dependency_delta.targets_to_generate,
+                        generated_entries,
+                    ],
+                    start_to_close_timeout=timedelta(seconds=30),
+                    retry_policy=DB_ACTIVITY_RETRY_POLICY,
                 )
-            except Exception as dep_error:
-                raise_if_temporal_cancellation(dep_error)
+            except Exception as cache_error:
+                raise_if_temporal_cancellation(cache_error)
                 logger.warning(
-                    "[workflow] Failed to document dependency '{}': {}",
-                    dependency_target.name,
-                    dep_error,
+                    "[workflow] Failed to cache dependency guides for {}: {}",
+                    codebase_metadata.codebase_name,
+                    cache_error,
                 )
-                dependency_agent_stats.append(create_zero_usage_statistics())
 
         dependency_guide_output = {"dependencies": dependency_entries}
 
@@ -30,6 +30,7 @@ with workflow.unsafe.imports_passed_through():
     )
     from unoplat_code_confluence_query_engine.services.temporal.workflow_envelopes import (
         ArchitectureEvidenceSummary,
+        CodebaseAgentLimits,
         CodebaseAgentWorkflowResult,
     )
 
@@ -41,6 +42,7 @@ async def start_codebase_child_workflows(
     repository_workflow_run_id: str,
     trace_id: str,
     git_ref_info: GitRefInfo | None,
+    limits: CodebaseAgentLimits,
 ) -> list[
     tuple[
         str,
@@ -74,6 +76,7 @@ async def start_codebase_child_workflows(
                 repository_workflow_run_id,
                 trace_id,
                 git_ref_info,
+                limits,
             ],
             id=f"{repository_qualified_name.replace('/', '-')}-{codebase_name}",
             parent_close_policy=ParentClosePolicy.TERMINATE,
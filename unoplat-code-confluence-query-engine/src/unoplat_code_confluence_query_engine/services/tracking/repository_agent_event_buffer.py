@@ -0,0 +1,339 @@
+"""Per-worker buffer that batches agent stream events into Postgres.
+
+``RepositoryAgentSnapshotWriter.append_event_atomic`` locks the codebase
+progress row and the run's snapshot row for every event, so codebases that
+stream in parallel serialize on the snapshot row. Tool calls and tool results
+do not change progress, so this buffer writes them differently:
+
+- Events are flushed in batches with a multi-row insert, on a timer or when
+  the batch is full.
+- Event ids are reserved on the progress row's ``next_event_id`` inside the
+  flush transaction, one ``UPDATE ... RETURNING`` per codebase instead of one
+  row lock per event. Ids are handed out when the events are written, so
+  every worker's events are numbered in the order they reach Postgres.
+- Progress rows get ``event_count`` and latest-event deltas in plain updates,
+  without re-aggregating.
+- The snapshot row's ``latest_event_at`` is touched at most once per flush
+  interval per run.
+
+Final results complete namespaces and move progress, so they flush the buffer
+and go through ``append_event_atomic`` unchanged.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from loguru import logger
+from sqlalchemy import func, insert, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from unoplat_code_confluence_commons.repo_models import (
+    RepositoryAgentCodebaseProgress,
+    RepositoryAgentEvent,
+    RepositoryAgentMdSnapshot,
+)
+
+from unoplat_code_confluence_query_engine.db.postgres.db import get_startup_session
+from unoplat_code_confluence_query_engine.services.tracking.repository_agent_snapshot_service import (
+    RepositoryAgentSnapshotWriter,
+)
+
+# (owner, repo, run id, codebase) and (owner, repo, run id)
+CodebaseKey = tuple[str, str, str, str]
+RunKey = tuple[str, str, str]
+
+
+@dataclass
+class _CodebaseDelta:
+    event_count: int
+    latest_event_id: int
+    latest_event_at: datetime
+
+
+def _codebase_key(event: Mapping[str, object]) -> CodebaseKey:
+    return (
+        str(event["repository_owner_name"]),
+        str(event["repository_name"]),
+        str(event["repository_workflow_run_id"]),
+        str(event["codebase_name"]),
+    )
+
+
+def _collect_codebase_deltas(
+    events: list[dict[str, object]],
+) -> dict[CodebaseKey, _CodebaseDelta]:
+    """Fold buffered event rows into one progress delta per codebase."""
+    deltas: dict[CodebaseKey, _CodebaseDelta] = {}
+    for event in events:
+        key = _codebase_key(event)
+        event_id = int(event["event_id"])  # type: ignore[call-overload]
+        created_at: datetime = event["created_at"]  # type: ignore[assignment]
+        delta = deltas.get(key)
+        if delta is None:
+            deltas[key] = _CodebaseDelta(
+                event_count=1, latest_event_id=event_id, latest_event_at=created_at
+            )
+            continue
+        delta.event_count += 1
+        delta.latest_event_id = max(delta.latest_event_id, event_id)
+        delta.latest_event_at = max(delta.latest_event_at, created_at)
+    return deltas
+
+
+def _progress_row_filter(key: CodebaseKey) -> tuple[object, ...]:
+    owner_name, repo_name, repository_workflow_run_id, codebase_name = key
+    return (
+        RepositoryAgentCodebaseProgress.repository_owner_name == owner_name,
+        RepositoryAgentCodebaseProgress.repository_name == repo_name,
+        RepositoryAgentCodebaseProgress.repository_workflow_run_id
+        == repository_workflow_run_id,
+        RepositoryAgentCodebaseProgress.codebase_name == codebase_name,
+    )
+
+
+class RepositoryAgentEventBuffer:
+    """Batch agent events per worker and coalesce progress and snapshot updates."""
+
+    def __init__(
+        self,
+        writer: RepositoryAgentSnapshotWriter,
+        *,
+        flush_interval_s: float = 0.5,
+        batch_size: int = 200,
+    ) -> None:
+        self._writer = writer
+        self.flush_interval_s = flush_interval_s
+        self.batch_size = batch_size
+        self._pending: list[dict[str, object]] = []
+        self._flush_lock = asyncio.Lock()
+        self._snapshot_pending: dict[RunKey, datetime] = {}
+        self._snapshot_touched_at: dict[RunKey, float] = {}
+        self._flush_task: asyncio.Task[None] | None = None
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    async def append_event(
+        self,
+        *,
+        owner_name: str,
+        repo_name: str,
+        codebase_name: str,
+        agent_name: str,
+        phase: str,
+        message: str | None,
+        tool_name: str | None = None,
+        tool_call_id: str | None = None,
+        tool_args: Mapping[str, object] | None = None,
+        tool_result_content: str | None = None,
+        completion_namespaces: set[str],
+        repository_workflow_run_id: str,
+    ) -> int | None:
+        """Buffer an event; final results are written through and return their id."""
+        if phase == "result":
+            # Flush first so the result lands after the events that led to it
+            await self.flush()
+            event_id = await self._writer.append_event_atomic(
+                owner_name=owner_name,
+                repo_name=repo_name,
+                codebase_name=codebase_name,
+                agent_name=agent_name,
+                phase=phase,
+                message=message,
+                tool_name=tool_name,
+                tool_call_id=tool_call_id,
+                tool_args=tool_args,
+                tool_result_content=tool_result_content,
+                completion_namespaces=completion_namespaces,
+                repository_workflow_run_id=repository_workflow_run_id,
+            )
+            return event_id
+
+        self._pending.append(
+            {
+                "repository_owner_name": owner_name,
+                "repository_name": repo_name,
+                "repository_workflow_run_id": repository_workflow_run_id,
+                "codebase_name": codebase_name,
+                "event": agent_name,
+                "phase": phase,
+                "message": message,
+                "tool_name": tool_name,
+                "tool_call_id": tool_call_id,
+                "tool_args": dict(tool_args) if tool_args is not None else None,
+                "tool_result_content": tool_result_content,
+                "created_at": datetime.now(timezone.utc),
+            }
+        )
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_periodically())
+        if len(self._pending) >= self.batch_size:
+            await self.flush()
+        return None
+
+    async def flush(self, *, force_snapshot: bool = False) -> None:
+        """Write buffered events and apply their progress and snapshot deltas.
+
+        Args:
+            force_snapshot: Touch every pending snapshot row even if it was
+                touched within the last flush interval.
+        """
+        async with self._flush_lock:
+            events, self._pending = self._pending, []
+            for event in events:
+                run_key: RunKey = (
+                    str(event["repository_owner_name"]),
+                    str(event["repository_name"]),
+                    str(event["repository_workflow_run_id"]),
+                )
+                created_at: datetime = event["created_at"]  # type: ignore[assignment]
+                previous = self._snapshot_pending.get(run_key)
+                if previous is None or created_at > previous:
+                    self._snapshot_pending[run_key] = created_at
+
+            now = asyncio.get_running_loop().time()
+            due_runs = [
+                run_key
+                for run_key in self._snapshot_pending
+                if force_snapshot
+                or now - self._snapshot_touched_at.get(run_key, float("-inf"))
+                >= self.flush_interval_s
+            ]
+            if not events and not due_runs:
+                return
+
+            flushed_runs: dict[RunKey, datetime] = {}
+            try:
+                async with get_startup_session() as session:
+                    written = await self._assign_event_ids(session, events)
+                    if written:
+                        await session.execute(
+                            insert(RepositoryAgentEvent).values(written)
+                        )
+                    for key, delta in _collect_codebase_deltas(written).items():
+                        await session.execute(
+                            update(RepositoryAgentCodebaseProgress)
+                            .where(*_progress_row_filter(key))
+                            .values(
+                                event_count=RepositoryAgentCodebaseProgress.event_count
+                                + delta.event_count,
+                                latest_event_id=func.greatest(
+                                    RepositoryAgentCodebaseProgress.latest_event_id,
+                                    delta.latest_event_id,
+                                ),
+                                latest_event_at=func.greatest(
+                                    RepositoryAgentCodebaseProgress.latest_event_at,
+                                    delta.latest_event_at,
+                                ),
+                                modified_at=func.now(),
+                            )
+                        )
+                    for run_key in due_runs:
+                        latest_event_at = self._snapshot_pending.pop(run_key)
+                        flushed_runs[run_key] = latest_event_at
+                        owner_name, repo_name, repository_workflow_run_id = run_key
+                        await session.execute(
+                            update(RepositoryAgentMdSnapshot)
+                            .where(
+                                RepositoryAgentMdSnapshot.repository_owner_name
+                                == owner_name,
+                                RepositoryAgentMdSnapshot.repository_name == repo_name,
+                                RepositoryAgentMdSnapshot.repository_workflow_run_id
+                                == repository_workflow_run_id,
+                            )
+                            .values(
+                                latest_event_at=func.greatest(
+                                    RepositoryAgentMdSnapshot.latest_event_at,
+                                    latest_event_at,
+                                ),
+                                modified_at=func.now(),
+                            )
+                        )
+            except BaseException:
+                # Nothing was committed; keep the batch for the next flush
+                self._pending[:0] = events
+                for run_key, latest_event_at in flushed_runs.items():
+                    previous = self._snapshot_pending.get(run_key)
+                    if previous is None or latest_event_at > previous:
+                        self._snapshot_pending[run_key] = latest_event_at
+                raise
+            for run_key in due_runs:
+                self._snapshot_touched_at[run_key] = now
+
+            # A run not touched within the interval is due anyway
+            for run_key, touched_at in list(self._snapshot_touched_at.items()):
+                if now - touched_at >= self.flush_interval_s:
+                    del self._snapshot_touched_at[run_key]
+
+    async def close(self) -> None:
+        """Stop the flush timer and write everything still buffered."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+        await self.flush(force_snapshot=True)
+
+    async def _assign_event_ids(
+        self, session: AsyncSession, events: list[dict[str, object]]
+    ) -> list[dict[str, object]]:
+        """Reserve ids for ``events`` in the flush transaction and number them.
+
+        Returns the events to write; events whose progress row is missing are
+        dropped.
+        """
+        by_codebase: dict[CodebaseKey, list[dict[str, object]]] = {}
+        for event in events:
+            by_codebase.setdefault(_codebase_key(event), []).append(event)
+
+        written: list[dict[str, object]] = []
+        # A fixed order keeps concurrent flushes from deadlocking on the rows
+        for key in sorted(by_codebase):
+            codebase_events = by_codebase[key]
+            result = await session.execute(
+                update(RepositoryAgentCodebaseProgress)
+                .where(*_progress_row_filter(key))
+                .values(
+                    next_event_id=RepositoryAgentCodebaseProgress.next_event_id
+                    + len(codebase_events)
+                )
+                .returning(RepositoryAgentCodebaseProgress.next_event_id)
+            )
+            end_event_id = result.scalar_one_or_none()
+            if end_event_id is None:
+                owner_name, repo_name, repository_workflow_run_id, codebase_name = key
+                logger.error(
+                    "Progress row missing for {}/{} codebase={} run_id={}, dropping {} events",
+                    owner_name,
+                    repo_name,
+                    codebase_name,
+                    repository_workflow_run_id,
+                    len(codebase_events),
+                )
+                continue
+            first_event_id = end_event_id - len(codebase_events)
+            for offset, event in enumerate(codebase_events):
+                event["event_id"] = first_event_id + offset
+            written.extend(codebase_events)
+        return written
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval_s)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(
+                    "Failed to flush buffered agent events: {} - {}",
+                    type(e).__name__,
+                    str(e),
+                )
+            if not self._pending and not self._snapshot_pending:
+                self._flush_task = None
+                return
+
+
+__all__ = ["RepositoryAgentEventBuffer"]
@@ -16,6 +16,7 @@ from unoplat_code_confluence_query_engine.models.repository.framework_feature_va
     DiscoveredFrameworkFeatureUsageSpan,
 )
 from unoplat_code_confluence_query_engine.services.temporal.agent_assembly.agents.user_prompts.build_user_prompt_call_expression_discoverer import (
+    build_call_expression_discoverer_batch_prompt,
     build_call_expression_discoverer_prompt,
 )
 from unoplat_code_confluence_query_engine.services.temporal.agent_assembly.catalog import (
@@ -77,6 +78,17 @@ def test_prompt_isolated_to_one_operation_and_keeps_existing_hints() -> None:
     assert "/repo/client.py" in prompt
 
 
+def test_batch_prompt_lists_every_operation_identity_and_hints() -> None:
+    target = _target()
+    prompt = build_call_expression_discoverer_batch_prompt(
+        "/repo", [(target, operation) for operation in target.operations]
+    )
+    assert "each of these 2 operations" in prompt
+    assert "'feature_operation_key': 'get'" in prompt
+    assert "'feature_operation_key': 'post'" in prompt
+    assert "/repo/client.py" in prompt
+
+
 def test_discovered_span_requires_exact_final_confidence() -> None:
     span = DiscoveredFrameworkFeatureUsageSpan(
         file_path="/repo/client.py",
@@ -14,6 +14,12 @@ import pytest
 from sqlalchemy import text
 
 from tests.utils.sync_db_utils import cleanup_postgresql_sync, get_sync_postgres_session
+from unoplat_code_confluence_query_engine.services.tracking import (
+    repository_agent_event_buffer as event_buffer_module,
+)
+from unoplat_code_confluence_query_engine.services.tracking.repository_agent_event_buffer import (
+    RepositoryAgentEventBuffer,
+)
 from unoplat_code_confluence_query_engine.services.tracking.repository_agent_snapshot_service import (
     RepositoryAgentSnapshotWriter,
 )
@@ -517,6 +523,261 @@ async def test_append_event_updates_progress_and_timestamp(seeded_db, writer):
         assert snapshot["modified_at"] > initial_modified_at
 
 
+@pytest.mark.integration
+@pytest.mark.asyncio(loop_scope="session")
+async def test_event_buffer_batches_tool_events_and_writes_results_through(
+    seeded_db, writer
+):
+    """Test that buffered tool events land in one flush and results stay atomic."""
+    await writer.begin_run(
+        owner_name=TEST_OWNER,
+        repo_name=TEST_REPO,
+        repository_qualified_name=f"{TEST_OWNER}/{TEST_REPO}",
+        repository_workflow_run_id=TEST_WORKFLOW_RUN_ID,
+        codebase_names=[TEST_CODEBASE_1],
+    )
+    event_buffer = RepositoryAgentEventBuffer(
+        writer, flush_interval_s=60, batch_size=100
+    )
+
+    tool_event_ids = [
+        await event_buffer.append_event(
+            owner_name=TEST_OWNER,
+            repo_name=TEST_REPO,
+            codebase_name=TEST_CODEBASE_1,
+            agent_name="processing_step",
+            phase=phase,
+            message=f"Tool event {index}",
+            tool_name="read_file",
+            tool_call_id=f"call-{index // 2}",
+            tool_args={"path": "README.md"} if phase == "tool.call" else None,
+            tool_result_content="contents" if phase == "tool.result" else None,
+            completion_namespaces={"processing_step", "final_review"},
+            repository_workflow_run_id=TEST_WORKFLOW_RUN_ID,
+        )
+        for index, phase in enumerate(["tool.call", "tool.result"] * 3)
+    ]
+    # Buffered events are numbered when they are written
+    assert tool_event_ids == [None] * 6
+    assert event_buffer.pending_count == 6
+
+    # Nothing reaches Postgres before a flush
+    with get_sync_postgres_session(seeded_db["postgresql"]) as session:
+        assert (
+            list_codebase_events(
+                session,
+                TEST_OWNER,
+                TEST_REPO,
+                TEST_WORKFLOW_RUN_ID,
+                TEST_CODEBASE_1,
+            )
+            == []
+        )
+
+    result_event_id = await event_buffer.append_event(
+        owner_name=TEST_OWNER,
+        repo_name=TEST_REPO,
+        codebase_name=TEST_CODEBASE_1,
+        agent_name="processing_step",
+        phase="result",
+        message="Step completed",
+        completion_namespaces={"processing_step", "final_review"},
+        repository_workflow_run_id=TEST_WORKFLOW_RUN_ID,
+    )
+    # The flush numbered the tool events first, so the result follows them
+    assert result_event_id == 7
+    assert event_buffer.pending_count == 0
+    await event_buffer.close()
+
+    with get_sync_postgres_session(seeded_db["postgresql"]) as session:
+        events = list_codebase_events(
+            session,
+            TEST_OWNER,
+            TEST_REPO,
+            TEST_WORKFLOW_RUN_ID,
+            TEST_CODEBASE_1,
+        )
+        assert [event["event_id"] for event in events] == [1, 2, 3, 4, 5, 6, 7]
+        assert events[0]["tool_args"] == {"path": "README.md"}
+        assert events[1]["tool_result_content"] == "contents"
+        assert events[-1]["phase"] == "result"
+
+        progress = list_codebase_progress_rows(
+            session,
+            TEST_OWNER,
+            TEST_REPO,
+            TEST_WORKFLOW_RUN_ID,
+        )[0]
+        assert progress["next_event_id"] == 8
+        assert progress["latest_event_id"] == 7
+        assert progress["event_count"] == 7
+        assert progress["progress"] == Decimal("50.00")
+        assert progress["completed_namespaces"] == ["processing_step"]
+
+        snapshot = get_snapshot_data(
+            session,
+            TEST_OWNER,
+            TEST_REPO,
+            TEST_WORKFLOW_RUN_ID,
+        )
+        assert snapshot is not None
+        assert snapshot["overall_progress"] == Decimal("50.00")
+        assert snapshot["latest_event_at"] == progress["latest_event_at"]
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio(loop_scope="session")
+async def test_event_buffers_on_different_workers_number_events_in_write_order(
+    seeded_db, writer
+):
+    """Test that an event buffered after another worker's result sorts after it."""
+    await writer.begin_run(
+        owner_name=TEST_OWNER,
+        repo_name=TEST_REPO,
+        repository_qualified_name=f"{TEST_OWNER}/{TEST_REPO}",
+        repository_workflow_run_id=TEST_WORKFLOW_RUN_ID,
+        codebase_names=[TEST_CODEBASE_1],
+    )
+    first_worker = RepositoryAgentEventBuffer(
+        writer, flush_interval_s=60, batch_size=100
+    )
+    second_worker = RepositoryAgentEventBuffer(
+        writer, flush_interval_s=60, batch_size=100
+    )
+    await first_worker.append_event(
+        owner_name=TEST_OWNER,
+        repo_name=TEST_REPO,
+        codebase_name=TEST_CODEBASE_1,
+        agent_name="processing_step",
+        phase="tool.call",
+        message="Before the result",
+        tool_name="read_file",
+        tool_call_id="call-0",
+        completion_namespaces={"processing_step", "final_review"},
+        repository_workflow_run_id=TEST_WORKFLOW_RUN_ID,
+    )
+    await first_worker.flush()
+    await second_worker.append_event(
+        owner_name=TEST_OWNER,
+        repo_name=TEST_REPO,
+        codebase_name=TEST_CODEBASE_1,
+        agent_name="processing_step",
+        phase="result",
+        message="Step completed",
+        completion_namespaces={"processing_step", "final_review"},
+        repository_workflow_run_id=TEST_WORKFLOW_RUN_ID,
+    )
+    await first_worker.append_event(
+        owner_name=TEST_OWNER,
+        repo_name=TEST_REPO,
+        codebase_name=TEST_CODEBASE_1,
+        agent_name="final_review",
+        phase="tool.call",
+        message="After the result",
+        tool_name="read_file",
+        tool_call_id="call-1",
+        completion_namespaces={"processing_step", "final_review"},
+        repository_workflow_run_id=TEST_WORKFLOW_RUN_ID,
+    )
+    await first_worker.close()
+    await second_worker.close()
+
+    with get_sync_postgres_session(seeded_db["postgresql"]) as session:
+        events = list_codebase_events(
+            session,
+            TEST_OWNER,
+            TEST_REPO,
+            TEST_WORKFLOW_RUN_ID,
+            TEST_CODEBASE_1,
+        )
+        assert [(event["event_id"], event["message"]) for event in events] == [
+            (1, "Before the result"),
+            (2, "Step completed"),
+            (3, "After the result"),
+        ]
+
+        progress = list_codebase_progress_rows(
+            session,
+            TEST_OWNER,
+            TEST_REPO,
+            TEST_WORKFLOW_RUN_ID,
+        )[0]
+        assert progress["latest_event_id"] == 3
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio(loop_scope="session")
+async def test_event_buffer_keeps_events_when_a_flush_fails(
+    seeded_db, writer, monkeypatch
+):
+    """Test that a failed flush leaves its events buffered for the next one."""
+    await writer.begin_run(
+        owner_name=TEST_OWNER,
+        repo_name=TEST_REPO,
+        repository_qualified_name=f"{TEST_OWNER}/{TEST_REPO}",
+        repository_workflow_run_id=TEST_WORKFLOW_RUN_ID,
+        codebase_names=[TEST_CODEBASE_1],
+    )
+    event_buffer = RepositoryAgentEventBuffer(
+        writer, flush_interval_s=60, batch_size=100
+    )
+    for index in range(3):
+        await event_buffer.append_event(
+            owner_name=TEST_OWNER,
+            repo_name=TEST_REPO,
+            codebase_name=TEST_CODEBASE_1,
+            agent_name="processing_step",
+            phase="tool.call",
+            message=f"Tool event {index}",
+            tool_name="read_file",
+            tool_call_id=f"call-{index}",
+            completion_namespaces={"processing_step"},
+            repository_workflow_run_id=TEST_WORKFLOW_RUN_ID,
+        )
+
+    def _failing_insert(table):
+        raise RuntimeError("insert failed")
+
+    monkeypatch.setattr(event_buffer_module, "insert", _failing_insert)
+    with pytest.raises(RuntimeError, match="insert failed"):
+        await event_buffer.flush(force_snapshot=True)
+    assert event_buffer.pending_count == 3
+
+    monkeypatch.undo()
+    await event_buffer.close()
+
+    with get_sync_postgres_session(seeded_db["postgresql"]) as session:
+        events = list_codebase_events(
+            session,
+            TEST_OWNER,
+            TEST_REPO,
+            TEST_WORKFLOW_RUN_ID,
+            TEST_CODEBASE_1,
+        )
+        assert [event["message"] for event in events] == [
+            "Tool event 0",
+            "Tool event 1",
+            "Tool event 2",
+        ]
+
+        progress = list_codebase_progress_rows(
+            session,
+            TEST_OWNER,
+            TEST_REPO,
+            TEST_WORKFLOW_RUN_ID,
+        )[0]
+        assert progress["event_count"] == 3
+
+        snapshot = get_snapshot_data(
+            session,
+            TEST_OWNER,
+            TEST_REPO,
+            TEST_WORKFLOW_RUN_ID,
+        )
+        assert snapshot is not None
+        assert snapshot["latest_event_at"] == progress["latest_event_at"]
+
+
 @pytest.mark.integration
 @pytest.mark.asyncio(loop_scope="session")
 async def test_patch_codebase_output_atomically_merges_sections(seeded_db, writer):
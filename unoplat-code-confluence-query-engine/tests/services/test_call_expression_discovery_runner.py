@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any
+
+from pydantic_ai.usage import RunUsage, UsageLimits
+import pytest
+from unoplat_code_confluence_commons.base_models import Concept
+
+from unoplat_code_confluence_query_engine.models.repository.framework_feature_validation_models import (
+    CallExpressionDiscoveryOperation,
+    CallExpressionDiscoveryTarget,
+    CallExpressionFeatureDefinition,
+)
+from unoplat_code_confluence_query_engine.models.repository.repository_ruleset_metadata import (
+    CodebaseMetadata,
+)
+from unoplat_code_confluence_query_engine.models.statistics.agent_usage_statistics import (
+    UsageStatistics,
+)
+from unoplat_code_confluence_query_engine.services.temporal.workflow_envelopes import (
+    CodebaseAgentLimits,
+)
+from unoplat_code_confluence_query_engine.services.temporal.workflows.runners import (
+    call_expression_discovery_runner as runner_module,
+)
+from unoplat_code_confluence_query_engine.services.temporal.workflows.runners.call_expression_discovery_runner import (
+    CallExpressionDiscoveryBatch,
+    plan_call_expression_discovery_batches,
+    run_call_expression_discovery,
+)
+
+
+def _target() -> CallExpressionDiscoveryTarget:
+    definition = CallExpressionFeatureDefinition(
+        concept=Concept.CALL_EXPRESSION,
+        description="Fetch a resource",
+        base_confidence=0.69,
+    )
+    return CallExpressionDiscoveryTarget(
+        feature_language="python",
+        feature_library="httpx",
+        feature_capability_key="http_client",
+        operations=[
+            CallExpressionDiscoveryOperation(
+                feature_operation_key="get",
+                definition=definition,
+                absolute_paths=["httpx.Client"],
+            ),
+            CallExpressionDiscoveryOperation(
+                feature_operation_key="post",
+                definition=definition,
+            ),
+        ],
+    )
+
+
+def _batch_keys(batches: list[CallExpressionDiscoveryBatch]) -> list[list[str]]:
+    return [
+        [
+            f"{capability.feature_library}.{operation.feature_operation_key}"
+            for capability, operation in batch
+        ]
+        for batch in batches
+    ]
+
+
+def test_discovery_batches_group_operations_by_library() -> None:
+    httpx_target = _target()
+    requests_target = httpx_target.model_copy(
+        update={
+            "feature_library": "requests",
+            "operations": httpx_target.operations[:1],
+        }
+    )
+    httpx_async_target = httpx_target.model_copy(
+        update={"feature_capability_key": "async_http_client"}
+    )
+    targets = [httpx_target, requests_target, httpx_async_target]
+
+    assert _batch_keys(plan_call_expression_discovery_batches(targets, 3)) == [
+        ["httpx.get", "httpx.post", "httpx.get"],
+        ["httpx.post"],
+        ["requests.get"],
+    ]
+    assert _batch_keys(plan_call_expression_discovery_batches(targets, 1)) == [
+        ["httpx.get"],
+        ["httpx.post"],
+        ["requests.get"],
+        ["httpx.get"],
+        ["httpx.post"],
+    ]
+
+
+class _FakeDiscoverer:
+    """Fails batched prompts and the ``post`` operation, succeeds otherwise."""
+
+    def __init__(self) -> None:
+        self.request_limits: list[int | None] = []
+
+    async def run(
+        self, prompt: str, *, usage_limits: UsageLimits | None, **kwargs: Any
+    ) -> SimpleNamespace:
+        assert usage_limits is not None
+        self.request_limits.append(usage_limits.request_limit)
+        if "each of these 2 operations" in prompt:
+            raise RuntimeError("batch output rejected")
+        if "'feature_operation_key': 'post'" in prompt:
+            raise RuntimeError("post output rejected")
+        return SimpleNamespace(
+            usage=RunUsage(requests=1, input_tokens=100, output_tokens=10)
+        )
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_falls_back_to_single_operation_runs(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        runner_module.workflow, "now", lambda: datetime.now(timezone.utc)
+    )
+    monkeypatch.setattr(
+        runner_module,
+        "get_cached_usage_limits",
+        lambda: UsageLimits(request_limit=10),
+    )
+    discoverer = _FakeDiscoverer()
+    agent_stats: list[UsageStatistics] = []
+    agent_errors: list[dict[str, object]] = []
+
+    await run_call_expression_discovery(
+        temporal_agents=SimpleNamespace(call_expression_discoverer=discoverer),  # type: ignore[arg-type]
+        codebase_metadata=CodebaseMetadata(
+            codebase_name="apps/api",
+            codebase_path=str(tmp_path),
+            codebase_programming_language="python",
+            codebase_package_manager="uv",
+            codebase_package_manager_provenance="local",
+            codebase_workspace_root=".",
+            codebase_workspace_root_path=str(tmp_path),
+        ),
+        repository_qualified_name="owner/repo",
+        repository_workflow_run_id="repository-run",
+        codebase_workflow_run_id="codebase-run",
+        targets=[_target()],
+        agent_stats=agent_stats,
+        agent_errors=agent_errors,
+        limits=CodebaseAgentLimits(
+            call_expression_discovery_batch_size=2,
+            call_expression_discovery_concurrency=2,
+        ),
+    )
+
+    # The batch gets the request budget of two runs, each retry that of one
+    assert discoverer.request_limits == [20, 10, 10]
+    assert [error["operation_identity"] for error in agent_errors] == [
+        {
+            "feature_language": "python",
+            "feature_library": "httpx",
+            "feature_capability_key": "http_client",
+            "feature_operation_key": "post",
+        }
+    ]
+    assert sorted(stats.input_tokens for stats in agent_stats) == [0, 100]
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from unoplat_code_confluence_query_engine.services.temporal.workflows.runners.codebase_agent_dag_runner import (
+    CodebaseAgentNode,
+    resolve_codebase_agent_dependencies,
+    run_codebase_agent_dag,
+)
+
+
+def _recording_node(
+    name: str,
+    timeline: list[str],
+    in_flight: list[int],
+    *,
+    writes: set[str],
+    reads: set[str] | None = None,
+) -> CodebaseAgentNode:
+    async def _run() -> str:
+        timeline.append(f"start:{name}")
+        in_flight.append(
+            sum(1 for event in timeline if event.startswith("start:"))
+            - sum(1 for event in timeline if event.startswith("end:"))
+        )
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        timeline.append(f"end:{name}")
+        return name.upper()
+
+    return CodebaseAgentNode(
+        name=name,
+        run=_run,
+        reads=frozenset(reads or set()),
+        writes=frozenset(writes),
+    )
+
+
+def _codebase_nodes(
+    timeline: list[str], in_flight: list[int]
+) -> list[CodebaseAgentNode]:
+    return [
+        _recording_node(
+            "development_workflow_guide",
+            timeline,
+            in_flight,
+            writes={"AGENTS.md", "engineering_workflow"},
+        ),
+        _recording_node(
+            "dependency_guide",
+            timeline,
+            in_flight,
+            writes={"dependencies_overview.md", "dependency_guide"},
+        ),
+        _recording_node(
+            "business_domain_guide",
+            timeline,
+            in_flight,
+            writes={"AGENTS.md", "business_logic"},
+        ),
+        _recording_node(
+            "app_interfaces_agent",
+            timeline,
+            in_flight,
+            writes={"app_interfaces.md", "app_interfaces"},
+        ),
+    ]
+
+
+def test_dependencies_follow_conflicting_resources_in_declaration_order() -> None:
+    nodes = _codebase_nodes([], [])
+    nodes.append(
+        _recording_node(
+            "reader", [], [], writes={"report.md"}, reads={"dependency_guide"}
+        )
+    )
+
+    assert resolve_codebase_agent_dependencies(nodes) == {
+        "development_workflow_guide": [],
+        "dependency_guide": [],
+        "business_domain_guide": ["development_workflow_guide"],
+        "app_interfaces_agent": [],
+        "reader": ["dependency_guide"],
+    }
+
+
+def test_duplicate_node_names_are_rejected() -> None:
+    node = _recording_node("dependency_guide", [], [], writes={"dependency_guide"})
+
+    with pytest.raises(ValueError):
+        resolve_codebase_agent_dependencies([node, node])
+
+
+@pytest.mark.asyncio
+async def test_single_slot_runs_nodes_sequentially_in_declaration_order() -> None:
+    timeline: list[str] = []
+    in_flight: list[int] = []
+
+    results = await run_codebase_agent_dag(_codebase_nodes(timeline, in_flight), 1)
+
+    assert timeline == [
+        "start:development_workflow_guide",
+        "end:development_workflow_guide",
+        "start:dependency_guide",
+        "end:dependency_guide",
+        "start:business_domain_guide",
+        "end:business_domain_guide",
+        "start:app_interfaces_agent",
+        "end:app_interfaces_agent",
+    ]
+    assert max(in_flight) == 1
+    assert results["app_interfaces_agent"] == "APP_INTERFACES_AGENT"
+
+
+@pytest.mark.asyncio
+async def test_independent_nodes_overlap_within_the_concurrency_limit() -> None:
+    timeline: list[str] = []
+    in_flight: list[int] = []
+
+    results = await run_codebase_agent_dag(_codebase_nodes(timeline, in_flight), 3)
+
+    assert max(in_flight) == 3
+    assert timeline.index("end:development_workflow_guide") < timeline.index(
+        "start:business_domain_guide"
+    )
+    assert list(results) == [
+        "development_workflow_guide",
+        "dependency_guide",
+        "business_domain_guide",
+        "app_interfaces_agent",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failed_node_skips_dependents_and_cancels_running_nodes() -> None:
+    timeline: list[str] = []
+    never_set = asyncio.Event()
+
+    async def _fail() -> str:
+        timeline.append("start:development_workflow_guide")
+        await asyncio.sleep(0)
+        raise RuntimeError("agent crashed")
+
+    async def _run_until_cancelled() -> str:
+        timeline.append("start:dependency_guide")
+        try:
+            await never_set.wait()
+        except asyncio.CancelledError:
+            timeline.append("cancelled:dependency_guide")
+            raise
+        return "DEPENDENCY_GUIDE"
+
+    async def _dependent() -> str:
+        timeline.append("start:business_domain_guide")
+        return "BUSINESS_DOMAIN_GUIDE"
+
+    nodes = [
+        CodebaseAgentNode(
+            name="development_workflow_guide",
+            run=_fail,
+            writes=frozenset({"AGENTS.md"}),
+        ),
+        CodebaseAgentNode(
+            name="dependency_guide",
+            run=_run_until_cancelled,
+            writes=frozenset({"dependency_guide"}),
+        ),
+        CodebaseAgentNode(
+            name="business_domain_guide",
+            run=_dependent,
+            writes=frozenset({"AGENTS.md"}),
+        ),
+    ]
+
+    with pytest.raises(RuntimeError, match="agent crashed"):
+        await run_codebase_agent_dag(nodes, 3)
+
+    assert "start:business_domain_guide" not in timeline
+    assert "cancelled:dependency_guide" in timeline
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from unoplat_code_confluence_query_engine.models.runtime.dependency_guide_target import (
+    DependencyGuideTarget,
+)
+from unoplat_code_confluence_query_engine.services.repository.dependency_guide_cache_service import (
+    assign_target_major_versions,
+    extract_major_version,
+    is_shareable_dependency_guide_purpose,
+)
+from unoplat_code_confluence_query_engine.services.temporal.agent_assembly.agents.user_prompts.build_user_prompt_dependency_guide import (
+    build_dependency_guide_prompt_version,
+)
+
+
+def test_extract_major_version_prefers_most_specific_field() -> None:
+    assert (
+        extract_major_version({"current_version": "2.1.3", "specifier": "^1.0"}) == "2"
+    )
+    assert extract_major_version({"minimum_version": "0.110.0"}) == "0"
+    assert extract_major_version({"specifier": "^18.2.0"}) == "18"
+    assert extract_major_version({"specifier": ">=01.4,<2"}) == "1"
+    assert extract_major_version({"specifier": "*"}) == ""
+    assert extract_major_version({}) == ""
+    assert extract_major_version(None) == ""
+
+
+def test_assign_target_major_versions_uses_agreeing_source_packages() -> None:
+    targets = [
+        DependencyGuideTarget(name="fastapi", source_packages=["fastapi"]),
+        DependencyGuideTarget(
+            name="Radix UI React Primitives",
+            source_packages=["@radix-ui/react-dialog", "@radix-ui/react-popover"],
+        ),
+        DependencyGuideTarget(
+            name="MUI",
+            source_packages=["@mui/material", "@mui/icons-material"],
+        ),
+        DependencyGuideTarget(name="requests", source_packages=["requests"]),
+    ]
+    versions = {
+        "fastapi": {"specifier": ">=0.115.0"},
+        "@radix-ui/react-dialog": {"specifier": "^1.1.2"},
+        "@radix-ui/react-popover": {"specifier": "^1.0.7"},
+        "@mui/material": {"specifier": "^6.1.0"},
+        "@mui/icons-material": {"specifier": "^5.16.0"},
+    }
+
+    versioned = assign_target_major_versions(targets, versions)
+
+    assert [(target.name, target.major_version) for target in versioned] == [
+        ("fastapi", "0"),
+        ("Radix UI React Primitives", "1"),
+        ("MUI", ""),
+        ("requests", ""),
+    ]
+    assert versioned[1].source_packages == targets[1].source_packages
+
+
+def test_internal_dependencies_are_not_shared() -> None:
+    assert is_shareable_dependency_guide_purpose("Web framework for APIs.")
+    assert not is_shareable_dependency_guide_purpose("internal_dependency")
+    assert not is_shareable_dependency_guide_purpose(" internal_dependency ")
+    assert not is_shareable_dependency_guide_purpose("")
+
+
+def test_prompt_version_is_stable() -> None:
+    prompt_version = build_dependency_guide_prompt_version()
+
+    assert len(prompt_version) == 12
+    assert build_dependency_guide_prompt_version() == prompt_version
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import pytest
 
+from unoplat_code_confluence_query_engine.config.settings import EnvironmentSettings
 from unoplat_code_confluence_query_engine.models.runtime.dependency_guide_target import (
+    DependencyGuideDelta,
     DependencyGuideTarget,
 )
 from unoplat_code_confluence_query_engine.services.agents_md.validation.dependency_overview import (
@@ -24,6 +26,9 @@ from unoplat_code_confluence_query_engine.services.temporal.activities.codebase_
 from unoplat_code_confluence_query_engine.services.temporal.agent_assembly.constants import (
     DEPENDENCY_OVERVIEW_ARTIFACT,
 )
+from unoplat_code_confluence_query_engine.services.temporal.temporal_agents import (
+    resolve_dependency_guide_concurrency,
+)
 
 
 async def _fake_dependencies(names: list[str]) -> list[str]:
@@ -241,3 +246,52 @@ async def test_fetch_dependency_guide_delta_uses_normalized_ui_family_name(
     ]
     assert delta.targets_to_generate == []
     assert delta.removed_names == []
+
+
+@pytest.mark.asyncio
+async def test_fetch_dependency_guide_delta_carries_worker_generation_concurrency(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    async def fake_fetch_codebase_dependencies(codebase_path: str) -> list[str]:
+        return await _fake_dependencies(["fastapi", "pydantic", "sqlalchemy"])
+
+    monkeypatch.setattr(
+        fetch_activity_module,
+        "fetch_codebase_dependencies",
+        fake_fetch_codebase_dependencies,
+    )
+    monkeypatch.setattr(
+        fetch_activity_module,
+        "get_cached_dependency_guide_concurrency",
+        lambda: 6,
+    )
+
+    delta = await DependencyGuideFetchActivity().fetch_dependency_guide_delta(
+        codebase_path=str(tmp_path),
+        programming_language="python",
+        package_manager="uv",
+    )
+
+    assert len(delta.targets_to_generate) == 3
+    assert delta.generation_concurrency == 6
+
+
+def test_dependency_guide_delta_ignores_fields_from_newer_workers() -> None:
+    delta = DependencyGuideDelta.model_validate(
+        {"removed_names": ["requests"], "generation_concurrency": 4, "new_field": 1}
+    )
+
+    assert delta.removed_names == ["requests"]
+    assert delta.generation_concurrency == 4
+
+
+def test_resolve_dependency_guide_concurrency_prefers_provider_override() -> None:
+    settings = EnvironmentSettings(
+        DEPENDENCY_GUIDE_MAX_CONCURRENCY=8,
+        DEPENDENCY_GUIDE_PROVIDER_CONCURRENCY="ollama=1, anthropic=3",
+    )
+
+    assert resolve_dependency_guide_concurrency(settings, "anthropic") == 3
+    assert resolve_dependency_guide_concurrency(settings, "ollama") == 1
+    assert resolve_dependency_guide_concurrency(settings, "openai") == 8
+    assert resolve_dependency_guide_concurrency(settings, None) == 8